@@ -14,6 +14,26 @@ STATICFILES_STORAGE = \
 CUSTOM_MIDDLEWARE = []
 CUSTOM_INSTALLED_APPS = []
 
+QUERY_METRICS_HEADERS = False
+QUERY_METRICS_LOG = True
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'utilities.metrics': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 CURRENT_DOMAIN = os.environ.get("PROD_HOSTNAME", None)
 CURRENT_PROTOCOL = 'https'
 ACCOUNT_DEFAULT_HTTP_PROTOCOL = "https"
@@ -14,7 +14,7 @@ import os
 from split_settings.tools import include
 
 from . import BASE_DIR
-from .settings_database import DATABASES_AVAILABLE
+from .settings_database import DATABASE_REPLICA, DATABASES_AVAILABLE
 from .settings_restframework import REST_FRAMEWORK_AVAILABLE
 
 BASE_SETTINGS = [
@@ -73,17 +73,36 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'utilities.metrics.middleware.QueryMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'utilities.profiling.middleware.RequestProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware',
 ]
 
+# The async API views are served under this prefix by the ASGI application,
+# through only the following async capable middleware (see root.asgi).
+# These views authenticate with the API's JWT authentication, so the session,
+# CSRF, auth, messages and allauth middleware are omitted.  The request
+# profiling middleware is also omitted, as cProfile only profiles the thread
+# it's started on, and can't follow a request across the event loop and the
+# database threads.  Requests to these views can't be profiled.
+
+ASYNC_API_PREFIX = '/api/v1/async/'
+ASYNC_MIDDLEWARE = [
+    'utilities.metrics.middleware.QueryMetricsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
 AUTHENTICATION_BACKENDS = (
     'django.contrib.auth.backends.ModelBackend',
     'allauth.account.auth_backends.AuthenticationBackend',
@@ -113,6 +132,10 @@ WSGI_APPLICATION = 'root.wsgi.application'
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
 DATABASES = {'default': DATABASES_AVAILABLE[ENVIRONMENT]}
+DATABASE_ROUTERS = ['utilities.database.routers.ReplicaRouter']
+
+if DATABASE_REPLICA:
+  DATABASES[DATABASE_REPLICA_ALIAS] = DATABASE_REPLICA
 
 DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
 
@@ -6,14 +6,44 @@ WARM_UP_DATABASE_WAIT_INTERVAL = 0.5
 
 # kitchen
 
+BULK_IMPORT_MAX_RECORDS = 5000
+FORECAST_EWMA_SPAN = 14
+NATURAL_SEARCH_MEMORY_LIMIT = 100
 PAGINATION_OVERRIDE_PARAM = "all_results"
+SHOPPING_LIST_CACHE = "default"
+SHOPPING_LIST_CACHE_TTL = 60 * 60
+SHOPPING_LIST_HORIZON_DAYS = 7
+SUGGESTED_ITEM_INDEX_TTL = 60 * 5
+SUGGESTED_ITEM_SEARCH_LIMIT = 10
+TRANSACTION_EXPORT_CHUNK_SIZE = 500
 TRANSACTION_HISTORY_MAX = 14
+TRIGRAM_SUPPORT_TTL = 60 * 5
 LEGACY_TRANSACTION_HISTORY_UPPER_BOUND = 150
 
 # spa_security
 
 BLEACH_RESTORE_LIST = {"&amp;": "&"}
 
+# user
+
+TIMEZONE_CACHE_MAX_AGE = 60 * 60 * 24
+USER_CACHE_MAX_SIZE = 1024
+USER_CACHE_TTL = 60
+
 # utilities
 
+ASYNC_THREADS = {'queries': 16, 'views': 16}
+DATABASE_REPLICA_ALIAS = 'replica'
+DATABASE_REPLICA_PIN_CACHE = 'default'
+DATABASE_REPLICA_PIN_SECONDS = 10
+QUERY_METRICS_HEADERS = True
+QUERY_METRICS_LOG = False
+QUERY_METRICS_SLOWEST = 3
+REQUEST_PROFILING_HEADER = 'X-Profile'
+REQUEST_PROFILING_MAX_QUERIES = 1000
+REQUEST_PROFILING_PARAM = 'profile'
+REQUEST_PROFILING_SUMMARY_LINES = 40
+THROTTLE_CACHE_ALIAS = 'default'
+THROTTLE_CACHE_MAX_SIZE = 4096
+THROTTLE_STORE = 'utilities.throttling.stores.DatabaseThrottleStore'
 TOCTREE_FACTORY_SETTINGS = 'root.toctree.settings'
@@ -8,13 +8,26 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # Database
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
+# Pooled connections are returned to the pool at the end of each request.
+POSTGRES_POOL_MAX_SIZE = int(os.environ.get("POSTGRES_POOL_MAX_SIZE", 0))
+POSTGRES_POOL_TIMEOUT = float(os.environ.get("POSTGRES_POOL_TIMEOUT", 10))
+POSTGRES_CONN_MAX_AGE = 0 if POSTGRES_POOL_MAX_SIZE else int(
+    os.environ.get("POSTGRES_CONN_MAX_AGE", 60)
+)
+
 DATABASES_CONFIGURATIONS = {
     'remote': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'utilities.database.backends.postgresql',
         'NAME': os.environ.get("POSTGRES_DB"),
         'USER': os.environ.get("POSTGRES_USER"),
         'PASSWORD': os.environ.get("POSTGRES_PASSWORD"),
         'HOST': os.environ.get("POSTGRES_HOSTNAME"),
+        'CONN_MAX_AGE': POSTGRES_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
+        'POOL': {
+            'MAX_SIZE': POSTGRES_POOL_MAX_SIZE,
+            'TIMEOUT': POSTGRES_POOL_TIMEOUT,
+        },
     },
     'test': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -22,6 +35,16 @@ DATABASES_CONFIGURATIONS = {
     },
 }
 
+# An optional read replica of the remote database, for read-only requests.
+POSTGRES_REPLICA_HOSTNAME = os.environ.get("POSTGRES_REPLICA_HOSTNAME")
+DATABASE_REPLICA = None
+if POSTGRES_REPLICA_HOSTNAME:
+  DATABASE_REPLICA = dict(
+      DATABASES_CONFIGURATIONS['remote'],
+      HOST=POSTGRES_REPLICA_HOSTNAME,
+      TEST={'MIRROR': 'default'},
+  )
+
 DATABASES_AVAILABLE = {
     'test': DATABASES_CONFIGURATIONS['remote'],
     'local': DATABASES_CONFIGURATIONS['remote'],
@@ -8,7 +8,7 @@ REST_FRAMEWORK_AVAILABLE = {
     'test': {},
     'local': {
         'DEFAULT_AUTHENTICATION_CLASSES': [
-            'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
+            'user.authentication.CachedJWTCookieAuthentication',
             'rest_framework.authentication.BasicAuthentication',
         ],
         'DEFAULT_PERMISSION_CLASSES': [
@@ -24,7 +24,7 @@ REST_FRAMEWORK_AVAILABLE = {
     },
     'stage': {
         'DEFAULT_AUTHENTICATION_CLASSES': [
-            'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
+            'user.authentication.CachedJWTCookieAuthentication',
         ],
         'DEFAULT_PERMISSION_CLASSES': [
             'rest_framework.permissions.IsAuthenticated',
@@ -32,8 +32,8 @@ REST_FRAMEWORK_AVAILABLE = {
         ],
         'DEFAULT_RENDERER_CLASSES': ('rest_framework.renderers.JSONRenderer',),
         'DEFAULT_THROTTLE_CLASSES': [
-            'rest_framework.throttling.AnonRateThrottle',
-            'rest_framework.throttling.UserRateThrottle'
+            'utilities.throttling.throttles.SharedAnonRateThrottle',
+            'utilities.throttling.throttles.SharedUserRateThrottle',
         ],
         'DEFAULT_THROTTLE_RATES': {
             'anon': '5/minute',
@@ -48,7 +48,7 @@ REST_FRAMEWORK_AVAILABLE = {
     },
     'prod': {
         'DEFAULT_AUTHENTICATION_CLASSES': [
-            'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
+            'user.authentication.CachedJWTCookieAuthentication',
         ],
         'DEFAULT_PERMISSION_CLASSES': [
             'rest_framework.permissions.IsAuthenticated',
@@ -56,8 +56,8 @@ REST_FRAMEWORK_AVAILABLE = {
         ],
         'DEFAULT_RENDERER_CLASSES': ('rest_framework.renderers.JSONRenderer',),
         'DEFAULT_THROTTLE_CLASSES': [
-            'rest_framework.throttling.AnonRateThrottle',
-            'rest_framework.throttling.UserRateThrottle'
+            'utilities.throttling.throttles.SharedAnonRateThrottle',
+            'utilities.throttling.throttles.SharedUserRateThrottle',
         ],
         'DEFAULT_THROTTLE_RATES': {
             'anon': '5/minute',
@@ -72,7 +72,7 @@ REST_FRAMEWORK_AVAILABLE = {
     },
     'admin': {
         'DEFAULT_AUTHENTICATION_CLASSES': [
-            'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
+            'user.authentication.CachedJWTCookieAuthentication',
             'rest_framework.authentication.BasicAuthentication',
         ],
         'DEFAULT_PERMISSION_CLASSES': [
@@ -0,0 +1,19 @@
+"""Pytest plugins for the Panic test suite."""
+
+import sys
+
+QUERY_BUDGET_MODULE = "kitchen.tests.fixtures.fixtures_query_budget"
+
+
+def pytest_terminal_summary(terminalreporter):
+  """Report the query counts and runtimes measured by query budget tests."""
+  module = sys.modules.get(QUERY_BUDGET_MODULE)
+  if module is None or not module.QUERY_BUDGET_RESULTS:
+    return
+
+  terminalreporter.section("query budgets")
+  for test_id, size, queries, runtime in module.QUERY_BUDGET_RESULTS:
+    terminalreporter.write_line(
+        "%s [%s records]: %s queries, %.3fs" %
+        (test_id, size, queries, runtime)
+    )
@@ -12,4 +12,4 @@ class KitchenConfig(AppConfig):
   def ready(self):
     """Load Signals."""
     # pylint: disable=unused-import, import-outside-toplevel
-    from .signals import item, transaction
+    from .signals import item, shopping, suggested, transaction
@@ -1,5 +1,6 @@
 """Exception classes for the kitchen app."""
 
+from django.core.exceptions import ValidationError
 from rest_framework import exceptions, serializers, status
 
 
@@ -28,4 +29,8 @@ class ResourceIsRequired(exceptions.APIException):
   status_code = status.HTTP_409_CONFLICT
 
 
+class UniqueNameConstraintError(ValidationError):
+  """Model validation exception due to a duplicate name (regardless of case)."""
+
+
 CUSTOM_VALIDATION_CLASSES = (ValidationPermissionError,)
@@ -1,5 +1,6 @@
 """Test the exceptions for the kitchen app."""
 
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 from rest_framework import serializers, status
 
@@ -7,6 +8,7 @@ from .. import (
     ConfirmationRequired,
     ProcessingError,
     ResourceIsRequired,
+    UniqueNameConstraintError,
     ValidationPermissionError,
 )
 
@@ -46,6 +48,15 @@ class TestCustomExceptions(TestCase):
 
     assert ResourceIsRequired.status_code == status.HTTP_409_CONFLICT
 
+  def test_unique_name_constraint_error(self):
+    with self.assertRaises(ValidationError) as raised:
+      raise UniqueNameConstraintError({'name': 'Duplicate.'})
+
+    self.assertIsInstance(raised.exception, UniqueNameConstraintError)
+    self.assertDictEqual(
+        raised.exception.message_dict, {'name': ['Duplicate.']}
+    )
+
   def test_validation_permission_error(self):
     with self.assertRaises(ValidationPermissionError) as raised:
       raise ValidationPermissionError()
@@ -1,25 +1,77 @@
 """Filters for the kitchen app."""
 
-from django_filters import CharFilter
+from django_filters import CharFilter, IsoDateTimeFilter
 from django_filters import rest_framework as simple_filters
 
 from .models.item import Item
+from .models.shelf import Shelf
+from .models.store import Store
 from .models.transaction import Transaction
+from .search.natural import search_natural_index
+
+
+class NaturalSearchFilter(CharFilter):
+  """Search filter, ranking matches by similarity to their natural name."""
+
+  def __init__(self, *args, **kwargs):
+    kwargs.setdefault(
+        'help_text',
+        'Search by name, results are ranked by similarity.',
+    )
+    super().__init__(*args, **kwargs)
+
+  def filter(self, qs, value):
+    """Filter and rank the queryset by similarity to the search value."""
+    if not value:
+      return qs
+    return search_natural_index(qs, value)
 
 
 class TransactionFilter(simple_filters.FilterSet):
   """Transaction filter."""
 
   item = CharFilter(required=True, field_name='item')
+  start = IsoDateTimeFilter(
+      field_name='datetime',
+      lookup_expr='gte',
+      help_text='Include transactions on or after this datetime.',
+  )
+  end = IsoDateTimeFilter(
+      field_name='datetime',
+      lookup_expr='lt',
+      help_text='Include transactions before this datetime.',
+  )
 
   class Meta:
     model = Transaction
-    fields = ['item']
+    fields = ['item', 'start', 'end']
 
 
 class ItemFilter(simple_filters.FilterSet):
   """Item filter."""
 
+  search = NaturalSearchFilter()
+
   class Meta:
     model = Item
-    fields = ['shelf', 'preferred_stores']
+    fields = ['shelf', 'preferred_stores', 'search']
+
+
+class ShelfFilter(simple_filters.FilterSet):
+  """Shelf filter."""
+
+  search = NaturalSearchFilter()
+
+  class Meta:
+    model = Shelf
+    fields = ['search']
+
+
+class StoreFilter(simple_filters.FilterSet):
+  """Store filter."""
+
+  search = NaturalSearchFilter()
+
+  class Meta:
+    model = Store
+    fields = ['search']
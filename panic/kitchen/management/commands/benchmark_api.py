@@ -0,0 +1,270 @@
+"""A management command to benchmark the API end to end, in process."""
+
+import json
+from functools import partial
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+from django.utils.timezone import now
+
+from ...models.forecast import Forecast
+from ...models.inventory import Inventory
+from ...models.item import Item
+from ...models.spending_summary import SpendingSummary
+from ...models.transaction import Transaction
+from ...models.waste import Waste
+from ...tests.fixtures.benchmark_testdata import BenchmarkDataConfiguration
+from utilities.metrics.latency import summarize
+
+DEFAULT_REQUESTS = 100
+DEFAULT_USER = BenchmarkDataConfiguration.username_prefix + "0"
+DEFAULT_WARMUP = 5
+RESTORE_BATCH_SIZE = 500
+ENDPOINTS = (
+    "auth_login",
+    "auth_token_refresh",
+    "auth_user_details",
+    "item_list",
+    "item_activity",
+    "transaction_create",
+    "shelf_list",
+    "store_list",
+)
+ERROR_MESSAGE = (
+    'The specified user does not exist, or has no items. '
+    'Create one with the load_benchmark_data command.'
+)
+JSON_CONTENT_TYPE = "application/json"
+LOGIN_ERROR_MESSAGE = 'Unable to login as the specified user.'
+STATUS_ERROR_MESSAGE = '{endpoint}: {errors} requests failed.'
+
+
+class Snapshot:
+  """The rows of a queryset, which can be restored after they've changed.
+
+  :param queryset: The rows to snapshot
+  :type queryset: :class:`django.db.models.QuerySet`
+  """
+
+  def __init__(self, queryset):
+    self.queryset = queryset
+    self.instances = list(queryset)
+
+  def restore(self):
+    """Delete any rows created since the snapshot, and restore the others."""
+    model = self.queryset.model
+    self.queryset.exclude(pk__in=[instance.pk for instance in self.instances]
+                         ).delete()
+    model._base_manager.bulk_update(
+        self.instances,
+        [
+            field.name
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+        ],
+        batch_size=RESTORE_BATCH_SIZE,
+    )
+
+
+class Command(BaseCommand):
+  """Management command that benchmarks the API end to end, in process."""
+
+  help = (
+      'Drives the API through the full URL conf and middleware as a seeded '
+      'user, and reports the p50/p95/p99 latency and throughput of each '
+      'endpoint as JSON.  Requests are made in autocommit mode, and the '
+      'changes they make to the user and their benchmarked item are undone '
+      'afterwards.'
+  )
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        '--user',
+        type=str,
+        default=DEFAULT_USER,
+        help='The username of the seeded user to benchmark as.',
+    )
+    parser.add_argument(
+        '--password',
+        type=str,
+        default=BenchmarkDataConfiguration.password,
+        help='The password of the seeded user.',
+    )
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help='The number of timed requests made to each endpoint.',
+    )
+    parser.add_argument(
+        '--warmup',
+        type=int,
+        default=DEFAULT_WARMUP,
+        help='The number of untimed requests made to each endpoint first.',
+    )
+    parser.add_argument(
+        '--endpoint',
+        action='append',
+        choices=ENDPOINTS,
+        help='An endpoint to benchmark (defaults to all of them).',
+    )
+    parser.add_argument(
+        '--label',
+        type=str,
+        default=None,
+        help='A label for the results, such as the current commit.',
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='A file to write the JSON results to (defaults to stdout).',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    try:
+      user = get_user_model().objects.get(username=options['user'])
+      item = Item.objects.filter(user=user).order_by('_index')[0]
+    except (ObjectDoesNotExist, IndexError):
+      self.stderr.write(self.style.ERROR(ERROR_MESSAGE))
+      return
+
+    snapshots = self._snapshot(user, item)
+    try:
+      results = self._benchmark_endpoints(user, item, options)
+    finally:
+      with transaction.atomic():
+        for snapshot in snapshots:
+          snapshot.restore()
+
+    if results is None:
+      self.stderr.write(self.style.ERROR(LOGIN_ERROR_MESSAGE))
+      return
+
+    self._write(
+        {
+            "label": options['label'],
+            "created": now().isoformat(),
+            "user": user.username,
+            "endpoints": results,
+        },
+        options['output'],
+    )
+
+  @staticmethod
+  def _snapshot(user, item):
+    return [
+        Snapshot(Transaction.objects.filter(item=item)),
+        Snapshot(Inventory.objects.filter(item=item)),
+        Snapshot(Waste.objects.filter(item=item)),
+        Snapshot(Forecast.objects.filter(item=item)),
+        Snapshot(SpendingSummary.objects.filter(item=item)),
+        Snapshot(Item.objects.filter(pk=item.pk)),
+        Snapshot(get_user_model().objects.filter(pk=user.pk)),
+    ]
+
+  def _benchmark_endpoints(self, user, item, options):
+    client = Client()
+    credentials = {"email": user.email, "password": options['password']}
+    if client.post(reverse("rest_login"), credentials).status_code != 200:
+      return None
+
+    requests = self._create_requests(item, credentials)
+    results = {}
+    for endpoint in options['endpoint'] or ENDPOINTS:
+      results[endpoint] = self._benchmark(
+          client,
+          endpoint,
+          requests[endpoint],
+          max(options['requests'], 1),
+          max(options['warmup'], 0),
+      )
+    return results
+
+  @staticmethod
+  def _create_requests(item, credentials):
+    return {
+        "auth_login": ("post", reverse("rest_login"), credentials),
+        "auth_token_refresh": ("post", reverse("token_refresh"), {}),
+        "auth_user_details": ("get", reverse("rest_user_details"), None),
+        "item_list": (
+            "get",
+            reverse("v1:items-supplementary-list"),
+            None,
+        ),
+        "item_activity": (
+            "get",
+            reverse("v1:items-activity", args=[item.id]),
+            None,
+        ),
+        "transaction_create": (
+            "post",
+            reverse("v1:transactions-list"),
+            {
+                "item": item.id,
+                "quantity": 1
+            },
+        ),
+        "shelf_list": (
+            "get",
+            reverse("v1:shelves-supplementary-list"),
+            None,
+        ),
+        "store_list": (
+            "get",
+            reverse("v1:stores-supplementary-list"),
+            None,
+        ),
+    }
+
+  def _benchmark(self, client, endpoint, request, count, warmup):
+    method, path, payload = request
+    if method == "post":
+      send = partial(
+          client.post,
+          path,
+          payload,
+          content_type=JSON_CONTENT_TYPE,
+      )
+    else:
+      send = partial(client.get, path)
+
+    for _ in range(warmup):
+      send()
+
+    errors = 0
+    latencies = []
+    start = perf_counter()
+    for _ in range(count):
+      request_start = perf_counter()
+      response = send()
+      latencies.append(perf_counter() - request_start)
+      if response.status_code >= 400:
+        errors += 1
+    elapsed = perf_counter() - start
+
+    if errors:
+      self.stderr.write(
+          self.style.WARNING(
+              STATUS_ERROR_MESSAGE.format(endpoint=endpoint, errors=errors)
+          )
+      )
+
+    result = {"method": method.upper(), "path": path, "errors": errors}
+    result.update(summarize(latencies, elapsed))
+    return result
+
+  def _write(self, results, output):
+    content = json.dumps(results, indent=2)
+    if output is None:
+      self.stdout.write(content)
+      return
+    with open(output, "w", encoding="utf-8") as file_handle:
+      file_handle.write(content + "\n")
@@ -0,0 +1,298 @@
+"""A management command to compare the sync and async read views under load."""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from wsgiref.util import setup_testing_defaults
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.urls import reverse
+from django.utils.timezone import now
+
+from ...models.item import Item
+from ...tests.fixtures.benchmark_testdata import BenchmarkDataConfiguration
+from .benchmark_api import (
+    DEFAULT_USER,
+    ERROR_MESSAGE,
+    LOGIN_ERROR_MESSAGE,
+    STATUS_ERROR_MESSAGE,
+)
+from utilities.asynchronous.executors import (
+    close_connections,
+    shutdown_executors,
+)
+from utilities.metrics.latency import summarize
+
+DEFAULT_CONCURRENCY = 10
+DEFAULT_REQUESTS = 200
+DEFAULT_WARMUP = 10
+ENDPOINTS = (
+    "item_list",
+    "item_detail",
+    "item_activity",
+    "suggestions",
+    "timezones",
+)
+HOST = "localhost"
+
+
+class Command(BaseCommand):
+  """Management command that compares the sync and async read views."""
+
+  help = (
+      'Drives the read endpoints of the sync WSGI application from a pool of '
+      'threads, and their async views in the ASGI application from tasks on '
+      'a single event loop, with the same number of concurrent requests.  '
+      'Reports the p50/p95/p99 latency and throughput of each as JSON.'
+  )
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        '--user',
+        type=str,
+        default=DEFAULT_USER,
+        help='The username of the seeded user to benchmark as.',
+    )
+    parser.add_argument(
+        '--password',
+        type=str,
+        default=BenchmarkDataConfiguration.password,
+        help='The password of the seeded user.',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help='The number of requests in flight at once.',
+    )
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help='The number of timed requests made to each endpoint.',
+    )
+    parser.add_argument(
+        '--warmup',
+        type=int,
+        default=DEFAULT_WARMUP,
+        help='The number of untimed requests made to each endpoint first.',
+    )
+    parser.add_argument(
+        '--endpoint',
+        action='append',
+        choices=ENDPOINTS,
+        help='An endpoint to benchmark (defaults to all of them).',
+    )
+    parser.add_argument(
+        '--label',
+        type=str,
+        default=None,
+        help='A label for the results, such as the current commit.',
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='A file to write the JSON results to (defaults to stdout).',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    # pylint: disable=import-outside-toplevel
+    from root.asgi import application as asgi_application
+    from root.wsgi import application as wsgi_application
+
+    try:
+      user = get_user_model().objects.get(username=options['user'])
+      item = Item.objects.filter(user=user).order_by('_index')[0]
+    except (ObjectDoesNotExist, IndexError):
+      self.stderr.write(self.style.ERROR(ERROR_MESSAGE))
+      return
+
+    client = Client()
+    credentials = {"email": user.email, "password": options['password']}
+    if client.post(reverse("rest_login"), credentials).status_code != 200:
+      self.stderr.write(self.style.ERROR(LOGIN_ERROR_MESSAGE))
+      return
+    cookie = "; ".join(
+        "%s=%s" % (name, morsel.value)
+        for name, morsel in client.cookies.items()
+    )
+
+    senders = {
+        "wsgi": lambda path: self._wsgi_request(wsgi_application, path, cookie),
+        "asgi": lambda path: self._asgi_request(asgi_application, path, cookie),
+    }
+    concurrency = max(options['concurrency'], 1)
+    count = max(options['requests'], 1)
+    warmup = max(options['warmup'], 0)
+
+    results = {}
+    for endpoint in options['endpoint'] or ENDPOINTS:
+      results[endpoint] = {}
+      for deployment, path in self._create_paths(item)[endpoint].items():
+        drive = getattr(self, "_drive_" + deployment)
+        send = senders[deployment]
+        drive(send, path, warmup, concurrency)
+        statuses, latencies, elapsed = drive(send, path, count, concurrency)
+        results[endpoint][deployment] = self._summarize(
+            "%s %s" % (deployment, endpoint),
+            path,
+            statuses,
+            latencies,
+            elapsed,
+        )
+    shutdown_executors()
+
+    self._write(
+        {
+            "label": options['label'],
+            "created": now().isoformat(),
+            "user": user.username,
+            "concurrency": concurrency,
+            "endpoints": results,
+        },
+        options['output'],
+    )
+
+  @staticmethod
+  def _create_paths(item):
+    return {
+        "item_list": {
+            "wsgi": reverse("v1:items-supplementary-list"),
+            "asgi": reverse("async_v1:items-list"),
+        },
+        "item_detail": {
+            "wsgi": reverse("v1:items-detail", args=[item.id]),
+            "asgi": reverse("async_v1:items-detail", args=[item.id]),
+        },
+        "item_activity": {
+            "wsgi": reverse("v1:items-activity", args=[item.id]),
+            "asgi": reverse("async_v1:items-activity", args=[item.id]),
+        },
+        "suggestions": {
+            "wsgi": reverse("v1:suggestions-list"),
+            "asgi": reverse("async_v1:suggestions-list"),
+        },
+        "timezones": {
+            "wsgi": reverse("user:timezones"),
+            "asgi": reverse("async_v1:timezones"),
+        },
+    }
+
+  @staticmethod
+  def _drive_wsgi(send, path, count, concurrency):
+
+    def timed(_):
+      start = perf_counter()
+      status = send(path)
+      return status, perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+      start = perf_counter()
+      responses = list(executor.map(timed, range(count)))
+      elapsed = perf_counter() - start
+      close_connections(executor, concurrency)
+
+    statuses, latencies = zip(*responses) if responses else ((), ())
+    return statuses, latencies, elapsed
+
+  @staticmethod
+  def _drive_asgi(send, path, count, concurrency):
+
+    async def drive():
+      semaphore = asyncio.Semaphore(concurrency)
+
+      async def timed():
+        async with semaphore:
+          start = perf_counter()
+          status = await send(path)
+          return status, perf_counter() - start
+
+      start = perf_counter()
+      responses = await asyncio.gather(*(timed() for _ in range(count)))
+      return responses, perf_counter() - start
+
+    responses, elapsed = asyncio.run(drive())
+    statuses, latencies = zip(*responses) if responses else ((), ())
+    return statuses, latencies, elapsed
+
+  @staticmethod
+  def _wsgi_request(application, path, cookie):
+    environ = {}
+    setup_testing_defaults(environ)
+    environ.update(
+        HTTP_COOKIE=cookie,
+        HTTP_HOST=HOST,
+        PATH_INFO=path,
+        SERVER_NAME=HOST,
+    )
+    status = []
+    response = application(
+        environ,
+        lambda response_status, headers: status.append(response_status),
+    )
+    b"".join(response)
+    response.close()
+    return int(status[0].split()[0])
+
+  @staticmethod
+  async def _asgi_request(application, path, cookie):
+    messages = []
+
+    async def receive():
+      return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+      messages.append(message)
+
+    await application(
+        {
+            "type": "http",
+            "asgi": {
+                "version": "3.0"
+            },
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", HOST.encode()),
+                (b"cookie", cookie.encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": (HOST, 80),
+        },
+        receive,
+        send,
+    )
+    return messages[0]["status"]
+
+  def _summarize(self, endpoint, path, statuses, latencies, elapsed):
+    errors = len([status for status in statuses if status >= 400])
+    if errors:
+      self.stderr.write(
+          self.style.WARNING(
+              STATUS_ERROR_MESSAGE.format(endpoint=endpoint, errors=errors)
+          )
+      )
+
+    result = {"path": path, "errors": errors}
+    result.update(summarize(latencies, elapsed))
+    return result
+
+  def _write(self, results, output):
+    content = json.dumps(results, indent=2)
+    if output is None:
+      self.stdout.write(content)
+      return
+    with open(output, "w", encoding="utf-8") as file_handle:
+      file_handle.write(content + "\n")
@@ -0,0 +1,94 @@
+"""A management command to benchmark validated and trusted item saves."""
+
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ...models.item import Item
+from ...models.shelf import Shelf
+from utilities.models.validators.trusted import trusted_write
+
+DEFAULT_SAVES = 200
+BENCHMARK_ITEM_NAME = "Benchmark Item"
+BENCHMARK_SHELF_NAME = "Benchmark Shelf"
+ERROR_MESSAGE = 'The specified user does not exist.'
+RESULT_MESSAGE = "{mode}: {total:.2f} ms total, {mean:.3f} ms per save"
+SAVING_MESSAGE = "Trusted writes save {saving:.3f} ms per save ({percent:.1f}%)."
+
+
+class Command(BaseCommand):
+  """Management command that benchmarks validated and trusted item saves."""
+
+  help = (
+      'Compares the cost of validated item saves to trusted system saves. '
+      'All changes are rolled back.'
+  )
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        'user',
+        nargs=1,
+        type=str,
+    )
+    parser.add_argument(
+        '--saves',
+        type=int,
+        default=DEFAULT_SAVES,
+        help='The number of saves to time in each mode.',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    username = options['user'][0]
+    saves = max(options['saves'], 1)
+
+    try:
+      user = get_user_model().objects.get(username=username)
+    except ObjectDoesNotExist:
+      self.stderr.write(self.style.ERROR(ERROR_MESSAGE))
+      return
+
+    with transaction.atomic():
+      item = self._create_item(user)
+      validated = self._time_saves(item, saves)
+      with trusted_write():
+        trusted = self._time_saves(item, saves)
+      transaction.set_rollback(True)
+
+    self._report("validated", validated, saves)
+    self._report("trusted", trusted, saves)
+    saving = (validated - trusted) / saves
+    self.stdout.write(
+        self.style.SUCCESS(
+            SAVING_MESSAGE.format(
+                saving=saving,
+                percent=100 * (validated - trusted) / validated,
+            )
+        )
+    )
+
+  @staticmethod
+  def _create_item(user):
+    shelf = Shelf.objects.create(user=user, name=BENCHMARK_SHELF_NAME)
+    return Item.objects.create(
+        user=user,
+        name=BENCHMARK_ITEM_NAME,
+        price=1,
+        shelf=shelf,
+    )
+
+  @staticmethod
+  def _time_saves(item, saves):
+    start = perf_counter()
+    for _ in range(saves):
+      item.save()
+    return (perf_counter() - start) * 1000
+
+  def _report(self, mode, total, saves):
+    self.stdout.write(
+        RESULT_MESSAGE.format(mode=mode, total=total, mean=total / saves)
+    )
@@ -0,0 +1,39 @@
+"""A management command to export a user's kitchen data."""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ...models.item import Item
+
+ERROR_MESSAGE = 'The specified user does not exist.'
+
+
+class Command(BaseCommand):
+  """Management command that exports a user's kitchen data as JSON lines."""
+
+  help = "Exports a user's items, transactions and inventory as JSON lines."
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        'user',
+        nargs=1,
+        type=str,
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    username = options['user'][0]
+
+    try:
+      user = get_user_model().objects.get(username=username)
+    except ObjectDoesNotExist:
+      self.stderr.write(self.style.ERROR(ERROR_MESSAGE))
+      return
+
+    for record in Item.objects.export(user):
+      self.stdout.write(json.dumps(record, cls=DjangoJSONEncoder))
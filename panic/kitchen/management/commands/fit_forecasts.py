@@ -0,0 +1,30 @@
+"""A management command to fit the consumption forecasts of all items."""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from ...models.forecast import Forecast
+
+MESSAGE_FITTING = "Fitting consumption forecasts..."
+MESSAGE_FITTED = "Fitted {count} forecasts for {username}."
+MESSAGE_SUCCESS = "Consumption forecasts have been fitted!"
+
+
+class Command(BaseCommand):
+  """Management command that fits the consumption forecasts of all items."""
+
+  help = 'Fits (or incrementally refits) the consumption forecasts of items.'
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+
+    self.stdout.write(MESSAGE_FITTING)
+
+    users = get_user_model().objects.filter(item__isnull=False).distinct()
+    for user in users.order_by('pk').iterator():
+      forecasts = Forecast.objects.fit(user)
+      self.stdout.write(
+          MESSAGE_FITTED.format(count=len(forecasts), username=user.username)
+      )
+
+    self.stdout.write(self.style.SUCCESS(MESSAGE_SUCCESS))
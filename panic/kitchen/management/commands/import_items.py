@@ -0,0 +1,96 @@
+"""A management command to bulk import items for a user."""
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ParseError
+
+from ...exceptions import UniqueNameConstraintError
+from ...models.item import Item
+from ...parsers import read_csv_records, read_json_lines_records
+from ...serializers.item_import import ItemImportRecordSerializer
+
+CONFLICT_MESSAGE = (
+    'Some of these names were created while importing, please try again.'
+)
+ERROR_MESSAGE = 'The specified user does not exist.'
+SUCCESS_MESSAGE = 'Imported {created} items, skipped {skipped} duplicates.'
+
+READERS = {
+    'csv': read_csv_records,
+    'jsonl': read_json_lines_records,
+}
+
+
+class Command(BaseCommand):
+  """Management command that bulk imports items from a CSV or JSONL file."""
+
+  help = 'Bulk imports items for a user from a CSV or JSON lines file.'
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        'user',
+        nargs=1,
+        type=str,
+    )
+    parser.add_argument(
+        'path',
+        nargs=1,
+        type=str,
+    )
+    parser.add_argument(
+        '--format',
+        choices=sorted(READERS),
+        default=None,
+        help='The file format (defaults to the file extension).',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    username = options['user'][0]
+    path = options['path'][0]
+
+    try:
+      user = get_user_model().objects.get(username=username)
+    except ObjectDoesNotExist:
+      self.stderr.write(self.style.ERROR(ERROR_MESSAGE))
+      return
+
+    records = self._read(path, options['format'])
+    serializer = ItemImportRecordSerializer(data=records, many=True)
+    if not serializer.is_valid():
+      raise CommandError(self._format_errors(serializer.errors))
+
+    try:
+      result = Item.objects.bulk_import(user, serializer.validated_data)
+    except UniqueNameConstraintError as exc:
+      raise CommandError(CONFLICT_MESSAGE) from exc
+    self.stdout.write(
+        self.style.SUCCESS(
+            SUCCESS_MESSAGE.format(
+                created=len(result['created']),
+                skipped=len(result['skipped']),
+            )
+        )
+    )
+
+  @staticmethod
+  def _read(path, file_format):
+    if file_format is None:
+      file_format = path.rsplit('.', 1)[-1].lower()
+    if file_format not in READERS:
+      raise CommandError(f"Unsupported file format: '{file_format}'.")
+
+    try:
+      with open(path, 'rb') as file_handle:
+        return READERS[file_format](file_handle)
+    except (OSError, ParseError) as exc:
+      raise CommandError(str(exc)) from exc
+
+  @staticmethod
+  def _format_errors(errors):
+    return "\n".join(
+        f"Record {index + 1}: {error}" for index, error in enumerate(errors)
+        if error
+    )
@@ -0,0 +1,100 @@
+"""A management command to create a large, realistic benchmark dataset."""
+
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from ...tests.fixtures.benchmark_testdata import (
+    BenchmarkDataConfiguration,
+    BenchmarkDataGenerator,
+)
+
+ERROR_MESSAGE = 'Users with the prefix "{prefix}" already exist.'
+SUCCESS_MESSAGE = (
+    'Benchmark data created for {users} users in {seconds:.1f} seconds.'
+)
+
+
+class Command(BaseCommand):
+  """Management command that loads a benchmark dataset into the database."""
+
+  help = (
+      'Creates users with years of purchase and consumption history, for '
+      'benchmarking realistic production data locally.'
+  )
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    defaults = BenchmarkDataConfiguration
+    parser.add_argument(
+        '--users',
+        type=int,
+        default=defaults.number_of_users,
+        help='The number of users to create.',
+    )
+    parser.add_argument(
+        '--items',
+        type=int,
+        default=defaults.number_of_items,
+        help='The number of items to create for each user.',
+    )
+    parser.add_argument(
+        '--stores',
+        type=int,
+        default=defaults.number_of_stores,
+        help='The number of stores to create for each user.',
+    )
+    parser.add_argument(
+        '--years',
+        type=int,
+        default=defaults.years,
+        help='The number of years of transaction history to create.',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=defaults.seed,
+        help='The random seed, for reproducible datasets.',
+    )
+    parser.add_argument(
+        '--prefix',
+        type=str,
+        default=defaults.username_prefix,
+        help='The prefix of the created usernames.',
+    )
+    parser.add_argument(
+        '--no-summaries',
+        action='store_true',
+        help='Skip building spending summaries, forecasts and waste.',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    config = BenchmarkDataConfiguration()
+    config.number_of_users = max(options['users'], 1)
+    config.number_of_items = max(options['items'], 1)
+    config.number_of_stores = max(options['stores'], 1)
+    config.years = max(options['years'], 1)
+    config.seed = options['seed']
+    config.username_prefix = options['prefix']
+    config.summarize = not options['no_summaries']
+
+    if get_user_model().objects.filter(
+        username__startswith=config.username_prefix,
+    ).exists():
+      self.stderr.write(
+          self.style.ERROR(ERROR_MESSAGE.format(prefix=config.username_prefix))
+      )
+      return
+
+    start = perf_counter()
+    BenchmarkDataGenerator(config).generate_data()
+    self.stdout.write(
+        self.style.SUCCESS(
+            SUCCESS_MESSAGE.format(
+                users=config.number_of_users,
+                seconds=perf_counter() - start,
+            )
+        )
+    )
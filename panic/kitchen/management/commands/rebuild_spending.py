@@ -0,0 +1,44 @@
+"""A management command to rebuild the monthly spending summaries."""
+
+from django.core.management.base import BaseCommand
+
+from ...models.spending_summary import SpendingSummary
+from utilities.management.shared.confirmation import ManagementConfirmation
+
+MESSAGE_REBUILDING = "Rebuilding Spending Summaries..."
+MESSAGE_SUCCESS = "Spending summaries have been rebuilt!"
+
+
+class Command(BaseCommand):
+  """Management command that rebuilds the monthly spending summaries."""
+
+  help = (
+      'Rebuilds the monthly spending summaries from transactions, wiping them '
+      'first.'
+  )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+
+    confirm = Confirmation()
+
+    if not confirm.are_you_sure():
+      return
+
+    self.stdout.write(MESSAGE_REBUILDING)
+    SpendingSummary.objects.rebuild(confirm=True)
+
+    self.stdout.write(self.style.SUCCESS(MESSAGE_SUCCESS))
+
+
+class Confirmation(ManagementConfirmation):
+  """Confirmation dialogue."""
+
+  confirm_message = (
+      "This command will erase and rebuild all Spending Summaries from "
+      "Transaction data.\n"
+      "As such, it should only be attempted during a "
+      "scheduled maintenance window.\n"
+      "Are you absolutely sure you wish to proceed [Y/n] ? "
+  )
+  confirm_yes = "Y"
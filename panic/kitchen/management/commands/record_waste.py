@@ -0,0 +1,30 @@
+"""A management command to record expired inventory in the Waste ledger."""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from ...models.waste import Waste
+
+MESSAGE_RECORDING = "Recording expired inventory as waste..."
+MESSAGE_RECORDED = "Recorded {count} expired purchases for {username}."
+MESSAGE_SUCCESS = "Expired inventory has been recorded!"
+
+
+class Command(BaseCommand):
+  """Management command that records expired inventory as waste."""
+
+  help = 'Records newly expired inventory in the Waste ledger.'
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+
+    self.stdout.write(MESSAGE_RECORDING)
+
+    users = get_user_model().objects.filter(item__isnull=False).distinct()
+    for user in users.order_by('pk').iterator():
+      waste = Waste.objects.record_expired(user)
+      self.stdout.write(
+          MESSAGE_RECORDED.format(count=len(waste), username=user.username)
+      )
+
+    self.stdout.write(self.style.SUCCESS(MESSAGE_SUCCESS))
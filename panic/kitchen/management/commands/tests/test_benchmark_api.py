@@ -0,0 +1,143 @@
+"""Test benchmark_api management command."""
+
+import json
+import os
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from ....models.inventory import Inventory
+from ....models.item import Item
+from ....models.spending_summary import SpendingSummary
+from ....models.transaction import Transaction
+from ....tests.fixtures.benchmark_testdata import (
+    BenchmarkDataConfiguration,
+    BenchmarkDataGenerator,
+)
+from ..benchmark_api import ENDPOINTS, ERROR_MESSAGE, LOGIN_ERROR_MESSAGE
+
+
+class TestDataConfiguration(BenchmarkDataConfiguration):
+  """Test configuration for benchmark data generation."""
+
+  number_of_items = 2
+  number_of_users = 1
+  summarize = False
+  username_prefix = "created_benchmark_user"
+  years = 1
+
+
+class CommandTestInvalid(TestCase):
+  """Test the benchmark_api command with an invalid user."""
+
+  def test_invalid_user_specified_stdout(self):
+    output_stdout = StringIO()
+    output_stderr = StringIO()
+    call_command(
+        'benchmark_api',
+        "--user=non-existent-user",
+        stdout=output_stdout,
+        stderr=output_stderr,
+        no_color=True
+    )
+
+    self.assertIn(ERROR_MESSAGE, output_stderr.getvalue())
+    self.assertEqual(output_stdout.getvalue(), "")
+
+
+class CommandTestValid(TestCase):
+  """Test the benchmark_api command with a seeded user."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.test_config = TestDataConfiguration()
+    BenchmarkDataGenerator(config=cls.test_config).generate_data()
+    cls.user = get_user_model().objects.get(
+        username=cls.test_config.username_prefix + "0"
+    )
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+
+  def call_command(self, *args):
+    call_command(
+        'benchmark_api',
+        "--user=" + self.user.username,
+        "--requests=2",
+        "--warmup=0",
+        *args,
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True
+    )
+
+  def test_invalid_password(self):
+    self.call_command("--password=invalid")
+
+    self.assertIn(LOGIN_ERROR_MESSAGE, self.output_stderr.getvalue())
+    self.assertEqual(self.output_stdout.getvalue(), "")
+
+  def test_reports_each_endpoint(self):
+    self.call_command("--label=abc123")
+    results = json.loads(self.output_stdout.getvalue())
+
+    self.assertEqual(results['label'], "abc123")
+    self.assertEqual(results['user'], self.user.username)
+    self.assertEqual(list(results['endpoints']), list(ENDPOINTS))
+    for result in results['endpoints'].values():
+      self.assertEqual(result['errors'], 0)
+      self.assertEqual(result['requests'], 2)
+      self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+      self.assertLessEqual(result['p95_ms'], result['p99_ms'])
+      self.assertGreater(result['throughput_rps'], 0)
+    self.assertEqual(self.output_stderr.getvalue(), "")
+
+  def test_selected_endpoints(self):
+    self.call_command("--endpoint=shelf_list", "--endpoint=store_list")
+    results = json.loads(self.output_stdout.getvalue())
+
+    self.assertEqual(
+        list(results['endpoints']),
+        ["shelf_list", "store_list"],
+    )
+
+  def test_writes_output_file(self):
+    with TemporaryDirectory() as temp_dir:
+      output = os.path.join(temp_dir, "results.json")
+      self.call_command("--endpoint=item_list", "--output=" + output)
+
+      with open(output, encoding="utf-8") as file_handle:
+        results = json.load(file_handle)
+
+    self.assertIn("item_list", results['endpoints'])
+    self.assertEqual(self.output_stdout.getvalue(), "")
+
+  def test_changes_are_undone(self):
+    transactions = Transaction.objects.count()
+    inventory = Inventory.objects.count()
+    items = list(Item.objects.order_by('pk').values())
+    spending = list(SpendingSummary.objects.order_by('pk').values())
+
+    self.call_command("--endpoint=transaction_create")
+
+    self.assertEqual(Transaction.objects.count(), transactions)
+    self.assertEqual(Inventory.objects.count(), inventory)
+    self.assertListEqual(list(Item.objects.order_by('pk').values()), items)
+    self.assertListEqual(
+        list(SpendingSummary.objects.order_by('pk').values()),
+        spending,
+    )
+
+  def test_login_is_undone(self):
+    last_login = get_user_model().objects.get(pk=self.user.pk).last_login
+
+    self.call_command("--endpoint=auth_login")
+
+    self.assertEqual(
+        get_user_model().objects.get(pk=self.user.pk).last_login,
+        last_login,
+    )
@@ -0,0 +1,107 @@
+"""Test benchmark_async management command."""
+
+import json
+import os
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+
+from ....tests.fixtures.benchmark_testdata import (
+    BenchmarkDataConfiguration,
+    BenchmarkDataGenerator,
+)
+from ..benchmark_api import ERROR_MESSAGE, LOGIN_ERROR_MESSAGE
+from ..benchmark_async import ENDPOINTS
+
+
+class TestDataConfiguration(BenchmarkDataConfiguration):
+  """Test configuration for benchmark data generation."""
+
+  number_of_items = 2
+  number_of_users = 1
+  summarize = False
+  username_prefix = "created_benchmark_user"
+  years = 1
+
+
+class CommandTestInvalid(TestCase):
+  """Test the benchmark_async command with an invalid user."""
+
+  def test_invalid_user_specified_stdout(self):
+    output_stdout = StringIO()
+    output_stderr = StringIO()
+    call_command(
+        'benchmark_async',
+        "--user=non-existent-user",
+        stdout=output_stdout,
+        stderr=output_stderr,
+        no_color=True
+    )
+
+    self.assertIn(ERROR_MESSAGE, output_stderr.getvalue())
+    self.assertEqual(output_stdout.getvalue(), "")
+
+
+class CommandTestValid(TransactionTestCase):
+  """Test the benchmark_async command with a seeded user."""
+
+  def setUp(self):
+    self.test_config = TestDataConfiguration()
+    BenchmarkDataGenerator(config=self.test_config).generate_data()
+    self.user = get_user_model().objects.get(
+        username=self.test_config.username_prefix + "0"
+    )
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+
+  def call_command(self, *args):
+    call_command(
+        'benchmark_async',
+        "--user=" + self.user.username,
+        "--concurrency=2",
+        "--requests=3",
+        "--warmup=0",
+        *args,
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True
+    )
+
+  def test_invalid_password(self):
+    self.call_command("--password=invalid")
+
+    self.assertIn(LOGIN_ERROR_MESSAGE, self.output_stderr.getvalue())
+    self.assertEqual(self.output_stdout.getvalue(), "")
+
+  def test_reports_each_endpoint(self):
+    self.call_command("--label=abc123")
+    results = json.loads(self.output_stdout.getvalue())
+
+    self.assertEqual(results['label'], "abc123")
+    self.assertEqual(results['user'], self.user.username)
+    self.assertEqual(results['concurrency'], 2)
+    self.assertEqual(list(results['endpoints']), list(ENDPOINTS))
+    for deployments in results['endpoints'].values():
+      self.assertEqual(list(deployments), ["wsgi", "asgi"])
+      for result in deployments.values():
+        self.assertEqual(result['errors'], 0)
+        self.assertEqual(result['requests'], 3)
+        self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+        self.assertLessEqual(result['p95_ms'], result['p99_ms'])
+        self.assertGreater(result['throughput_rps'], 0)
+    self.assertEqual(self.output_stderr.getvalue(), "")
+
+  def test_writes_output_file(self):
+    with TemporaryDirectory() as temp_dir:
+      output = os.path.join(temp_dir, "results.json")
+      self.call_command("--endpoint=timezones", "--output=" + output)
+
+      with open(output, encoding="utf-8") as file_handle:
+        results = json.load(file_handle)
+
+    self.assertEqual(list(results['endpoints']), ["timezones"])
+    self.assertTrue(results['endpoints']['timezones']['asgi']['path'])
+    self.assertEqual(self.output_stdout.getvalue(), "")
@@ -0,0 +1,66 @@
+"""Test benchmark_saves management command."""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from ....models.item import Item
+from ..benchmark_saves import ERROR_MESSAGE
+
+
+class CommandTestInvalid(TestCase):
+  """Test the benchmark_saves command with an invalid user."""
+
+  def test_invalid_user_specified_stdout(self):
+    output_stdout = StringIO()
+    output_stderr = StringIO()
+    call_command(
+        'benchmark_saves',
+        "non-existent-user",
+        stdout=output_stdout,
+        stderr=output_stderr,
+        no_color=True
+    )
+
+    self.assertIn(
+        ERROR_MESSAGE,
+        output_stderr.getvalue(),
+    )
+    self.assertEqual(output_stdout.getvalue(), "")
+
+
+class CommandTestValid(TestCase):
+  """Test the benchmark_saves command with a valid user."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.user = get_user_model().objects.create_user(
+        username="created_test_user",
+        email="created_test_user@niallbyrne.ca",
+        password="test123",
+    )
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+    call_command(
+        'benchmark_saves',
+        self.user.username,
+        "--saves=2",
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True
+    )
+
+  def test_reports_each_mode(self):
+    stdout_capture = self.output_stdout.getvalue()
+
+    self.assertIn("validated:", stdout_capture)
+    self.assertIn("trusted:", stdout_capture)
+    self.assertIn("Trusted writes save", stdout_capture)
+    self.assertEqual(self.output_stderr.getvalue(), "")
+
+  def test_changes_are_rolled_back(self):
+    self.assertFalse(Item.objects.filter(user=self.user).exists())
@@ -0,0 +1,57 @@
+"""Test export_items management command."""
+
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from ....models.item import Item
+from ..export_items import ERROR_MESSAGE
+
+
+class CommandTest(TestCase):
+  """Test the export_items management command."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.user = get_user_model().objects.create_user(
+        username="created_test_user",
+        email="created_test_user@niallbyrne.ca",
+        password="test123",
+    )
+    cls.item = Item.objects.create(
+        name="Rice",
+        user=cls.user,
+        price=1.00,
+    )
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+
+  def test_invalid_user(self):
+    call_command(
+        'export_items',
+        "non-existent-user",
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True,
+    )
+
+    self.assertIn(ERROR_MESSAGE, self.output_stderr.getvalue())
+    self.assertEqual(self.output_stdout.getvalue(), "")
+
+  def test_export(self):
+    call_command(
+        'export_items',
+        self.user.username,
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True,
+    )
+
+    lines = self.output_stdout.getvalue().splitlines()
+    self.assertEqual(len(lines), 1)
+    self.assertEqual(json.loads(lines[0])["data"]["id"], self.item.id)
@@ -0,0 +1,55 @@
+"""Test fit_forecasts management command."""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from ....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from .. import fit_forecasts as command_module
+from ..fit_forecasts import MESSAGE_FITTED, MESSAGE_FITTING, MESSAGE_SUCCESS
+
+COMMAND_MODULE = command_module.__name__
+
+
+class TestCommand(TransactionTestHarness):
+  """Test the fit_forecasts command."""
+
+  @classmethod
+  def create_data_hook(cls):
+    cls.user2 = cls.create_dependencies(2)['user']
+    get_user_model().objects.create_user(
+        username="testuser3",
+        email="test3@niallbyrne.ca",
+        password="test123",
+    )
+
+  def _call_command(self):
+    output = StringIO()
+    call_command('fit_forecasts', stdout=output, no_color=True)
+    return output.getvalue()
+
+  @patch(COMMAND_MODULE + '.Forecast.objects.fit', return_value=[])
+  def test_fits_users_with_items(self, m_fit):
+    self._call_command()
+
+    self.assertListEqual(
+        [call.args for call in m_fit.call_args_list],
+        [(self.user1,), (self.user2,)],
+    )
+
+  @patch(COMMAND_MODULE + '.Forecast.objects.fit', return_value=[None])
+  def test_output(self, _):
+    output = self._call_command()
+
+    self.assertEqual(
+        output,
+        "\n".join([
+            MESSAGE_FITTING,
+            MESSAGE_FITTED.format(count=1, username=self.user1.username),
+            MESSAGE_FITTED.format(count=1, username=self.user2.username),
+            MESSAGE_SUCCESS,
+            "",
+        ]),
+    )
@@ -0,0 +1,102 @@
+"""Test import_items management command."""
+
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ....exceptions import UniqueNameConstraintError
+from ....models.item import Item
+from ..import_items import CONFLICT_MESSAGE, ERROR_MESSAGE, SUCCESS_MESSAGE
+
+
+class CommandTest(TestCase):
+  """Test the import_items management command."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.user = get_user_model().objects.create_user(
+        username="created_test_user",
+        email="created_test_user@niallbyrne.ca",
+        password="test123",
+    )
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+    self.directory = tempfile.TemporaryDirectory()
+
+  def tearDown(self):
+    self.directory.cleanup()
+
+  def _write(self, filename, content):
+    path = os.path.join(self.directory.name, filename)
+    with open(path, "w", encoding="utf-8") as file_handle:
+      file_handle.write(content)
+    return path
+
+  def _call(self, *args, **kwargs):
+    call_command(
+        'import_items',
+        *args,
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True,
+        **kwargs,
+    )
+
+  def test_invalid_user(self):
+    path = self._write("items.csv", "name,price\nRice,1.00\n")
+
+    self._call("non-existent-user", path)
+
+    self.assertIn(ERROR_MESSAGE, self.output_stderr.getvalue())
+    self.assertFalse(Item.objects.exists())
+
+  def test_import_csv(self):
+    path = self._write("items.csv", "name,price\nRice,1.00\nrice,1.00\n")
+
+    self._call(self.user.username, path)
+
+    self.assertIn(
+        SUCCESS_MESSAGE.format(created=1, skipped=1),
+        self.output_stdout.getvalue(),
+    )
+    self.assertTrue(Item.objects.filter(name="Rice").exists())
+
+  def test_import_json_lines_with_format(self):
+    path = self._write("items.txt", '{"name": "Rice", "price": "1.00"}\n')
+
+    self._call(self.user.username, path, format="jsonl")
+
+    self.assertTrue(Item.objects.filter(name="Rice").exists())
+
+  def test_unsupported_format(self):
+    path = self._write("items.xls", "")
+
+    with self.assertRaises(CommandError):
+      self._call(self.user.username, path)
+
+  def test_invalid_records(self):
+    path = self._write("items.csv", "name\nRice\n")
+
+    with self.assertRaises(CommandError) as raised:
+      self._call(self.user.username, path)
+
+    self.assertIn("Record 1", str(raised.exception))
+    self.assertFalse(Item.objects.exists())
+
+  @mock.patch.object(Item.objects, "bulk_import")
+  def test_concurrently_created_names(self, m_import):
+    m_import.side_effect = UniqueNameConstraintError("name")
+    path = self._write("items.csv", "name,price\nRice,1.00\n")
+
+    with self.assertRaises(CommandError) as raised:
+      self._call(self.user.username, path)
+
+    self.assertEqual(str(raised.exception), CONFLICT_MESSAGE)
@@ -0,0 +1,92 @@
+"""Test load_benchmark_data management command."""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from .... import management
+from ..load_benchmark_data import ERROR_MESSAGE
+
+MANAGEMENT_MODULE = management.__name__
+
+
+class CommandTestExistingUsers(TestCase):
+  """Test the load_benchmark_data command with existing users."""
+
+  @classmethod
+  def setUpTestData(cls):
+    get_user_model().objects.create_user(
+        username="benchmark_user0",
+        email="benchmark_user0@niallbyrne.ca",
+        password="test123",
+    )
+
+  @patch(
+      f"{MANAGEMENT_MODULE}.commands.load_benchmark_data."
+      "BenchmarkDataGenerator"
+  )
+  def test_existing_users_stderr(self, generator):
+    output_stdout = StringIO()
+    output_stderr = StringIO()
+    call_command(
+        'load_benchmark_data',
+        stdout=output_stdout,
+        stderr=output_stderr,
+        no_color=True
+    )
+
+    self.assertIn(
+        ERROR_MESSAGE.format(prefix="benchmark_user"),
+        output_stderr.getvalue(),
+    )
+    self.assertEqual(output_stdout.getvalue(), "")
+    generator.assert_not_called()
+
+
+class CommandTestValid(TestCase):
+  """Test the load_benchmark_data command with valid options."""
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+
+    with patch(
+        f"{MANAGEMENT_MODULE}.commands.load_benchmark_data."
+        "BenchmarkDataGenerator"
+    ) as generator:
+      self.generator = generator
+      call_command(
+          'load_benchmark_data',
+          "--users=3",
+          "--items=4",
+          "--stores=2",
+          "--years=5",
+          "--seed=7",
+          "--prefix=created_user",
+          "--no-summaries",
+          stdout=self.output_stdout,
+          stderr=self.output_stderr,
+          no_color=True
+      )
+
+  def test_configures_the_generator(self):
+    config = self.generator.call_args[0][0]
+
+    self.assertEqual(config.number_of_users, 3)
+    self.assertEqual(config.number_of_items, 4)
+    self.assertEqual(config.number_of_stores, 2)
+    self.assertEqual(config.years, 5)
+    self.assertEqual(config.seed, 7)
+    self.assertEqual(config.username_prefix, "created_user")
+    self.assertFalse(config.summarize)
+
+  def test_generates_data(self):
+    self.generator.return_value.generate_data.assert_called_once_with()
+    self.assertIn(
+        "Benchmark data created for 3 users",
+        self.output_stdout.getvalue(),
+    )
+    self.assertEqual(self.output_stderr.getvalue(), "")
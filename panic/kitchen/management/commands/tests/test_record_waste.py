@@ -0,0 +1,55 @@
+"""Test record_waste management command."""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from ....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from .. import record_waste as command_module
+from ..record_waste import MESSAGE_RECORDED, MESSAGE_RECORDING, MESSAGE_SUCCESS
+
+COMMAND_MODULE = command_module.__name__
+
+
+class TestCommand(TransactionTestHarness):
+  """Test the record_waste command."""
+
+  @classmethod
+  def create_data_hook(cls):
+    cls.user2 = cls.create_dependencies(2)['user']
+    get_user_model().objects.create_user(
+        username="testuser3",
+        email="test3@niallbyrne.ca",
+        password="test123",
+    )
+
+  def _call_command(self):
+    output = StringIO()
+    call_command('record_waste', stdout=output, no_color=True)
+    return output.getvalue()
+
+  @patch(COMMAND_MODULE + '.Waste.objects.record_expired', return_value=[])
+  def test_records_users_with_items(self, m_record):
+    self._call_command()
+
+    self.assertListEqual(
+        [call.args for call in m_record.call_args_list],
+        [(self.user1,), (self.user2,)],
+    )
+
+  @patch(COMMAND_MODULE + '.Waste.objects.record_expired', return_value=[None])
+  def test_output(self, _):
+    output = self._call_command()
+
+    self.assertEqual(
+        output,
+        "\n".join([
+            MESSAGE_RECORDING,
+            MESSAGE_RECORDED.format(count=1, username=self.user1.username),
+            MESSAGE_RECORDED.format(count=1, username=self.user2.username),
+            MESSAGE_SUCCESS,
+            "",
+        ]),
+    )
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-10-19 12:00
+
+from django.db import migrations
+
+UNIQUE_LOWER_NAME_TABLES = (
+    'kitchen_item',
+    'kitchen_shelf',
+    'kitchen_store',
+)
+
+
+def create_index(table):
+  return (
+      f'CREATE UNIQUE INDEX "{table}_user_lower_name_uniq" '
+      f'ON "{table}" ("user_id", lower("name"));'
+  )
+
+
+def drop_index(table):
+  return f'DROP INDEX "{table}_user_lower_name_uniq";'
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      ('kitchen', '0012_restrict_deletes_20210926_0330'),
+  ]
+
+  operations = [
+      migrations.RunSQL(
+          sql=create_index(table),
+          reverse_sql=drop_index(table),
+      ) for table in UNIQUE_LOWER_NAME_TABLES
+  ]
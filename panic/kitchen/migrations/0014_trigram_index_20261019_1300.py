@@ -0,0 +1,60 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:00
+
+import logging
+
+from django.db import migrations
+
+TRIGRAM_INDEX_TABLES = (
+    'kitchen_item',
+    'kitchen_shelf',
+    'kitchen_store',
+)
+
+UNAVAILABLE_MESSAGE = (
+    "The pg_trgm extension is not available on this PostgreSQL server, so the "
+    "trigram indexes were not created, and similarity searches will be "
+    "matched in memory.  Install the PostgreSQL contrib package, then roll "
+    "back and run this migration again."
+)
+
+logger = logging.getLogger(__name__)
+
+
+def trigram_available(schema_editor):
+  with schema_editor.connection.cursor() as cursor:
+    cursor.execute(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm';"
+    )
+    return cursor.fetchone() is not None
+
+
+def create_indexes(apps, schema_editor):
+  if schema_editor.connection.vendor != 'postgresql':
+    return
+  if not trigram_available(schema_editor):
+    logger.error(UNAVAILABLE_MESSAGE)
+    return
+  schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+  for table in TRIGRAM_INDEX_TABLES:
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{table}_index_trgm" '
+        f'ON "{table}" USING gin ("_index" gin_trgm_ops);'
+    )
+
+
+def drop_indexes(apps, schema_editor):
+  if schema_editor.connection.vendor != 'postgresql':
+    return
+  for table in TRIGRAM_INDEX_TABLES:
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_index_trgm";')
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      ('kitchen', '0013_unique_lower_name_20261019_1200'),
+  ]
+
+  operations = [
+      migrations.RunPython(create_indexes, drop_indexes),
+  ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      ('kitchen', '0014_trigram_index_20261019_1300'),
+  ]
+
+  operations = [
+      migrations.CreateModel(
+          name='Forecast',
+          fields=[
+              (
+                  'item',
+                  models.OneToOneField(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      primary_key=True,
+                      related_name='forecast',
+                      serialize=False,
+                      to='kitchen.item'
+                  )
+              ),
+              ('alpha', models.FloatField()),
+              ('rate', models.FloatField(default=0)),
+              (
+                  'fitted_through',
+                  models.DateField(blank=True, default=None, null=True)
+              ),
+              ('pending', models.FloatField(default=0)),
+              (
+                  'pending_date',
+                  models.DateField(blank=True, default=None, null=True)
+              ),
+          ],
+      ),
+  ]
@@ -0,0 +1,118 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+      ('kitchen', '0015_forecast_20261019_1400'),
+  ]
+
+  operations = [
+      migrations.CreateModel(
+          name='WasteSummary',
+          fields=[
+              (
+                  'id',
+                  models.BigAutoField(
+                      auto_created=True,
+                      primary_key=True,
+                      serialize=False,
+                      verbose_name='ID'
+                  )
+              ),
+              (
+                  'cost',
+                  models.DecimalField(
+                      decimal_places=2, default=0, max_digits=12
+                  )
+              ),
+              ('month', models.DateField()),
+              ('quantity', models.FloatField(default=0)),
+              (
+                  'item',
+                  models.ForeignKey(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      to='kitchen.item'
+                  )
+              ),
+              (
+                  'shelf',
+                  models.ForeignKey(
+                      blank=True,
+                      null=True,
+                      on_delete=django.db.models.deletion.SET_NULL,
+                      to='kitchen.shelf'
+                  )
+              ),
+              (
+                  'user',
+                  models.ForeignKey(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      to=settings.AUTH_USER_MODEL
+                  )
+              ),
+          ],
+          options={
+              'verbose_name_plural': 'Waste summaries',
+          },
+      ),
+      migrations.CreateModel(
+          name='Waste',
+          fields=[
+              (
+                  'id',
+                  models.BigAutoField(
+                      auto_created=True,
+                      primary_key=True,
+                      serialize=False,
+                      verbose_name='ID'
+                  )
+              ),
+              ('cost', models.DecimalField(decimal_places=2, max_digits=12)),
+              ('expired', models.DateField()),
+              ('quantity', models.FloatField()),
+              (
+                  'unit_price',
+                  models.DecimalField(decimal_places=2, max_digits=10)
+              ),
+              (
+                  'item',
+                  models.ForeignKey(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      to='kitchen.item'
+                  )
+              ),
+              (
+                  'shelf',
+                  models.ForeignKey(
+                      blank=True,
+                      null=True,
+                      on_delete=django.db.models.deletion.SET_NULL,
+                      to='kitchen.shelf'
+                  )
+              ),
+              (
+                  'transaction',
+                  models.OneToOneField(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      related_name='waste',
+                      to='kitchen.transaction'
+                  )
+              ),
+          ],
+          options={
+              'verbose_name_plural': 'Waste',
+          },
+      ),
+      migrations.AddIndex(
+          model_name='wastesummary',
+          index=models.Index(
+              fields=['user', 'month'], name='kitchen_was_user_id_747891_idx'
+          ),
+      ),
+  ]
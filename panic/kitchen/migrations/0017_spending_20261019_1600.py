@@ -0,0 +1,101 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+
+
+def snapshot_unit_prices(apps, schema_editor):
+  Item = apps.get_model('kitchen', 'Item')
+  Transaction = apps.get_model('kitchen', 'Transaction')
+  Transaction.objects.filter(
+      quantity__gt=0,
+      unit_price__isnull=True,
+  ).update(
+      unit_price=Subquery(
+          Item.objects.filter(pk=OuterRef('item_id')).values('price')[:1]
+      )
+  )
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+      ('kitchen', '0016_waste_20261019_1500'),
+  ]
+
+  operations = [
+      migrations.AddField(
+          model_name='transaction',
+          name='unit_price',
+          field=models.DecimalField(
+              blank=True, decimal_places=2, max_digits=10, null=True
+          ),
+      ),
+      migrations.CreateModel(
+          name='SpendingSummary',
+          fields=[
+              (
+                  'id',
+                  models.BigAutoField(
+                      auto_created=True,
+                      primary_key=True,
+                      serialize=False,
+                      verbose_name='ID'
+                  )
+              ),
+              (
+                  'cost',
+                  models.DecimalField(
+                      decimal_places=2, default=0, max_digits=12
+                  )
+              ),
+              ('month', models.DateField()),
+              ('quantity', models.FloatField(default=0)),
+              (
+                  'item',
+                  models.ForeignKey(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      to='kitchen.item'
+                  )
+              ),
+              (
+                  'shelf',
+                  models.ForeignKey(
+                      blank=True,
+                      null=True,
+                      on_delete=django.db.models.deletion.SET_NULL,
+                      to='kitchen.shelf'
+                  )
+              ),
+              (
+                  'store',
+                  models.ForeignKey(
+                      blank=True,
+                      null=True,
+                      on_delete=django.db.models.deletion.SET_NULL,
+                      to='kitchen.store'
+                  )
+              ),
+              (
+                  'user',
+                  models.ForeignKey(
+                      on_delete=django.db.models.deletion.CASCADE,
+                      to=settings.AUTH_USER_MODEL
+                  )
+              ),
+          ],
+          options={
+              'verbose_name_plural': 'Spending summaries',
+          },
+      ),
+      migrations.AddIndex(
+          model_name='spendingsummary',
+          index=models.Index(
+              fields=['user', 'month'], name='kitchen_spe_user_id_c0bac9_idx'
+          ),
+      ),
+      migrations.RunPython(snapshot_unit_prices, migrations.RunPython.noop),
+  ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.25 on 2026-10-19 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      ('kitchen', '0017_spending_20261019_1600'),
+  ]
+
+  operations = [
+      migrations.AddIndex(
+          model_name='transaction',
+          index=models.Index(
+              fields=['item', 'datetime', 'id'],
+              name='kitchen_tra_item_id_25cde1_idx'
+          ),
+      ),
+  ]
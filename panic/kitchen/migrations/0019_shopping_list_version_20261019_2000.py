@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-19 20:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+      ('kitchen', '0018_transaction_history_20261019_1700'),
+  ]
+
+  operations = [
+      migrations.CreateModel(
+          name='ShoppingListVersion',
+          fields=[
+              (
+                  'user',
+                  models.OneToOneField(
+                      db_constraint=False,
+                      on_delete=django.db.models.deletion.DO_NOTHING,
+                      primary_key=True,
+                      related_name='shopping_list_version',
+                      serialize=False,
+                      to=settings.AUTH_USER_MODEL
+                  )
+              ),
+              ('version', models.BigIntegerField(default=0)),
+          ],
+      ),
+  ]
@@ -2,7 +2,19 @@
 
 import pendulum
 
-from . import inventory, item, shelf, store, suggested, transaction
+from . import (
+    forecast,
+    inventory,
+    item,
+    shelf,
+    shopping_list_version,
+    spending_summary,
+    store,
+    suggested,
+    transaction,
+    waste,
+    waste_summary,
+)
 
 pendulum.week_starts_at(pendulum.SUNDAY)
 pendulum.week_ends_at(pendulum.SATURDAY)
@@ -0,0 +1,84 @@
+"""Forecast model."""
+
+from datetime import timedelta
+
+from django.db import models
+
+from .managers.forecast import ForecastManager
+
+
+class Forecast(models.Model):
+  """Forecast model.
+
+  Stores the exponentially weighted average daily consumption of an Item, as
+  of the end of the last complete local day that was fitted.  Consumption on
+  the current (incomplete) local day is held separately as pending.
+  """
+
+  item = models.OneToOneField(
+      'Item',
+      on_delete=models.CASCADE,
+      primary_key=True,
+      related_name='forecast',
+  )
+  alpha = models.FloatField()
+  rate = models.FloatField(default=0)
+  fitted_through = models.DateField(null=True, blank=True, default=None)
+  pending = models.FloatField(default=0)
+  pending_date = models.DateField(null=True, blank=True, default=None)
+
+  objects = ForecastManager()
+
+  def __str__(self):
+    return "%s units of %s per day" % (
+        round(self.rate, 2),
+        self.item.name,
+    )
+
+  def get_rate(self, date):
+    """Return the daily consumption rate, as of the start of a local date.
+
+    Days since the last fit had no transactions (or the forecast would have
+    been refit), so the rate is decayed over them without querying.
+
+    :param date: The user's local date
+    :type date: :class:`datetime.date`
+
+    :returns: The average daily consumption
+    :rtype: float
+    """
+    rate = self.rate
+    fitted_through = self.fitted_through
+
+    if self.pending_date is not None and self.pending_date < date:
+      if fitted_through is None:
+        rate = self.pending
+      else:
+        rate = rate * self.__decay(fitted_through, self.pending_date)
+        rate = self.alpha * self.pending + (1 - self.alpha) * rate
+      fitted_through = self.pending_date
+
+    if fitted_through is None:
+      return 0.0
+    return rate * self.__decay(fitted_through, date)
+
+  def get_stock_out_date(self, quantity, date):
+    """Return the local date a quantity is projected to be consumed by.
+
+    :param quantity: The quantity in stock
+    :type quantity: float
+    :param date: The user's local date
+    :type date: :class:`datetime.date`
+
+    :returns: The projected date, or None if there is no consumption
+    :rtype: :class:`datetime.date`, None
+    """
+    if quantity <= 0:
+      return date
+    rate = self.get_rate(date)
+    if rate <= 0:
+      return None
+    return date + timedelta(days=int(quantity / rate))
+
+  def __decay(self, fitted_through, date):
+    return (1 - self.alpha)**max((date - fitted_through).days - 1, 0)
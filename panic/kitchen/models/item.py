@@ -1,7 +1,7 @@
 """Item model."""
 
-import pendulum
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils.functional import cached_property
@@ -17,6 +17,7 @@ from .mixins import (
 from .transaction import Transaction
 from naturalsortfield import NaturalSortField
 from spa_security.fields import BlondeCharField
+from user.utilities.request_timezone import local_timezone
 from utilities.models.decorators.caching import PersistentCachedProperty
 
 User = get_user_model()
@@ -109,9 +110,18 @@ class Item(
     :rtype: :class:`django.db.models.QuerySet`, None
     """
     return Transaction.objects.get_activity_last_two_weeks(
-        self.id, zone=self.user.timezone.zone
+        self.id, zone=self.local_timezone
     )
 
+  @property
+  def local_timezone(self):
+    """Return the owning user's timezone, shared with the request if possible.
+
+    :returns: The user's local timezone
+    :rtype: :class:`user.utilities.request_timezone.LocalTimezone`
+    """
+    return local_timezone(self)
+
   @PersistentCachedProperty(ttl_field="next_expiry_datetime")
   def expired(self):
     """Return the sum quantity of all inventory that is expired.
@@ -136,7 +146,7 @@ class Item(
     utc_datetime = self.next_expiry_datetime
 
     if utc_datetime:
-      user_date = utc_datetime.astimezone(self.user.timezone).date()
+      user_date = utc_datetime.astimezone(self.local_timezone.timezone).date()
     return user_date
 
   @cached_property
@@ -150,6 +160,25 @@ class Item(
     """
     return Inventory.objects.get_next_expiry_datetime(self)
 
+  @property
+  def projected_stock_out(self):
+    """Return the date the item's stock is projected to run out, if any.
+
+    The date is based on the item's consumption forecast, in the User's
+    configured tz.
+
+    :returns: A date, or None if there is no forecast consumption.
+    :rtype: None, :class:`datetime.date`
+    """
+    try:
+      forecast = self.forecast
+    except ObjectDoesNotExist:
+      return None
+    return forecast.get_stock_out_date(
+        self.quantity,
+        self.local_timezone.now.date(),
+    )
+
   @PersistentCachedProperty(ttl_field="next_expiry_datetime")
   def next_expiry_quantity(self):
     """Return the quantity of the next batch of expiring items, if any.
@@ -169,13 +198,11 @@ class Item(
     :rtype: float
     """
     activity_first = self.activity_first
-    average = 0
-    if activity_first is not None:
-      since_first_transaction = (
-          pendulum.now() - pendulum.instance(activity_first)
-      )
-      average = self.usage_total / (since_first_transaction.in_weeks() + 1)
-    return float("{:.2f}".format(average))
+    return Transaction.objects.calculate_usage_average(
+        activity_first,
+        self.usage_total if activity_first is not None else 0,
+        "weeks",
+    )
 
   @property
   def usage_avg_month(self):
@@ -185,13 +212,11 @@ class Item(
     :rtype: float
     """
     activity_first = self.activity_first
-    average = 0
-    if activity_first is not None:
-      since_first_transaction = (
-          pendulum.now() - pendulum.instance(activity_first)
-      )
-      average = self.usage_total / (since_first_transaction.in_months() + 1)
-    return float("{:.2f}".format(average))
+    return Transaction.objects.calculate_usage_average(
+        activity_first,
+        self.usage_total if activity_first is not None else 0,
+        "months",
+    )
 
   @property
   def usage_current_week(self):
@@ -202,7 +227,7 @@ class Item(
     :rtype: float
     """
     return Transaction.objects.get_usage_current_week(
-        self.id, zone=self.user.timezone.zone
+        self.id, zone=self.local_timezone
     )
 
   @property
@@ -214,7 +239,7 @@ class Item(
     :rtype: float
     """
     return Transaction.objects.get_usage_current_month(
-        self.id, zone=self.user.timezone.zone
+        self.id, zone=self.local_timezone
     )
 
   @cached_property
@@ -0,0 +1,9 @@
+"""Root Forecast model manager."""
+
+from .fitting import FittingManager
+
+
+class ForecastManager(
+    FittingManager,
+):
+  """Aggregate sub-managers into a root Forecast model manager."""
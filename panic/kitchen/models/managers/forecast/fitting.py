@@ -0,0 +1,181 @@
+"""Forecast Fitting manager."""
+
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import TruncDate
+
+from ...transaction import Transaction
+from user.utilities.request_timezone import LocalTimezone, local_timezone
+
+
+def smoothing_factor(span):
+  """Return the exponential smoothing factor for a span of days.
+
+  :param span: The span of days, in the sense of a "N day moving average"
+  :type span: int
+
+  :returns: The smoothing factor (alpha)
+  :rtype: float
+  """
+  return 2 / (span + 1)
+
+
+def ewma(consumption, starts, alpha, initial):
+  """Fold daily consumption into exponentially weighted moving averages.
+
+  Each row of the consumption matrix is an item, and each column is a day.
+  Columns before an item's start column are ignored, and the item's initial
+  average is the average as of the day before its start column.
+
+  :param consumption: Daily consumption (items x days)
+  :type consumption: :class:`numpy.ndarray`
+  :param starts: The first column to fold into each item's average
+  :type starts: :class:`numpy.ndarray`
+  :param alpha: The smoothing factor
+  :type alpha: float
+  :param initial: The average of each item, before it's start column
+  :type initial: :class:`numpy.ndarray`
+
+  :returns: The average of each item, as of the last column
+  :rtype: :class:`numpy.ndarray`
+  """
+  days = consumption.shape[1]
+  columns = np.arange(days)
+  folded = np.where(columns >= starts[:, np.newaxis], consumption, 0.0)
+  weights = alpha * (1 - alpha)**(days - 1 - columns)
+  return folded @ weights + initial * (1 - alpha)**(days - starts)
+
+
+class FittingManager(models.Manager):
+  """Fit Forecast models to the transaction history of Items."""
+
+  def fit(self, user, item_ids=None):
+    """Fit the consumption forecasts of a user's items.
+
+    Existing forecasts are advanced incrementally, so only transactions after
+    the last complete local day they were fitted through are read.  Items
+    without a forecast are fitted from their first transaction.  All items are
+    fitted in one vectorized pass, over the daily rollup of a single query.
+
+    :param user: The user whose items are being fitted
+    :type user: :class:`user.models.user.User`
+    :param item_ids: The pks of the items to fit (defaults to all items)
+    :type item_ids: List[int], None
+
+    :returns: The fitted forecasts
+    :rtype: List[:class:`kitchen.models.forecast.Forecast`]
+    """
+    local = LocalTimezone(user.timezone, user.pk)
+    today = local.now.date()
+    alpha = smoothing_factor(settings.FORECAST_EWMA_SPAN)
+
+    forecasts = super().get_queryset().filter(item__user=user)
+    transactions = Transaction.objects.filter(item__user=user)
+    if item_ids is not None:
+      forecasts = forecasts.filter(item_id__in=item_ids)
+      transactions = transactions.filter(item_id__in=item_ids)
+    existing = {forecast.item_id: forecast for forecast in forecasts}
+
+    daily = self.__query_daily_consumption(transactions, local)
+
+    fitted = self.__fit(existing, daily, today, alpha)
+    with transaction.atomic():
+      self.bulk_create([
+          forecast for forecast in fitted if forecast.item_id not in existing
+      ])
+      self.bulk_update(
+          [forecast for forecast in fitted if forecast.item_id in existing],
+          ['alpha', 'rate', 'fitted_through', 'pending', 'pending_date'],
+      )
+    return fitted
+
+  def refit(self, item_transaction):
+    """Incrementally refit an item's forecast, after a transaction is saved.
+
+    Transactions dated on the pending day only add to its pending consumption,
+    and transactions dated after the last fitted day are appended with an
+    incremental fit.  Transactions dated before the last fitted day invalidate
+    the existing fit, and the item is fitted again from its first transaction
+    once the database transaction commits.
+
+    :param item_transaction: The transaction that was saved
+    :type item_transaction: :class:`kitchen.models.transaction.Transaction`
+    """
+    item = item_transaction.item
+    local_date = item_transaction.datetime.astimezone(
+        local_timezone(item).timezone
+    ).date()
+    forecasts = super().get_queryset().filter(item=item)
+
+    if forecasts.filter(
+        Q(fitted_through__isnull=True) | Q(fitted_through__lt=local_date),
+        pending_date=local_date,
+    ).update(pending=F('pending') + max(-item_transaction.quantity, 0)):
+      return
+
+    if forecasts.filter(fitted_through__gte=local_date
+                       ).update(fitted_through=None,):
+      transaction.on_commit(lambda: self.fit(item.user, [item.id]))
+      return
+
+    self.fit(item.user, [item.id])
+
+  @staticmethod
+  def __query_daily_consumption(transactions, local):
+    daily = {}
+    for row in transactions.annotate(
+        date=TruncDate('datetime', tzinfo=local.timezone),
+    ).filter(
+        Q(item__forecast__fitted_through__isnull=True) |
+        Q(date__gt=F('item__forecast__fitted_through'))
+    ).values('item_id', 'date'
+            ).annotate(consumed=Sum('quantity',
+                                    filter=Q(quantity__lt=0)),).order_by():
+      daily.setdefault(row['item_id'],
+                       {})[row['date']] = abs(row['consumed'] or 0)
+    return daily
+
+  def __fit(self, existing, daily, today, alpha):
+    yesterday = today - timedelta(days=1)
+    item_ids = sorted(set(existing) | set(daily))
+    if not item_ids:
+      return []
+
+    start_dates = []
+    initial = []
+    for item_id in item_ids:
+      forecast = existing.get(item_id)
+      if forecast is not None and forecast.fitted_through is not None:
+        start_dates.append(forecast.fitted_through + timedelta(days=1))
+        initial.append(forecast.rate)
+      else:
+        first_date = min(daily.get(item_id, {today: 0}))
+        start_dates.append(first_date)
+        initial.append(daily.get(item_id, {}).get(first_date, 0))
+
+    origin = min(start_dates)
+    days = max((yesterday - origin).days + 1, 0)
+    consumption = np.zeros((len(item_ids), days))
+    for row, item_id in enumerate(item_ids):
+      for date, consumed in daily.get(item_id, {}).items():
+        if origin <= date <= yesterday:
+          consumption[row, (date - origin).days] = consumed
+
+    starts = np.array([(start - origin).days for start in start_dates])
+    rates = ewma(consumption, starts, alpha, np.array(initial, dtype=float))
+
+    fitted = []
+    for row, item_id in enumerate(item_ids):
+      forecast = existing.get(item_id) or self.model(item_id=item_id, rate=0)
+      forecast.alpha = alpha
+      if start_dates[row] <= yesterday:
+        forecast.rate = float(rates[row])
+        forecast.fitted_through = yesterday
+      forecast.pending_date = today
+      forecast.pending = daily.get(item_id, {}).get(today, 0)
+      fitted.append(forecast)
+    return fitted
@@ -0,0 +1,205 @@
+"""Test the Forecast Fitting manager."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytz
+from django.test import SimpleTestCase
+from freezegun import freeze_time
+
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....forecast import Forecast
+from ....item import Item
+from ..fitting import ewma, smoothing_factor
+
+ALPHA = smoothing_factor(14)
+
+
+def recursive_ewma(values, alpha=ALPHA, initial=None):
+  average = values[0] if initial is None else initial
+  for value in values[0 if initial is not None else 1:]:
+    average = alpha * value + (1 - alpha) * average
+  return average
+
+
+class TestEWMA(SimpleTestCase):
+  """Test the ewma and smoothing_factor functions."""
+
+  def test_smoothing_factor(self):
+    self.assertEqual(smoothing_factor(9), 0.2)
+
+  def test_ewma_matches_recursion(self):
+    consumption = np.random.default_rng(0).random((3, 20))
+    starts = np.array([0, 5, 19])
+    initial = np.array([consumption[0, 0], 1.5, 0.5])
+
+    rates = ewma(consumption, starts, ALPHA, initial)
+
+    np.testing.assert_allclose(
+        rates,
+        [
+            recursive_ewma(consumption[0]),
+            recursive_ewma(consumption[1, 5:], initial=1.5),
+            recursive_ewma(consumption[2, 19:], initial=0.5),
+        ],
+    )
+
+  def test_ewma_no_new_days(self):
+    rates = ewma(np.zeros((2, 3)), np.array([3, 3]), ALPHA, np.array([1., 0.]))
+
+    np.testing.assert_allclose(rates, [1., 0.])
+
+
+class TestFittingManager(TransactionTestHarness):
+  """Test the FittingManager model manager class."""
+
+  mute_signals = False
+
+  def setUp(self):
+    super().setUp()
+    self.user1.timezone = pytz.utc
+    self.user1.save()
+    Forecast.objects.all().delete()
+
+  def transact(self, when, quantity, item=None):
+    with self.captureOnCommitCallbacks(execute=True):
+      return self.create_test_instance(
+          item=item or self.item1,
+          date_object=pytz.utc.localize(when),
+          quantity=quantity,
+      )
+
+  def create_history(self):
+    self.transact(datetime(2020, 1, 1, 9), 10)
+    self.transact(datetime(2020, 1, 5, 9), -2)
+    self.transact(datetime(2020, 1, 10, 9), -1)
+    self.transact(datetime(2020, 1, 10, 18), -1)
+
+  def create_history_start(self):
+    self.transact(datetime(2020, 1, 1, 9), 10)
+    self.transact(datetime(2020, 1, 5, 9), -2)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_fit_full(self):
+    self.create_history()
+    self.transact(datetime(2020, 1, 14, 9), -1)
+    Forecast.objects.all().delete()
+
+    forecast, = Forecast.objects.fit(self.user1)
+
+    daily = np.zeros(13)
+    daily[4] = 2
+    daily[9] = 2
+    self.assertEqual(forecast.item_id, self.item1.id)
+    self.assertEqual(forecast.alpha, ALPHA)
+    self.assertAlmostEqual(forecast.rate, recursive_ewma(daily))
+    self.assertEqual(forecast.fitted_through, date(2020, 1, 13))
+    self.assertEqual(forecast.pending, 1)
+    self.assertEqual(forecast.pending_date, date(2020, 1, 14))
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_fit_first_day(self):
+    self.transact(datetime(2020, 1, 14, 9), 10)
+    self.transact(datetime(2020, 1, 14, 10), -2)
+
+    forecast = Forecast.objects.get(item=self.item1)
+
+    self.assertEqual(forecast.rate, 0)
+    self.assertIsNone(forecast.fitted_through)
+    self.assertEqual(forecast.pending, 2)
+
+  def test_fit_incremental_matches_full(self):
+    with freeze_time("2020-01-06 12:00:00"):
+      self.create_history_start()
+    with freeze_time("2020-01-14 12:00:00"):
+      self.transact(datetime(2020, 1, 10, 9), -1)
+      self.transact(datetime(2020, 1, 12, 9), -3)
+      incremental = Forecast.objects.get(item=self.item1)
+
+      Forecast.objects.all().delete()
+      full, = Forecast.objects.fit(self.user1)
+
+    self.assertEqual(incremental.fitted_through, full.fitted_through)
+    self.assertAlmostEqual(incremental.rate, full.rate)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_fit_incremental_reads_new_days_only(self):
+    self.create_history()
+    forecast = Forecast.objects.get(item=self.item1)
+    forecast.rate = 100
+    forecast.save()
+
+    forecast, = Forecast.objects.fit(self.user1)
+
+    self.assertAlmostEqual(forecast.rate, 100)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_refit_backdated_transaction(self):
+    self.create_history()
+    forecast = Forecast.objects.get(item=self.item1)
+    forecast.rate = 100
+    forecast.save()
+
+    self.transact(datetime(2020, 1, 2, 9), -1)
+    forecast = Forecast.objects.get(item=self.item1)
+
+    daily = np.zeros(13)
+    daily[1] = 1
+    daily[4] = 2
+    daily[9] = 2
+    self.assertAlmostEqual(forecast.rate, recursive_ewma(daily))
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_refit_backdated_transaction_is_deferred(self):
+    self.create_history()
+
+    with self.captureOnCommitCallbacks() as callbacks:
+      self.create_test_instance(
+          item=self.item1,
+          date_object=pytz.utc.localize(datetime(2020, 1, 2, 9)),
+          quantity=-1,
+      )
+      forecast = Forecast.objects.get(item=self.item1)
+
+    self.assertEqual(len(callbacks), 1)
+    self.assertIsNone(forecast.fitted_through)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_refit_pending_day(self):
+    self.create_history()
+    transaction = self.transact(datetime(2020, 1, 14, 9), 5)
+    expected = Forecast.objects.get(item=self.item1)
+    transaction.quantity = -3
+    transaction.datetime = pytz.utc.localize(datetime(2020, 1, 14, 11))
+
+    with self.assertNumQueries(1):
+      Forecast.objects.refit(transaction)
+    forecast = Forecast.objects.get(item=self.item1)
+
+    self.assertEqual(forecast.pending, expected.pending + 3)
+    self.assertEqual(forecast.fitted_through, expected.fitted_through)
+    self.assertAlmostEqual(forecast.rate, expected.rate)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_fit_query_count_is_constant(self):
+    for index in range(3):
+      item = Item.objects.create(
+          name=f"Item {index}",
+          user=self.user1,
+          price=2.00,
+      )
+      self.transact(datetime(2020, 1, 1, 9), 10, item=item)
+      self.transact(datetime(2020, 1, 5, 9), -2, item=item)
+    Forecast.objects.all().delete()
+
+    with self.assertNumQueries(5):
+      forecasts = Forecast.objects.fit(self.user1)
+
+    self.assertEqual(len(forecasts), 3)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_fit_excludes_other_users(self):
+    user2 = self.create_dependencies(2)['user']
+    self.create_history()
+
+    self.assertListEqual(Forecast.objects.fit(user2), [])
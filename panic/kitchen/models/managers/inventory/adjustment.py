@@ -3,6 +3,7 @@
 from django.db import models
 
 from ....exceptions import ProcessingError
+from utilities.models.validators.trusted import trusted_write
 
 
 class AdjustmentManager(models.Manager):
@@ -14,12 +15,13 @@ class AdjustmentManager(models.Manager):
     :param transaction: A Transaction model instance (of the item in question)
     :type transaction: :class:`kitchen.models.transaction.Transaction`
     """
-    if transaction.quantity > 0:
-      self.__credit_inventory(transaction)
-    else:
-      self.__debit_inventory(transaction)
+    with trusted_write():
+      if transaction.quantity > 0:
+        self.__credit_inventory(transaction)
+      else:
+        self.__debit_inventory(transaction)
 
-    self.__clear_transaction_item_cache(transaction)
+      self.__clear_transaction_item_cache(transaction)
 
   def __credit_inventory(self, transaction):
     super().get_queryset().create(
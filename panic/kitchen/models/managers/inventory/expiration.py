@@ -8,9 +8,11 @@ from django.db import models
 from django.db.models import Sum
 from django.db.models.functions import TruncDay
 
+from user.utilities.request_timezone import local_timezone
+
 
 class ExpirationManager(models.Manager):
-  """Retrieve Inventory expiration data for individual items."""
+  """Retrieve Inventory expiration data for items."""
 
   def _get_inventory_expiry(self, inventory):
     """Return the expiry datetime of an inventory entry, for the user.
@@ -21,10 +23,14 @@ class ExpirationManager(models.Manager):
     :returns: A datetime, or None if no items are expiring.
     :rtype: None, :class:`datetime.datetime`
     """
-    transaction_datetime = inventory.transaction.datetime
-    shelf_life = inventory.item.shelf_life
-    user_timezone = inventory.item.user.timezone
+    return self._get_expiry(
+        inventory.transaction.datetime,
+        inventory.item.shelf_life,
+        local_timezone(inventory.item).timezone,
+    )
 
+  @staticmethod
+  def _get_expiry(transaction_datetime, shelf_life, user_timezone):
     user_time = pendulum.instance(
         transaction_datetime.astimezone(user_timezone) +
         timedelta(days=shelf_life)
@@ -44,8 +50,7 @@ class ExpirationManager(models.Manager):
     :rtype: None, :class:`datetime.datetime`
     """
     shelf_life = item.shelf_life
-    timezone = item.user.timezone
-    current_day_start = pendulum.now(tz=timezone).start_of('day')
+    current_day_start = local_timezone(item).start_of('day')
     return current_day_start - timedelta(days=shelf_life)
 
   def get_next_expiry_datetime(self, item):
@@ -93,7 +98,7 @@ class ExpirationManager(models.Manager):
     """
     next_expiration_quantity = 0
     inventory_expiration = self.get_inventory_expiration_datetime(item)
-    timezone = item.user.timezone
+    timezone = local_timezone(item).timezone
 
     next_quantity_sum = super().get_queryset().\
         filter(
@@ -144,3 +149,54 @@ class ExpirationManager(models.Manager):
     if total_expired_inventory:
       expired = total_expired_inventory
     return expired
+
+  def prefetch_expiry(self, items):
+    """Calculate the expiry properties of many items, with a single query.
+
+    The `expired`, `next_expiry_datetime` and `next_expiry_quantity`
+    properties of each item are supplied with the same values that their
+    individual queries would return.
+
+    :param items: The item instances to analyze
+    :type items: List[:class:`kitchen.models.item.Item`]
+    """
+    inventory = {}
+    for item_id, remaining, purchased in super().get_queryset().filter(
+        item__in=items,
+    ).order_by('transaction__datetime').values_list(
+        'item_id',
+        'remaining',
+        'transaction__datetime',
+    ):
+      inventory.setdefault(item_id, []).append((purchased, remaining))
+
+    for item in items:
+      self.__prefetch_item(item, inventory.get(item.id, []))
+
+  def __prefetch_item(self, item, inventory):
+    inventory_expiration = self.get_inventory_expiration_datetime(item)
+    timezone = local_timezone(item).timezone
+
+    expired = 0
+    next_expiry_datetime = None
+    next_expiry_quantity = 0
+    next_expiry_day = None
+
+    for purchased, remaining in inventory:
+      if purchased < inventory_expiration:
+        expired += remaining
+        continue
+      purchased_day = purchased.astimezone(timezone).date()
+      if next_expiry_day is None:
+        next_expiry_day = purchased_day
+        next_expiry_datetime = self._get_expiry(
+            purchased,
+            item.shelf_life,
+            timezone,
+        )
+      if purchased_day == next_expiry_day:
+        next_expiry_quantity += remaining
+
+    item.__dict__['next_expiry_datetime'] = next_expiry_datetime
+    item.__class__.expired.prefetch(item, expired)
+    item.__class__.next_expiry_quantity.prefetch(item, next_expiry_quantity)
@@ -91,6 +91,15 @@ class TestAdjustmentManager(InventoryTestHarness):
         item=transaction.item,
     )
 
+  @patch.object(Inventory, "full_clean")
+  def test_transaction_positive_is_trusted_write(self, m_clean):
+    transaction = self.__positive_transaction()
+    with patch.object(transaction.item, "full_clean") as m_item_clean:
+      Inventory.objects.adjust(transaction)
+
+    m_clean.assert_not_called()
+    m_item_clean.assert_not_called()
+
   def test_transaction_full_debit(self):
     initial_transaction = self.__positive_transaction()
     Inventory.objects.adjust(initial_transaction)
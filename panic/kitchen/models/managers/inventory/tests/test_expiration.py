@@ -9,6 +9,7 @@ from freezegun import freeze_time
 
 from .....tests.fixtures.fixtures_item import ItemTestHarness
 from ....inventory import Inventory
+from ....item import Item
 from ....transaction import Transaction
 
 
@@ -420,3 +421,58 @@ class TestGetNextExpiryQuantity(ExpirationManagerTestHarness):
 
     received_quantity = Inventory.objects.get_next_expiry_quantity(self.item)
     self.assertEqual(received_quantity, 0)
+
+
+class TestPrefetchExpiry(ExpirationManagerTestHarness):
+  """Test the `ExpirationManager.prefetch_expiry` method."""
+
+  def _assert_prefetch_matches(self):
+    self.item.invalidate_caches()
+    expected = (
+        Inventory.objects.get_expired(self.item),
+        Inventory.objects.get_next_expiry_datetime(self.item),
+        Inventory.objects.get_next_expiry_quantity(self.item),
+    )
+
+    item = Item.objects.get(id=self.item.id)
+    Inventory.objects.prefetch_expiry([item])
+
+    with self.assertNumQueries(0):
+      received = (
+          item.expired,
+          item.next_expiry_datetime,
+          item.next_expiry_quantity,
+      )
+    self.assertEqual(received, expected)
+
+  def test_utc(self):
+    scenarios = self._create_scenarios(30.1)
+    for scenario in scenarios.values():
+      self._create_test_transaction(**scenario)
+
+    self.item.user.timezone = "UTC"
+    self.item.user.save()
+
+    self._assert_prefetch_matches()
+
+  def test_honolulu(self):
+    scenarios = self._create_scenarios(30.1)
+    for scenario in scenarios.values():
+      self._create_test_transaction(**scenario)
+
+    self.item.user.timezone = "Pacific/Honolulu"
+    self.item.user.save()
+
+    self._assert_prefetch_matches()
+
+  def test_no_inventory(self):
+    self._assert_prefetch_matches()
+
+  def test_single_query(self):
+    scenarios = self._create_scenarios(30.1)
+    self._create_test_transaction(**scenarios['last_week'])
+    Inventory.objects.prefetch_expiry(list(Item.objects.all()))
+    items = list(Item.objects.select_related('user'))
+
+    with self.assertNumQueries(1):
+      Inventory.objects.prefetch_expiry(items)
@@ -1,9 +1,15 @@
 """Root Item model manager."""
 
+from .bulk import BulkManager
+from .export import ExportManager
 from .maintenance import MaintenanceManager
+from .shopping import ShoppingListManager
 
 
 class ItemManager(
+    BulkManager,
+    ExportManager,
     MaintenanceManager,
+    ShoppingListManager,
 ):
   """Aggregate sub-managers into a root Item model manager."""
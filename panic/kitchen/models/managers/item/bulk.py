@@ -0,0 +1,194 @@
+"""Item Bulk Import manager."""
+
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Lower
+from django.utils.timezone import now
+
+from ....exceptions import UniqueNameConstraintError
+from ... import constants
+from ...inventory import Inventory
+from ...preferred_store import PreferredStore
+from ...shelf import Shelf
+from ...spending_summary import SpendingSummary
+from ...store import Store
+from ...transaction import Transaction
+from .shopping import invalidate_shopping_list
+
+BULK_CREATE_BATCH_SIZE = 500
+
+
+class BulkManager(models.Manager):
+  """Import Item models in bulk, with their related models."""
+
+  def bulk_import(self, user, records):
+    """Create items for a user from validated import records.
+
+    Names are deduplicated (regardless of case) against the user's existing
+    items and the other records in memory.  Shelves and stores are resolved by
+    name in bulk, and created if they don't already exist.  Records with an
+    initial quantity receive a purchase transaction at the item's price, along
+    with inventory and spending.
+
+    Names created concurrently by another request, after they were
+    deduplicated, raise a unique name error and nothing is imported.
+
+    :param user: The user who will own the imported items
+    :type user: :class:`user.models.user.User`
+    :param records: Validated import records
+    :type records: List[dict]
+
+    :returns: A dictionary of the created items, and the skipped names
+    :rtype: dict
+
+    :raises: :class:`panic.kitchen.exceptions.UniqueNameConstraintError`
+    """
+    accepted, skipped = self.__deduplicate(user, records)
+
+    try:
+      items = self.__create(user, accepted)
+    except IntegrityError as exc:
+      if not any(
+          model.get_unique_name_index() in str(exc)
+          for model in (self.model, Shelf, Store)
+      ):
+        raise
+      raise UniqueNameConstraintError(
+          constants.UNIQUE_NAME_CONSTRAINT_ERROR
+      ) from exc
+
+    invalidate_shopping_list(user.pk)
+    return {"created": items, "skipped": skipped}
+
+  def __create(self, user, accepted):
+    with transaction.atomic():
+      shelves = self.__resolve_by_name(
+          Shelf,
+          user,
+          [record['shelf'] for record in accepted if record.get('shelf')],
+      )
+      stores = self.__resolve_by_name(
+          Store,
+          user,
+          [
+              store for record in accepted
+              for store in record.get('preferred_stores', [])
+          ],
+      )
+      items = self.__create_items(user, accepted, shelves)
+      store_ids = self.__create_preferred_stores(items, accepted, stores)
+      self.__create_inventory(items, store_ids)
+    return items
+
+  def __deduplicate(self, user, records):
+    accepted = []
+    skipped = []
+    existing = {
+        name.lower() for name in super().get_queryset().filter(user=user,).
+        values_list('name', flat=True)
+    }
+
+    for record in records:
+      key = record['name'].lower()
+      if key in existing:
+        skipped.append(record['name'])
+        continue
+      existing.add(key)
+      accepted.append(record)
+
+    return accepted, skipped
+
+  @staticmethod
+  def __resolve_by_name(model, user, names):
+    requested = {}
+    for name in names:
+      requested.setdefault(name.lower(), name)
+
+    if not requested:
+      return {}
+
+    existing = model.objects.\
+        annotate(lower_name=Lower('name')).\
+        filter(user=user, lower_name__in=list(requested))
+    resolved = {instance.lower_name: instance for instance in existing}
+    missing = [key for key in requested if key not in resolved]
+    instances = [model(user=user, name=requested[key]) for key in missing]
+    model._meta.get_field('_index').prepare_many(instances)
+    created = model.objects.bulk_create(
+        instances,
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+    resolved.update(zip(missing, created))
+
+    return {key: resolved[key] for key in requested}
+
+  def __create_items(self, user, records, shelves):
+    items = []
+    for record in records:
+      shelf_name = record.get('shelf')
+      items.append(
+          self.model(
+              user=user,
+              name=record['name'],
+              price=record['price'],
+              quantity=record.get('quantity', 0),
+              shelf_life=record['shelf_life'],
+              has_partial_quantities=record.get(
+                  'has_partial_quantities',
+                  False,
+              ),
+              shelf=shelves[shelf_name.lower()] if shelf_name else None,
+          )
+      )
+    self.model._meta.get_field('_index').prepare_many(items)
+    return super().get_queryset().bulk_create(
+        items,
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+
+  @staticmethod
+  def __create_preferred_stores(items, records, stores):
+    preferred_stores = []
+    first_store_ids = {}
+    for item, record in zip(items, records):
+      selected = {name.lower() for name in record.get('preferred_stores', [])}
+      for key in sorted(selected):
+        preferred_stores.append(PreferredStore(item=item, store=stores[key]))
+      if selected:
+        # pylint: disable=protected-access
+        first_store_ids[item.id] = min(
+            (stores[key] for key in selected),
+            key=lambda store: store._index,
+        ).id
+    PreferredStore.objects.bulk_create(
+        preferred_stores,
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+    return first_store_ids
+
+  @staticmethod
+  def __create_inventory(items, store_ids):
+    stocked = [item for item in items if item.quantity > 0]
+    timestamp = now()
+
+    transactions = Transaction.objects.bulk_create(
+        [
+            Transaction(
+                item=item,
+                quantity=item.quantity,
+                datetime=timestamp,
+                unit_price=item.price,
+            ) for item in stocked
+        ],
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+    Inventory.objects.bulk_create(
+        [
+            Inventory(
+                item=record.item,
+                transaction=record,
+                remaining=record.quantity,
+            ) for record in transactions
+        ],
+        batch_size=BULK_CREATE_BATCH_SIZE,
+    )
+    SpendingSummary.objects.record_new(transactions, store_ids)
@@ -0,0 +1,65 @@
+"""Item Export manager."""
+
+from django.db import models
+
+from ...inventory import Inventory
+from ...preferred_store import PreferredStore
+from ...transaction import Transaction
+
+EXPORT_CHUNK_SIZE = 500
+
+
+class ExportManager(models.Manager):
+  """Export a user's items, transactions and inventory as a stream."""
+
+  def export(self, user):
+    """Generate export records for all of a user's kitchen data.
+
+    Rows are read from server side cursors in chunks, so the export never
+    holds an entire table in memory.  Each record is a dictionary with a
+    `type` key (`item`, `transaction` or `inventory`) and a `data` key.
+
+    :param user: The user whose data is being exported
+    :type user: :class:`user.models.user.User`
+
+    :returns: A generator of export records
+    :rtype: Generator[dict]
+    """
+    yield from self.__export_items(user)
+    yield from self.__export_related(
+        "transaction",
+        Transaction.objects.filter(item__user=user).order_by('datetime', 'id'),
+        ('id', 'item_id', 'datetime', 'quantity'),
+    )
+    yield from self.__export_related(
+        "inventory",
+        Inventory.objects.filter(item__user=user).order_by('id'),
+        ('id', 'item_id', 'transaction_id', 'remaining'),
+    )
+
+  def __export_items(self, user):
+    preferred_stores = {}
+    for item_id, store_name in PreferredStore.objects.filter(
+        item__user=user,
+    ).order_by('store___index').values_list('item_id', 'store__name'):
+      preferred_stores.setdefault(item_id, []).append(store_name)
+
+    items = super().get_queryset().filter(user=user).order_by('_index').values(
+        'id',
+        'name',
+        'price',
+        'quantity',
+        'shelf_life',
+        'has_partial_quantities',
+        'shelf__name',
+    )
+
+    for item in items.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+      item['shelf'] = item.pop('shelf__name')
+      item['preferred_stores'] = preferred_stores.get(item['id'], [])
+      yield {"type": "item", "data": item}
+
+  @staticmethod
+  def __export_related(record_type, queryset, fields):
+    for row in queryset.values(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+      yield {"type": record_type, "data": row}
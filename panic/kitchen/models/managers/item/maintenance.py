@@ -5,6 +5,7 @@ from django.db import models
 
 from ....exceptions import ConfirmationRequired
 from ...inventory import Inventory
+from utilities.models.validators.trusted import trusted_write
 
 ITEM_PAGE_SIZE = 250
 
@@ -31,4 +32,5 @@ class MaintenanceManager(models.Manager):
 
       for item in page.object_list:
         item.quantity = Inventory.objects.get_quantity(item)
-        item.save()
+        with trusted_write():
+          item.save()
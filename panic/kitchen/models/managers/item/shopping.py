@@ -0,0 +1,293 @@
+"""Item Shopping List manager."""
+
+import math
+from datetime import timedelta
+
+import pendulum
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, models, transaction
+from django.db.models import Min, Q, Sum
+
+from ...inventory import Inventory
+from ...preferred_store import PreferredStore
+from ...shopping_list_version import ShoppingListVersion
+from user.utilities.request_timezone import LocalTimezone
+
+SHOPPING_LIST_CACHE_KEY = "kitchen:shopping_list:{user_id}:{version}"
+
+# A single statement creates or increments the version, so concurrent
+# invalidations are serialized by the row lock.
+INVALIDATE_SQL = """
+INSERT INTO {table} AS stamp (user_id, version)
+VALUES (%(user_id)s, 1)
+ON CONFLICT (user_id) DO UPDATE SET version = stamp.version + 1
+"""
+
+
+def invalidate_shopping_list(user_id):
+  """Discard a user's cached shopping list, in every process.
+
+  The user's version is bumped once the current transaction commits, and only
+  once, no matter how many times their shopping list is invalidated in it.
+
+  :param user_id: The pk of the user whose shopping list is invalidated
+  :type user_id: int
+  """
+  for _, callback in connection.run_on_commit:
+    if isinstance(callback, ShoppingListInvalidation) and \
+        callback.user_id == user_id and callback.pending:
+      return
+  transaction.on_commit(ShoppingListInvalidation(user_id))
+
+
+class ShoppingListInvalidation:
+  """A deferred increment of a user's shopping list version.
+
+  :param user_id: The pk of the user whose shopping list is invalidated
+  :type user_id: int
+  """
+
+  def __init__(self, user_id):
+    self.user_id = user_id
+    self.pending = True
+
+  def __call__(self):
+    self.pending = False
+    with connection.cursor() as cursor:
+      cursor.execute(
+          INVALIDATE_SQL.format(
+              table=connection.ops.
+              quote_name(ShoppingListVersion._meta.db_table)
+          ),
+          {"user_id": self.user_id},
+      )
+
+
+def project_run_out(batches, daily_usage):
+  """Project the number of days until a FIFO consumed stock runs out.
+
+  Batches that expire before they are reached are skipped, and partially
+  consumed batches are abandoned when they expire.
+
+  :param batches: Pairs of (days until expiry, remaining quantity) in FIFO order
+  :type batches: List[Tuple[float, float]]
+  :param daily_usage: The average quantity consumed per day
+  :type daily_usage: float
+
+  :returns: The number of days until the stock runs out, or None if it won't
+  :rtype: float, None
+  """
+  elapsed = 0.0
+  for expires_in, remaining in batches:
+    if expires_in <= elapsed:
+      continue
+    if daily_usage > 0:
+      elapsed = min(elapsed + remaining / daily_usage, expires_in)
+    else:
+      elapsed = expires_in
+  if math.isinf(elapsed):
+    return None
+  return elapsed
+
+
+class ShoppingListManager(models.Manager):
+  """Generate shopping lists from the consumption patterns of Items."""
+
+  def get_shopping_list(self, user):
+    """Return a user's shopping list, cached until their items next change.
+
+    Cached shopping lists are keyed by the user's version stamp, which is read
+    from the database, so a list invalidated by another process is never
+    returned.  They also expire at the end of the user's local day, as the
+    projected dates are relative to it.
+
+    :param user: The user to generate a shopping list for
+    :type user: :class:`user.models.user.User`
+
+    :returns: The shopping list
+    :rtype: dict
+    """
+    cache = caches[settings.SHOPPING_LIST_CACHE]
+    version = ShoppingListVersion.objects.filter(user=user).values_list(
+        'version',
+        flat=True,
+    ).first()
+    key = SHOPPING_LIST_CACHE_KEY.format(user_id=user.pk, version=version or 0)
+    shopping_list = cache.get(key)
+    if shopping_list is None:
+      shopping_list = self.generate_shopping_list(user)
+      generated = shopping_list['generated']
+      end_of_day = generated.start_of('day').add(days=1) - generated
+      cache.set(
+          key,
+          shopping_list,
+          min(end_of_day.total_seconds(), settings.SHOPPING_LIST_CACHE_TTL),
+      )
+    return shopping_list
+
+  def generate_shopping_list(self, user):
+    """Generate a per store shopping list for all of a user's items.
+
+    An item is listed when its stock is projected to run out within the
+    shopping list horizon, taking both its average weekly usage and the expiry
+    of its inventory into account.  Each item is listed under its first
+    preferred store, or under no store if it has none.
+
+    This runs a fixed number of queries, regardless of the number of items.
+
+    :param user: The user to generate a shopping list for
+    :type user: :class:`user.models.user.User`
+
+    :returns: The shopping list
+    :rtype: dict
+    """
+    local = LocalTimezone(user.timezone, user.pk)
+    today = local.now.date()
+    horizon = settings.SHOPPING_LIST_HORIZON_DAYS
+
+    items = self.__query_items(user)
+    batches = self.__query_batches(user, items, local.timezone)
+    stores, item_stores = self.__query_preferred_stores(user)
+
+    for item in items:
+      entry = self.__create_entry(item, batches.get(item['id'], []), today)
+      if entry['projected_run_out'] is None:
+        continue
+      days_in_stock = (entry['projected_run_out'] - today).days
+      if days_in_stock >= horizon:
+        continue
+      entry['quantity_to_buy'] = self.__quantity_to_buy(
+          item,
+          entry['usage_avg_week'],
+          horizon - days_in_stock,
+      )
+      store_ids = item_stores.get(item['id'], [])
+      entry['preferred_stores'] = store_ids
+      stores[store_ids[0] if store_ids else None]['items'].append(entry)
+
+    return {
+        "generated": local.now,
+        "horizon": horizon,
+        "stores": [store for store in stores.values() if store['items']],
+    }
+
+  def __query_items(self, user):
+    return list(
+        super().get_queryset().filter(user=user).annotate(
+            activity_first=Min('transaction__datetime'),
+            usage_total=Sum(
+                'transaction__quantity',
+                filter=Q(transaction__quantity__lt=0),
+            ),
+        ).order_by('_index').values(
+            'id',
+            'name',
+            'price',
+            'quantity',
+            'has_partial_quantities',
+            'shelf_life',
+            'activity_first',
+            'usage_total',
+        )
+    )
+
+  @staticmethod
+  def __query_batches(user, items, timezone):
+    shelf_lives = {item['id']: item['shelf_life'] for item in items}
+    batches = {}
+
+    for item_id, remaining, purchased in Inventory.objects.filter(
+        item__user=user,
+        remaining__gt=0,
+    ).order_by('transaction__datetime').values_list(
+        'item_id',
+        'remaining',
+        'transaction__datetime',
+    ):
+      expiry = (
+          purchased.astimezone(timezone).date() +
+          timedelta(days=shelf_lives[item_id])
+      )
+      batches.setdefault(item_id, []).append((expiry, remaining))
+
+    return batches
+
+  @staticmethod
+  def __query_preferred_stores(user):
+    stores = {}
+    item_stores = {}
+
+    for item_id, store_id, store_name in PreferredStore.objects.filter(
+        item__user=user,
+    ).order_by('store___index').values_list(
+        'item_id',
+        'store_id',
+        'store__name',
+    ):
+      stores.setdefault(
+          store_id,
+          {
+              "id": store_id,
+              "name": store_name,
+              "items": [],
+          },
+      )
+      item_stores.setdefault(item_id, []).append(store_id)
+
+    stores[None] = {"id": None, "name": None, "items": []}
+    return stores, item_stores
+
+  @staticmethod
+  def __create_entry(item, batches, today):
+    usage_avg_week = 0
+    if item['activity_first'] is not None:
+      since_first_transaction = (
+          pendulum.now() - pendulum.instance(item['activity_first'])
+      )
+      usage_avg_week = abs(item['usage_total'] or 0
+                          ) / (since_first_transaction.in_weeks() + 1)
+    usage_avg_week = float("{:.2f}".format(usage_avg_week))
+
+    unexpired = [batch for batch in batches if batch[0] > today]
+
+    next_expiry_date = None
+    next_expiry_quantity = 0
+    if unexpired:
+      next_expiry_date = unexpired[0][0]
+      next_expiry_quantity = sum(
+          remaining for expiry, remaining in unexpired
+          if expiry == next_expiry_date
+      )
+
+    if batches:
+      stock = [
+          ((expiry - today).days, remaining) for expiry, remaining in unexpired
+      ]
+    elif item['quantity'] > 0:
+      stock = [(math.inf, item['quantity'])]
+    else:
+      stock = []
+    days_in_stock = project_run_out(stock, usage_avg_week / 7)
+
+    projected_run_out = None
+    if days_in_stock is not None:
+      projected_run_out = today + timedelta(days=int(days_in_stock))
+
+    return {
+        "id": item['id'],
+        "name": item['name'],
+        "price": item['price'],
+        "quantity": item['quantity'],
+        "usage_avg_week": usage_avg_week,
+        "next_expiry_date": next_expiry_date,
+        "next_expiry_quantity": next_expiry_quantity,
+        "projected_run_out": projected_run_out,
+    }
+
+  @staticmethod
+  def __quantity_to_buy(item, usage_avg_week, days_without_stock):
+    required = max(usage_avg_week / 7 * days_without_stock, 1)
+    if item['has_partial_quantities']:
+      return float("{:.2f}".format(required))
+    return float(math.ceil(required))
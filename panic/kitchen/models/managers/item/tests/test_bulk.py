@@ -0,0 +1,214 @@
+"""Test the Item Bulk Import manager."""
+
+from decimal import Decimal
+from unittest import mock
+
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from .....exceptions import UniqueNameConstraintError
+from .....tests.fixtures.fixtures_item import ItemTestHarness
+from ....inventory import Inventory
+from ....item import Item
+from ....shelf import Shelf
+from ....spending_summary import SpendingSummary
+from ....store import Store
+from ....transaction import Transaction
+from .. import bulk
+
+BULK_MODULE = bulk.__name__
+
+
+class TestBulkManager(ItemTestHarness):
+  """Test the BulkManager model manager class."""
+
+  @classmethod
+  def create_data_hook(cls):
+    cls.existing = Item.objects.create(
+        name="Canned Beans",
+        user=cls.user1,
+        shelf_life=99,
+        shelf=cls.shelf1,
+        price=2.00,
+    )
+
+  def _record(self, name, **kwargs):
+    record = {
+        'name': name,
+        'price': Decimal("2.00"),
+        'shelf_life': 10,
+        'has_partial_quantities': False,
+        'quantity': 0,
+        'shelf': None,
+        'preferred_stores': [],
+    }
+    record.update(kwargs)
+    return record
+
+  def test_creates_items(self):
+    records = [self._record("Rice"), self._record("Pasta 10")]
+
+    result = Item.objects.bulk_import(self.user1, records)
+
+    self.assertEqual(len(result['created']), 2)
+    self.assertListEqual(result['skipped'], [])
+    created = Item.objects.get(name="Pasta 10", user=self.user1)
+    self.assertEqual(created._index, "pasta 00000010")
+    self.assertEqual(created.shelf_life, 10)
+
+  def test_deduplicates_names_regardless_of_case(self):
+    records = [
+        self._record("canned beans"),
+        self._record("Rice"),
+        self._record("RICE"),
+    ]
+
+    result = Item.objects.bulk_import(self.user1, records)
+
+    self.assertEqual(len(result['created']), 1)
+    self.assertListEqual(result['skipped'], ["canned beans", "RICE"])
+    self.assertEqual(Item.objects.filter(user=self.user1).count(), 2)
+
+  def test_resolves_shelves_and_stores_by_name(self):
+    records = [
+        self._record(
+            "Rice",
+            shelf=self.shelf1.name.upper(),
+            preferred_stores=[self.store1.name, "New Store", "new store"],
+        ),
+        self._record("Pasta", shelf="New Shelf"),
+        self._record("Flour", shelf="new shelf"),
+    ]
+
+    Item.objects.bulk_import(self.user1, records)
+
+    rice = Item.objects.get(name="Rice")
+    pasta = Item.objects.get(name="Pasta")
+    flour = Item.objects.get(name="Flour")
+    self.assertEqual(rice.shelf, self.shelf1)
+    self.assertEqual(pasta.shelf, flour.shelf)
+    self.assertEqual(pasta.shelf.name, "New Shelf")
+    self.assertEqual(Shelf.objects.filter(user=self.user1).count(), 2)
+    self.assertSetEqual(
+        {store.name for store in rice.preferred_stores.all()},
+        {self.store1.name, "New Store"},
+    )
+    self.assertEqual(Store.objects.filter(user=self.user1).count(), 2)
+
+  def test_does_not_resolve_other_users_relations(self):
+    self.create_second_test_set()
+
+    Item.objects.bulk_import(
+        self.user1,
+        [
+            self._record(
+                "Rice",
+                shelf=self.shelf2.name,
+                preferred_stores=[self.store2.name],
+            )
+        ],
+    )
+
+    rice = Item.objects.get(name="Rice")
+    self.assertEqual(rice.shelf.user, self.user1)
+    self.assertEqual(rice.preferred_stores.get().user, self.user1)
+
+  def test_creates_inventory_for_quantities(self):
+    Item.objects.bulk_import(
+        self.user1,
+        [self._record("Rice", quantity=3),
+         self._record("Pasta")],
+    )
+
+    rice = Item.objects.get(name="Rice")
+    transaction = Transaction.objects.get(item=rice)
+    inventory = Inventory.objects.get(item=rice)
+    self.assertEqual(rice.quantity, 3)
+    self.assertEqual(transaction.quantity, 3)
+    self.assertEqual(inventory.transaction, transaction)
+    self.assertEqual(inventory.remaining, 3)
+    self.assertFalse(Transaction.objects.filter(item__name="Pasta").exists(),)
+
+  def test_records_spending_for_quantities(self):
+    Item.objects.bulk_import(
+        self.user1,
+        [
+            self._record(
+                "Rice",
+                quantity=3,
+                price=Decimal("2.15"),
+                shelf=self.shelf1.name,
+                preferred_stores=["Zellers", self.store1.name],
+            ),
+            self._record("Pasta"),
+        ],
+    )
+
+    rice = Item.objects.get(name="Rice")
+    transaction = Transaction.objects.get(item=rice)
+    summary = SpendingSummary.objects.get()
+    self.assertEqual(transaction.unit_price, Decimal("2.15"))
+    self.assertEqual(summary.item, rice)
+    self.assertEqual(summary.quantity, 3)
+    self.assertEqual(summary.cost, Decimal("6.45"))
+    self.assertEqual(summary.shelf, self.shelf1)
+    self.assertEqual(summary.store, self.store1)
+    self.assertEqual(summary.user, self.user1)
+
+  def test_spending_survives_rebuild(self):
+    Item.objects.bulk_import(
+        self.user1,
+        [self._record("Rice", quantity=3, price=Decimal("2.15"))],
+    )
+    recorded = list(SpendingSummary.objects.values('cost', 'month', 'quantity'))
+
+    SpendingSummary.objects.rebuild(confirm=True)
+
+    self.assertListEqual(
+        list(SpendingSummary.objects.values('cost', 'month', 'quantity')),
+        recorded,
+    )
+
+  def test_concurrently_created_names(self):
+    records = [self._record("Rice"), self._record("Canned Beans")]
+
+    with mock.patch.object(
+        bulk.BulkManager,
+        "_BulkManager__deduplicate",
+        return_value=(records, []),
+    ):
+      with self.assertRaises(UniqueNameConstraintError):
+        Item.objects.bulk_import(self.user1, records)
+
+    self.assertFalse(Item.objects.filter(name="Rice").exists())
+
+  def test_other_integrity_errors(self):
+    with mock.patch.object(
+        bulk.BulkManager,
+        "_BulkManager__create",
+        side_effect=IntegrityError("other_constraint"),
+    ):
+      with self.assertRaises(IntegrityError):
+        Item.objects.bulk_import(self.user1, [self._record("Rice")])
+
+  @mock.patch(BULK_MODULE + ".invalidate_shopping_list")
+  def test_invalidates_shopping_list(self, m_invalidate):
+    Item.objects.bulk_import(self.user1, [self._record("Rice", quantity=3)])
+
+    m_invalidate.assert_called_once_with(self.user1.id)
+
+  def test_query_count_is_constant(self):
+    records = [
+        self._record(
+            f"Item {index}",
+            quantity=1,
+            shelf=f"Shelf {index % 3}",
+            preferred_stores=[f"Store {index % 4}"],
+        ) for index in range(50)
+    ]
+
+    with CaptureQueriesContext(connection) as queries:
+      Item.objects.bulk_import(self.user1, records)
+
+    self.assertLessEqual(len(queries.captured_queries), 13)
+    self.assertEqual(Item.objects.filter(user=self.user1).count(), 51)
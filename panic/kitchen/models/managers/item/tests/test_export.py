@@ -0,0 +1,79 @@
+"""Test the Item Export manager."""
+
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....inventory import Inventory
+from ....item import Item
+
+
+class TestExportManager(TransactionTestHarness):
+  """Test the ExportManager model manager class."""
+
+  mute_signals = False
+
+  @classmethod
+  def create_data_hook(cls):
+    test_data = cls.create_dependencies(2)
+    cls.user2 = test_data['user']
+    cls.store2 = test_data['store']
+    cls.shelf2 = test_data['shelf']
+    cls.item2 = test_data['item']
+
+    cls.purchase = cls.create_instance(
+        item=cls.item2,
+        date_object=cls.today,
+        quantity=3,
+    )
+
+  def test_export_records(self):
+    records = list(Item.objects.export(self.user2))
+    inventory = Inventory.objects.get(item=self.item2)
+
+    self.assertListEqual(
+        records,
+        [
+            {
+                "type": "item",
+                "data": {
+                    "id": self.item2.id,
+                    "name": self.item2.name,
+                    "price": self.item2.price,
+                    "quantity": 3.0,
+                    "shelf_life": self.item2.shelf_life,
+                    "has_partial_quantities": False,
+                    "shelf": self.shelf2.name,
+                    "preferred_stores": [self.store2.name],
+                },
+            },
+            {
+                "type": "transaction",
+                "data": {
+                    "id": self.purchase.id,
+                    "item_id": self.item2.id,
+                    "datetime": self.purchase.datetime,
+                    "quantity": 3.0,
+                },
+            },
+            {
+                "type": "inventory",
+                "data": {
+                    "id": inventory.id,
+                    "item_id": self.item2.id,
+                    "transaction_id": self.purchase.id,
+                    "remaining": 3.0,
+                },
+            },
+        ],
+    )
+
+  def test_export_excludes_other_users(self):
+    records = list(Item.objects.export(self.user1))
+
+    self.assertListEqual(
+        [record["data"]["id"] for record in records],
+        [self.item1.id],
+    )
+
+  def test_export_is_lazy(self):
+    export = Item.objects.export(self.user2)
+
+    self.assertEqual(next(export)["type"], "item")
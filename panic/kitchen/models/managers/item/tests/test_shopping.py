@@ -0,0 +1,303 @@
+"""Test the Item Shopping List manager."""
+
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import mock
+
+import pytz
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from freezegun import freeze_time
+
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....item import Item
+from ....shopping_list_version import ShoppingListVersion
+from .. import shopping
+
+SHOPPING_MODULE = shopping.__name__
+
+
+class TestProjectRunOut(SimpleTestCase):
+  """Test the project_run_out function."""
+
+  def test_no_stock(self):
+    self.assertEqual(shopping.project_run_out([], 1), 0)
+
+  def test_consumed_before_expiry(self):
+    self.assertEqual(shopping.project_run_out([(10, 4)], 1), 4)
+
+  def test_expires_before_consumed(self):
+    self.assertEqual(shopping.project_run_out([(3, 4)], 1), 3)
+
+  def test_consumes_batches_in_order(self):
+    self.assertEqual(shopping.project_run_out([(3, 2), (10, 4)], 1), 6)
+
+  def test_skips_batches_expiring_before_reached(self):
+    self.assertEqual(shopping.project_run_out([(5, 6), (4, 2)], 1), 5)
+
+  def test_no_usage_runs_out_at_last_expiry(self):
+    self.assertEqual(shopping.project_run_out([(3, 2), (10, 4)], 0), 10)
+
+  def test_no_usage_never_expiring(self):
+    self.assertIsNone(shopping.project_run_out([(math.inf, 2)], 0))
+
+
+@freeze_time("2020-01-14 12:00:00")
+class TestShoppingListManager(TransactionTestHarness):
+  """Test the ShoppingListManager model manager class."""
+
+  mute_signals = False
+
+  @classmethod
+  def setUpTestData(cls):
+    with cls.captureOnCommitCallbacks(execute=True):
+      super().setUpTestData()
+
+  def setUp(self):
+    with self.captureOnCommitCallbacks(execute=True):
+      super().setUp()
+      self.user1.timezone = pytz.utc
+      self.user1.save()
+      self.item1.shelf_life = 99
+      self.item1.save()
+    cache.clear()
+
+  def tearDown(self):
+    cache.clear()
+    super().tearDown()
+
+  def purchase(self, when, quantity, item=None):
+    with self.captureOnCommitCallbacks(execute=True):
+      return self.create_test_instance(
+          item=item or self.item1,
+          date_object=pytz.utc.localize(when),
+          quantity=quantity,
+      )
+
+  def create_item_without_stores(self, name="Unsorted Item"):
+    return Item.objects.create(
+        name=name,
+        shelf_life=10,
+        user=self.user1,
+        price=1.00,
+    )
+
+  def listed(self, shopping_list):
+    return {
+        store['id']: [item['name'] for item in store['items']
+                     ] for store in shopping_list['stores']
+    }
+
+  def test_runs_out_from_usage(self):
+    self.purchase(datetime(2020, 1, 1), 10)
+    self.purchase(datetime(2020, 1, 10), -8)
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+
+    self.assertEqual(shopping_list['horizon'], 7)
+    self.assertListEqual(
+        shopping_list['stores'],
+        [{
+            "id":
+                self.store1.id,
+            "name":
+                self.store1.name,
+            "items": [{
+                "id": self.item1.id,
+                "name": self.item1.name,
+                "price": Decimal("2.00"),
+                "quantity": 2.0,
+                "usage_avg_week": 4.0,
+                "next_expiry_date": date(2020, 4, 9),
+                "next_expiry_quantity": 2.0,
+                "projected_run_out": date(2020, 1, 17),
+                "quantity_to_buy": 3.0,
+                "preferred_stores": [self.store1.id],
+            }],
+        }],
+    )
+
+  def test_runs_out_from_expiry(self):
+    self.item1.shelf_life = 15
+    self.item1.save()
+    self.purchase(datetime(2020, 1, 1), 10)
+    self.purchase(datetime(2020, 1, 10), -1)
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+    entry = shopping_list['stores'][0]['items'][0]
+
+    self.assertEqual(entry['projected_run_out'], date(2020, 1, 16))
+    self.assertEqual(entry['next_expiry_date'], date(2020, 1, 16))
+    self.assertEqual(entry['quantity_to_buy'], 1.0)
+
+  def test_expired_stock_is_out_of_stock(self):
+    self.item1.shelf_life = 5
+    self.item1.save()
+    self.purchase(datetime(2020, 1, 1), 10)
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+    entry = shopping_list['stores'][0]['items'][0]
+
+    self.assertEqual(entry['projected_run_out'], date(2020, 1, 14))
+    self.assertIsNone(entry['next_expiry_date'])
+    self.assertEqual(entry['next_expiry_quantity'], 0)
+
+  def test_partial_quantities(self):
+    self.item1.has_partial_quantities = True
+    self.item1.save()
+    self.purchase(datetime(2020, 1, 1), 10)
+    self.purchase(datetime(2020, 1, 10), -8)
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+    entry = shopping_list['stores'][0]['items'][0]
+
+    self.assertEqual(entry['quantity_to_buy'], 2.29)
+
+  def test_sufficient_stock_not_listed(self):
+    self.purchase(datetime(2020, 1, 14), 10)
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+
+    self.assertListEqual(shopping_list['stores'], [])
+
+  def test_items_without_stores(self):
+    item = self.create_item_without_stores()
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+
+    self.assertDictEqual(
+        self.listed(shopping_list),
+        {
+            self.store1.id: [self.item1.name],
+            None: [item.name],
+        },
+    )
+    self.assertEqual(
+        shopping_list['stores'][1]['items'][0]['quantity_to_buy'], 1.0
+    )
+
+  def test_excludes_other_users(self):
+    self.create_dependencies(2)
+
+    shopping_list = Item.objects.generate_shopping_list(self.user1)
+
+    self.assertDictEqual(
+        self.listed(shopping_list),
+        {self.store1.id: [self.item1.name]},
+    )
+
+  def test_bounded_queries(self):
+    self.purchase(datetime(2020, 1, 1), 10)
+    self.purchase(datetime(2020, 1, 10), -8)
+    for index in range(3):
+      self.create_item_without_stores(name=f"Unsorted Item {index}")
+
+    with self.assertNumQueries(3):
+      Item.objects.generate_shopping_list(self.user1)
+
+  def test_get_shopping_list_is_cached(self):
+    shopping_list = Item.objects.get_shopping_list(self.user1)
+
+    with self.assertNumQueries(1):
+      self.assertEqual(
+          Item.objects.get_shopping_list(self.user1), shopping_list
+      )
+
+  def test_get_shopping_list_invalidated_by_transaction(self):
+    Item.objects.get_shopping_list(self.user1)
+
+    self.purchase(datetime(2020, 1, 14), 10)
+
+    self.assertListEqual(
+        Item.objects.get_shopping_list(self.user1)['stores'],
+        [],
+    )
+
+  def version(self):
+    return ShoppingListVersion.objects.get(user=self.user1).version
+
+  def test_get_shopping_list_ignores_stale_entries(self):
+    stale = Item.objects.get_shopping_list(self.user1)
+    version = self.version()
+
+    self.purchase(datetime(2020, 1, 14), 10)
+
+    self.assertEqual(
+        cache.get(
+            shopping.SHOPPING_LIST_CACHE_KEY.format(
+                user_id=self.user1.id,
+                version=version,
+            )
+        ),
+        stale,
+    )
+    self.assertListEqual(
+        Item.objects.get_shopping_list(self.user1)['stores'],
+        [],
+    )
+
+  @override_settings(SHOPPING_LIST_CACHE_TTL=60 * 60)
+  @mock.patch(SHOPPING_MODULE + ".caches")
+  def test_get_shopping_list_timeout_ttl(self, m_caches):
+    m_cache = m_caches.__getitem__.return_value
+    m_cache.get.return_value = None
+
+    shopping_list = Item.objects.get_shopping_list(self.user1)
+
+    m_caches.__getitem__.assert_called_once_with("default")
+    m_cache.set.assert_called_once_with(
+        shopping.SHOPPING_LIST_CACHE_KEY.format(
+            user_id=self.user1.id,
+            version=self.version(),
+        ),
+        shopping_list,
+        60 * 60,
+    )
+
+  @override_settings(SHOPPING_LIST_CACHE_TTL=60 * 60 * 24)
+  @mock.patch(SHOPPING_MODULE + ".caches")
+  def test_get_shopping_list_timeout_end_of_day(self, m_caches):
+    m_cache = m_caches.__getitem__.return_value
+    m_cache.get.return_value = None
+
+    Item.objects.get_shopping_list(self.user1)
+
+    self.assertEqual(m_cache.set.call_args[0][2], 60 * 60 * 12)
+
+  def test_invalidate_shopping_list(self):
+    version = self.version()
+
+    with self.captureOnCommitCallbacks(execute=True):
+      shopping.invalidate_shopping_list(self.user1.id)
+
+    self.assertEqual(self.version(), version + 1)
+
+  def test_invalidate_shopping_list_once_per_transaction(self):
+    version = self.version()
+
+    with self.captureOnCommitCallbacks(execute=True) as callbacks:
+      shopping.invalidate_shopping_list(self.user1.id)
+      self.purchase(datetime(2020, 1, 14), 10)
+      shopping.invalidate_shopping_list(self.user1.id)
+
+    self.assertEqual(len(callbacks), 1)
+    self.assertEqual(self.version(), version + 1)
+
+  def test_invalidate_shopping_list_deferred_until_commit(self):
+    version = self.version()
+
+    with self.captureOnCommitCallbacks() as callbacks:
+      shopping.invalidate_shopping_list(self.user1.id)
+
+    self.assertEqual(self.version(), version)
+    callbacks[0]()
+    self.assertEqual(self.version(), version + 1)
+
+  def test_invalidate_shopping_list_creates_version(self):
+    ShoppingListVersion.objects.all().delete()
+
+    with self.captureOnCommitCallbacks(execute=True):
+      shopping.invalidate_shopping_list(self.user1.id)
+
+    self.assertEqual(self.version(), 1)
@@ -0,0 +1,11 @@
+"""Root SpendingSummary model manager."""
+
+from .report import ReportManager
+from .rollup import RollupManager
+
+
+class SpendingSummaryManager(
+    ReportManager,
+    RollupManager,
+):
+  """Aggregate sub-managers into a root SpendingSummary model manager."""
@@ -0,0 +1,95 @@
+"""SpendingSummary Report manager."""
+
+from django.db import models
+from django.db.models import Sum
+from django.db.models.functions import TruncYear
+
+PERIODS = ("month", "year")
+
+
+class ReportManager(models.Manager):
+  """Report on a user's spending, from the pre-aggregated monthly rows.
+
+  Each report reads at most one row per Item, Shelf, Store and month, so its
+  cost is independent of the number of Transactions recorded.
+  """
+
+  def by_store(self, user, start=None, end=None):
+    """Return a user's total spending at each Store, by descending cost.
+
+    :param user: The user whose spending is being reported on
+    :type user: :class:`user.models.user.User`
+    :param start: Include spending from this date's month onward (optional)
+    :type start: :class:`datetime.date`, None
+    :param end: Include spending up until this date's month (optional)
+    :type end: :class:`datetime.date`, None
+
+    :returns: A queryset of dictionaries
+    :rtype: :class:`django.db.models.QuerySet`
+    """
+    return self.__aggregate(user, start, end, 'store_id', 'store__name').\
+        order_by('-cost', 'store___index')
+
+  def by_shelf(self, user, start=None, end=None):
+    """Return a user's total spending for each Shelf, by descending cost.
+
+    :param user: The user whose spending is being reported on
+    :type user: :class:`user.models.user.User`
+    :param start: Include spending from this date's month onward (optional)
+    :type start: :class:`datetime.date`, None
+    :param end: Include spending up until this date's month (optional)
+    :type end: :class:`datetime.date`, None
+
+    :returns: A queryset of dictionaries
+    :rtype: :class:`django.db.models.QuerySet`
+    """
+    return self.__aggregate(user, start, end, 'shelf_id', 'shelf__name').\
+        order_by('-cost', 'shelf___index')
+
+  def by_period(self, user, period="month", start=None, end=None):
+    """Return a user's total spending for each month or year, in order.
+
+    :param user: The user whose spending is being reported on
+    :type user: :class:`user.models.user.User`
+    :param period: The length of each period ("month", "year")
+    :type period: str
+    :param start: Include spending from this date's month onward (optional)
+    :type start: :class:`datetime.date`, None
+    :param end: Include spending up until this date's month (optional)
+    :type end: :class:`datetime.date`, None
+
+    :returns: A queryset of dictionaries
+    :rtype: :class:`django.db.models.QuerySet`
+    """
+    if period not in PERIODS:
+      raise ValueError("Unknown period: %s" % period)
+
+    query_set = self.__filter(user, start, end)
+    if period == "year":
+      query_set = query_set.annotate(period=TruncYear('month'))
+    else:
+      query_set = query_set.annotate(period=models.F('month'))
+
+    return query_set.\
+        values('period').\
+        annotate(
+          quantity=Sum('quantity'),
+          cost=Sum('cost'),
+        ).\
+        order_by('period')
+
+  def __filter(self, user, start, end):
+    query_set = super().get_queryset().filter(user=user)
+    if start is not None:
+      query_set = query_set.filter(month__gte=start.replace(day=1))
+    if end is not None:
+      query_set = query_set.filter(month__lte=end)
+    return query_set
+
+  def __aggregate(self, user, start, end, *group_by):
+    return self.__filter(user, start, end).\
+        values(*group_by).\
+        annotate(
+          quantity=Sum('quantity'),
+          cost=Sum('cost'),
+        )
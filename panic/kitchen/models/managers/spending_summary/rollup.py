@@ -0,0 +1,178 @@
+"""SpendingSummary Rollup manager."""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.db.models import DecimalField, F, Func, Sum
+from django.db.models.functions import TruncMonth
+
+from ....exceptions import ConfirmationRequired
+from ...preferred_store import PreferredStore
+from ...transaction import Transaction
+from user.utilities.request_timezone import local_timezone
+
+CENTS = Decimal("0.01")
+SUMMARY_BATCH_SIZE = 250
+
+
+class PurchaseCost(Func):
+  """The cost of each purchase, rounded to the cent as it's recorded."""
+
+  arg_joiner = " * "
+  output_field = DecimalField()
+  template = "ROUND(%(expressions)s::numeric, 2)"
+
+  def __init__(self, **extra):
+    super().__init__(F('unit_price'), F('quantity'), **extra)
+
+
+class RollupManager(models.Manager):
+  """Maintain the pre-aggregated monthly spending of each Item."""
+
+  def record(self, purchase):
+    """Add a purchase Transaction to its Item's monthly spending.
+
+    The spending is attributed to the Item's Shelf, and its first preferred
+    Store, at the time of purchase.  The month is determined by the timezone
+    of the Item's owner.
+
+    :param purchase: A purchase Transaction with a unit price
+    :type purchase: :class:`kitchen.models.transaction.Transaction`
+    """
+    item = purchase.item
+    month = purchase.datetime.astimezone(local_timezone(item).timezone,
+                                        ).date().replace(day=1)
+    cost = (purchase.unit_price * Decimal(str(purchase.quantity))).quantize(
+        CENTS,
+        rounding=ROUND_HALF_UP,
+    )
+    store = item.preferred_stores.order_by('_index').values('id').first()
+    store_id = store['id'] if store else None
+
+    with transaction.atomic():
+      updated = super().get_queryset().filter(
+          item_id=item.id,
+          month=month,
+          shelf_id=item.shelf_id,
+          store_id=store_id,
+      ).update(
+          quantity=F('quantity') + purchase.quantity,
+          cost=F('cost') + cost,
+      )
+      if not updated:
+        self.create(
+            cost=cost,
+            item_id=item.id,
+            month=month,
+            quantity=purchase.quantity,
+            shelf_id=item.shelf_id,
+            store_id=store_id,
+            user_id=item.user_id,
+        )
+
+  def record_new(self, purchases, store_ids):
+    """Add the purchase Transactions of newly created Items in bulk.
+
+    The Items must not have any spending recorded yet, and each may have only
+    one purchase, so every purchase becomes a new summary.
+
+    :param purchases: Purchase Transactions with unit prices
+    :type purchases: List[:class:`kitchen.models.transaction.Transaction`]
+    :param store_ids: The first preferred Store id of each Item, by Item id
+    :type store_ids: dict
+    """
+    timezones = {}
+    summaries = []
+    for purchase in purchases:
+      item = purchase.item
+      if item.user_id not in timezones:
+        timezones[item.user_id] = local_timezone(item).timezone
+      summaries.append(
+          self.model(
+              cost=(purchase.unit_price *
+                    Decimal(str(purchase.quantity))).quantize(
+                        CENTS,
+                        rounding=ROUND_HALF_UP,
+                    ),
+              item_id=item.id,
+              month=purchase.datetime.astimezone(timezones[item.user_id]
+                                                ).date().replace(day=1),
+              quantity=purchase.quantity,
+              shelf_id=item.shelf_id,
+              store_id=store_ids.get(item.id),
+              user_id=item.user_id,
+          )
+      )
+    self.bulk_create(summaries, batch_size=SUMMARY_BATCH_SIZE)
+
+  def rebuild(self, confirm=False):
+    """Wipe and rebuild the monthly spending of all Items from Transactions.
+
+    Purchases are attributed to each Item's current Shelf and first preferred
+    Store.  They are aggregated in the database, one query for each timezone
+    their owners are in, and the summaries are replaced in a single
+    transaction.
+
+    :param confirm: A boolean indicating you REALLY want to do this
+    :type confirm: bool
+
+    :raises: :class:`panic.kitchen.exceptions.ConfirmationNeeded`
+    """
+    if not confirm:
+      raise ConfirmationRequired("Are you sure you want to do this?")
+
+    with transaction.atomic():
+      super().get_queryset().all().delete()
+
+      stores = self.__query_first_preferred_stores()
+      summaries = []
+      for timezone in self.__query_timezones():
+        for row in self.__query_monthly_spending(timezone):
+          summaries.append(
+              self.model(
+                  cost=row['total_cost'],
+                  item_id=row['item_id'],
+                  month=row['month'].date(),
+                  quantity=row['total_quantity'],
+                  shelf_id=row['item__shelf_id'],
+                  store_id=stores.get(row['item_id']),
+                  user_id=row['item__user_id'],
+              )
+          )
+      self.bulk_create(summaries, batch_size=SUMMARY_BATCH_SIZE)
+
+  @staticmethod
+  def __query_first_preferred_stores():
+    stores = {}
+    for item_id, store_id in PreferredStore.objects.order_by(
+        'store___index'
+    ).values_list('item_id', 'store_id'):
+      stores.setdefault(item_id, store_id)
+    return stores
+
+  @staticmethod
+  def __query_timezones():
+    return get_user_model().objects.filter(
+        item__transaction__quantity__gt=0,
+        item__transaction__unit_price__isnull=False,
+    ).order_by('timezone').values_list(
+        'timezone',
+        flat=True,
+    ).distinct()
+
+  @staticmethod
+  def __query_monthly_spending(timezone):
+    return Transaction.objects.filter(
+        item__user__timezone=timezone,
+        quantity__gt=0,
+        unit_price__isnull=False,
+    ).annotate(month=TruncMonth('datetime', tzinfo=timezone)).values(
+        'item_id',
+        'item__shelf_id',
+        'item__user_id',
+        'month',
+    ).annotate(
+        total_cost=Sum(PurchaseCost()),
+        total_quantity=Sum('quantity'),
+    ).order_by('month', 'item_id')
@@ -0,0 +1,130 @@
+"""Test the SpendingSummary Report manager."""
+
+from datetime import date
+from decimal import Decimal
+
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....item import Item
+from ....spending_summary import SpendingSummary
+
+
+class TestReportManager(TransactionTestHarness):
+  """Test the ReportManager model manager class."""
+
+  @classmethod
+  def create_data_hook(cls):
+    cls.item2 = Item.objects.create(
+        name="Another Item",
+        user=cls.user1,
+        price=1.00,
+    )
+    cls.create_summary(cls.item1, date(2019, 12, 1), 1, "2.00", True)
+    cls.create_summary(cls.item1, date(2020, 1, 1), 2, "4.00", True)
+    cls.create_summary(cls.item2, date(2020, 1, 1), 10, "10.00", False)
+
+    other = cls.create_dependencies(2)['item']
+    cls.create_summary(other, date(2020, 1, 1), 1, "1.00", True)
+
+  @staticmethod
+  def create_summary(item, month, quantity, cost, located):
+    SpendingSummary.objects.create(
+        user=item.user,
+        item=item,
+        shelf=item.shelf if located else None,
+        store=item.preferred_stores.first() if located else None,
+        month=month,
+        quantity=quantity,
+        cost=Decimal(cost),
+    )
+
+  def test_by_store(self):
+    self.assertListEqual(
+        list(SpendingSummary.objects.by_store(self.user1)),
+        [
+            {
+                'store_id': None,
+                'store__name': None,
+                'quantity': 10.0,
+                'cost': Decimal("10.00"),
+            },
+            {
+                'store_id': self.store1.id,
+                'store__name': self.store1.name,
+                'quantity': 3.0,
+                'cost': Decimal("6.00"),
+            },
+        ],
+    )
+
+  def test_by_shelf(self):
+    self.assertListEqual(
+        list(SpendingSummary.objects.by_shelf(self.user1)),
+        [
+            {
+                'shelf_id': None,
+                'shelf__name': None,
+                'quantity': 10.0,
+                'cost': Decimal("10.00"),
+            },
+            {
+                'shelf_id': self.shelf1.id,
+                'shelf__name': self.shelf1.name,
+                'quantity': 3.0,
+                'cost': Decimal("6.00"),
+            },
+        ],
+    )
+
+  def test_by_shelf_within_range(self):
+    self.assertListEqual(
+        list(
+            SpendingSummary.objects.by_shelf(
+                self.user1,
+                start=date(2019, 12, 15),
+                end=date(2019, 12, 31),
+            )
+        ),
+        [{
+            'shelf_id': self.shelf1.id,
+            'shelf__name': self.shelf1.name,
+            'quantity': 1.0,
+            'cost': Decimal("2.00"),
+        }],
+    )
+
+  def test_by_period_month(self):
+    self.assertListEqual(
+        list(SpendingSummary.objects.by_period(self.user1)),
+        [
+            {
+                'period': date(2019, 12, 1),
+                'quantity': 1.0,
+                'cost': Decimal("2.00"),
+            },
+            {
+                'period': date(2020, 1, 1),
+                'quantity': 12.0,
+                'cost': Decimal("14.00"),
+            },
+        ],
+    )
+
+  def test_by_period_year(self):
+    self.assertListEqual(
+        list(
+            SpendingSummary.objects.by_period(
+                self.user1,
+                period="year",
+                start=date(2020, 1, 1),
+            )
+        ),
+        [{
+            'period': date(2020, 1, 1),
+            'quantity': 12.0,
+            'cost': Decimal("14.00"),
+        }],
+    )
+
+  def test_by_period_invalid(self):
+    with self.assertRaises(ValueError):
+      SpendingSummary.objects.by_period(self.user1, period="week")
@@ -0,0 +1,167 @@
+"""Test the SpendingSummary Rollup manager."""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+import pytz
+
+from .....exceptions import ConfirmationRequired
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....spending_summary import SpendingSummary
+from ....store import Store
+from .. import rollup
+
+
+class TestRollupManager(TransactionTestHarness):
+  """Test the RollupManager model manager class."""
+
+  mute_signals = False
+
+  def setUp(self):
+    super().setUp()
+    self.user1.timezone = pytz.timezone("America/Toronto")
+    self.user1.save()
+
+  def purchase(self, when, quantity=2):
+    return self.create_test_instance(
+        item=self.item1,
+        date_object=pytz.utc.localize(when),
+        quantity=quantity,
+    )
+
+  def summaries(self):
+    return list(
+        SpendingSummary.objects.order_by('month', 'id').values(
+            'item_id',
+            'shelf_id',
+            'store_id',
+            'user_id',
+            'month',
+            'quantity',
+            'cost',
+        )
+    )
+
+  def test_record_purchase(self):
+    self.purchase(datetime(2020, 1, 14), quantity=1.5)
+
+    self.assertListEqual(
+        self.summaries(),
+        [{
+            'item_id': self.item1.id,
+            'shelf_id': self.shelf1.id,
+            'store_id': self.store1.id,
+            'user_id': self.user1.id,
+            'month': datetime(2020, 1, 1).date(),
+            'quantity': 1.5,
+            'cost': Decimal("3.00"),
+        }],
+    )
+
+  def test_record_accumulates_monthly(self):
+    self.purchase(datetime(2020, 1, 14))
+    self.purchase(datetime(2020, 1, 20))
+
+    summaries = self.summaries()
+
+    self.assertEqual(len(summaries), 1)
+    self.assertEqual(summaries[0]['quantity'], 4)
+    self.assertEqual(summaries[0]['cost'], Decimal("8.00"))
+
+  def test_record_uses_local_month(self):
+    self.purchase(datetime(2020, 2, 1, 2))
+
+    self.assertEqual(self.summaries()[0]['month'], datetime(2020, 1, 1).date())
+
+  def test_record_uses_unit_price_snapshot(self):
+    self.purchase(datetime(2020, 1, 14))
+    self.item1.price = 10
+    self.item1.save()
+    self.purchase(datetime(2020, 1, 20))
+
+    self.assertEqual(self.summaries()[0]['cost'], Decimal("24.00"))
+
+  def test_record_rounds_half_up(self):
+    self.item1.price = Decimal("0.01")
+    self.item1.save()
+
+    self.purchase(datetime(2020, 1, 14), quantity=0.5)
+
+    self.assertEqual(self.summaries()[0]['cost'], Decimal("0.01"))
+
+  def test_record_ignores_consumption(self):
+    self.purchase(datetime(2020, 1, 14))
+    self.purchase(datetime(2020, 1, 15), quantity=-1)
+
+    self.assertEqual(self.summaries()[0]['quantity'], 2)
+
+  def test_record_first_preferred_store(self):
+    other_store = Store.objects.create(user=self.user1, name="a store")
+    self.item1.preferred_stores.add(other_store)
+
+    self.purchase(datetime(2020, 1, 14))
+
+    self.assertEqual(self.summaries()[0]['store_id'], other_store.id)
+
+  def test_rebuild_not_confirmed(self):
+    with self.assertRaises(ConfirmationRequired):
+      SpendingSummary.objects.rebuild()
+
+  def test_rebuild_confirmed(self):
+    self.purchase(datetime(2020, 1, 14))
+    self.purchase(datetime(2020, 2, 14))
+    original = self.summaries()
+    SpendingSummary.objects.all().update(cost=0)
+
+    SpendingSummary.objects.rebuild(confirm=True)
+
+    self.assertListEqual(
+        [dict(row, id=None) for row in self.summaries()],
+        [dict(row, id=None) for row in original],
+    )
+
+  def test_rebuild_multiple_items_and_timezones(self):
+    user2 = self.create_dependencies(2)['user']
+    user2.timezone = pytz.utc
+    user2.save()
+    item2 = user2.item_set.get()
+    self.item1.price = Decimal("0.01")
+    self.item1.save()
+    self.purchase(datetime(2020, 2, 1, 2), quantity=0.5)
+    self.purchase(datetime(2020, 2, 1, 3), quantity=0.5)
+    self.purchase(datetime(2020, 2, 14), quantity=-1)
+    self.create_test_instance(
+        item=item2,
+        date_object=pytz.utc.localize(datetime(2020, 2, 1, 2)),
+        quantity=3,
+    )
+    original = self.summaries()
+    SpendingSummary.objects.all().delete()
+
+    with self.assertNumQueries(8):
+      SpendingSummary.objects.rebuild(confirm=True)
+
+    self.assertListEqual(
+        sorted(
+            [dict(row, id=None) for row in self.summaries()],
+            key=lambda row: row['user_id'],
+        ),
+        sorted(
+            [dict(row, id=None) for row in original],
+            key=lambda row: row['user_id'],
+        ),
+    )
+
+  def test_rebuild_is_atomic(self):
+    self.purchase(datetime(2020, 1, 14))
+    original = self.summaries()
+
+    with mock.patch(
+        rollup.__name__ + ".RollupManager.bulk_create",
+        side_effect=ValueError,
+    ):
+      with self.assertRaises(ValueError):
+        SpendingSummary.objects.rebuild(confirm=True)
+
+    self.assertListEqual(self.summaries(), original)
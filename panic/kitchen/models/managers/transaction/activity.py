@@ -1,5 +1,6 @@
 """Transaction Activity model manager."""
 
+import asyncio
 from datetime import timedelta
 
 import pendulum
@@ -9,10 +10,78 @@ from django.db import models
 from django.db.models import Sum
 from django.db.models.functions import TruncDate, TruncDay
 
+from user.utilities.request_timezone import LocalTimezone
+from utilities.asynchronous.executors import database_sync_to_async
+
 
 class ActivityManager(models.Manager):
   """Provide reporting on the usage activity patterns of Items."""
 
+  async def gather_activity(self, item_id, zone=pytz.utc.zone):
+    """Retrieve all the statistics of an item's activity report concurrently.
+    Each statistic is queried on a separate thread, and database connection.
+
+    :param item_id: The pk of the item model instance in question
+    :type item_id: int
+    :param zone: A world timezone descriptor string (defaults to UTC)
+    :type zone: str, :class:`user.utilities.request_timezone.LocalTimezone`
+
+    The usage averages are calculated from the gathered statistics.
+
+    :returns: The statistics, keyed by the Item properties they correspond to
+    :rtype: dict
+    """
+    local = LocalTimezone.from_zone(zone)
+    queries = {
+        "activity_first": (self.get_activity_first, item_id),
+        "activity_last_two_weeks": (
+            self.get_activity_last_two_weeks,
+            item_id,
+            local,
+        ),
+        "usage_current_month": (self.get_usage_current_month, item_id, local),
+        "usage_current_week": (self.get_usage_current_week, item_id, local),
+        "usage_total": (self.get_usage_total, item_id),
+    }
+    results = await asyncio.gather(
+        *(
+            database_sync_to_async(query)(*args)
+            for query, *args in queries.values()
+        )
+    )
+    activity = dict(zip(queries, results))
+    for name, unit in (("usage_avg_month", "months"),
+                       ("usage_avg_week", "weeks")):
+      activity[name] = self.calculate_usage_average(
+          activity["activity_first"],
+          activity["usage_total"],
+          unit,
+      )
+    return activity
+
+  @staticmethod
+  def calculate_usage_average(activity_first, usage_total, unit):
+    """Calculate an item's average usage, since it's first activity.
+
+    :param activity_first: The datetime of the item's first transaction
+    :type activity_first: :class:`datetime.datetime`, None
+    :param usage_total: The item's total consumption
+    :type usage_total: float
+    :param unit: The pendulum unit to average over ("weeks", "months")
+    :type unit: str
+
+    :returns: The average usage
+    :rtype: float
+    """
+    average = 0
+    if activity_first is not None:
+      since_first_transaction = (
+          pendulum.now() - pendulum.instance(activity_first)
+      )
+      periods = getattr(since_first_transaction, "in_" + unit)()
+      average = usage_total / (periods + 1)
+    return float("{:.2f}".format(average))
+
   def get_activity_first(self, item_id, zone=pytz.utc.zone):
     """Search for the first transaction for this item, and return the datetime.
     The datetime is returned in the specified timezone.
@@ -22,12 +91,12 @@ class ActivityManager(models.Manager):
     :param item_id: The pk of the item model instance in question
     :type item_id: int
     :param zone: A world timezone descriptor string (defaults to UTC)
-    :type item_id: str
+    :type zone: str, :class:`user.utilities.request_timezone.LocalTimezone`
 
     :returns: The datetime, or None
     :rtype: :class:`datetime.datetime`, None
     """
-    zone = pytz.timezone(zone)
+    zone = LocalTimezone.from_zone(zone).timezone
     query_set = super().get_queryset().\
         filter(
           item=item_id,
@@ -46,21 +115,22 @@ class ActivityManager(models.Manager):
     :param item_id: The pk of the item model instance in question
     :type item_id: int
     :param zone: A world timezone descriptor string (defaults to UTC)
-    :type item_id: str
+    :type zone: str, :class:`user.utilities.request_timezone.LocalTimezone`
 
     :returns: A queryset representing the activity
     :rtype: :class:`django.db.models.QuerySet`, None
     """
-    timezone_object = pytz.timezone(zone)
-    query = self._query_activity_last_two_weeks(item_id, timezone_object)
-    results = self._zfill_activity_last_two_weeks(query, timezone_object)
+    local = LocalTimezone.from_zone(zone)
+    query = self._query_activity_last_two_weeks(item_id, local)
+    results = self._zfill_activity_last_two_weeks(query, local)
     return results
 
-  def _query_activity_last_two_weeks(self, item_id, timezone_object):
+  def _query_activity_last_two_weeks(self, item_id, local):
     """Retrieve transaction activity for the past two weeks."""
     results = []
+    timezone_object = local.timezone
 
-    start_of_window = pendulum.now(tz=timezone_object)
+    start_of_window = local.now
     end_of_window = (
         start_of_window -
         (timedelta(days=int(settings.TRANSACTION_HISTORY_MAX)))
@@ -82,11 +152,11 @@ class ActivityManager(models.Manager):
 
     return results
 
-  def _zfill_activity_last_two_weeks(self, query_results, timezone_object):
+  def _zfill_activity_last_two_weeks(self, query_results, local):
     """Add zero `change` entries to the query for days without activity."""
     zero_padded_results = []
     query_hash = {}
-    current_datetime = pendulum.now(timezone_object)
+    current_datetime = local.now
 
     for row in query_results:
       query_hash[row['date']] = row['change']
@@ -109,12 +179,12 @@ class ActivityManager(models.Manager):
     :param item_id: The pk of the item model instance in question
     :type item_id: int
     :param zone: A world timezone descriptor string (defaults to UTC)
-    :type item_id: str
+    :type zone: str, :class:`user.utilities.request_timezone.LocalTimezone`
 
     :returns: The total count of cumulative consumption
     :rtype: float
     """
-    start_of_week = pendulum.now(zone).start_of('week')
+    start_of_week = LocalTimezone.from_zone(zone).start_of('week')
 
     quantity = super().get_queryset().\
         filter(
@@ -135,12 +205,12 @@ class ActivityManager(models.Manager):
     :param item_id: The pk of the item model instance in question
     :type item_id: int
     :param zone: A world timezone descriptor string (defaults to UTC)
-    :type item_id: str
+    :type zone: str, :class:`user.utilities.request_timezone.LocalTimezone`
 
     :returns: The total count of cumulative consumption
     :rtype: float
     """
-    start_of_month = pendulum.now(zone).start_of('month')
+    start_of_month = LocalTimezone.from_zone(zone).start_of('month')
 
     quantity = super().get_queryset().\
         filter(
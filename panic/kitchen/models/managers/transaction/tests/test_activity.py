@@ -2,15 +2,18 @@
 
 from collections import OrderedDict
 from datetime import timedelta
+from unittest.mock import patch
 
 import pendulum
 import pytz
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
 from django.utils import timezone
 from freezegun import freeze_time
 
 from .....tests.fixtures.fixtures_freezegun import to_realdate
 from ....transaction import Transaction
+from .. import activity
 from .fixtures.fixtures_activity import ActivityManagerTestHarness
 
 
@@ -527,3 +530,42 @@ class TestActivityManagerStats(ActivityManagerTestHarness):
     self.assertEqual(
         0, Transaction.objects.get_usage_current_month(self.item2.id)
     )
+
+  # Run the gathered queries on this thread, where the test data is visible.
+  @patch(activity.__name__ + ".database_sync_to_async", sync_to_async)
+  def test_gather_activity(self):
+    zone = "Pacific/Honolulu"
+
+    gathered = async_to_sync(Transaction.objects.gather_activity)(
+        self.item1.id,
+        zone=zone,
+    )
+
+    self.assertEqual(
+        gathered,
+        {
+            "activity_first":
+                Transaction.objects.get_activity_first(self.item1.id),
+            "activity_last_two_weeks":
+                Transaction.objects.get_activity_last_two_weeks(
+                    self.item1.id,
+                    zone=zone,
+                ),
+            "usage_current_month":
+                Transaction.objects.get_usage_current_month(
+                    self.item1.id,
+                    zone=zone,
+                ),
+            "usage_current_week":
+                Transaction.objects.get_usage_current_week(
+                    self.item1.id,
+                    zone=zone,
+                ),
+            "usage_total":
+                Transaction.objects.get_usage_total(self.item1.id),
+            "usage_avg_month":
+                self.item1.usage_avg_month,
+            "usage_avg_week":
+                self.item1.usage_avg_week,
+        },
+    )
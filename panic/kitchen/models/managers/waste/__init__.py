@@ -0,0 +1,9 @@
+"""Root Waste model manager."""
+
+from .ledger import LedgerManager
+
+
+class WasteManager(
+    LedgerManager,
+):
+  """Aggregate sub-managers into a root Waste model manager."""
@@ -0,0 +1,114 @@
+"""Waste Ledger manager."""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.db.models import F
+
+from ...inventory import Inventory
+from ...waste_summary import WasteSummary
+from user.utilities.request_timezone import LocalTimezone
+
+CENTS = Decimal("0.01")
+
+
+class LedgerManager(models.Manager):
+  """Record expired inventory in the Waste ledger."""
+
+  def record_expired(self, user, item_ids=None):
+    """Record all of a user's newly expired inventory as waste.
+
+    Each purchase is recorded at most once, with the quantity that remained in
+    inventory once it expired.  The pre-aggregated WasteSummary rows are
+    updated in the same transaction.
+
+    The checked items are locked first, so concurrent recordings of the same
+    item are serialized, and can't record a purchase or summary twice.
+
+    :param user: The user whose inventory is being checked
+    :type user: :class:`user.models.user.User`
+    :param item_ids: The pks of the items to check (defaults to all items)
+    :type item_ids: List[int], None
+
+    :returns: The recorded waste
+    :rtype: List[:class:`kitchen.models.waste.Waste`]
+    """
+    today = LocalTimezone(user.timezone, user.pk).now.date()
+    timezone = user.timezone
+
+    items = self.model._meta.get_field('item').related_model.objects.filter(
+        user=user,
+    )
+    inventory = Inventory.objects.filter(
+        item__user=user,
+        remaining__gt=0,
+        transaction__waste__isnull=True,
+    )
+    if item_ids is not None:
+      items = items.filter(pk__in=item_ids)
+      inventory = inventory.filter(item_id__in=item_ids)
+
+    with transaction.atomic():
+      list(items.select_for_update().order_by('pk').values_list('pk'))
+
+      waste = []
+      for row in inventory.values(
+          'item_id',
+          'item__price',
+          'item__shelf_id',
+          'item__shelf_life',
+          'remaining',
+          'transaction_id',
+          'transaction__datetime',
+      ):
+        expired = (
+            row['transaction__datetime'].astimezone(timezone).date() +
+            timedelta(days=row['item__shelf_life'])
+        )
+        if expired <= today:
+          waste.append(self.__create_entry(row, expired))
+
+      if waste:
+        self.bulk_create(waste)
+        self.__summarize(user, waste)
+    return waste
+
+  def __create_entry(self, row, expired):
+    return self.model(
+        cost=(row['item__price'] *
+              Decimal(str(row['remaining']))).quantize(CENTS),
+        expired=expired,
+        item_id=row['item_id'],
+        quantity=row['remaining'],
+        shelf_id=row['item__shelf_id'],
+        transaction_id=row['transaction_id'],
+        unit_price=row['item__price'],
+    )
+
+  @staticmethod
+  def __summarize(user, waste):
+    totals = {}
+    for entry in waste:
+      key = (entry.item_id, entry.shelf_id, entry.expired.replace(day=1))
+      quantity, cost = totals.get(key, (0, Decimal(0)))
+      totals[key] = (quantity + entry.quantity, cost + entry.cost)
+
+    for (item_id, shelf_id, month), (quantity, cost) in totals.items():
+      updated = WasteSummary.objects.filter(
+          item_id=item_id,
+          shelf_id=shelf_id,
+          month=month,
+      ).update(
+          quantity=F('quantity') + quantity,
+          cost=F('cost') + cost,
+      )
+      if not updated:
+        WasteSummary.objects.create(
+            cost=cost,
+            item_id=item_id,
+            month=month,
+            quantity=quantity,
+            shelf_id=shelf_id,
+            user=user,
+        )
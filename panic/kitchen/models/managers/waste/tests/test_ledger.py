@@ -0,0 +1,137 @@
+"""Test the Waste Ledger manager."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytz
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
+
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....inventory import Inventory
+from ....waste import Waste
+from ....waste_summary import WasteSummary
+
+
+@freeze_time("2020-03-14 12:00:00")
+class TestLedgerManager(TransactionTestHarness):
+  """Test the LedgerManager model manager class."""
+
+  mute_signals = False
+
+  def setUp(self):
+    super().setUp()
+    self.user1.timezone = pytz.utc
+    self.user1.save()
+    self.item1.shelf_life = 10
+    self.item1.save()
+
+  def purchase(self, when, quantity):
+    return self.create_test_instance(
+        item=self.item1,
+        date_object=pytz.utc.localize(when),
+        quantity=quantity,
+    )
+
+  def test_records_expired_inventory(self):
+    purchase = self.purchase(datetime(2020, 2, 1), 3)
+
+    waste, = Waste.objects.record_expired(self.user1)
+
+    self.assertEqual(waste.item, self.item1)
+    self.assertEqual(waste.shelf, self.shelf1)
+    self.assertEqual(waste.transaction, purchase)
+    self.assertEqual(waste.quantity, 3)
+    self.assertEqual(waste.unit_price, Decimal("2.00"))
+    self.assertEqual(waste.cost, Decimal("6.00"))
+    self.assertEqual(waste.expired, date(2020, 2, 11))
+
+  def test_records_remaining_quantity(self):
+    self.purchase(datetime(2020, 2, 1), 3)
+    inventory = Inventory.objects.get(item=self.item1)
+    inventory.remaining = 0.5
+    inventory.save()
+
+    waste, = Waste.objects.record_expired(self.user1)
+
+    self.assertEqual(waste.quantity, 0.5)
+    self.assertEqual(waste.cost, Decimal("1.00"))
+
+  def test_ignores_unexpired_inventory(self):
+    self.purchase(datetime(2020, 3, 5), 3)
+
+    self.assertListEqual(Waste.objects.record_expired(self.user1), [])
+
+  def test_records_each_purchase_once(self):
+    self.purchase(datetime(2020, 2, 1), 3)
+    Waste.objects.record_expired(self.user1)
+
+    self.assertListEqual(Waste.objects.record_expired(self.user1), [])
+    self.assertEqual(Waste.objects.count(), 1)
+
+  def test_locks_items(self):
+    self.purchase(datetime(2020, 2, 1), 3)
+
+    with CaptureQueriesContext(connection) as queries:
+      Waste.objects.record_expired(self.user1, [self.item1.id])
+
+    locks = [
+        query['sql']
+        for query in queries
+        if query['sql'].endswith("FOR UPDATE")
+    ]
+    self.assertEqual(len(locks), 1)
+    self.assertIn(str(self.item1.id), locks[0])
+
+  def test_filters_items(self):
+    self.purchase(datetime(2020, 2, 1), 3)
+
+    self.assertListEqual(
+        Waste.objects.record_expired(self.user1, [self.item1.id + 1]),
+        [],
+    )
+
+  def test_excludes_other_users(self):
+    user2 = self.create_dependencies(2)['user']
+    self.purchase(datetime(2020, 2, 1), 3)
+
+    self.assertListEqual(Waste.objects.record_expired(user2), [])
+
+  def test_summarizes_by_month(self):
+    self.purchase(datetime(2020, 1, 1), 1)
+    self.purchase(datetime(2020, 1, 25), 2)
+    Waste.objects.record_expired(self.user1)
+    self.purchase(datetime(2020, 1, 26), 3)
+    Waste.objects.record_expired(self.user1)
+
+    self.assertListEqual(
+        list(
+            WasteSummary.objects.order_by('month').values(
+                'user',
+                'item',
+                'shelf',
+                'month',
+                'quantity',
+                'cost',
+            )
+        ),
+        [
+            {
+                'user': self.user1.id,
+                'item': self.item1.id,
+                'shelf': self.shelf1.id,
+                'month': date(2020, 1, 1),
+                'quantity': 1.0,
+                'cost': Decimal("2.00"),
+            },
+            {
+                'user': self.user1.id,
+                'item': self.item1.id,
+                'shelf': self.shelf1.id,
+                'month': date(2020, 2, 1),
+                'quantity': 5.0,
+                'cost': Decimal("10.00"),
+            },
+        ],
+    )
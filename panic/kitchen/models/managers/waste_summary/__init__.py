@@ -0,0 +1,9 @@
+"""Root WasteSummary model manager."""
+
+from .report import ReportManager
+
+
+class WasteSummaryManager(
+    ReportManager,
+):
+  """Aggregate sub-managers into a root WasteSummary model manager."""
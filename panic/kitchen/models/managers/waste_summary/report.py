@@ -0,0 +1,52 @@
+"""WasteSummary Report manager."""
+
+from django.db import models
+from django.db.models import Sum
+
+
+class ReportManager(models.Manager):
+  """Report on a user's waste, from the pre-aggregated WasteSummary rows."""
+
+  def by_item(self, user):
+    """Return a user's total waste for each Item, by descending cost.
+
+    :param user: The user whose waste is being reported on
+    :type user: :class:`user.models.user.User`
+
+    :returns: A queryset of dictionaries
+    :rtype: :class:`django.db.models.QuerySet`
+    """
+    return self.__aggregate(user, 'item_id', 'item__name').\
+        order_by('-cost', 'item___index')
+
+  def by_shelf(self, user):
+    """Return a user's total waste for each Shelf, by descending cost.
+
+    :param user: The user whose waste is being reported on
+    :type user: :class:`user.models.user.User`
+
+    :returns: A queryset of dictionaries
+    :rtype: :class:`django.db.models.QuerySet`
+    """
+    return self.__aggregate(user, 'shelf_id', 'shelf__name').\
+        order_by('-cost', 'shelf___index')
+
+  def by_month(self, user):
+    """Return a user's total waste for each month, in chronological order.
+
+    :param user: The user whose waste is being reported on
+    :type user: :class:`user.models.user.User`
+
+    :returns: A queryset of dictionaries
+    :rtype: :class:`django.db.models.QuerySet`
+    """
+    return self.__aggregate(user, 'month').order_by('month')
+
+  def __aggregate(self, user, *group_by):
+    return super().get_queryset().\
+        filter(user=user).\
+        values(*group_by).\
+        annotate(
+          quantity=Sum('quantity'),
+          cost=Sum('cost'),
+        )
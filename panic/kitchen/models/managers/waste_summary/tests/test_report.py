@@ -0,0 +1,92 @@
+"""Test the WasteSummary Report manager."""
+
+from datetime import date
+from decimal import Decimal
+
+from .....tests.fixtures.fixtures_transaction import TransactionTestHarness
+from ....item import Item
+from ....waste_summary import WasteSummary
+
+
+class TestReportManager(TransactionTestHarness):
+  """Test the ReportManager model manager class."""
+
+  @classmethod
+  def create_data_hook(cls):
+    cls.item2 = Item.objects.create(
+        name="Another Item",
+        user=cls.user1,
+        price=1.00,
+    )
+    cls.create_summary(cls.item1, cls.shelf1, date(2020, 1, 1), 1, "2.00")
+    cls.create_summary(cls.item1, cls.shelf1, date(2020, 2, 1), 2, "4.00")
+    cls.create_summary(cls.item2, None, date(2020, 1, 1), 10, "10.00")
+
+    other = cls.create_dependencies(2)
+    cls.create_summary(other['item'], other['shelf'], date(2020, 1, 1), 1, "1")
+
+  @staticmethod
+  def create_summary(item, shelf, month, quantity, cost):
+    WasteSummary.objects.create(
+        user=item.user,
+        item=item,
+        shelf=shelf,
+        month=month,
+        quantity=quantity,
+        cost=Decimal(cost),
+    )
+
+  def test_by_item(self):
+    self.assertListEqual(
+        list(WasteSummary.objects.by_item(self.user1)),
+        [
+            {
+                'item_id': self.item2.id,
+                'item__name': self.item2.name,
+                'quantity': 10.0,
+                'cost': Decimal("10.00"),
+            },
+            {
+                'item_id': self.item1.id,
+                'item__name': self.item1.name,
+                'quantity': 3.0,
+                'cost': Decimal("6.00"),
+            },
+        ],
+    )
+
+  def test_by_shelf(self):
+    self.assertListEqual(
+        list(WasteSummary.objects.by_shelf(self.user1)),
+        [
+            {
+                'shelf_id': None,
+                'shelf__name': None,
+                'quantity': 10.0,
+                'cost': Decimal("10.00"),
+            },
+            {
+                'shelf_id': self.shelf1.id,
+                'shelf__name': self.shelf1.name,
+                'quantity': 3.0,
+                'cost': Decimal("6.00"),
+            },
+        ],
+    )
+
+  def test_by_month(self):
+    self.assertListEqual(
+        list(WasteSummary.objects.by_month(self.user1)),
+        [
+            {
+                'month': date(2020, 1, 1),
+                'quantity': 11.0,
+                'cost': Decimal("12.00"),
+            },
+            {
+                'month': date(2020, 2, 1),
+                'quantity': 2.0,
+                'cost': Decimal("4.00"),
+            },
+        ],
+    )
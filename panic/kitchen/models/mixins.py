@@ -2,17 +2,21 @@
 
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 
+from ..exceptions import UniqueNameConstraintError
 from . import constants
+from utilities.models.validators.trusted import is_trusted_write
 
 
 class FullCleanMixin:
-  """Ensures full_clean is called on save."""
+  """Ensures full_clean is called on save, unless the write is trusted."""
 
   # pylint: disable=signature-differs
   def save(self, *args, **kwargs):
     """Clean and save model."""
-    self.full_clean()
+    if not is_trusted_write():
+      self.full_clean()
     super().save(*args, **kwargs)
 
 
@@ -53,21 +57,35 @@ class RelatedFieldEnforcementMixin:
 
 
 class UniqueNameConstraintMixin:
-  """Enforces uniqueness on the `name` field, regardless of case."""
+  """Enforces uniqueness on the `name` field, regardless of case.
 
-  def clean(self):
-    """Validate the field `name` is unique regardless of case, per user.
+  Uniqueness is enforced by a functional unique index on `(user_id,
+  lower(name))`, and violations are translated into validation errors.
+  """
 
-    :raises: :class:`django.core.exceptions.ValidationError`
+  UNIQUE_NAME_INDEX_SUFFIX = "user_lower_name_uniq"
+
+  # pylint: disable=signature-differs
+  def save(self, *args, **kwargs):
+    """Save model, translating a unique name violation into a validation error.
+
+    :raises: :class:`panic.kitchen.exceptions.UniqueNameConstraintError`
+    """
+    try:
+      with transaction.atomic():
+        super().save(*args, **kwargs)
+    except IntegrityError as exc:
+      if self.get_unique_name_index() not in str(exc):
+        raise
+      raise UniqueNameConstraintError(
+          constants.UNIQUE_NAME_CONSTRAINT_ERROR
+      ) from exc
+
+  @classmethod
+  def get_unique_name_index(cls):
+    """Return the name of the functional unique index for this model.
+
+    :returns: The database index name
+    :rtype: str
     """
-    super().clean()
-    count = self._meta.model.objects.\
-        filter(
-          name__iexact=self.name,
-          user=self.user,
-        ).exclude(
-          id=self.id
-        ).count()
-
-    if count > 0:
-      raise ValidationError(constants.UNIQUE_NAME_CONSTRAINT_ERROR)
+    return f"{cls._meta.db_table}_{cls.UNIQUE_NAME_INDEX_SUFFIX}"
@@ -0,0 +1,33 @@
+"""ShoppingListVersion model."""
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+User = get_user_model()
+
+
+class ShoppingListVersion(models.Model):
+  """ShoppingListVersion model.
+
+  A per user version stamp, incremented whenever the user's shopping list is
+  invalidated.  Cached shopping lists are keyed by it, so every process sees
+  an invalidation, regardless of the cache backend.
+
+  Deleting a user also deletes their items, which invalidates their shopping
+  list again, so the stamp has no database constraint, and is left behind.
+  """
+
+  user = models.OneToOneField(
+      User,
+      on_delete=models.DO_NOTHING,
+      db_constraint=False,
+      primary_key=True,
+      related_name='shopping_list_version',
+  )
+  version = models.BigIntegerField(default=0)
+
+  def __str__(self):
+    return "Shopping list version %s of %s" % (
+        self.version,
+        self.user.username,
+    )
@@ -0,0 +1,49 @@
+"""SpendingSummary model."""
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+from .managers.spending_summary import SpendingSummaryManager
+
+User = get_user_model()
+
+
+class SpendingSummary(models.Model):
+  """SpendingSummary model.
+
+  Purchase Transactions, pre-aggregated by Item, Shelf, Store and month for
+  reporting.
+  """
+
+  cost = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+  item = models.ForeignKey('Item', on_delete=models.CASCADE)
+  month = models.DateField()
+  quantity = models.FloatField(default=0)
+  shelf = models.ForeignKey(
+      'Shelf',
+      on_delete=models.SET_NULL,
+      blank=True,
+      null=True,
+  )
+  store = models.ForeignKey(
+      'Store',
+      on_delete=models.SET_NULL,
+      blank=True,
+      null=True,
+  )
+  user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+  objects = SpendingSummaryManager()
+
+  class Meta:
+    verbose_name_plural = "Spending summaries"
+    indexes = [
+        models.Index(fields=['user', 'month']),
+    ]
+
+  def __str__(self):
+    return "%s spent on %s in %s" % (
+        self.cost,
+        self.item.name,
+        self.month.strftime("%B %Y"),
+    )
@@ -0,0 +1,72 @@
+"""Test the Forecast model."""
+
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from ..forecast import Forecast
+from ..item import Item
+
+TODAY = date(2020, 1, 14)
+
+
+class TestForecast(SimpleTestCase):
+  """Test the Forecast model."""
+
+  def forecast(self, **kwargs):
+    values = {
+        'item': Item(name="Canned Beans"),
+        'alpha': 0.5,
+        'rate': 2.0,
+        'fitted_through': date(2020, 1, 13),
+        'pending': 0,
+        'pending_date': TODAY,
+    }
+    values.update(kwargs)
+    return Forecast(**values)
+
+  def test_str(self):
+    self.assertEqual(
+        str(self.forecast(rate=1 / 3)),
+        "0.33 units of Canned Beans per day",
+    )
+
+  def test_get_rate_fitted(self):
+    self.assertEqual(self.forecast().get_rate(TODAY), 2.0)
+
+  def test_get_rate_decays_without_consumption(self):
+    forecast = self.forecast(pending=0)
+
+    self.assertEqual(forecast.get_rate(date(2020, 1, 17)), 0.25)
+
+  def test_get_rate_folds_pending_consumption(self):
+    forecast = self.forecast(pending=4)
+
+    self.assertEqual(forecast.get_rate(date(2020, 1, 15)), 3.0)
+    self.assertEqual(forecast.get_rate(date(2020, 1, 16)), 1.5)
+
+  def test_get_rate_folds_pending_after_gap(self):
+    forecast = self.forecast(
+        fitted_through=date(2020, 1, 10),
+        pending=4,
+    )
+
+    self.assertEqual(forecast.get_rate(date(2020, 1, 15)), 2.125)
+
+  def test_get_rate_pending_first_day(self):
+    forecast = self.forecast(rate=0, fitted_through=None, pending=3)
+
+    self.assertEqual(forecast.get_rate(TODAY), 0)
+    self.assertEqual(forecast.get_rate(date(2020, 1, 15)), 3)
+
+  def test_get_stock_out_date(self):
+    self.assertEqual(
+        self.forecast().get_stock_out_date(5, TODAY),
+        date(2020, 1, 16),
+    )
+
+  def test_get_stock_out_date_out_of_stock(self):
+    self.assertEqual(self.forecast().get_stock_out_date(0, TODAY), TODAY)
+
+  def test_get_stock_out_date_no_consumption(self):
+    self.assertIsNone(self.forecast(rate=0).get_stock_out_date(5, TODAY))
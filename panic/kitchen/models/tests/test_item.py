@@ -15,6 +15,7 @@ from ...tests.fixtures.fixture_mixins import ModelTestMixin
 from ...tests.fixtures.fixtures_item import ItemTestHarness
 from .. import constants
 from .. import item as item_module
+from ..forecast import Forecast
 from ..item import Item
 from utilities.models.decorators.caching import PersistentCachedProperty
 
@@ -326,6 +327,26 @@ class TestItemCalculatedPropertiesInventory(ItemTestHarness):
     self.assertEqual(self.item1.next_expiry_quantity, original_value)
     m_func.assert_called_once_with(self.item1)
 
+  def test_projected_stock_out_no_forecast(self):
+    self.assertIsNone(self.item1.projected_stock_out)
+
+  @freeze_time("2020-01-14 12:00:00")
+  def test_projected_stock_out(self):
+    Forecast.objects.create(
+        item=self.item1,
+        alpha=0.5,
+        rate=0.5,
+        fitted_through=datetime.date(2020, 1, 13),
+        pending=0,
+        pending_date=datetime.date(2020, 1, 14),
+    )
+    self.item1.quantity = 3
+
+    self.assertEqual(
+        self.item1.projected_stock_out,
+        datetime.date(2020, 1, 20),
+    )
+
   @patch(ITEM_MODULE + '.Transaction.objects.get_activity_first')
   def test_activity_first(self, m_activity):
     m_activity.return_value = self.today - datetime.timedelta(days=900)
@@ -358,7 +379,9 @@ class TestItemCalculatedPropertiesInventory(ItemTestHarness):
         self.item1.activity_last_two_weeks,
         m_activity.return_value,
     )
-    m_activity.assert_called_with(self.item1.id, zone=self.user1.timezone.zone)
+    args, kwargs = m_activity.call_args
+    self.assertEqual(args, (self.item1.id,))
+    self.assertEqual(kwargs['zone'].zone, self.user1.timezone.zone)
 
   @patch(ITEM_MODULE + '.Transaction.objects.get_activity_first')
   @patch(ITEM_MODULE + '.Transaction.objects.get_usage_total')
@@ -466,7 +489,9 @@ class TestItemCalculatedPropertiesInventory(ItemTestHarness):
         self.item1.usage_current_week,
         m_usage.return_value,
     )
-    m_usage.assert_called_with(self.item1.id, zone=self.user1.timezone.zone)
+    args, kwargs = m_usage.call_args
+    self.assertEqual(args, (self.item1.id,))
+    self.assertEqual(kwargs['zone'].zone, self.user1.timezone.zone)
 
   @patch(ITEM_MODULE + '.Transaction.objects.get_usage_current_month')
   def test_usage_current_month(self, m_usage):
@@ -476,7 +501,9 @@ class TestItemCalculatedPropertiesInventory(ItemTestHarness):
         self.item1.usage_current_month,
         m_usage.return_value,
     )
-    m_usage.assert_called_with(self.item1.id, zone=self.user1.timezone.zone)
+    args, kwargs = m_usage.call_args
+    self.assertEqual(args, (self.item1.id,))
+    self.assertEqual(kwargs['zone'].zone, self.user1.timezone.zone)
 
   @patch(ITEM_MODULE + '.Transaction.objects.get_usage_total')
   def test_usage_total(self, m_usage):
@@ -1,10 +1,15 @@
 """Test the Shelf model."""
 
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ...tests.fixtures.fixture_mixins import ModelTestMixin
 from ...tests.fixtures.fixtures_shelf import ShelfTestHarness
 from ..shelf import Shelf
+from utilities.models.validators.trusted import trusted_write
 
 
 class TestShelf(ModelTestMixin, ShelfTestHarness):
@@ -33,6 +38,39 @@ class TestShelf(ModelTestMixin, ShelfTestHarness):
     count = Shelf.objects.filter(name__iexact=test_name).count()
     assert count == 1
 
+  def test_unique_does_not_count_names(self):
+    shelf = self.create_test_instance(user=self.user1, name="Above Sink")
+
+    with CaptureQueriesContext(connection) as context:
+      shelf.save()
+
+    self.assertFalse([
+        query for query in context.captured_queries if "COUNT" in query['sql']
+    ])
+
+  def test_unique_index_name(self):
+    self.assertEqual(
+        Shelf.get_unique_name_index(),
+        "kitchen_shelf_user_lower_name_uniq",
+    )
+
+  def test_save_calls_full_clean(self):
+    shelf = self.create_test_instance(user=self.user1, name="Pantry")
+
+    with patch.object(shelf, "full_clean") as m_clean:
+      shelf.save()
+
+    m_clean.assert_called_once_with()
+
+  def test_trusted_write_skips_full_clean(self):
+    shelf = self.create_test_instance(user=self.user1, name="Pantry")
+
+    with patch.object(shelf, "full_clean") as m_clean:
+      with trusted_write():
+        shelf.save()
+
+    m_clean.assert_not_called()
+
   def test_bleach(self):
     test_name = "Refrigerator<script>alert('hi');</script>"
     sanitized_name = "Refrigerator&lt;script&gt;alert('hi');&lt;/script&gt;"
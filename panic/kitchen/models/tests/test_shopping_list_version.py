@@ -0,0 +1,20 @@
+"""Test the ShoppingListVersion model."""
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+
+from ..shopping_list_version import ShoppingListVersion
+
+User = get_user_model()
+
+
+class TestShoppingListVersion(SimpleTestCase):
+  """Test the ShoppingListVersion model."""
+
+  def test_str(self):
+    version = ShoppingListVersion(
+        user=User(username="testuser"),
+        version=3,
+    )
+
+    self.assertEqual(str(version), "Shopping list version 3 of testuser")
@@ -0,0 +1,25 @@
+"""Test the SpendingSummary model."""
+
+from datetime import date
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from ..item import Item
+from ..spending_summary import SpendingSummary
+
+
+class TestSpendingSummary(SimpleTestCase):
+  """Test the SpendingSummary model."""
+
+  def test_str(self):
+    summary = SpendingSummary(
+        item=Item(name="Canned Beans"),
+        cost=Decimal("4.50"),
+        month=date(2020, 1, 1),
+    )
+
+    self.assertEqual(
+        str(summary),
+        "4.50 spent on Canned Beans in January 2020",
+    )
@@ -1,10 +1,14 @@
 """Test the Store model."""
 
+from unittest import mock
+
 from django.core.exceptions import ValidationError
+from django.forms import modelform_factory
 
 from ...tests.fixtures.fixture_mixins import ModelTestMixin
 from ...tests.fixtures.fixtures_store import StoreTestHarness
 from ..store import Store
+from spa_security import fields
 
 
 class TestStore(ModelTestMixin, StoreTestHarness):
@@ -46,6 +50,43 @@ class TestStore(ModelTestMixin, StoreTestHarness):
     self.assertEqual(query[0].name, sanitized_name)
     self.assertEqual(query[0].user.id, self.user1.id)
 
+  def test_bleach_model_form(self):
+    test_name = "Fruit & Veg"
+    form_class = modelform_factory(Store, fields=["user", "name"])
+    form = form_class(data={"user": self.user1.id, "name": test_name})
+
+    created = form.save()
+    created.refresh_from_db()
+
+    self.assertEqual(created.name, test_name)
+
+  def test_bleach_model_form_edit(self):
+    test_name = "Fruit & Veg"
+    created = self.create_test_instance(user=self.user1, name="Grocer")
+    form_class = modelform_factory(Store, fields=["user", "name"])
+    form = form_class(
+        data={
+            "user": self.user1.id,
+            "name": test_name
+        },
+        instance=Store.objects.get(id=created.id),
+    )
+
+    form.save()
+    created.refresh_from_db()
+
+    self.assertEqual(created.name, test_name)
+
+  def test_bleach_skipped_for_unchanged_loaded_name(self):
+    created = self.create_test_instance(user=self.user1, name="Fruit & Veg")
+    loaded = Store.objects.get(id=created.id)
+
+    with mock.patch.object(fields, "clean") as m_clean:
+      loaded.save()
+
+    m_clean.assert_not_called()
+    self.assertEqual(loaded.name, "Fruit & Veg")
+
   def test_str(self):
     test_name = "Shoppers Drugmart"
     item = self.create_test_instance(user=self.user1, name=test_name)
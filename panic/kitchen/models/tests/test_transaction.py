@@ -1,5 +1,7 @@
 """Test the Transaction model."""
 
+from decimal import Decimal
+
 from django.core.exceptions import ValidationError
 from freezegun import freeze_time
 
@@ -162,3 +164,20 @@ class TestTransaction(ModelTestMixin, TransactionTestHarness):
         transaction.item.quantity,
         transaction.quantity * 2,
     )
+
+  def test_purchase_snapshots_unit_price(self):
+    transaction = self.create_test_instance(**self.positive_data)
+
+    self.item1.price = 5
+    self.item1.save()
+    transaction.refresh_from_db()
+
+    self.assertEqual(transaction.unit_price, Decimal("2.00"))
+
+  def test_consumption_has_no_unit_price(self):
+    self.create_test_instance(**self.positive_data)
+    transaction = self.create_test_instance(**self.negative_data)
+
+    transaction.refresh_from_db()
+
+    self.assertIsNone(transaction.unit_price)
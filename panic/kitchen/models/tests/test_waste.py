@@ -0,0 +1,41 @@
+"""Test the Waste and WasteSummary models."""
+
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from ..item import Item
+from ..waste import Waste
+from ..waste_summary import WasteSummary
+
+
+class TestWaste(SimpleTestCase):
+  """Test the Waste model."""
+
+  def test_str(self):
+    waste = Waste(
+        item=Item(name="Canned Beans"),
+        quantity=2.0,
+        expired=date(2020, 1, 14),
+    )
+
+    self.assertEqual(
+        str(waste),
+        "2.0 units of Canned Beans, expired on 2020-01-14",
+    )
+
+
+class TestWasteSummary(SimpleTestCase):
+  """Test the WasteSummary model."""
+
+  def test_str(self):
+    summary = WasteSummary(
+        item=Item(name="Canned Beans"),
+        quantity=2.0,
+        month=date(2020, 1, 1),
+    )
+
+    self.assertEqual(
+        str(summary),
+        "2.0 units of Canned Beans wasted in January 2020",
+    )
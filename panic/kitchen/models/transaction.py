@@ -10,6 +10,7 @@ from .validators.transaction import (
     TransactionQuantityValidator,
     related_item_quantity_validator,
 )
+from utilities.models.validators.trusted import trusted_write
 
 User = get_user_model()
 
@@ -22,12 +23,19 @@ class Transaction(models.Model):
   quantity = models.FloatField(
       validators=[TransactionQuantityValidator(constants.MAXIMUM_QUANTITY)]
   )
+  unit_price = models.DecimalField(
+      max_digits=10,
+      decimal_places=2,
+      blank=True,
+      null=True,
+  )
 
   objects = TransactionManager()
 
   class Meta:
     indexes = [
         models.Index(fields=['datetime']),
+        models.Index(fields=['item', 'datetime', 'id']),
     ]
 
   @property
@@ -62,7 +70,18 @@ class Transaction(models.Model):
     """
     if force or self.id is None:
       self.item.quantity += self.quantity
-      self.item.save()
+      with trusted_write():
+        self.item.save()
+
+  def snapshot_unit_price(self):
+    """Record the related item's current price on a new purchase.
+
+    This keeps the cost of historical purchases stable, as the item's price
+    changes over time.
+    """
+    if self.id is None and self.unit_price is None and \
+        self.operation == "Purchase":
+      self.unit_price = self.item.price
 
   def clean(self):
     """Validate the related item quantity changes we're about to make."""
@@ -74,6 +93,7 @@ class Transaction(models.Model):
   def save(self, *args, **kwargs):
     """Clean and save model."""
     with transaction.atomic():
+      self.snapshot_unit_price()
       self.full_clean()
       self.apply_transaction_to_item()
       super().save(*args, **kwargs)
@@ -0,0 +1,42 @@
+"""Waste model."""
+
+from django.db import models
+
+from .managers.waste import WasteManager
+
+
+class Waste(models.Model):
+  """Waste model.
+
+  A ledger entry recording the quantity of a purchase that was still in
+  inventory when it expired, valued at the Item's price at that time.
+  """
+
+  cost = models.DecimalField(max_digits=12, decimal_places=2)
+  expired = models.DateField()
+  item = models.ForeignKey('Item', on_delete=models.CASCADE)
+  quantity = models.FloatField()
+  shelf = models.ForeignKey(
+      'Shelf',
+      on_delete=models.SET_NULL,
+      blank=True,
+      null=True,
+  )
+  transaction = models.OneToOneField(
+      'Transaction',
+      on_delete=models.CASCADE,
+      related_name='waste',
+  )
+  unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+
+  objects = WasteManager()
+
+  class Meta:
+    verbose_name_plural = "Waste"
+
+  def __str__(self):
+    return "%s units of %s, expired on %s" % (
+        self.quantity,
+        self.item.name,
+        self.expired,
+    )
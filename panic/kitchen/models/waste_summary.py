@@ -0,0 +1,42 @@
+"""WasteSummary model."""
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+from .managers.waste_summary import WasteSummaryManager
+
+User = get_user_model()
+
+
+class WasteSummary(models.Model):
+  """WasteSummary model.
+
+  The Waste ledger, pre-aggregated by Item, Shelf and month for reporting.
+  """
+
+  cost = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+  item = models.ForeignKey('Item', on_delete=models.CASCADE)
+  month = models.DateField()
+  quantity = models.FloatField(default=0)
+  shelf = models.ForeignKey(
+      'Shelf',
+      on_delete=models.SET_NULL,
+      blank=True,
+      null=True,
+  )
+  user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+  objects = WasteSummaryManager()
+
+  class Meta:
+    verbose_name_plural = "Waste summaries"
+    indexes = [
+        models.Index(fields=['user', 'month']),
+    ]
+
+  def __str__(self):
+    return "%s units of %s wasted in %s" % (
+        self.quantity,
+        self.item.name,
+        self.month.strftime("%B %Y"),
+    )
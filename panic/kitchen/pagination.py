@@ -1,7 +1,18 @@
 """Pagination for the kitchen app."""
 
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
 from django.conf import settings
-from rest_framework.pagination import PageNumberPagination
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class BasePagePagination(PageNumberPagination):
@@ -39,3 +50,184 @@ class PagePaginationWithOverride(BasePagePagination):
       return None
 
     return super().paginate_queryset(queryset, request, view)
+
+
+class TransactionCursorPagination(BasePagination):
+  """Keyset pagination of Transactions, by a (datetime, id) cursor.
+
+  Each page seeks directly to the position after the previous page's last
+  Transaction, so no rows are skipped with OFFSET, however deep the history.
+  """
+
+  cursor_query_param = 'cursor'
+  invalid_cursor_message = 'Invalid cursor'
+  ordering = ('datetime', 'id')
+  page_size = settings.PAGE_SIZE
+  max_page_size = settings.PAGE_SIZE_MAX
+  page_size_query_param = settings.PAGE_SIZE_PARAM
+
+  def __init__(self):
+    self.base_url = None
+    self.next_position = None
+
+  @staticmethod
+  def encode_cursor(position):
+    """Encode a (datetime, id) position as an opaque cursor.
+
+    :param position: The datetime and pk of a Transaction
+    :type position: Tuple[:class:`datetime.datetime`, int]
+
+    :returns: The encoded cursor
+    :rtype: str
+    """
+    value = "%s|%s" % (position[0].isoformat(), position[1])
+    return urlsafe_b64encode(value.encode('ascii')).decode('ascii')
+
+  def decode_cursor(self, cursor):
+    """Decode an opaque cursor into a (datetime, id) position.
+
+    :param cursor: The encoded cursor
+    :type cursor: str
+
+    :returns: The datetime and pk of a Transaction
+    :rtype: Tuple[:class:`datetime.datetime`, int]
+
+    :raises: :class:`rest_framework.exceptions.NotFound`
+    """
+    try:
+      value = urlsafe_b64decode(cursor.encode('ascii')).decode('ascii')
+      timestamp, pk = value.split('|')
+      position = (datetime.fromisoformat(timestamp), int(pk))
+    except (TypeError, ValueError) as exc:
+      raise NotFound(self.invalid_cursor_message) from exc
+    if position[0].tzinfo is None:
+      raise NotFound(self.invalid_cursor_message)
+    return position
+
+  @staticmethod
+  def seek(queryset, position):
+    """Filter a queryset to the Transactions following a position.
+
+    :param queryset: A django queryset of Transactions
+    :type queryset: :class:`django.db.models.query.QuerySet`
+    :param position: The datetime and pk of a Transaction, or None
+    :type position: Tuple[:class:`datetime.datetime`, int], None
+
+    :returns: The ordered queryset, after the position
+    :rtype: :class:`django.db.models.query.QuerySet`
+    """
+    queryset = queryset.order_by(*TransactionCursorPagination.ordering)
+    if position is None:
+      return queryset
+    timestamp, pk = position
+    return queryset.filter(
+        Q(datetime__gt=timestamp) | Q(datetime=timestamp, id__gt=pk)
+    )
+
+  @classmethod
+  def iterate_chunks(cls, queryset, chunk_size):
+    """Iterate over every Transaction in a queryset, in ordered chunks.
+
+    Each chunk is fetched with its own keyset query, so memory use is bound
+    by the chunk size, regardless of the length of the history.
+
+    :param queryset: A django queryset of Transactions
+    :type queryset: :class:`django.db.models.query.QuerySet`
+    :param chunk_size: The maximum number of Transactions in each chunk
+    :type chunk_size: int
+
+    :returns: A generator of lists of Transactions
+    :rtype: Generator[List[:class:`kitchen.models.transaction.Transaction`]]
+    """
+    position = None
+    while True:
+      chunk = list(cls.seek(queryset, position)[:chunk_size])
+      if chunk:
+        yield chunk
+      if len(chunk) < chunk_size:
+        return
+      position = (chunk[-1].datetime, chunk[-1].id)
+
+  def get_page_size(self, request):
+    """Return the requested page size, bounded by the maximum page size.
+
+    :param request: The request being made
+    :type request: :class:`rest_framework.request.Request`
+
+    :returns: The page size
+    :rtype: int
+    """
+    try:
+      return _positive_int(
+          request.query_params[self.page_size_query_param],
+          strict=True,
+          cutoff=self.max_page_size,
+      )
+    except (KeyError, ValueError):
+      return self.page_size
+
+  def paginate_queryset(self, queryset, request, view=None):
+    """Return the page of Transactions following the requested cursor.
+
+    :param queryset: A django queryset of Transactions
+    :type queryset: :class:`django.db.models.query.QuerySet`
+    :param request: The request being made
+    :type request: :class:`rest_framework.request.Request`
+    :param view: The view being paginated
+    :type view: function
+
+    :returns: The page of Transactions
+    :rtype: List[:class:`kitchen.models.transaction.Transaction`]
+    """
+    self.base_url = request.build_absolute_uri()
+    page_size = self.get_page_size(request)
+
+    position = None
+    cursor = request.query_params.get(self.cursor_query_param)
+    if cursor:
+      position = self.decode_cursor(cursor)
+
+    results = list(self.seek(queryset, position)[:page_size + 1])
+    self.next_position = None
+    if len(results) > page_size:
+      results = results[:page_size]
+      self.next_position = (results[-1].datetime, results[-1].id)
+    return results
+
+  def get_next_link(self):
+    """Return the link to the next page, if there is one.
+
+    :returns: An absolute url, or None
+    :rtype: str, None
+    """
+    if self.next_position is None:
+      return None
+    return replace_query_param(
+        self.base_url,
+        self.cursor_query_param,
+        self.encode_cursor(self.next_position),
+    )
+
+  def get_paginated_response(self, data):
+    """Return a paginated style response for the serialized page.
+
+    :param data: The serialized page of Transactions
+    :type data: list
+
+    :returns: The response
+    :rtype: :class:`rest_framework.response.Response`
+    """
+    return Response({'next': self.get_next_link(), 'results': data})
+
+  def get_paginated_response_schema(self, schema):
+    """Return the schema of the paginated response."""
+    return {
+        'type': 'object',
+        'properties': {
+            'next': {
+                'type': 'string',
+                'nullable': True,
+            },
+            'results': schema,
+        },
+    }
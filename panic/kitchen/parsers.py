@@ -0,0 +1,114 @@
+"""Parsers for the kitchen app."""
+
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+CSV_LIST_DELIMITER = ";"
+CSV_LIST_FIELDS = ("preferred_stores",)
+
+
+def read_csv_records(stream, encoding="utf-8"):
+  """Read bulk import records from a CSV byte stream with a header row.
+
+  Columns listed in `CSV_LIST_FIELDS` are split on `CSV_LIST_DELIMITER`, and
+  empty cells are omitted so that serializer defaults apply.
+
+  :param stream: A byte stream containing CSV data
+  :type stream: :class:`io.BufferedIOBase`
+  :param encoding: The character encoding of the stream
+  :type encoding: str
+
+  :returns: A list of records
+  :rtype: List[dict]
+
+  :raises: :class:`rest_framework.exceptions.ParseError`
+  """
+  records = []
+  reader = csv.DictReader(codecs.getreader(encoding)(stream))
+  try:
+    for row in reader:
+      records.append(_csv_row_to_record(row))
+      _enforce_record_limit(records)
+  except (csv.Error, UnicodeDecodeError) as exc:
+    raise ParseError(f"CSV parse error - {exc}") from exc
+  return records
+
+
+def read_json_lines_records(stream, encoding="utf-8"):
+  """Read bulk import records from a JSON lines byte stream.
+
+  :param stream: A byte stream containing one JSON object per line
+  :type stream: :class:`io.BufferedIOBase`
+  :param encoding: The character encoding of the stream
+  :type encoding: str
+
+  :returns: A list of records
+  :rtype: List[dict]
+
+  :raises: :class:`rest_framework.exceptions.ParseError`
+  """
+  records = []
+  try:
+    for line_number, line in enumerate(codecs.getreader(encoding)(stream), 1):
+      if not line.strip():
+        continue
+      record = json.loads(line)
+      if not isinstance(record, dict):
+        raise ParseError(f"JSON lines parse error - line {line_number}")
+      records.append(record)
+      _enforce_record_limit(records)
+  except (ValueError, UnicodeDecodeError) as exc:
+    raise ParseError(f"JSON lines parse error - {exc}") from exc
+  return records
+
+
+def _csv_row_to_record(row):
+  record = {}
+  for key, value in row.items():
+    if key is None or value is None or value.strip() == "":
+      continue
+    key = key.strip()
+    value = value.strip()
+    if key in CSV_LIST_FIELDS:
+      value = [
+          entry.strip()
+          for entry in value.split(CSV_LIST_DELIMITER)
+          if entry.strip()
+      ]
+    record[key] = value
+  return record
+
+
+def _enforce_record_limit(records):
+  if len(records) > settings.BULK_IMPORT_MAX_RECORDS:
+    raise ParseError(
+        "Too many records, the maximum is "
+        f"{settings.BULK_IMPORT_MAX_RECORDS}."
+    )
+
+
+class CSVRecordParser(BaseParser):
+  """Parses CSV bulk import records."""
+
+  media_type = "text/csv"
+
+  def parse(self, stream, media_type=None, parser_context=None):
+    """Parse the incoming bytestream as CSV records."""
+    encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+    return read_csv_records(stream, encoding)
+
+
+class JSONLinesRecordParser(BaseParser):
+  """Parses JSON lines bulk import records."""
+
+  media_type = "application/x-ndjson"
+
+  def parse(self, stream, media_type=None, parser_context=None):
+    """Parse the incoming bytestream as JSON lines records."""
+    encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+    return read_json_lines_records(stream, encoding)
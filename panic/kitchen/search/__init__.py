@@ -0,0 +1 @@
+"""In-process search indexes for the kitchen app."""
@@ -0,0 +1,125 @@
+"""In-memory name search index."""
+
+import bisect
+import re
+from collections import defaultdict
+
+TRIGRAM_SIMILARITY_THRESHOLD = 0.3
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def trigrams(string):
+  """Return the set of trigrams in a string, in the style of pg_trgm.
+
+  Each word is lower cased and padded with two leading spaces and one
+  trailing space before being split into trigrams.
+
+  :param string: The string to split into trigrams
+  :type string: str
+
+  :returns: The set of trigrams
+  :rtype: set(str)
+  """
+  result = set()
+  for word in WORD_PATTERN.findall(string.lower()):
+    padded = f"  {word} "
+    result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+  return result
+
+
+def similarity(trigrams1, trigrams2):
+  """Return the trigram similarity of two trigram sets, in the range 0 to 1.
+
+  :param trigrams1: The first set of trigrams
+  :type trigrams1: set(str)
+  :param trigrams2: The second set of trigrams
+  :type trigrams2: set(str)
+
+  :returns: The number of shared trigrams, divided by the number of distinct
+    trigrams in both sets
+  :rtype: float
+  """
+  if not trigrams1 or not trigrams2:
+    return 0.0
+  shared = len(trigrams1 & trigrams2)
+  return shared / (len(trigrams1) + len(trigrams2) - shared)
+
+
+class NameSearchIndex:
+  """An immutable, in-memory search index of named records.
+
+  Records are kept in a sorted array of lower case names for binary search
+  prefix matching, with an inverted trigram index for fuzzy matching.
+
+  :param records: An iterable of (id, name) pairs
+  :type records: Iterable[Tuple[int, str]]
+  """
+
+  def __init__(self, records):
+    entries = sorted(
+        (name.lower(), record_id, name) for record_id, name in records
+    )
+    self._keys = [key for key, _, _ in entries]
+    self._records = [{
+        "id": record_id,
+        "name": name
+    } for _, record_id, name in entries]
+    self._trigrams = [trigrams(key) for key in self._keys]
+    self._postings = defaultdict(list)
+    for position, record_trigrams in enumerate(self._trigrams):
+      for trigram in record_trigrams:
+        self._postings[trigram].append(position)
+
+  def __len__(self):
+    return len(self._records)
+
+  def search(self, query, limit):
+    """Return up to `limit` records matching a query, ignoring case.
+
+    Records whose names start with the query are returned first, in name
+    order, followed by fuzzy trigram matches ranked by similarity.
+
+    :param query: The search string
+    :type query: str
+    :param limit: The maximum number of records to return
+    :type limit: int
+
+    :returns: The matching records, as dictionaries with an id and name
+    :rtype: List[dict]
+    """
+    key = query.strip().lower()
+    if not key or limit < 1:
+      return []
+
+    positions = self._prefix_positions(key, limit)
+    if len(positions) < limit:
+      positions += self._fuzzy_positions(
+          key,
+          limit - len(positions),
+          exclude=set(positions),
+      )
+    return [self._records[position] for position in positions]
+
+  def _prefix_positions(self, key, limit):
+    positions = []
+    start = bisect.bisect_left(self._keys, key)
+    for position in range(start, len(self._keys)):
+      if len(positions) >= limit or not self._keys[position].startswith(key):
+        break
+      positions.append(position)
+    return positions
+
+  def _fuzzy_positions(self, key, limit, exclude):
+    query_trigrams = trigrams(key)
+    candidates = set()
+    for trigram in query_trigrams:
+      candidates.update(self._postings.get(trigram, ()))
+    candidates -= exclude
+
+    scored = []
+    for position in candidates:
+      score = similarity(query_trigrams, self._trigrams[position])
+      if score >= TRIGRAM_SIMILARITY_THRESHOLD:
+        scored.append((-score, self._keys[position], position))
+    scored.sort()
+    return [position for _, _, position in scored[:limit]]
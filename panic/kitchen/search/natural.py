@@ -0,0 +1,117 @@
+"""Similarity search on the naturalized `_index` of named models."""
+
+import heapq
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models import Case, IntegerField, Q, When
+
+from .index import TRIGRAM_SIMILARITY_THRESHOLD, similarity, trigrams
+from naturalsortfield import NaturalSortField
+
+INDEX_FIELD = "_index"
+SIMILARITY_ANNOTATION = "search_similarity"
+UNSUPPORTED_MESSAGE = (
+    "The pg_trgm extension is not installed on the '%s' database, "
+    "similarity searches are being matched in memory."
+)
+
+NaturalSortField.register_lookup(TrigramSimilar)
+
+logger = logging.getLogger(__name__)
+
+_trigram_support = {}
+
+
+def has_trigram_support(alias):
+  """Determine if a database connection can use the pg_trgm extension.
+
+  The result is cached for `TRIGRAM_SUPPORT_TTL` seconds, so an extension
+  installed later is picked up without a restart.
+
+  :param alias: The database connection alias
+  :type alias: str
+
+  :returns: A boolean indicating if the extension is installed
+  :rtype: bool
+  """
+  checked_at, supported = _trigram_support.get(alias, (None, False))
+  if checked_at is None or (
+      time.monotonic() - checked_at > settings.TRIGRAM_SUPPORT_TTL
+  ):
+    supported = _query_trigram_support(connections[alias])
+    if not supported:
+      logger.warning(UNSUPPORTED_MESSAGE, alias)
+    _trigram_support[alias] = (time.monotonic(), supported)
+  return supported
+
+
+def clear_trigram_support():
+  """Discard the cached pg_trgm support of all database connections."""
+  _trigram_support.clear()
+
+
+def _query_trigram_support(connection):
+  if connection.vendor != "postgresql":
+    return False
+  with connection.cursor() as cursor:
+    cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    return cursor.fetchone() is not None
+
+
+def search_natural_index(queryset, value):
+  """Filter a queryset to rows similar to a value, ranked by similarity.
+
+  On PostgreSQL with pg_trgm, this uses the trigram index on `_index`.
+  Otherwise, the candidate rows are streamed and matched in memory, and only
+  the `NATURAL_SEARCH_MEMORY_LIMIT` best matches are returned.
+
+  :param queryset: A queryset of a model with a naturalized `_index` field
+  :type queryset: :class:`django.db.models.QuerySet`
+  :param value: The search string
+  :type value: str
+
+  :returns: The filtered and ordered queryset
+  :rtype: :class:`django.db.models.QuerySet`
+  """
+  field = queryset.model._meta.get_field(INDEX_FIELD)
+  term = field.naturalize(value)
+  if not term:
+    return queryset
+
+  if has_trigram_support(queryset.db):
+    return _search_database(queryset, term)
+  return _search_memory(queryset, term)
+
+
+def _search_database(queryset, term):
+  contains = Q(**{f"{INDEX_FIELD}__contains": term})
+  similar = Q(**{f"{INDEX_FIELD}__{TrigramSimilar.lookup_name}": term})
+  return queryset.\
+      annotate(**{SIMILARITY_ANNOTATION: TrigramSimilarity(INDEX_FIELD, term)}).\
+      filter(contains | similar).\
+      order_by(f"-{SIMILARITY_ANNOTATION}", INDEX_FIELD)
+
+
+def _search_memory(queryset, term):
+  term_trigrams = trigrams(term)
+
+  def matches():
+    for pk, index in queryset.values_list('pk', INDEX_FIELD).iterator():
+      score = similarity(term_trigrams, trigrams(index))
+      if term in index or score >= TRIGRAM_SIMILARITY_THRESHOLD:
+        yield -score, index, pk
+
+  ranked = heapq.nsmallest(settings.NATURAL_SEARCH_MEMORY_LIMIT, matches())
+
+  pks = [pk for _, _, pk in ranked]
+  ordering = Case(
+      *[When(pk=pk, then=position) for position, pk in enumerate(pks)],
+      default=len(pks),
+      output_field=IntegerField(),
+  )
+  return queryset.filter(pk__in=pks).order_by(ordering)
@@ -0,0 +1,74 @@
+"""Process wide search index of SuggestedItem names."""
+
+import threading
+import time
+
+from django.conf import settings
+
+from ..models.suggested import SuggestedItem
+from .index import NameSearchIndex
+
+
+class SuggestedItemIndex:
+  """A lazily built search index of SuggestedItem names.
+
+  The index is built on first use, rebuilt after it is invalidated by a
+  change to the table in this process, and rebuilt after
+  `SUGGESTED_ITEM_INDEX_TTL` seconds to pick up changes made by other
+  processes.
+  """
+
+  def __init__(self):
+    self._index = None
+    self._built_at = None
+    self._generation = 0
+    self._lock = threading.Lock()
+
+  def invalidate(self):
+    """Discard the current index, so it's rebuilt on next use."""
+    self._generation += 1
+    self._index = None
+
+  def get_index(self):
+    """Return an up to date search index, rebuilding it if required.
+
+    :returns: The search index
+    :rtype: :class:`kitchen.search.index.NameSearchIndex`
+    """
+    index = self._index
+    if index is None or self._is_expired():
+      with self._lock:
+        index = self._index
+        if index is None or self._is_expired():
+          index = self._build()
+    return index
+
+  def search(self, query, limit=None):
+    """Search the SuggestedItem names, without querying the database.
+
+    :param query: The search string
+    :type query: str
+    :param limit: The maximum number of results
+    :type limit: int, None
+
+    :returns: The matching suggestions, as dictionaries with an id and name
+    :rtype: List[dict]
+    """
+    if limit is None:
+      limit = settings.SUGGESTED_ITEM_SEARCH_LIMIT
+    return self.get_index().search(query, limit)
+
+  def _is_expired(self):
+    return time.monotonic() - self._built_at > settings.SUGGESTED_ITEM_INDEX_TTL
+
+  def _build(self):
+    generation = self._generation
+    built_at = time.monotonic()
+    index = NameSearchIndex(SuggestedItem.objects.values_list('id', 'name'))
+    if generation == self._generation:
+      self._index = index
+      self._built_at = built_at
+    return index
+
+
+SUGGESTED_ITEM_INDEX = SuggestedItemIndex()
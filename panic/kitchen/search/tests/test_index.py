@@ -0,0 +1,96 @@
+"""Test the NameSearchIndex class."""
+
+from django.test import SimpleTestCase
+
+from ..index import NameSearchIndex, similarity, trigrams
+
+RECORDS = (
+    (1, "Tofu"),
+    (2, "Tomatoes"),
+    (3, "Tomato Paste"),
+    (4, "Red Bean Dessert"),
+    (5, "Bananas"),
+    (6, "tortillas"),
+)
+
+
+class TestTrigrams(SimpleTestCase):
+  """Test the trigram functions."""
+
+  def test_trigrams(self):
+    self.assertSetEqual(trigrams("Cat"), {"  c", " ca", "cat", "at "})
+
+  def test_trigrams_multiple_words(self):
+    self.assertSetEqual(
+        trigrams("a b"),
+        {"  a", " a ", "  b", " b "},
+    )
+
+  def test_trigrams_empty(self):
+    self.assertSetEqual(trigrams(" - "), set())
+
+  def test_similarity_identical(self):
+    self.assertEqual(similarity(trigrams("word"), trigrams("word")), 1.0)
+
+  def test_similarity_disjoint(self):
+    self.assertEqual(similarity(trigrams("abc"), trigrams("xyz")), 0.0)
+
+  def test_similarity_empty(self):
+    self.assertEqual(similarity(set(), trigrams("xyz")), 0.0)
+
+
+class TestNameSearchIndex(SimpleTestCase):
+  """Test the NameSearchIndex class."""
+
+  def setUp(self):
+    self.index = NameSearchIndex(RECORDS)
+
+  def test_len(self):
+    self.assertEqual(len(self.index), len(RECORDS))
+
+  def test_prefix_matches_in_name_order(self):
+    results = self.index.search("TOM", 10)
+
+    self.assertListEqual(
+        [result["name"] for result in results][:2],
+        ["Tomato Paste", "Tomatoes"],
+    )
+
+  def test_prefix_matches_respect_limit(self):
+    results = self.index.search("to", 2)
+
+    self.assertListEqual(
+        results,
+        [{
+            "id": 1,
+            "name": "Tofu"
+        }, {
+            "id": 3,
+            "name": "Tomato Paste"
+        }],
+    )
+
+  def test_fuzzy_fallback(self):
+    results = self.index.search("banana", 10)
+
+    self.assertListEqual(results, [{"id": 5, "name": "Bananas"}])
+
+  def test_fuzzy_fallback_after_prefix_matches(self):
+    results = self.index.search("tomatoe", 10)
+
+    self.assertEqual(results[0]["name"], "Tomatoes")
+    self.assertIn({"id": 3, "name": "Tomato Paste"}, results[1:])
+
+  def test_fuzzy_fallback_misspelling(self):
+    results = self.index.search("desert", 10)
+
+    self.assertListEqual(results, [{"id": 4, "name": "Red Bean Dessert"}])
+
+  def test_no_matches(self):
+    self.assertListEqual(self.index.search("zzzz", 10), [])
+
+  def test_empty_query(self):
+    self.assertListEqual(self.index.search("  ", 10), [])
+
+  def test_zero_limit(self):
+    self.assertListEqual(self.index.search("to", 0), [])
@@ -0,0 +1,135 @@
+"""Test the natural index search functions."""
+
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+
+from ...models.shelf import Shelf
+from ...tests.fixtures.fixtures_shelf import ShelfTestHarness
+from .. import natural
+
+MODULE = natural.__name__
+
+
+class TestHasTrigramSupport(ShelfTestHarness):
+  """Test the has_trigram_support function."""
+
+  def setUp(self):
+    super().setUp()
+    natural.clear_trigram_support()
+
+  def tearDown(self):
+    natural.clear_trigram_support()
+    super().tearDown()
+
+  def test_matches_installed_extensions(self):
+    expected = False
+    if connection.vendor == "postgresql":
+      with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        expected = cursor.fetchone() is not None
+
+    self.assertEqual(natural.has_trigram_support(connection.alias), expected)
+
+  @mock.patch(MODULE + ".connections")
+  def test_other_vendors_unsupported(self, m_connections):
+    m_connections.__getitem__.return_value.vendor = "sqlite"
+
+    with self.assertLogs(MODULE, level="WARNING") as logs:
+      self.assertFalse(natural.has_trigram_support("other"))
+
+    m_connections.__getitem__.return_value.cursor.assert_not_called()
+    self.assertEqual(
+        logs.records[0].getMessage(),
+        natural.UNSUPPORTED_MESSAGE % "other",
+    )
+
+  @override_settings(TRIGRAM_SUPPORT_TTL=60)
+  @mock.patch(MODULE + "._query_trigram_support", return_value=True)
+  @mock.patch(MODULE + ".time.monotonic")
+  def test_cached_within_ttl(self, m_monotonic, m_query):
+    m_monotonic.side_effect = [100, 160]
+
+    natural.has_trigram_support(connection.alias)
+    natural.has_trigram_support(connection.alias)
+
+    m_query.assert_called_once()
+
+  @override_settings(TRIGRAM_SUPPORT_TTL=60)
+  @mock.patch(MODULE + "._query_trigram_support")
+  @mock.patch(MODULE + ".time.monotonic")
+  def test_checked_again_after_ttl(self, m_monotonic, m_query):
+    m_monotonic.side_effect = [100, 161, 161]
+    m_query.side_effect = [False, True]
+
+    with self.assertLogs(MODULE, level="WARNING"):
+      self.assertFalse(natural.has_trigram_support(connection.alias))
+    self.assertTrue(natural.has_trigram_support(connection.alias))
+
+    self.assertEqual(m_query.call_count, 2)
+
+
+class TestSearchNaturalIndex(ShelfTestHarness):
+  """Test the search_natural_index function."""
+
+  def setUp(self):
+    super().setUp()
+    for name in ("Pantry", "Pantry Shelf 2", "Refrigerator", "Freezer"):
+      self.create_test_instance(user=self.user1, name=name)
+    self.queryset = Shelf.objects.filter(user=self.user1)
+
+  def search(self, value):
+    return [
+        shelf.name for shelf in natural.search_natural_index(
+            self.queryset,
+            value,
+        )
+    ]
+
+  @mock.patch(MODULE + ".has_trigram_support", return_value=False)
+  def test_memory_exact_match_ranked_first(self, _):
+    self.assertListEqual(self.search("pantry"), ["Pantry", "Pantry Shelf 2"])
+
+  @mock.patch(MODULE + ".has_trigram_support", return_value=False)
+  def test_memory_substring_match(self, _):
+    self.assertListEqual(self.search("FRIG"), ["Refrigerator"])
+
+  @mock.patch(MODULE + ".has_trigram_support", return_value=False)
+  def test_memory_similar_match(self, _):
+    self.assertListEqual(self.search("freezr"), ["Freezer"])
+
+  @mock.patch(MODULE + ".has_trigram_support", return_value=False)
+  def test_memory_naturalized_term(self, _):
+    self.assertListEqual(
+        self.search("The Pantry Shelf 02"),
+        ["Pantry Shelf 2", "Pantry"],
+    )
+
+  @mock.patch(MODULE + ".has_trigram_support", return_value=False)
+  def test_memory_no_match(self, _):
+    self.assertListEqual(self.search("garage"), [])
+
+  @override_settings(NATURAL_SEARCH_MEMORY_LIMIT=1)
+  @mock.patch(MODULE + ".has_trigram_support", return_value=False)
+  def test_memory_limit(self, _):
+    self.assertListEqual(self.search("pantry"), ["Pantry"])
+
+  @mock.patch(MODULE + ".has_trigram_support")
+  def test_empty_term_unfiltered(self, m_support):
+    queryset = natural.search_natural_index(self.queryset, "  ")
+
+    self.assertIs(queryset, self.queryset)
+    m_support.assert_not_called()
+
+  @mock.patch(MODULE + ".has_trigram_support", return_value=True)
+  def test_database_query(self, _):
+    queryset = natural.search_natural_index(self.queryset, "pantry")
+    sql = str(queryset.query)
+
+    self.assertIn("SIMILARITY(", sql)
+    self.assertIn(natural.SIMILARITY_ANNOTATION, sql)
+    self.assertEqual(
+        queryset.query.order_by,
+        (f"-{natural.SIMILARITY_ANNOTATION}", natural.INDEX_FIELD),
+    )
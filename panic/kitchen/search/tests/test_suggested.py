@@ -0,0 +1,89 @@
+"""Test the SuggestedItemIndex class."""
+
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from ...models.suggested import SuggestedItem
+from .. import suggested as suggested_module
+from ..suggested import SUGGESTED_ITEM_INDEX, SuggestedItemIndex
+
+SUGGESTED_MODULE = suggested_module.__name__
+
+
+class TestSuggestedItemIndex(TestCase):
+  """Test the SuggestedItemIndex class."""
+
+  @classmethod
+  def setUpTestData(cls):
+    SuggestedItem.objects.create(name="Tofu")
+    SuggestedItem.objects.create(name="Tomatoes")
+
+  def setUp(self):
+    self.index = SuggestedItemIndex()
+
+  def test_search(self):
+    results = self.index.search("tom")
+
+    self.assertListEqual(
+        results,
+        [{
+            "id": SuggestedItem.objects.get(name="Tomatoes").id,
+            "name": "Tomatoes"
+        }],
+    )
+
+  @override_settings(SUGGESTED_ITEM_SEARCH_LIMIT=1)
+  def test_search_default_limit(self):
+    self.assertEqual(len(self.index.search("to")), 1)
+
+  def test_search_is_served_from_memory(self):
+    self.index.search("to")
+
+    with CaptureQueriesContext(connection) as context:
+      self.index.search("to")
+
+    self.assertEqual(len(context.captured_queries), 0)
+
+  def test_invalidate(self):
+    self.index.search("to")
+    SuggestedItem.objects.create(name="Tortillas")
+    self.index.invalidate()
+
+    self.assertEqual(len(self.index.search("to")), 3)
+
+  @override_settings(SUGGESTED_ITEM_INDEX_TTL=60)
+  @patch(SUGGESTED_MODULE + ".time.monotonic")
+  def test_expiry(self, m_monotonic):
+    m_monotonic.return_value = 0
+    first = self.index.get_index()
+
+    m_monotonic.return_value = 59
+    self.assertIs(self.index.get_index(), first)
+
+    m_monotonic.return_value = 61
+    self.assertIsNot(self.index.get_index(), first)
+
+  def test_invalidate_during_build(self):
+    original = SuggestedItem.objects.values_list
+
+    def invalidate_during_build(*args):
+      self.index.invalidate()
+      return original(*args)
+
+    with patch.object(
+        SuggestedItem.objects,
+        "values_list",
+        side_effect=invalidate_during_build,
+    ):
+      self.index.get_index()
+
+    with CaptureQueriesContext(connection) as context:
+      self.index.get_index()
+
+    self.assertEqual(len(context.captured_queries), 1)
+
+  def test_module_instance(self):
+    self.assertIsInstance(SUGGESTED_ITEM_INDEX, SuggestedItemIndex)
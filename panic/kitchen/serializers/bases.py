@@ -1,9 +1,11 @@
 """Base classes for custom serializers."""
 
+from contextlib import contextmanager
+
 from django.db.models import Model
 from rest_framework import serializers
 
-from ..exceptions import ValidationPermissionError
+from ..exceptions import UniqueNameConstraintError, ValidationPermissionError
 from .constants import UNIQUE_CONSTRAINT_MSG
 
 
@@ -24,6 +26,19 @@ class KitchenBaseModelSerializer(serializers.ModelSerializer):
       return [related_instance], "a "
     return related_instance, ""
 
+  def __get_owner_id(self, related_instance, user_field):
+    """Retrieve the owner's `pk` of a related instance, without a query.
+
+    :param related_instance: A django model instance being validated
+    :type related_instance: :class:`django.db.models.Model`
+    :param user_field: The related instance's field that stores the user
+    :type user_field: str
+
+    :returns: The `pk` of the related instance's owner
+    """
+    field = related_instance._meta.get_field(user_field)
+    return getattr(related_instance, field.attname)
+
   def related_validator(self, related_instance, field, user_field="user"):
     """Require the 'user' field of a related instance to match request user.
 
@@ -39,30 +54,53 @@ class KitchenBaseModelSerializer(serializers.ModelSerializer):
     """
     iterable, modifier = self.__to_iterable(related_instance)
     for instance in iterable:
-      if self.context['request'].user != getattr(instance, user_field):
+      if self.context['request'].user.pk != self.__get_owner_id(
+          instance,
+          user_field,
+      ):
         raise ValidationPermissionError(
             detail=f"Please provide {modifier}valid {field}.",
         )
 
-  def case_unique_validator(self, value, field):
-    """Require a field to be unique (regardless of case) per related user.
+  @contextmanager
+  def __case_unique_violations(self):
+    """Translate model unique name violations into serializer errors.
 
-    :param value: The value being checked for case uniqueness
-    :type value: str
-    :param field: The model field being checked for case uniqueness
-    :type field: str
+    :raises: :class:`rest_framework.exceptions.ValidationError`
+    """
+    try:
+      yield
+    except UniqueNameConstraintError as exc:
+      raise serializers.ValidationError(
+          detail={"name": [UNIQUE_CONSTRAINT_MSG]},
+      ) from exc
+
+  def create(self, validated_data):
+    """Create a model instance, translating unique name violations.
+
+    :param validated_data: The validated request data
+    :type validated_data: dict
+
+    :returns: The created model instance
+    :rtype: :class:`django.db.models.Model`
+
+    :raises: :class:`rest_framework.exceptions.ValidationError`
+    """
+    with self.__case_unique_violations():
+      return super().create(validated_data)
+
+  def update(self, instance, validated_data):
+    """Update a model instance, translating unique name violations.
+
+    :param instance: The model instance being updated
+    :type instance: :class:`django.db.models.Model`
+    :param validated_data: The validated request data
+    :type validated_data: dict
+
+    :returns: The updated model instance
+    :rtype: :class:`django.db.models.Model`
 
     :raises: :class:`rest_framework.exceptions.ValidationError`
     """
-    is_unchanged = (
-        self.instance and value.lower() == getattr(self.instance, field).lower()
-    )
-
-    model = self.Meta.model
-    user = self.context['request'].user
-    query_filter = {f"{field}__iexact": value, "user": user}
-    count = model.objects.filter(**query_filter).count()
-    unique_limit = 1 if is_unchanged else 0
-
-    if count > unique_limit:
-      raise serializers.ValidationError(detail=UNIQUE_CONSTRAINT_MSG,)
+    with self.__case_unique_violations():
+      return super().update(instance, validated_data)
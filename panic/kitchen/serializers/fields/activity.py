@@ -0,0 +1,29 @@
+"""Serializer fields for the statistics of an Item's activity report."""
+
+from rest_framework import serializers
+
+ACTIVITY_CONTEXT_KEY = "activity"
+
+
+class ActivityFieldMixin:
+  """Read a statistic from the serializer context, if it was gathered there.
+
+  Views may retrieve an Item's activity statistics in advance, and pass them
+  in the serializer context as a dictionary keyed by the Item properties they
+  replace.  Statistics that weren't gathered are read from the Item.
+  """
+
+  def get_attribute(self, instance):
+    """Return the gathered statistic, or the Item's attribute."""
+    activity = self.context.get(ACTIVITY_CONTEXT_KEY)
+    if activity is not None and self.source in activity:
+      return activity[self.source]
+    return super().get_attribute(instance)
+
+
+class ActivityField(ActivityFieldMixin, serializers.ReadOnlyField):
+  """A read only activity report statistic."""
+
+
+class ActivityListSerializer(ActivityFieldMixin, serializers.ListSerializer):
+  """A read only list of activity report statistics."""
@@ -2,6 +2,7 @@
 
 from drf_yasg import openapi
 
+from ...exceptions import ValidationPermissionError
 from ..store import Store
 from utilities.serializers.fields.m2m import M2MThroughSerializerField
 
@@ -19,3 +20,23 @@ class PreferredStoreSerializerField(M2MThroughSerializerField):
         "title": "Store",
         "type": openapi.TYPE_INTEGER,
     }
+
+  def get_queryset(self):
+    """Restrict the resolvable stores to those owned by the request user."""
+    queryset = super().get_queryset()
+    request = self.context.get('request')
+    if request is not None:
+      queryset = queryset.filter(user_id=request.user.pk)
+    return queryset
+
+  def fail_missing(self, missing):
+    """Raise a permission error for stores that could not be resolved.
+
+    :param missing: The `pk`'s that were not found in the queryset
+    :type missing: List[str]
+
+    :raises: :class:`panic.kitchen.exceptions.ValidationPermissionError`
+    """
+    raise ValidationPermissionError(
+        detail="Please provide valid preferred_stores.",
+    )
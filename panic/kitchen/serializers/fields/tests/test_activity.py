@@ -0,0 +1,66 @@
+"""Tests for the activity report serializer fields."""
+
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from ..activity import ActivityField, ActivityListSerializer
+
+
+class ChangeSerializer(serializers.Serializer):
+  """A serializer for the test activity report's changes."""
+
+  change = serializers.IntegerField(read_only=True)
+
+  class Meta:
+    list_serializer_class = ActivityListSerializer
+
+
+class ReportSerializer(serializers.Serializer):
+  """A serializer for a test activity report."""
+
+  total = ActivityField()
+  changes = ChangeSerializer(many=True, read_only=True)
+
+
+class Report:
+  """A test activity report."""
+
+  total = 1
+  changes = [{"change": 1}]
+
+
+class TestActivityFields(SimpleTestCase):
+  """Test the ActivityField and ActivityListSerializer classes."""
+
+  def test_reads_instance(self):
+    serialized = ReportSerializer(Report())
+
+    self.assertEqual(serialized.data["total"], 1)
+    self.assertEqual(serialized.data["changes"], [{"change": 1}])
+
+  def test_reads_gathered_activity(self):
+    serialized = ReportSerializer(
+        Report(),
+        context={
+            "activity": {
+                "total": 2,
+                "changes": [{
+                    "change": 2
+                }],
+            },
+        },
+    )
+
+    self.assertEqual(serialized.data["total"], 2)
+    self.assertEqual(serialized.data["changes"], [{"change": 2}])
+
+  def test_reads_instance_when_not_gathered(self):
+    serialized = ReportSerializer(
+        Report(),
+        context={"activity": {
+            "total": 2
+        }},
+    )
+
+    self.assertEqual(serialized.data["total"], 2)
+    self.assertEqual(serialized.data["changes"], [{"change": 1}])
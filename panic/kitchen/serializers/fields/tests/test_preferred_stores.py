@@ -1,6 +1,12 @@
 """Tests for the ItemSerializer's PreferredStore serializer field."""
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ErrorDetail, ValidationError
+
+from ....exceptions import ValidationPermissionError
 from ....models.item import Item
+from ....models.store import Store
 from ....tests.fixtures.fixtures_django import MockRequest
 from ....tests.fixtures.fixtures_item import ItemTestHarness
 from ...item import ItemSerializer
@@ -19,6 +25,7 @@ class TestPreferredStore(ItemTestHarness):
         'next_expiry_date',
         'next_expiry_datetime',
         'next_expiry_quantity',
+        'projected_stock_out',
     }
     cls.m2m_fields = {'preferred_stores'}
 
@@ -65,6 +72,7 @@ class TestPreferredStore(ItemTestHarness):
     expected['expired'] = 0
     expected['next_expiry_date'] = None
     expected['next_expiry_datetime'] = None
+    expected['projected_stock_out'] = None
     return expected
 
   def test_deserialize(self):
@@ -143,3 +151,46 @@ class TestPreferredStore(ItemTestHarness):
     representation['price'] = float(item.price)
 
     self.assertDictEqual(representation, expected)
+
+  def test_serialize_ps_single_query(self):
+    extra_store = Store.objects.create(user=self.user1, name="Extra Store")
+    data = dict(self.serializer_data)
+    data.update({'preferred_stores': [self.store1.id, extra_store.id]})
+
+    serialized = self.serializer(
+        context={'request': self.request},
+        data=data,
+    )
+    with CaptureQueriesContext(connection) as queries:
+      serialized.is_valid(raise_exception=True)
+      serialized.save()
+
+    store_row_select = 'SELECT "kitchen_store"."id", "kitchen_store"."name"'
+    store_reads = [
+        query for query in queries.captured_queries
+        if query['sql'].startswith(store_row_select)
+    ]
+    self.assertEqual(len(store_reads), 1)
+
+  def test_serialize_ps_wrong_user(self):
+    data = dict(self.serializer_data)
+    data.update({'preferred_stores': [self.store2.id]})
+
+    serialized = self.serializer(
+        context={'request': self.request},
+        data=data,
+    )
+    with self.assertRaises(ValidationError) as raised:
+      serialized.is_valid(raise_exception=True)
+
+    self.assertEqual(
+        raised.exception.detail,
+        {
+            'preferred_stores': [
+                ErrorDetail(
+                    string="Please provide valid preferred_stores.",
+                    code=ValidationPermissionError.default_code
+                ),
+            ],
+        },
+    )
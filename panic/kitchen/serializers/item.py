@@ -6,6 +6,7 @@ from rest_framework import serializers
 from ..models.item import Item
 from .bases import KitchenBaseModelSerializer
 from .fields.preferred_stores import PreferredStoreSerializerField
+from utilities.models.validators.m2m import ManyToManyRelatedValidator
 
 DEFAULT_TIMEZONE = pytz.utc.zone
 
@@ -18,6 +19,7 @@ class ItemSerializer(KitchenBaseModelSerializer):
   next_expiry_date = serializers.ReadOnlyField()
   next_expiry_datetime = serializers.ReadOnlyField()
   next_expiry_quantity = serializers.ReadOnlyField()
+  projected_stock_out = serializers.ReadOnlyField()
   expired = serializers.ReadOnlyField()
 
   class Meta:
@@ -33,19 +35,39 @@ class ItemSerializer(KitchenBaseModelSerializer):
         "next_expiry_date",
         "next_expiry_datetime",
         "next_expiry_quantity",
+        "projected_stock_out",
         "quantity",
     )
 
-  def validate_name(self, name):
-    """Ensure the name is unique (regardless of case) per user.
+  def create(self, validated_data):
+    """Create an Item, reusing the already validated preferred_stores.
 
-    :param name: The item name.
-    :type name: str
+    :param validated_data: The validated request data
+    :type validated_data: dict
 
-    :raises: :class:`rest_framework.serializers.ValidationError`
+    :returns: The created model instance
+    :rtype: :class:`panic.kitchen.models.item.Item`
+    """
+    with ManyToManyRelatedValidator.validated(
+        validated_data.get('preferred_stores', [])
+    ):
+      return super().create(validated_data)
+
+  def update(self, instance, validated_data):
+    """Update an Item, reusing the already validated preferred_stores.
+
+    :param instance: The model instance being updated
+    :type instance: :class:`panic.kitchen.models.item.Item`
+    :param validated_data: The validated request data
+    :type validated_data: dict
+
+    :returns: The updated model instance
+    :rtype: :class:`panic.kitchen.models.item.Item`
     """
-    self.case_unique_validator(name, "name")
-    return name
+    with ManyToManyRelatedValidator.validated(
+        validated_data.get('preferred_stores', [])
+    ):
+      return super().update(instance, validated_data)
 
   def validate_preferred_stores(self, preferred_stores):
     """Ensure preferred_stores are owned by the current request user.
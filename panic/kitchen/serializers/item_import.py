@@ -0,0 +1,46 @@
+"""Serializer for bulk Item import records."""
+
+from rest_framework import serializers
+
+from ..models import constants
+from ..models.item import Item
+from ..models.shelf import Shelf
+from ..models.store import Store
+
+
+class ItemImportRecordSerializer(serializers.Serializer):
+  """Serializer for a single bulk Item import record."""
+
+  name = serializers.CharField(max_length=Item.MAXIMUM_NAME_LENGTH)
+  price = serializers.DecimalField(max_digits=10, decimal_places=2)
+  shelf_life = serializers.IntegerField(
+      default=Item.DEFAULT_SHELF_LIFE,
+      min_value=Item.MINIMUM_SHELF_LIFE,
+      max_value=Item.MAXIMUM_SHELF_LIFE,
+  )
+  has_partial_quantities = serializers.BooleanField(default=False)
+  quantity = serializers.FloatField(
+      default=0,
+      min_value=constants.MINIMUM_QUANTITY,
+      max_value=constants.MAXIMUM_QUANTITY,
+  )
+  shelf = serializers.CharField(
+      max_length=Shelf.MAXIMUM_NAME_LENGTH,
+      allow_blank=True,
+      allow_null=True,
+      default=None,
+  )
+  preferred_stores = serializers.ListField(
+      child=serializers.CharField(max_length=Store.MAXIMUM_NAME_LENGTH),
+      default=list,
+  )
+
+  # pylint: disable=useless-super-delegation
+  def create(self, validated_data):
+    """Implement ABC."""
+    return super().create(validated_data)
+
+  # pylint: disable=useless-super-delegation
+  def update(self, instance, validated_data):
+    """Implement ABC."""
+    return super().update(instance, validated_data)
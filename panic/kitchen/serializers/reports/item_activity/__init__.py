@@ -5,18 +5,23 @@ from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
 
 from ....models.item import Item
+from ...fields.activity import ActivityField
 from .item_activity_recent import RecentActivitySerializer
 
 DEFAULT_TIMEZONE = pytz.utc.zone
 
 
 class ItemActivityReportSerializer(serializers.ModelSerializer):
-  """Serializer for the Item's activity report."""
+  """Serializer for the Item's activity report.
 
-  activity_first = serializers.ReadOnlyField(read_only=True)
-  usage_total = serializers.ReadOnlyField(read_only=True)
-  usage_avg_week = serializers.ReadOnlyField(read_only=True)
-  usage_avg_month = serializers.ReadOnlyField(read_only=True)
+  Statistics gathered in advance can be passed in the serializer context, as
+  described by :class:`kitchen.serializers.fields.activity.ActivityField`.
+  """
+
+  activity_first = ActivityField(read_only=True)
+  usage_total = ActivityField(read_only=True)
+  usage_avg_week = ActivityField(read_only=True)
+  usage_avg_month = ActivityField(read_only=True)
   recent_activity = serializers.SerializerMethodField(read_only=True)
 
   class Meta:
@@ -33,4 +38,4 @@ class ItemActivityReportSerializer(serializers.ModelSerializer):
   @swagger_serializer_method(serializer_or_field=RecentActivitySerializer)
   def get_recent_activity(self, obj):
     """Retrieve recent purchase/usage activity for an item."""
-    return RecentActivitySerializer(obj).data
+    return RecentActivitySerializer(obj, context=self.context).data
@@ -2,6 +2,8 @@
 
 from rest_framework import serializers
 
+from ...fields.activity import ActivityListSerializer
+
 
 class LastTwoWeeksActivitySerializer(serializers.Serializer):
   """Serializer for an Item's last two weeks of usage activity."""
@@ -9,6 +11,9 @@ class LastTwoWeeksActivitySerializer(serializers.Serializer):
   date = serializers.DateField(read_only=True)
   change = serializers.IntegerField(read_only=True)
 
+  class Meta:
+    list_serializer_class = ActivityListSerializer
+
   # pylint: disable=useless-super-delegation
   def create(self, validated_data):
     """Implement ABC."""
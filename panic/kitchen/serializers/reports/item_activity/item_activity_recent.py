@@ -6,6 +6,7 @@ from rest_framework import serializers
 from timezone_field.rest_framework import TimeZoneSerializerField
 
 from ....models.item import Item
+from ...fields.activity import ActivityField
 from .item_activity_last_two_weeks import LastTwoWeeksActivitySerializer
 
 DEFAULT_TIMEZONE = pytz.utc.zone
@@ -15,8 +16,8 @@ class RecentActivitySerializer(serializers.ModelSerializer):
   """Serializer for the user's recent activity."""
 
   user_timezone = serializers.SerializerMethodField(read_only=True)
-  usage_current_week = serializers.ReadOnlyField(read_only=True)
-  usage_current_month = serializers.ReadOnlyField(read_only=True)
+  usage_current_week = ActivityField(read_only=True)
+  usage_current_month = ActivityField(read_only=True)
   activity_last_two_weeks = LastTwoWeeksActivitySerializer(
       many=True,
       read_only=True,
@@ -34,4 +35,4 @@ class RecentActivitySerializer(serializers.ModelSerializer):
   @swagger_serializer_method(serializer_or_field=TimeZoneSerializerField)
   def get_user_timezone(self, obj):
     """Retrieve the user's configured timezone."""
-    return obj.user.timezone.zone
+    return obj.local_timezone.zone
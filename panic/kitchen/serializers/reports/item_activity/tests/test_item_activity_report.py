@@ -2,6 +2,7 @@
 
 import json
 from datetime import timedelta
+from unittest import mock
 
 import pytz
 from django.utils import timezone
@@ -125,3 +126,41 @@ class TestItemActivitySerializer(TransactionTestHarness):
         json.dumps(deserialized['recent_activity'],),
         json.dumps(deserialized_transaction.data),
     )
+
+  def test_gathered_activity(self):
+    activity = {
+        "activity_first": self.one_year_ago,
+        "activity_last_two_weeks": [{
+            "date": self.today.date(),
+            "change": -3,
+        }],
+        "usage_avg_month": 1.5,
+        "usage_avg_week": 0.5,
+        "usage_current_month": 3,
+        "usage_current_week": 2,
+        "usage_total": 3,
+    }
+
+    with mock.patch(
+        MANAGER_MODULE + ".ActivityManager.get_usage_total"
+    ) as m_usage_total:
+      serialized = self.serializer(
+          self.item1,
+          context={
+              'request': self.request,
+              'activity': activity,
+          },
+      )
+      deserialized = serialized.data
+
+    m_usage_total.assert_not_called()
+    self.assertEqual(deserialized['usage_avg_month'], 1.5)
+    self.assertEqual(deserialized['usage_avg_week'], 0.5)
+    self.assertEqual(deserialized['recent_activity']['usage_current_week'], 2)
+    self.assertEqual(
+        deserialized['recent_activity']['activity_last_two_weeks'],
+        [{
+            "date": self.today.date().isoformat(),
+            "change": -3,
+        }],
+    )
@@ -0,0 +1,56 @@
+"""Serializers for the user's shopping list."""
+
+from rest_framework import serializers
+
+
+class ShoppingListBaseSerializer(serializers.Serializer):
+  """Base serializer for the read only shopping list."""
+
+  # pylint: disable=useless-super-delegation
+  def create(self, validated_data):
+    """Implement ABC."""
+    return super().create(validated_data)
+
+  # pylint: disable=useless-super-delegation
+  def update(self, instance, validated_data):
+    """Implement ABC."""
+    return super().update(instance, validated_data)
+
+
+class ShoppingListItemSerializer(ShoppingListBaseSerializer):
+  """Serializer for an Item on the user's shopping list."""
+
+  id = serializers.IntegerField(read_only=True)  # pylint: disable=invalid-name
+  name = serializers.CharField(read_only=True)
+  price = serializers.DecimalField(
+      max_digits=10,
+      decimal_places=2,
+      read_only=True,
+  )
+  quantity = serializers.FloatField(read_only=True)
+  usage_avg_week = serializers.FloatField(read_only=True)
+  next_expiry_date = serializers.DateField(read_only=True, allow_null=True)
+  next_expiry_quantity = serializers.FloatField(read_only=True)
+  projected_run_out = serializers.DateField(read_only=True)
+  quantity_to_buy = serializers.FloatField(read_only=True)
+  preferred_stores = serializers.ListField(
+      child=serializers.IntegerField(),
+      read_only=True,
+  )
+
+
+class ShoppingListStoreSerializer(ShoppingListBaseSerializer):
+  """Serializer for the Items on the user's shopping list, for one Store."""
+
+  # pylint: disable=invalid-name
+  id = serializers.IntegerField(read_only=True, allow_null=True)
+  name = serializers.CharField(read_only=True, allow_null=True)
+  items = ShoppingListItemSerializer(many=True, read_only=True)
+
+
+class ShoppingListSerializer(ShoppingListBaseSerializer):
+  """Serializer for the user's shopping list."""
+
+  generated = serializers.DateTimeField(read_only=True)
+  horizon = serializers.IntegerField(read_only=True)
+  stores = ShoppingListStoreSerializer(many=True, read_only=True)
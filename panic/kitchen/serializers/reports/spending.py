@@ -0,0 +1,98 @@
+"""Serializers for the user's spending report."""
+
+from rest_framework import serializers
+
+from ...models.managers.spending_summary.report import PERIODS
+
+
+class SpendingReportBaseSerializer(serializers.Serializer):
+  """Base serializer for the read only spending report."""
+
+  quantity = serializers.FloatField(read_only=True)
+  cost = serializers.DecimalField(
+      max_digits=12,
+      decimal_places=2,
+      read_only=True,
+  )
+
+  # pylint: disable=useless-super-delegation
+  def create(self, validated_data):
+    """Implement ABC."""
+    return super().create(validated_data)
+
+  # pylint: disable=useless-super-delegation
+  def update(self, instance, validated_data):
+    """Implement ABC."""
+    return super().update(instance, validated_data)
+
+
+class SpendingReportQuerySerializer(serializers.Serializer):
+  """Serializer for the spending report's query parameters."""
+
+  start = serializers.DateField(required=False)
+  end = serializers.DateField(required=False)
+  period = serializers.ChoiceField(
+      choices=PERIODS,
+      default=PERIODS[0],
+      required=False,
+  )
+
+  # pylint: disable=useless-super-delegation
+  def create(self, validated_data):
+    """Implement ABC."""
+    return super().create(validated_data)
+
+  # pylint: disable=useless-super-delegation
+  def update(self, instance, validated_data):
+    """Implement ABC."""
+    return super().update(instance, validated_data)
+
+  def validate(self, attrs):
+    """Ensure the reported range does not end before it starts.
+
+    :param attrs: The validated query parameters
+    :type attrs: dict
+
+    :raises: :class:`rest_framework.serializers.ValidationError`
+    """
+    start = attrs.get('start')
+    end = attrs.get('end')
+    if start and end and end < start:
+      raise serializers.ValidationError({'end': "Must not precede start."})
+    return attrs
+
+
+class SpendingByStoreSerializer(SpendingReportBaseSerializer):
+  """Serializer for the user's total spending at a Store."""
+
+  id = serializers.IntegerField(  # pylint: disable=invalid-name
+      source="store_id",
+      read_only=True,
+      allow_null=True,
+  )
+  name = serializers.CharField(
+      source="store__name",
+      read_only=True,
+      allow_null=True,
+  )
+
+
+class SpendingByShelfSerializer(SpendingReportBaseSerializer):
+  """Serializer for the user's total spending on a Shelf."""
+
+  id = serializers.IntegerField(  # pylint: disable=invalid-name
+      source="shelf_id",
+      read_only=True,
+      allow_null=True,
+  )
+  name = serializers.CharField(
+      source="shelf__name",
+      read_only=True,
+      allow_null=True,
+  )
+
+
+class SpendingByPeriodSerializer(SpendingReportBaseSerializer):
+  """Serializer for the user's total spending in a month or year."""
+
+  period = serializers.DateField(read_only=True)
@@ -0,0 +1,55 @@
+"""Serializers for the user's waste report."""
+
+from rest_framework import serializers
+
+
+class WasteReportBaseSerializer(serializers.Serializer):
+  """Base serializer for the read only waste report."""
+
+  quantity = serializers.FloatField(read_only=True)
+  cost = serializers.DecimalField(
+      max_digits=12,
+      decimal_places=2,
+      read_only=True,
+  )
+
+  # pylint: disable=useless-super-delegation
+  def create(self, validated_data):
+    """Implement ABC."""
+    return super().create(validated_data)
+
+  # pylint: disable=useless-super-delegation
+  def update(self, instance, validated_data):
+    """Implement ABC."""
+    return super().update(instance, validated_data)
+
+
+class WasteByItemSerializer(WasteReportBaseSerializer):
+  """Serializer for the user's total waste of an Item."""
+
+  id = serializers.IntegerField(  # pylint: disable=invalid-name
+      source="item_id",
+      read_only=True,
+  )
+  name = serializers.CharField(source="item__name", read_only=True)
+
+
+class WasteByShelfSerializer(WasteReportBaseSerializer):
+  """Serializer for the user's total waste from a Shelf."""
+
+  id = serializers.IntegerField(  # pylint: disable=invalid-name
+      source="shelf_id",
+      read_only=True,
+      allow_null=True,
+  )
+  name = serializers.CharField(
+      source="shelf__name",
+      read_only=True,
+      allow_null=True,
+  )
+
+
+class WasteByMonthSerializer(WasteReportBaseSerializer):
+  """Serializer for the user's total waste in a month."""
+
+  month = serializers.DateField(read_only=True)
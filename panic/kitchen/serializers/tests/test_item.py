@@ -28,6 +28,7 @@ class TestItem(SerializerTestMixin, ItemTestHarness):
         'next_expiry_date',
         'next_expiry_datetime',
         'next_expiry_quantity',
+        'projected_stock_out',
     }
     cls.m2m_fields = {'preferred_stores'}
 
@@ -76,6 +77,7 @@ class TestItem(SerializerTestMixin, ItemTestHarness):
     new_dictionary['expired'] = 0
     new_dictionary['next_expiry_date'] = None
     new_dictionary['next_expiry_datetime'] = None
+    new_dictionary['projected_stock_out'] = None
     return new_dictionary
 
   @classmethod
@@ -246,11 +248,12 @@ class TestItem(SerializerTestMixin, ItemTestHarness):
         context={'request': self.request},
         data=case_change,
     )
-    with self.assertRaises(ValidationError):
-      serialized2.is_valid(raise_exception=True)
+    serialized2.is_valid(raise_exception=True)
+    with self.assertRaises(ValidationError) as raised:
+      serialized2.save()
 
     self.assertEqual(
-        str(serialized2.errors['name'][0]),
+        str(raised.exception.detail['name'][0]),
         UNIQUE_CONSTRAINT_MSG,
     )
 
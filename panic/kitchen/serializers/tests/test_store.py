@@ -89,11 +89,12 @@ class TestStore(SerializerTestMixin, StoreTestHarness):
         context={'request': self.request},
         data=case_change,
     )
-    with self.assertRaises(ValidationError):
-      serialized2.is_valid(raise_exception=True)
+    serialized2.is_valid(raise_exception=True)
+    with self.assertRaises(ValidationError) as raised:
+      serialized2.save()
 
     self.assertEqual(
-        str(serialized2.errors['name'][0]),
+        str(raised.exception.detail['name'][0]),
         UNIQUE_CONSTRAINT_MSG,
     )
 
@@ -1,5 +1,7 @@
 """Test the Transaction serializer."""
 
+from decimal import Decimal
+
 from django.utils import timezone
 from freezegun import freeze_time
 from rest_framework.serializers import ErrorDetail, ValidationError
@@ -67,6 +69,7 @@ class TestTransactionSerializer(SerializerTestMixin, TransactionTestHarness):
 
     deserialized['datetime'] = \
         deserialize_datetime(deserialized['datetime'])
+    deserialized['unit_price'] = Decimal(deserialized['unit_price'])
 
     self.assertDictEqual(representation, deserialized)
 
@@ -10,7 +10,7 @@ class TransactionSerializer(KitchenBaseModelSerializer):
   class Meta:
     model = Transaction
     fields = '__all__'
-    read_only_fields = ("id", "date")
+    read_only_fields = ("id", "date", "unit_price")
 
   def validate_item(self, item):
     """Ensure item is owned by the current request user.
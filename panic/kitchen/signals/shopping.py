@@ -0,0 +1,44 @@
+"""Handles signals that invalidate cached shopping lists."""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ..models.item import Item
+from ..models.managers.item.shopping import invalidate_shopping_list
+from utilities.models.decorators.caching import PersistentCachedProperty
+
+ITEM_CACHED_FIELDS = frozenset(
+    value.cached_field
+    for value in Item.__dict__.values()
+    if isinstance(value, PersistentCachedProperty)
+)
+
+
+# pylint: disable = unused-argument
+@receiver(post_save, sender='kitchen.Item')
+def shopping_list_item_save_handler(instance, update_fields=None, **kwargs):
+  """Invalidate the owner's shopping list when an Item is saved.
+
+  Saves that only persist the Item's cached properties are ignored.
+  """
+  if update_fields and update_fields <= ITEM_CACHED_FIELDS:
+    return
+  invalidate_shopping_list(instance.user_id)
+
+
+# pylint: disable = unused-argument
+@receiver(post_delete, sender='kitchen.Item')
+@receiver(post_save, sender='kitchen.Store')
+@receiver(post_delete, sender='kitchen.Store')
+@receiver(m2m_changed, sender=Item.preferred_stores.through)
+def shopping_list_owner_change_handler(instance, **kwargs):
+  """Invalidate the owner's shopping list when an Item or Store changes."""
+  invalidate_shopping_list(instance.user_id)
+
+
+# pylint: disable = unused-argument
+@receiver(post_save, sender='kitchen.Transaction')
+@receiver(post_delete, sender='kitchen.Transaction')
+def shopping_list_transaction_handler(instance, **kwargs):
+  """Invalidate the owner's shopping list when a Transaction changes."""
+  invalidate_shopping_list(instance.item.user_id)
@@ -0,0 +1,14 @@
+"""Handles signals from the SuggestedItem model."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..search.suggested import SUGGESTED_ITEM_INDEX
+
+
+# pylint: disable = unused-argument
+@receiver(post_save, sender='kitchen.SuggestedItem')
+@receiver(post_delete, sender='kitchen.SuggestedItem')
+def suggested_item_change_handler(**kwargs):
+  """Invalidate the SuggestedItem search index when the table changes."""
+  SUGGESTED_ITEM_INDEX.invalidate()
@@ -0,0 +1,53 @@
+"""Test the shopping list signal handlers."""
+
+from unittest.mock import patch
+
+from ...tests.fixtures.fixtures_transaction import TransactionTestHarness
+from .. import shopping as shopping_module
+
+
+@patch(shopping_module.__name__ + '.invalidate_shopping_list')
+class TestShoppingListHandlers(TransactionTestHarness):
+  """Test the shopping list invalidation signal handlers."""
+
+  mute_signals = False
+
+  def test_item_save(self, m_invalidate):
+    self.item1.save()
+    m_invalidate.assert_called_once_with(self.user1.id)
+
+  def test_item_cached_property_save(self, m_invalidate):
+    self.item1.save(update_fields=["_expired", "_next_expiry_quantity"])
+    m_invalidate.assert_not_called()
+
+  def test_item_partial_save(self, m_invalidate):
+    self.item1.save(update_fields=["_expired", "name"])
+    m_invalidate.assert_called_once_with(self.user1.id)
+
+  def test_item_preferred_stores_change(self, m_invalidate):
+    self.item1.preferred_stores.remove(self.store1)
+    m_invalidate.assert_any_call(self.user1.id)
+
+  def test_store_save(self, m_invalidate):
+    self.store1.save()
+    m_invalidate.assert_called_once_with(self.user1.id)
+
+  def test_transaction_save(self, m_invalidate):
+    self.create_test_instance(
+        item=self.item1,
+        date_object=self.today,
+        quantity=3,
+    )
+    m_invalidate.assert_any_call(self.user1.id)
+
+  def test_transaction_delete(self, m_invalidate):
+    transaction = self.create_test_instance(
+        item=self.item1,
+        date_object=self.today,
+        quantity=3,
+    )
+    m_invalidate.reset_mock()
+
+    transaction.delete()
+
+    m_invalidate.assert_called_once_with(self.user1.id)
@@ -0,0 +1,32 @@
+"""Test The SuggestedItem model signal handler."""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ...models.suggested import SuggestedItem
+from .. import suggested as suggested_module
+
+
+@patch(suggested_module.__name__ + '.SUGGESTED_ITEM_INDEX.invalidate')
+class TestSuggestedItemChangeHandler(TestCase):
+  """Test the suggested_item_change_handler signal handler."""
+
+  def test_create(self, m_invalidate):
+    SuggestedItem.objects.create(name="Tofu")
+    m_invalidate.assert_called_once_with()
+
+  def test_update(self, m_invalidate):
+    suggested = SuggestedItem.objects.create(name="Tofu")
+    m_invalidate.reset_mock()
+
+    suggested.name = "Firm Tofu"
+    suggested.save()
+    m_invalidate.assert_called_once_with()
+
+  def test_delete(self, m_invalidate):
+    suggested = SuggestedItem.objects.create(name="Tofu")
+    m_invalidate.reset_mock()
+
+    suggested.delete()
+    m_invalidate.assert_called_once_with()
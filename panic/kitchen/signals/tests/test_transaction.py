@@ -33,6 +33,35 @@ class TestTransactionPostSaveHandler(TransactionTestHarness):
     transaction = self.create_test_instance(**self.positive_data)
     m_adjust.assert_called_once_with(transaction)
 
+  @patch(transaction_module.__name__ + '.Forecast.objects.refit')
+  def test_refit_forecast_from_transaction(self, m_refit):
+    transaction = self.create_test_instance(**self.positive_data)
+    m_refit.assert_called_once_with(transaction)
+
+  @patch(transaction_module.__name__ + '.Forecast.objects.refit')
+  def test_existing_transaction_save_event_no_refit(self, m_refit):
+    transaction = self.create_test_instance(**self.positive_data)
+    transaction.save()
+
+    m_refit.assert_called_once_with(transaction)
+
+  @patch(transaction_module.__name__ + '.Waste.objects.record_expired')
+  def test_consumption_records_waste(self, m_record):
+    self.create_test_instance(**self.positive_data)
+    m_record.assert_not_called()
+
+    self.create_test_instance(**self.negative_data)
+    m_record.assert_called_once_with(self.user1, [self.item1.id])
+
+  @patch(transaction_module.__name__ + '.SpendingSummary.objects.record')
+  def test_purchase_records_spending(self, m_record):
+    purchase = self.create_test_instance(**self.positive_data)
+    m_record.assert_called_once_with(purchase)
+
+    m_record.reset_mock()
+    self.create_test_instance(**self.negative_data)
+    m_record.assert_not_called()
+
   @patch(transaction_module.__name__ + '.Inventory.objects.adjust')
   def test_existing_transaction_save_event_noop(self, m_adjust):
     transaction = self.create_test_instance(**self.positive_data)
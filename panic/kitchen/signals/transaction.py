@@ -3,7 +3,10 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from ..models.forecast import Forecast
 from ..models.inventory import Inventory
+from ..models.spending_summary import SpendingSummary
+from ..models.waste import Waste
 
 
 # pylint: disable = unused-argument
@@ -11,4 +14,9 @@ from ..models.inventory import Inventory
 def transaction_post_save_handler(instance, created, **kwargs):
   """Handle the Transaction model `post_save` signal."""
   if created:
+    if instance.quantity < 0:
+      Waste.objects.record_expired(instance.item.user, [instance.item_id])
+    if instance.unit_price is not None:
+      SpendingSummary.objects.record(instance)
     Inventory.objects.adjust(instance)
+    Forecast.objects.refit(instance)
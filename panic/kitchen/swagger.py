@@ -47,3 +47,17 @@ custom_item_consumption_view_parm = openapi.Parameter(
     type=openapi.TYPE_STRING,
     default=pytz.utc.zone,
 )
+
+custom_suggested_search_view_parm = openapi.Parameter(
+    'q',
+    openapi.IN_QUERY,
+    description="Search suggestions by name prefix, or similarity",
+    type=openapi.TYPE_STRING,
+)
+
+custom_transaction_cursor_view_parm = openapi.Parameter(
+    'cursor',
+    openapi.IN_QUERY,
+    description="The cursor of the page to retrieve, from the 'next' link",
+    type=openapi.TYPE_STRING,
+)
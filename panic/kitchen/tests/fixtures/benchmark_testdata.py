@@ -0,0 +1,237 @@
+"""Benchmark test data generator."""
+
+import io
+import random
+from collections import deque
+from datetime import timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytz
+from allauth.account.models import EmailAddress
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+from ...models.forecast import Forecast
+from ...models.inventory import Inventory
+from ...models.item import Item
+from ...models.spending_summary import SpendingSummary
+from ...models.transaction import Transaction
+from ...models.waste import Waste
+from .bulk_testdata import BulkTestDataGenerator, DataConfiguration
+
+CENTS = Decimal("0.01")
+COPY_NULL = "\\N"
+
+
+class BenchmarkDataConfiguration(DataConfiguration):
+  """Configuration for the BenchmarkDataGenerator class."""
+
+  batch_size = 5000
+  max_daily_usage = 1.5
+  min_daily_usage = 0.1
+  number_of_items = 50
+  number_of_stores = 3
+  number_of_users = 10
+  password = "benchmark"
+  seed = 0
+  summarize = True
+  timezones = (
+      "UTC",
+      "America/Toronto",
+      "America/Vancouver",
+      "Europe/London",
+      "Asia/Tokyo",
+  )
+  username_prefix = "benchmark_user"
+  years = 2
+
+
+class BenchmarkDataGenerator(BulkTestDataGenerator):
+  """Generate users with years of realistic kitchen history, for benchmarks.
+
+  Each item is consumed every few days at its own daily rate, and restocked
+  when it runs low.  Inventory is simulated in memory with the same FIFO
+  rules as :class:`kitchen.models.managers.inventory.AdjustmentManager`.
+
+  Transactions and Inventory are streamed into Postgres with COPY, bypassing
+  model instantiation and the per transaction signal handlers.  Spending
+  summaries, forecasts and waste are then built once for each user.
+
+  :param config: The generator's configuration
+  :type config: :class:`BenchmarkDataConfiguration`
+  """
+
+  # pylint: disable=super-init-not-called
+  def __init__(self, config=BenchmarkDataConfiguration()):
+    self.config = config
+    self.random = random.Random(config.seed)
+    self.user = None
+    self.users = None
+    self.shelf = None
+    self.items = None
+    self.stores = None
+    self.transactions = None
+    self.inventory = None
+
+  def __create_users(self):
+    password = make_password(self.config.password)
+    self.users = get_user_model().objects.bulk_create([
+        get_user_model()(
+            username=self.config.username_prefix + str(i),
+            email="%s%s@example.com" % (self.config.username_prefix, i),
+            password=password,
+            timezone=pytz.timezone(self.random.choice(self.config.timezones)),
+        ) for i in range(0, self.config.number_of_users)
+    ])
+    EmailAddress.objects.bulk_create([
+        EmailAddress(user=user, email=user.email, primary=True, verified=True)
+        for user in self.users
+    ])
+
+  def __simulate_item(self, item, start, days):
+    daily_usage = self.random.uniform(
+        self.config.min_daily_usage,
+        self.config.max_daily_usage,
+    )
+    price = Decimal(item.price)
+    stock = deque()
+    quantity = 0
+    day = self.random.uniform(0, 7)
+
+    while day < days:
+      if quantity < daily_usage * 3:
+        purchased = max(1, round(daily_usage * self.random.uniform(7, 21)))
+        stock.append([len(self.transactions), purchased])
+        self.transactions.append(
+            (start + timedelta(days=day), item.id, purchased, price)
+        )
+        quantity += purchased
+
+      gap = self.random.uniform(1, 4)
+      day += gap
+      consumed = min(quantity, max(1, round(daily_usage * gap)))
+      if day >= days or not consumed:
+        continue
+
+      self.transactions.append(
+          (start + timedelta(days=day), item.id, -consumed, None)
+      )
+      quantity -= consumed
+      while consumed:
+        debit = min(stock[0][1], consumed)
+        stock[0][1] -= debit
+        consumed -= debit
+        if not stock[0][1]:
+          stock.popleft()
+
+    item.quantity = quantity
+    self.inventory.extend(
+        (item.id, index, remaining) for index, remaining in stock
+    )
+
+  def __simulate_history(self):
+    self.transactions = []
+    self.inventory = []
+    days = self.config.years * 365
+    start = now() - timedelta(days=days)
+
+    for item in self.items:
+      self.__simulate_item(item, start, days)
+
+  def __summarize_spending(self):
+    store = self.stores[self.config.preferred_store]
+    summaries = {}
+
+    for datetime, item_id, quantity, unit_price in self.transactions:
+      if unit_price is None:
+        continue
+      month = datetime.astimezone(self.user.timezone).date().replace(day=1)
+      summary = summaries.setdefault(
+          (item_id, month),
+          SpendingSummary(
+              item_id=item_id,
+              month=month,
+              shelf=self.shelf,
+              store=store,
+              user=self.user,
+          ),
+      )
+      summary.quantity += quantity
+      summary.cost += (unit_price * Decimal(str(quantity))).quantize(
+          CENTS,
+          rounding=ROUND_HALF_UP,
+      )
+
+    SpendingSummary.objects.bulk_create(
+        summaries.values(),
+        batch_size=self.config.batch_size,
+    )
+
+  @staticmethod
+  def __reserve_ids(model, count):
+    with connection.cursor() as cursor:
+      cursor.execute(
+          "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+          "FROM generate_series(1, %s)",
+          [model._meta.db_table, count],
+      )
+      return [row[0] for row in cursor.fetchall()]
+
+  def __copy(self, model, fields, rows):
+    columns = ", ".join(
+        connection.ops.quote_name(model._meta.get_field(field).column)
+        for field in fields
+    )
+    statement = "COPY %s (%s) FROM STDIN" % (
+        connection.ops.quote_name(model._meta.db_table),
+        columns,
+    )
+
+    with connection.cursor() as cursor:
+      for offset in range(0, len(rows), self.config.batch_size):
+        buffer = io.StringIO()
+        for row in rows[offset:offset + self.config.batch_size]:
+          buffer.write(
+              "\t".join(
+                  COPY_NULL if value is None else str(value) for value in row
+              ) + "\n"
+          )
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+
+  def __save_history(self):
+    ids = self.__reserve_ids(Transaction, len(self.transactions))
+    self.__copy(
+        Transaction,
+        ('id', 'datetime', 'item', 'quantity', 'unit_price'),
+        [(ids[index],) + row for index, row in enumerate(self.transactions)],
+    )
+    self.__copy(
+        Inventory,
+        ('item', 'transaction', 'remaining'),
+        [(item_id, ids[index], remaining)
+         for item_id, index, remaining in self.inventory],
+    )
+    Item.objects.bulk_update(
+        self.items,
+        ['quantity'],
+        batch_size=self.config.batch_size,
+    )
+
+    if self.config.summarize:
+      self.__summarize_spending()
+      Forecast.objects.fit(self.user)
+      Waste.objects.record_expired(self.user)
+
+  def generate_data(self):
+    """Perform the data generation, and save the generated models."""
+    self.__create_users()
+
+    for user in self.users:
+      self.user = user
+      with transaction.atomic():
+        super().generate_data()
+        self.__simulate_history()
+        self.__save_history()
@@ -3,6 +3,7 @@
 from django.contrib.auth import get_user_model
 
 from ...models.item import Item
+from ...models.preferred_store import PreferredStore
 from ...models.shelf import Shelf
 from ...models.store import Store
 
@@ -52,12 +53,13 @@ class BulkTestDataGenerator:
       self.stores.append(new_store)
 
   def __save(self):
-    for store in Store.objects.bulk_create(self.stores):
-      store.save()
+    Store.objects.bulk_create(self.stores)
+    Item.objects.bulk_create(self.items)
 
-    for item in Item.objects.bulk_create(self.items):
-      item.preferred_stores.add(self.stores[self.config.preferred_store])
-      item.save()
+    preferred_store = self.stores[self.config.preferred_store]
+    PreferredStore.objects.bulk_create([
+        PreferredStore(item=item, store=preferred_store) for item in self.items
+    ])
 
   def generate_data(self):
     """Perform the data generation, and save the generated models."""
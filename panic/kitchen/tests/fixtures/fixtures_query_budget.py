@@ -0,0 +1,133 @@
+"""Query budget test fixtures for the kitchen API."""
+
+from abc import ABC, abstractmethod
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .bulk_testdata import BulkTestDataGenerator, DataConfiguration
+
+QUERY_BUDGET_DATASET_SIZES = (10, 100, 1000)
+QUERY_BUDGET_RESULTS = []
+
+
+class QueryBudgetDataConfiguration(DataConfiguration):
+  """Configuration for generating query budget datasets."""
+
+  number_of_stores = 2
+
+
+class QueryBudgetMixin(ABC):
+  """Mixin class asserting the query budget of a kitchen API endpoint.
+
+  Mix with :class:`django.test.TestCase`, and implement `create_dataset`.
+
+  The endpoint is requested against datasets of increasing size, which are
+  rolled back after each measurement.  A test fails if the endpoint exceeds
+  its query budget on any dataset, or if its query count grows with the
+  dataset.
+
+  Measurements, including runtimes, are collected in `QUERY_BUDGET_RESULTS`
+  for reporting by the query budget pytest plugin.
+  """
+
+  dataset_sizes = QUERY_BUDGET_DATASET_SIZES
+
+  @classmethod
+  def setUpTestData(cls):
+    super().setUpTestData()
+    cls.user = get_user_model().objects.create_user(
+        username="query_budget_user",
+        email="query_budget_user@niallbyrne.ca",
+        password="test123",
+    )
+
+  def setUp(self):
+    super().setUp()
+    self.client = APIClient()
+    self.client.force_authenticate(self.user)
+
+  @abstractmethod
+  def create_dataset(self, size):
+    """Create a dataset of the given size, and return the URL to request.
+
+    :param size: The number of records to create
+    :type size: int
+
+    :returns: The URL of the endpoint under test
+    :rtype: str
+    """
+
+  def generate_items(self, size):
+    """Generate items with preferred stores, using the bulk data generator.
+
+    :param size: The number of items to generate
+    :type size: int
+
+    :returns: The generated items
+    :rtype: List[:class:`kitchen.models.item.Item`]
+    """
+    config = QueryBudgetDataConfiguration()
+    config.number_of_items = size
+    generator = BulkTestDataGenerator(self.user.username, config=config)
+    generator.generate_data()
+    return generator.items
+
+  def measure(self, url):
+    """Request a URL, and measure its query count and runtime.
+
+    The URL is requested once beforehand, so one time lookups are excluded.
+
+    :param url: The URL to request
+    :type url: str
+
+    :returns: The number of queries, and the runtime in seconds
+    :rtype: Tuple[int, float]
+    """
+    self.client.get(url)
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+      start = perf_counter()
+      response = self.client.get(url)
+      runtime = perf_counter() - start
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    return len(context), runtime
+
+  def assertQueryBudget(self, max_queries):
+    """Assert an endpoint's query count stays within a budget.
+
+    :param max_queries: The maximum number of queries per request
+    :type max_queries: int
+    """
+    measurements = []
+
+    for size in self.dataset_sizes:
+      savepoint = transaction.savepoint()
+      try:
+        url = self.create_dataset(size)
+        queries, runtime = self.measure(url)
+      finally:
+        transaction.savepoint_rollback(savepoint)
+        cache.clear()
+      measurements.append((size, queries))
+      QUERY_BUDGET_RESULTS.append((self.id(), size, queries, runtime))
+
+    for size, queries in measurements:
+      self.assertLessEqual(
+          queries,
+          max_queries,
+          "%s queries exceeds the budget of %s, with %s records." %
+          (queries, max_queries, size),
+      )
+
+    counts = [queries for _, queries in measurements]
+    self.assertLessEqual(
+        max(counts),
+        counts[0],
+        "The query count scales with the data: %s." % counts,
+    )
@@ -0,0 +1,143 @@
+"""Test the BenchmarkDataGenerator class."""
+
+from allauth.account.models import EmailAddress
+from django.contrib.auth import get_user_model
+from django.db.models import Sum
+from django.test import TestCase
+
+from ....models.forecast import Forecast
+from ....models.inventory import Inventory
+from ....models.item import Item
+from ....models.spending_summary import SpendingSummary
+from ....models.transaction import Transaction
+from ..benchmark_testdata import (
+    BenchmarkDataConfiguration,
+    BenchmarkDataGenerator,
+)
+
+
+class TestDataConfiguration(BenchmarkDataConfiguration):
+  """Test configuration for benchmark data generation."""
+
+  number_of_items = 3
+  number_of_stores = 2
+  number_of_users = 2
+  username_prefix = "created_benchmark_user"
+  years = 1
+
+
+class TestBenchmarkDataGenerator(TestCase):
+  """Test the BenchmarkDataGenerator class."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.test_config = TestDataConfiguration()
+    cls.generator = BenchmarkDataGenerator(config=cls.test_config)
+    cls.generator.generate_data()
+    cls.users = get_user_model().objects.filter(
+        username__startswith=cls.test_config.username_prefix,
+    )
+
+  def test_creates_users(self):
+    self.assertEqual(
+        [user.username for user in self.users.order_by('username')],
+        [
+            self.test_config.username_prefix + str(i)
+            for i in range(0, self.test_config.number_of_users)
+        ],
+    )
+    self.assertTrue(self.users[0].check_password(self.test_config.password))
+
+  def test_creates_verified_email_addresses(self):
+    for user in self.users:
+      self.assertTrue(
+          EmailAddress.objects.filter(
+              user=user,
+              email=user.email,
+              primary=True,
+              verified=True,
+          ).exists()
+      )
+
+  def test_creates_items_for_each_user(self):
+    for user in self.users:
+      self.assertEqual(
+          Item.objects.filter(user=user).count(),
+          self.test_config.number_of_items,
+      )
+
+  def test_creates_purchases_and_consumption(self):
+    for item in Item.objects.filter(user__in=self.users):
+      transactions = Transaction.objects.filter(item=item)
+      self.assertTrue(transactions.filter(quantity__gt=0).exists())
+      self.assertTrue(transactions.filter(quantity__lt=0).exists())
+      self.assertFalse(
+          transactions.filter(quantity__gt=0, unit_price__isnull=True).exists()
+      )
+
+  def test_item_quantity_matches_transactions(self):
+    for item in Item.objects.filter(user__in=self.users):
+      total = Transaction.objects.filter(item=item
+                                        ).aggregate(total=Sum('quantity')
+                                                   )['total']
+      self.assertEqual(item.quantity, total)
+
+  def test_inventory_matches_item_quantity(self):
+    for item in Item.objects.filter(user__in=self.users):
+      remaining = Inventory.objects.filter(item=item
+                                          ).aggregate(total=Sum('remaining')
+                                                     )['total']
+      self.assertEqual(remaining or 0, item.quantity)
+      self.assertFalse(
+          Inventory.objects.filter(item=item, remaining__lte=0).exists()
+      )
+
+  def test_inventory_is_the_latest_purchases(self):
+    for item in Item.objects.filter(user__in=self.users):
+      inventory = Inventory.objects.filter(item=item)
+      if not inventory.exists():
+        continue
+      oldest = inventory.order_by('transaction__datetime').first()
+      newer_purchases = Transaction.objects.filter(
+          item=item,
+          quantity__gt=0,
+          datetime__gt=oldest.transaction.datetime,
+      ).count()
+      self.assertEqual(newer_purchases, inventory.count() - 1)
+
+  def test_spending_matches_purchases(self):
+    for user in self.users:
+      spent = SpendingSummary.objects.filter(user=user
+                                            ).aggregate(total=Sum('quantity')
+                                                       )['total']
+      purchased = Transaction.objects.filter(
+          item__user=user,
+          quantity__gt=0,
+      ).aggregate(total=Sum('quantity'))['total']
+      self.assertEqual(spent, purchased)
+
+  def test_fits_forecasts(self):
+    self.assertEqual(
+        Forecast.objects.filter(item__user__in=self.users).count(),
+        self.test_config.number_of_users * self.test_config.number_of_items,
+    )
+
+  def test_is_reproducible(self):
+    first = list(
+        Transaction.objects.filter(
+            item__user__in=self.users
+        ).order_by('item__user__username', 'item___index',
+                   'datetime').values_list('quantity', flat=True)
+    )
+    Item.objects.filter(user__in=self.users).delete()
+    self.users.delete()
+
+    BenchmarkDataGenerator(config=self.test_config).generate_data()
+
+    second = list(
+        Transaction.objects.filter(
+            item__user__username__startswith=self.test_config.username_prefix
+        ).order_by('item__user__username', 'item___index',
+                   'datetime').values_list('quantity', flat=True)
+    )
+    self.assertEqual(first, second)
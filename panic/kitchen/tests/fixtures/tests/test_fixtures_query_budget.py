@@ -0,0 +1,65 @@
+"""Test the QueryBudgetMixin class."""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ..fixtures_query_budget import QUERY_BUDGET_RESULTS, QueryBudgetMixin
+
+
+class TestQueryBudgetMixin(QueryBudgetMixin, TestCase):
+  """Test the QueryBudgetMixin class."""
+
+  dataset_sizes = (1, 10)
+
+  def create_dataset(self, size):
+    return "/v1/items/?size=%s" % size
+
+  @patch.object(QueryBudgetMixin, "measure", return_value=(3, 0.1))
+  def test_within_budget(self, m_measure):
+    self.assertQueryBudget(max_queries=3)
+
+    m_measure.assert_any_call("/v1/items/?size=1")
+    m_measure.assert_any_call("/v1/items/?size=10")
+    self.assertIn((self.id(), 10, 3, 0.1), QUERY_BUDGET_RESULTS)
+
+  @patch.object(QueryBudgetMixin, "measure", return_value=(4, 0.1))
+  def test_exceeds_query_budget(self, _):
+    with self.assertRaises(AssertionError) as raised:
+      self.assertQueryBudget(max_queries=3)
+
+    self.assertIn("exceeds the budget of 3", str(raised.exception))
+
+  @patch.object(QueryBudgetMixin, "measure", return_value=(3, 60.0))
+  def test_runtime_is_reported_only(self, _):
+    self.assertQueryBudget(max_queries=3)
+
+    self.assertIn((self.id(), 10, 3, 60.0), QUERY_BUDGET_RESULTS)
+
+  @patch.object(
+      QueryBudgetMixin,
+      "measure",
+      side_effect=[(2, 0.1), (3, 0.1)],
+  )
+  def test_query_count_scales(self, _):
+    with self.assertRaises(AssertionError) as raised:
+      self.assertQueryBudget(max_queries=10)
+
+    self.assertIn("scales with the data: [2, 3]", str(raised.exception))
+
+  def test_generate_items(self):
+    items = self.generate_items(3)
+
+    self.assertEqual(len(items), 3)
+    self.assertListEqual(
+        [item.preferred_stores.count() for item in items],
+        [1, 1, 1],
+    )
+
+  def test_create_dataset_is_abstract(self):
+
+    class Incomplete(QueryBudgetMixin, TestCase):
+      pass
+
+    with self.assertRaises(TypeError):
+      Incomplete()
@@ -0,0 +1,33 @@
+"""Test the kitchen app pagination classes."""
+
+from datetime import datetime
+
+import pytz
+from django.test import SimpleTestCase
+from rest_framework.exceptions import NotFound
+
+from ..pagination import TransactionCursorPagination
+
+
+class TestTransactionCursorPagination(SimpleTestCase):
+  """Test the TransactionCursorPagination class."""
+
+  def setUp(self):
+    self.paginator = TransactionCursorPagination()
+
+  def test_cursor_round_trip(self):
+    position = (pytz.utc.localize(datetime(2020, 1, 14, 1, 2, 3, 4)), 99)
+
+    cursor = self.paginator.encode_cursor(position)
+
+    self.assertEqual(self.paginator.decode_cursor(cursor), position)
+
+  def test_decode_malformed_cursor(self):
+    with self.assertRaises(NotFound):
+      self.paginator.decode_cursor("not a cursor")
+
+  def test_decode_naive_cursor(self):
+    cursor = self.paginator.encode_cursor((datetime(2020, 1, 14), 1))
+
+    with self.assertRaises(NotFound):
+      self.paginator.decode_cursor(cursor)
@@ -0,0 +1,131 @@
+"""Test the bulk import parsers for the kitchen app."""
+
+from io import BytesIO
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import ParseError
+
+from ..parsers import (
+    CSVRecordParser,
+    JSONLinesRecordParser,
+    read_csv_records,
+    read_json_lines_records,
+)
+
+
+class TestReadCSVRecords(SimpleTestCase):
+  """Test the read_csv_records function."""
+
+  def test_parses_rows(self):
+    stream = BytesIO(
+        b"name,price,shelf,preferred_stores\n"
+        b"Beans,2.00,Pantry,Store A; Store B\n"
+        b"Rice,1.50,,\n"
+    )
+
+    records = read_csv_records(stream)
+
+    self.assertListEqual(
+        records,
+        [
+            {
+                'name': 'Beans',
+                'price': '2.00',
+                'shelf': 'Pantry',
+                'preferred_stores': ['Store A', 'Store B'],
+            },
+            {
+                'name': 'Rice',
+                'price': '1.50'
+            },
+        ],
+    )
+
+  def test_invalid_encoding(self):
+    stream = BytesIO(b"name,price\n\xff\xfe,2.00\n")
+
+    with self.assertRaises(ParseError):
+      read_csv_records(stream)
+
+  @override_settings(BULK_IMPORT_MAX_RECORDS=1)
+  def test_record_limit(self):
+    stream = BytesIO(b"name,price\nBeans,2.00\nRice,1.50\n")
+
+    with self.assertRaises(ParseError):
+      read_csv_records(stream)
+
+
+class TestReadJSONLinesRecords(SimpleTestCase):
+  """Test the read_json_lines_records function."""
+
+  def test_parses_lines(self):
+    stream = BytesIO(
+        b'{"name": "Beans", "price": "2.00"}\n'
+        b'\n'
+        b'{"name": "Rice", "preferred_stores": ["Store A"]}\n'
+    )
+
+    records = read_json_lines_records(stream)
+
+    self.assertListEqual(
+        records,
+        [
+            {
+                'name': 'Beans',
+                'price': '2.00'
+            },
+            {
+                'name': 'Rice',
+                'preferred_stores': ['Store A']
+            },
+        ],
+    )
+
+  def test_invalid_json(self):
+    stream = BytesIO(b'{"name": "Beans"\n')
+
+    with self.assertRaises(ParseError):
+      read_json_lines_records(stream)
+
+  def test_non_object_line(self):
+    stream = BytesIO(b'["Beans"]\n')
+
+    with self.assertRaises(ParseError):
+      read_json_lines_records(stream)
+
+  @override_settings(BULK_IMPORT_MAX_RECORDS=1)
+  def test_record_limit(self):
+    stream = BytesIO(b'{"name": "Beans"}\n{"name": "Rice"}\n')
+
+    with self.assertRaises(ParseError):
+      read_json_lines_records(stream)
+
+
+class TestRecordParsers(SimpleTestCase):
+  """Test the DRF bulk import parser classes."""
+
+  def test_csv_parser(self):
+    parser = CSVRecordParser()
+    stream = BytesIO(b"name,price\nBeans,2.00\n")
+
+    self.assertEqual(parser.media_type, "text/csv")
+    self.assertListEqual(
+        parser.parse(stream),
+        [{
+            'name': 'Beans',
+            'price': '2.00'
+        }],
+    )
+
+  def test_json_lines_parser(self):
+    parser = JSONLinesRecordParser()
+    stream = BytesIO(b'{"name": "Beans", "price": "2.00"}\n')
+
+    self.assertEqual(parser.media_type, "application/x-ndjson")
+    self.assertListEqual(
+        parser.parse(stream, parser_context={'encoding': 'utf-8'}),
+        [{
+            'name': 'Beans',
+            'price': '2.00'
+        }],
+    )
@@ -3,9 +3,24 @@
 from django.urls import include, path
 from rest_framework import routers
 
-from ..views import item, shelf, store, suggested, transaction
+from ..views import (
+    bulk,
+    item,
+    shelf,
+    shopping,
+    spending,
+    store,
+    suggested,
+    transaction,
+    waste,
+)
 
 v1_router = routers.SimpleRouter()
+v1_router.register(
+    "items/bulk",
+    bulk.ItemBulkViewSet,
+    basename="items-bulk",
+)
 v1_router.register(
     "items",
     item.ItemViewSet,
@@ -26,6 +41,16 @@ v1_router.register(
     shelf.ShelfListCreateViewSet,
     basename="shelves-supplementary",
 )
+v1_router.register(
+    "shopping-list",
+    shopping.ShoppingListViewSet,
+    basename="shopping-list",
+)
+v1_router.register(
+    "spending",
+    spending.SpendingReportViewSet,
+    basename="spending",
+)
 v1_router.register(
     "stores",
     store.StoreViewSet,
@@ -46,6 +71,11 @@ v1_router.register(
     transaction.TransactionViewSet,
     basename="transactions",
 )
+v1_router.register(
+    "waste",
+    waste.WasteReportViewSet,
+    basename="waste",
+)
 
 app_name = "kitchen"
 urlpatterns = [
@@ -1,9 +1,12 @@
 """Base view classes."""
 
+from .mixins import ReplicaReadMixin, RequestTimezoneMixin
 from spa_security.mixins.csrf import CSRFMixin
 
 
 class KitchenBaseView(
     CSRFMixin,
+    ReplicaReadMixin,
+    RequestTimezoneMixin,
 ):
   """Kitchen base view."""
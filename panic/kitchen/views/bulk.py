@@ -0,0 +1,96 @@
+"""Views for bulk Item import and export."""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import (
+    decorators,
+    parsers,
+    response,
+    serializers,
+    status,
+    viewsets,
+)
+
+from ..exceptions import UniqueNameConstraintError
+from ..models.item import Item
+from ..parsers import CSVRecordParser, JSONLinesRecordParser
+from ..serializers.constants import UNIQUE_CONSTRAINT_MSG
+from ..serializers.item_import import ItemImportRecordSerializer
+from .bases import KitchenBaseView
+
+EXPORT_CONTENT_TYPE = "application/x-ndjson"
+EXPORT_FILENAME = "kitchen-export.jsonl"
+
+
+class ItemBulkViewSet(
+    KitchenBaseView,
+    viewsets.GenericViewSet,
+):
+  """Item bulk import and export API view."""
+
+  serializer_class = ItemImportRecordSerializer
+  queryset = Item.objects.all()
+  parser_classes = (
+      CSVRecordParser,
+      JSONLinesRecordParser,
+      parsers.JSONParser,
+  )
+
+  @swagger_auto_schema(
+      request_body=ItemImportRecordSerializer(many=True),
+      responses={status.HTTP_201_CREATED: "Import summary"},
+  )
+  @decorators.action(
+      methods=["POST"],
+      detail=False,
+      url_path="import",
+      url_name="import",
+  )
+  # pylint: disable=unused-argument
+  def bulk_import(self, request, *args, **kwargs):
+    """Import Items in bulk from CSV or JSON lines records."""
+
+    serializer = self.get_serializer(data=request.data, many=True)
+    serializer.is_valid(raise_exception=True)
+
+    try:
+      result = Item.objects.bulk_import(
+          request.user,
+          serializer.validated_data,
+      )
+    except UniqueNameConstraintError as exc:
+      raise serializers.ValidationError(
+          detail={"name": [UNIQUE_CONSTRAINT_MSG]},
+      ) from exc
+    return response.Response(
+        {
+            "created": len(result['created']),
+            "skipped": result['skipped'],
+        },
+        status=status.HTTP_201_CREATED,
+    )
+
+  @decorators.action(
+      methods=["GET"],
+      detail=False,
+      url_path="export",
+      url_name="export",
+  )
+  # pylint: disable=unused-argument
+  def bulk_export(self, request, *args, **kwargs):
+    """Stream all Items, Transactions and Inventory as JSON lines records."""
+
+    streamed = StreamingHttpResponse(
+        (
+            json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+            for record in Item.objects.export(request.user)
+        ),
+        content_type=EXPORT_CONTENT_TYPE,
+    )
+    streamed['Content-Disposition'] = (
+        f'attachment; filename="{EXPORT_FILENAME}"'
+    )
+    return streamed
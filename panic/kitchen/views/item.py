@@ -1,11 +1,15 @@
 """Views for the Item model."""
 
+from asgiref.sync import async_to_sync
 from django_filters import rest_framework as filters
 from rest_framework import decorators, mixins, response, viewsets
 
 from ..filters import ItemFilter
+from ..models.inventory import Inventory
 from ..models.item import Item
+from ..models.transaction import Transaction
 from ..pagination import BasePagePagination
+from ..serializers.fields.activity import ACTIVITY_CONTEXT_KEY
 from ..serializers.item import ItemSerializer
 from ..serializers.reports.item_activity import ItemActivityReportSerializer
 from ..swagger import openapi_ready
@@ -18,7 +22,7 @@ class ItemBaseViewSet(
   """Item base API view."""
 
   serializer_class = ItemSerializer
-  queryset = Item.objects.all()
+  queryset = Item.objects.select_related('forecast')
 
 
 class ItemViewSet(
@@ -30,6 +34,8 @@ class ItemViewSet(
 ):
   """Item API view."""
 
+  concurrent_activity = False
+
   @openapi_ready
   def perform_update(self, serializer):
     """Update an Item."""
@@ -40,7 +46,14 @@ class ItemViewSet(
     """Retrieve the activity report for an Item."""
 
     instance = self.get_object()
-    serializer = ItemActivityReportSerializer(instance)
+    context = self.get_serializer_context()
+    if self.concurrent_activity:
+      gather_activity = async_to_sync(Transaction.objects.gather_activity)
+      context[ACTIVITY_CONTEXT_KEY] = gather_activity(
+          instance.id,
+          zone=instance.local_timezone,
+      )
+    serializer = ItemActivityReportSerializer(instance, context=context)
     return response.Response(serializer.data)
 
 
@@ -59,9 +72,16 @@ class ItemListCreateViewSet(
   @openapi_ready
   def get_queryset(self):
     """Retrieve the view queryset."""
-    queryset = self.queryset
+    queryset = self.queryset.prefetch_related('preferred_stores')
     return queryset.filter(user=self.request.user).order_by("_index")
 
+  def paginate_queryset(self, queryset):
+    """Paginate the queryset, and prefetch the expiry data of the page."""
+    page = super().paginate_queryset(queryset)
+    if page is not None:
+      Inventory.objects.prefetch_expiry(page)
+    return page
+
   @openapi_ready
   def perform_create(self, serializer):
     """Create a new item."""
@@ -1,8 +1,11 @@
 """Kitchen view Mixins."""
 
 from django.db.models import RestrictedError
+from rest_framework.permissions import SAFE_METHODS
 
 from ..exceptions import ResourceIsRequired
+from user.utilities.request_timezone import request_timezone
+from utilities.database.routers import replica_reads
 
 
 class ProtectedResourceMixin:
@@ -14,3 +17,34 @@ class ProtectedResourceMixin:
       return super().perform_destroy(instance)
     except RestrictedError as exc:
       raise ResourceIsRequired from exc
+
+
+class RequestTimezoneMixin:
+  """Shares the request user's timezone with all models during a request."""
+
+  def dispatch(self, request, *args, **kwargs):
+    """Override the dispatch implementation in the view."""
+    with request_timezone(lambda: getattr(self.request, "user", None)):
+      return super().dispatch(request, *args, **kwargs)
+
+
+class ReplicaReadMixin:
+  """Routes the reads of read-only requests to the database replica.
+
+  Users who have recently written are kept on the primary database, so they
+  always read their own writes.
+  """
+
+  def dispatch(self, request, *args, **kwargs):
+    """Override the dispatch implementation in the view."""
+    with replica_reads() as context:
+      self.replica_reads = context
+      return super().dispatch(request, *args, **kwargs)
+
+  def initial(self, request, *args, **kwargs):
+    """Once authenticated, allow read-only requests to use the replica."""
+    super().initial(request, *args, **kwargs)
+    self.replica_reads.activate(
+        getattr(request.user, "pk", None),
+        request.method in SAFE_METHODS,
+    )
@@ -1,7 +1,9 @@
 """Views for the Shelf model."""
 
+from django_filters import rest_framework as filters
 from rest_framework import mixins, viewsets
 
+from ..filters import ShelfFilter
 from ..models.shelf import Shelf
 from ..pagination import PagePaginationWithOverride
 from ..serializers.shelf import ShelfSerializer
@@ -36,6 +38,8 @@ class ShelfListCreateViewSet(
 ):
   """Shelf list and create API view."""
 
+  filter_backends = (filters.DjangoFilterBackend,)
+  filterset_class = ShelfFilter
   pagination_class = PagePaginationWithOverride
 
   @openapi_ready
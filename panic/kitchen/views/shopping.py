@@ -0,0 +1,29 @@
+"""Views for the user's shopping list."""
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import response, status, viewsets
+
+from ..models.item import Item
+from ..serializers.reports.shopping_list import ShoppingListSerializer
+from .bases import KitchenBaseView
+
+
+class ShoppingListViewSet(
+    KitchenBaseView,
+    viewsets.GenericViewSet,
+):
+  """Shopping list API view."""
+
+  serializer_class = ShoppingListSerializer
+  queryset = Item.objects.all()
+
+  @swagger_auto_schema(
+      responses={status.HTTP_200_OK: ShoppingListSerializer()},
+  )
+  # pylint: disable=unused-argument
+  def list(self, request, *args, **kwargs):
+    """Retrieve the Items to buy from each Store, before they run out."""
+
+    shopping_list = Item.objects.get_shopping_list(request.user)
+    serializer = self.get_serializer(shopping_list)
+    return response.Response(serializer.data)
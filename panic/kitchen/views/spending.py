@@ -0,0 +1,77 @@
+"""Views for the user's spending report."""
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import decorators, response, status, viewsets
+
+from ..models.spending_summary import SpendingSummary
+from ..serializers.reports.spending import (
+    SpendingByPeriodSerializer,
+    SpendingByShelfSerializer,
+    SpendingByStoreSerializer,
+    SpendingReportQuerySerializer,
+)
+from .bases import KitchenBaseView
+
+
+class SpendingReportViewSet(
+    KitchenBaseView,
+    viewsets.GenericViewSet,
+):
+  """Spending report API views."""
+
+  queryset = SpendingSummary.objects.all()
+
+  def get_serializer_class(self):
+    """Retrieve the serializer for the requested report."""
+    return {
+        "shelves": SpendingByShelfSerializer,
+        "periods": SpendingByPeriodSerializer,
+    }.get(self.action, SpendingByStoreSerializer)
+
+  @swagger_auto_schema(
+      query_serializer=SpendingReportQuerySerializer,
+      responses={status.HTTP_200_OK: SpendingByStoreSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False)
+  # pylint: disable=unused-argument
+  def stores(self, request, *args, **kwargs):
+    """Retrieve the total cost of purchases at each Store."""
+    query = self.__parse_query()
+    query.pop('period')
+    return self.__report(SpendingSummary.objects.by_store, query)
+
+  @swagger_auto_schema(
+      query_serializer=SpendingReportQuerySerializer,
+      responses={status.HTTP_200_OK: SpendingByShelfSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False)
+  # pylint: disable=unused-argument
+  def shelves(self, request, *args, **kwargs):
+    """Retrieve the total cost of purchases for each Shelf."""
+    query = self.__parse_query()
+    query.pop('period')
+    return self.__report(SpendingSummary.objects.by_shelf, query)
+
+  @swagger_auto_schema(
+      query_serializer=SpendingReportQuerySerializer,
+      responses={status.HTTP_200_OK: SpendingByPeriodSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False)
+  # pylint: disable=unused-argument
+  def periods(self, request, *args, **kwargs):
+    """Retrieve the total cost of purchases for each month or year."""
+    return self.__report(
+        SpendingSummary.objects.by_period, self.__parse_query()
+    )
+
+  def __parse_query(self):
+    query = SpendingReportQuerySerializer(data=self.request.query_params)
+    query.is_valid(raise_exception=True)
+    return dict(query.validated_data)
+
+  def __report(self, report, query):
+    serializer = self.get_serializer(
+        report(self.request.user, **query),
+        many=True,
+    )
+    return response.Response(serializer.data)
@@ -1,7 +1,9 @@
 """Views for the Store model."""
 
+from django_filters import rest_framework as filters
 from rest_framework import mixins, viewsets
 
+from ..filters import StoreFilter
 from ..models.store import Store
 from ..pagination import PagePaginationWithOverride
 from ..serializers.store import StoreSerializer
@@ -36,6 +38,8 @@ class StoreListCreateViewSet(
 ):
   """Store list and create API views."""
 
+  filter_backends = (filters.DjangoFilterBackend,)
+  filterset_class = StoreFilter
   pagination_class = PagePaginationWithOverride
 
   @openapi_ready
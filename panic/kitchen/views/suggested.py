@@ -1,11 +1,13 @@
 """Views for the SuggestedItem model."""
 
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, viewsets
 
 from ..models.suggested import SuggestedItem
 from ..pagination import BasePagePagination
+from ..search.suggested import SUGGESTED_ITEM_INDEX
 from ..serializers.suggested import SuggestedItemSerializer
-from ..swagger import openapi_ready
+from ..swagger import custom_suggested_search_view_parm, openapi_ready
 from .bases import KitchenBaseView
 
 
@@ -32,3 +34,14 @@ class SuggestedItemListViewSet(
     """Retrieve the view queryset."""
     queryset = self.queryset
     return queryset.order_by("name")
+
+  @swagger_auto_schema(manual_parameters=[custom_suggested_search_view_parm])
+  def list(self, request, *args, **kwargs):
+    """List SuggestedItems, or search them with the `q` query parameter."""
+    query = request.query_params.get('q')
+    if not query:
+      return super().list(request, *args, **kwargs)
+
+    page = self.paginate_queryset(SUGGESTED_ITEM_INDEX.search(query))
+    serializer = self.get_serializer(page, many=True)
+    return self.get_paginated_response(serializer.data)
@@ -0,0 +1,144 @@
+"""Test the Item bulk import and export API."""
+
+import json
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ...exceptions import UniqueNameConstraintError
+from ...models.item import Item
+from ...serializers.constants import UNIQUE_CONSTRAINT_MSG
+from ...tests.fixtures.fixtures_item import ItemTestHarness
+
+IMPORT_URL = reverse("v1:items-bulk-import")
+EXPORT_URL = reverse("v1:items-bulk-export")
+
+
+class PublicItemBulkTest(TestCase):
+  """Test the public Item bulk API."""
+
+  def setUp(self):
+    self.client = APIClient()
+
+  def test_import_login_required(self):
+    res = self.client.post(IMPORT_URL, data=[], format="json")
+
+    self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+  def test_export_login_required(self):
+    res = self.client.get(EXPORT_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PrivateItemBulkTest(ItemTestHarness):
+  """Test the authorized Item bulk API."""
+
+  def setUp(self):
+    super().setUp()
+    self.client = APIClient()
+    self.client.force_authenticate(self.user1)
+
+  def test_import_csv(self):
+    payload = (
+        "name,price,shelf_life,shelf,preferred_stores\n"
+        f"Canned Beans,2.00,99,{self.shelf1.name},{self.store1.name}\n"
+        "canned beans,2.00,99,,\n"
+        "Rice,3.50,,Pantry,\n"
+    )
+
+    res = self.client.post(
+        IMPORT_URL,
+        data=payload.encode(),
+        content_type="text/csv",
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+    self.assertDictEqual(res.data, {"created": 2, "skipped": ["canned beans"]})
+    beans = Item.objects.get(name="Canned Beans", user=self.user1)
+    self.assertEqual(beans.shelf, self.shelf1)
+    self.assertListEqual(list(beans.preferred_stores.all()), [self.store1])
+    self.assertEqual(
+        Item.objects.get(name="Rice").shelf_life,
+        Item.DEFAULT_SHELF_LIFE,
+    )
+
+  def test_import_json_lines(self):
+    payload = "\n".join([
+        json.dumps({
+            "name": "Rice",
+            "price": "1.00",
+            "quantity": 2
+        }),
+        json.dumps({
+            "name": "Pasta",
+            "price": "1.00"
+        }),
+    ])
+
+    res = self.client.post(
+        IMPORT_URL,
+        data=payload.encode(),
+        content_type="application/x-ndjson",
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+    self.assertDictEqual(res.data, {"created": 2, "skipped": []})
+    self.assertEqual(Item.objects.get(name="Rice").quantity, 2)
+
+  def test_import_invalid_record(self):
+    payload = [{"name": "Rice", "price": "1.00"}, {"name": "Pasta"}]
+
+    res = self.client.post(IMPORT_URL, data=payload, format="json")
+
+    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+    self.assertEqual(res.data[0], {})
+    self.assertIn("price", res.data[1])
+    self.assertFalse(Item.objects.filter(user=self.user1).exists())
+
+  @mock.patch.object(Item.objects, "bulk_import")
+  def test_import_concurrently_created_names(self, m_import):
+    m_import.side_effect = UniqueNameConstraintError("name")
+    payload = [{"name": "Rice", "price": "1.00"}]
+
+    res = self.client.post(IMPORT_URL, data=payload, format="json")
+
+    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+    self.assertDictEqual(res.data, {"name": [UNIQUE_CONSTRAINT_MSG]})
+
+  def test_export(self):
+    item = self.create_test_instance(
+        name="Canned Beans",
+        user=self.user1,
+        shelf_life=99,
+        shelf=self.shelf1,
+        preferred_stores=[self.store1],
+        price=2.00,
+    )
+
+    res = self.client.get(EXPORT_URL)
+    lines = b"".join(res.streaming_content).decode().splitlines()
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertEqual(res["Content-Type"], "application/x-ndjson")
+    self.assertIn("attachment", res["Content-Disposition"])
+    self.assertEqual(len(lines), 1)
+    self.assertDictEqual(
+        json.loads(lines[0]),
+        {
+            "type": "item",
+            "data": {
+                "id": item.id,
+                "name": "Canned Beans",
+                "price": "2.00",
+                "quantity": 0.0,
+                "shelf_life": 99,
+                "has_partial_quantities": False,
+                "shelf": self.shelf1.name,
+                "preferred_stores": [self.store1.name],
+            },
+        },
+    )
@@ -1,6 +1,9 @@
 """Test the ItemActivityReport API."""
 
+from unittest.mock import patch
+
 import pytz
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.test import TestCase
 from django.urls import reverse
@@ -9,8 +12,11 @@ from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from ...models.managers.transaction import activity
 from ...serializers.reports.item_activity import ItemActivityReportSerializer
+from ...views.item import ItemViewSet
 from .fixtures.fixtures_item_activity import ItemActivityViewSetHarness
+from user.utilities import request_timezone
 
 ACTIVITY_REPORT_VIEW = "v1:items-activity"
 
@@ -165,6 +171,36 @@ class PrivateItemActivityViewSetTest(ItemActivityViewSetHarness):
         serializer.data['recent_activity']['usage_current_month']
     )
 
+  def test_user_timezone_resolved_once(self):
+    with patch.object(
+        request_timezone,
+        "LocalTimezone",
+        wraps=request_timezone.LocalTimezone,
+    ) as m_local_timezone:
+      res = self.client.get(item_pk_url(self.item1.id))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertEqual(
+        res.data['recent_activity']['user_timezone'],
+        self.timezone,
+    )
+    m_local_timezone.assert_called_once()
+
+
+@freeze_time("2020-01-14")
+class PrivateItemActivityViewSetConcurrentTest(PrivateItemActivityViewSetTest):
+  """Test the authorized ItemActivityReport API, with gathered statistics."""
+
+  def setUp(self):
+    super().setUp()
+    # Run the gathered queries on this thread, where the test data is visible.
+    for patcher in (
+        patch.object(ItemViewSet, "concurrent_activity", True),
+        patch.object(activity, "database_sync_to_async", sync_to_async),
+    ):
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
 
 @freeze_time("2020-01-14")
 class PrivateItemActivityViewSetAnotherUserTest(ItemActivityViewSetHarness):
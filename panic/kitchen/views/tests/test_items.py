@@ -123,6 +123,31 @@ class PrivateItemTest(ItemViewSetTestHarness):
     self.assertEqual(res.status_code, status.HTTP_200_OK)
     self.assertEqual(res.data['results'], serializer.data)
 
+  def test_list_items_search(self):
+    self.create_test_instance(**self.data1)
+    self.create_test_instance(**self.data2)
+
+    res = self.client.get(item_url_with_params({"search": "noodle"}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        [result['name'] for result in res.data['results']],
+        [self.data2['name']],
+    )
+
+  def test_list_items_search_by_shelf(self):
+    self.create_test_instance(**self.data1)
+    self.create_test_instance(**self.data2)
+
+    url = item_url_with_params({"search": "canned", "shelf": self.shelf1.id})
+    res = self.client.get(url)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        [result['name'] for result in res.data['results']],
+        [self.data1['name']],
+    )
+
   def test_delete_item(self):
     delete = self.create_test_instance(**self.data1)
     self.create_test_instance(**self.data2)
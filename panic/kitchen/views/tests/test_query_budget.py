@@ -0,0 +1,60 @@
+"""Test the query budgets of the kitchen API."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from ...models.inventory import Inventory
+from ...models.transaction import Transaction
+from ...tests.fixtures.fixtures_query_budget import QueryBudgetMixin
+
+
+class ItemListQueryBudgetTest(QueryBudgetMixin, TestCase):
+  """Test the query budget of the Item list API."""
+
+  def create_dataset(self, size):
+    items = self.generate_items(size)
+    now = timezone.now()
+    transactions = Transaction.objects.bulk_create([
+        Transaction(
+            item=item,
+            datetime=now - timedelta(days=index % 200),
+            quantity=2,
+        ) for index, item in enumerate(items)
+    ])
+    Inventory.objects.bulk_create([
+        Inventory(
+            item=transaction.item,
+            remaining=transaction.quantity,
+            transaction=transaction,
+        ) for transaction in transactions
+    ])
+    return "{}?{}".format(
+        reverse("v1:items-supplementary-list"),
+        urlencode({"page_size": 100}),
+    )
+
+  def test_query_budget(self):
+    self.assertQueryBudget(max_queries=5)
+
+
+class ItemActivityQueryBudgetTest(QueryBudgetMixin, TestCase):
+  """Test the query budget of the ItemActivityReport API."""
+
+  def create_dataset(self, size):
+    item = self.generate_items(1)[0]
+    now = timezone.now()
+    Transaction.objects.bulk_create([
+        Transaction(
+            item=item,
+            datetime=now - timedelta(hours=index),
+            quantity=1 if index % 2 else -1,
+        ) for index in range(size)
+    ])
+    return reverse("v1:items-activity", args=[item.id])
+
+  def test_query_budget(self):
+    self.assertQueryBudget(max_queries=8)
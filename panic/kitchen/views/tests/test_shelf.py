@@ -108,6 +108,19 @@ class PrivateShelfTest(ShelfTestHarness):
     self.assertEqual(res_get.status_code, status.HTTP_200_OK)
     self.assertEqual(res_get.data['results'], serializer.data)
 
+  def test_list_shelfs_search(self):
+    self.create_test_instance(user=self.user1, name="Pantry")
+    self.create_test_instance(user=self.user1, name="Refrigerator")
+    self.create_test_instance(user=self.user1, name="Freezer")
+
+    res = self.client.get(shelf_url_with_params({"search": "frig"}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        [result['name'] for result in res.data['results']],
+        ["Refrigerator"],
+    )
+
   def test_create_shelf(self):
     data = {"name": "Refrigerator"}
 
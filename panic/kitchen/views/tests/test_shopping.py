@@ -0,0 +1,97 @@
+"""Test the Shopping List API."""
+
+from datetime import datetime
+
+import pytz
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ...tests.fixtures.fixtures_transaction import TransactionTestHarness
+
+SHOPPING_LIST_URL = reverse("v1:shopping-list-list")
+
+
+class PublicShoppingListTest(TestCase):
+  """Test the public Shopping List API."""
+
+  def setUp(self):
+    self.client = APIClient()
+
+  def test_login_required(self):
+    res = self.client.get(SHOPPING_LIST_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@freeze_time("2020-01-14 12:00:00")
+class PrivateShoppingListTest(TransactionTestHarness):
+  """Test the authorized Shopping List API."""
+
+  mute_signals = False
+
+  def setUp(self):
+    super().setUp()
+    cache.clear()
+    self.user1.timezone = pytz.utc
+    self.user1.save()
+    self.client = APIClient()
+    self.client.force_authenticate(self.user1)
+
+  def tearDown(self):
+    cache.clear()
+    super().tearDown()
+
+  def test_shopping_list(self):
+    self.create_test_instance(
+        item=self.item1,
+        date_object=pytz.utc.localize(datetime(2020, 1, 1)),
+        quantity=10,
+    )
+    self.create_test_instance(
+        item=self.item1,
+        date_object=pytz.utc.localize(datetime(2020, 1, 10)),
+        quantity=-8,
+    )
+
+    res = self.client.get(SHOPPING_LIST_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertDictEqual(
+        res.json(),
+        {
+            "generated":
+                "2020-01-14T12:00:00Z",
+            "horizon":
+                7,
+            "stores": [{
+                "id":
+                    self.store1.id,
+                "name":
+                    self.store1.name,
+                "items": [{
+                    "id": self.item1.id,
+                    "name": self.item1.name,
+                    "price": "2.00",
+                    "quantity": 2.0,
+                    "usage_avg_week": 4.0,
+                    "next_expiry_date": "2020-04-09",
+                    "next_expiry_quantity": 2.0,
+                    "projected_run_out": "2020-01-17",
+                    "quantity_to_buy": 3.0,
+                    "preferred_stores": [self.store1.id],
+                }],
+            }],
+        },
+    )
+
+  def test_shopping_list_other_user(self):
+    self.client.force_authenticate(self.create_another_user(2))
+
+    res = self.client.get(SHOPPING_LIST_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(res.json()['stores'], [])
@@ -0,0 +1,121 @@
+"""Test the Spending report API."""
+
+from datetime import datetime
+
+import pytz
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ...tests.fixtures.fixtures_transaction import TransactionTestHarness
+
+SPENDING_STORES_URL = reverse("v1:spending-stores")
+SPENDING_SHELVES_URL = reverse("v1:spending-shelves")
+SPENDING_PERIODS_URL = reverse("v1:spending-periods")
+
+
+class PublicSpendingReportTest(TestCase):
+  """Test the public Spending report API."""
+
+  def setUp(self):
+    self.client = APIClient()
+
+  def test_login_required(self):
+    for url in (
+        SPENDING_STORES_URL, SPENDING_SHELVES_URL, SPENDING_PERIODS_URL
+    ):
+      res = self.client.get(url)
+
+      self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PrivateSpendingReportTest(TransactionTestHarness):
+  """Test the authorized Spending report API."""
+
+  mute_signals = False
+
+  def setUp(self):
+    super().setUp()
+    self.user1.timezone = pytz.utc
+    self.user1.save()
+    for when in (datetime(2019, 12, 14), datetime(2020, 1, 14)):
+      self.create_test_instance(
+          item=self.item1,
+          date_object=pytz.utc.localize(when),
+          quantity=3,
+      )
+    self.client = APIClient()
+    self.client.force_authenticate(self.user1)
+
+  def test_stores(self):
+    res = self.client.get(SPENDING_STORES_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        res.json(),
+        [{
+            "id": self.store1.id,
+            "name": self.store1.name,
+            "quantity": 6.0,
+            "cost": "12.00",
+        }],
+    )
+
+  def test_shelves_within_range(self):
+    res = self.client.get(SPENDING_SHELVES_URL, {"start": "2020-01-01"})
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        res.json(),
+        [{
+            "id": self.shelf1.id,
+            "name": self.shelf1.name,
+            "quantity": 3.0,
+            "cost": "6.00",
+        }],
+    )
+
+  def test_periods(self):
+    res = self.client.get(SPENDING_PERIODS_URL, {"period": "year"})
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        res.json(),
+        [
+            {
+                "period": "2019-01-01",
+                "quantity": 3.0,
+                "cost": "6.00",
+            },
+            {
+                "period": "2020-01-01",
+                "quantity": 3.0,
+                "cost": "6.00",
+            },
+        ],
+    )
+
+  def test_invalid_range(self):
+    res = self.client.get(
+        SPENDING_PERIODS_URL,
+        {
+            "start": "2020-01-01",
+            "end": "2019-01-01"
+        },
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+  def test_invalid_period(self):
+    res = self.client.get(SPENDING_PERIODS_URL, {"period": "week"})
+
+    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+  def test_other_user(self):
+    self.client.force_authenticate(self.create_another_user(2))
+
+    res = self.client.get(SPENDING_STORES_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(res.json(), [])
@@ -1,5 +1,7 @@
 """Test the Store API."""
 
+from unittest.mock import patch
+
 from django.conf import settings
 from django.test import TestCase
 from django.urls import reverse
@@ -12,6 +14,7 @@ from ...serializers.store import StoreSerializer
 from ...tests.fixtures.fixtures_store import StoreTestHarness
 from .fixtures.fixtures_item import ItemViewSetTestHarness
 from .fixtures.fixtures_store import AnotherUserTestHarness
+from utilities.database.routers import ReplicaReads
 
 STORE_URL = reverse("v1:stores-supplementary-list")
 
@@ -108,6 +111,19 @@ class PrivateStoreTest(StoreTestHarness):
     self.assertEqual(res_get.status_code, status.HTTP_200_OK)
     self.assertEqual(res_get.data['results'], serializer.data)
 
+  def test_list_stores_search(self):
+    self.create_test_instance(user=self.user1, name="No Frills")
+    self.create_test_instance(user=self.user1, name="Loblaws")
+    self.create_test_instance(user=self.user1, name="Farm Boy")
+
+    res = self.client.get(store_url_with_params({"search": "loblw"}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        [result['name'] for result in res.data['results']],
+        ["Loblaws"],
+    )
+
   def test_create_store(self):
     data = {"name": "Shoppers Drugmart"}
 
@@ -119,6 +135,20 @@ class PrivateStoreTest(StoreTestHarness):
     self.assertEqual(res.status_code, status.HTTP_201_CREATED)
     self.assertEqual(shelves[0].name, data['name'])
 
+  @patch.object(ReplicaReads, "activate")
+  def test_list_stores_replica_reads(self, m_activate):
+    res = self.client.get(STORE_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    m_activate.assert_called_once_with(self.user1.pk, True)
+
+  @patch.object(ReplicaReads, "activate")
+  def test_create_store_replica_reads(self, m_activate):
+    res = self.client.post(STORE_URL, {"name": "Loblaws"})
+
+    self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+    m_activate.assert_called_once_with(self.user1.pk, False)
+
 
 class PrivateStoreTestInUse(ItemViewSetTestHarness):
   """Test the authorized Store API with existing items referencing a Store."""
@@ -1,7 +1,9 @@
 """Test the SuggestedItems API."""
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.http import urlencode
 from rest_framework import status
@@ -89,3 +91,40 @@ class PrivateListItemsTest(SuggestedItemTestHarness):
     self.assertEqual(len(res.data['results']), 10)
     self.assertIsNotNone(res.data['next'])
     self.assertIsNone(res.data['previous'])
+
+  def test_search_items(self):
+    tofu = self.create_test_instance(name="Tofu")
+    self.create_test_instance(name="Red Bean Dessert")
+
+    res = self.client.get(item_url_with_params({"q": "tof"}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertEqual(res.data['count'], 1)
+    self.assertEqual(
+        res.data['results'],
+        [{
+            "id": tofu.id,
+            "name": tofu.name
+        }],
+    )
+
+  def test_search_items_fuzzy(self):
+    dessert = self.create_test_instance(name="Red Bean Dessert")
+
+    res = self.client.get(item_url_with_params({"q": "desert"}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertEqual(res.data['results'][0]['id'], dessert.id)
+
+  def test_search_items_without_queries(self):
+    self.create_test_instance(name="Tofu")
+    self.client.get(item_url_with_params({"q": "tof"}))
+
+    with CaptureQueriesContext(connection) as context:
+      res = self.client.get(item_url_with_params({"q": "tof"}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertFalse([
+        query for query in context.captured_queries
+        if "kitchen_suggesteditem" in query['sql']
+    ])
@@ -1,6 +1,8 @@
 """Test the Transaction API."""
 
-from django.test import TestCase
+import json
+
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.http import urlencode
@@ -12,6 +14,7 @@ from ...models.transaction import Transaction
 from .fixtures.fixtures_transaction import TransactionViewSetHarness
 
 TRANSACTION_URL = reverse("v1:transactions-list")
+TRANSACTION_EXPORT_URL = reverse("v1:transactions-export")
 
 
 # pylint: disable=dangerous-default-value
@@ -31,6 +34,16 @@ class PublicTransactionTest(TestCase):
 
     self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
+  def test_list_login_required(self):
+    res = self.client.get(TRANSACTION_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+  def test_export_login_required(self):
+    res = self.client.get(TRANSACTION_EXPORT_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
 
 class PrivateTransactionTest(TransactionViewSetHarness):
   """Test the authorized Transaction API."""
@@ -87,3 +100,114 @@ class PrivateTransactionAnotherUser(TransactionViewSetHarness):
     )
 
     self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class PrivateTransactionHistoryTest(TransactionViewSetHarness):
+  """Test the authorized Transaction history API."""
+
+  def setUp(self):
+    super().setUp()
+    self.transactions = [
+        self.create_test_instance(**self.transaction_eleven_days_ago),
+        self.create_test_instance(**self.transaction_now),
+        self.create_test_instance(**self.transaction_now),
+        self.create_test_instance(**self.transaction_one_second),
+    ]
+    self.create_test_instance(**self.transaction_two_seconds_another_item)
+    self.client = APIClient()
+    self.client.force_authenticate(self.user1)
+
+  def ids(self, results):
+    return [transaction['id'] for transaction in results]
+
+  def test_list_item_required(self):
+    res = self.client.get(TRANSACTION_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+  def test_list_chronological(self):
+    res = self.client.get(transaction_query_url({'item': self.item1.id}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertIsNone(res.json()['next'])
+    self.assertListEqual(
+        self.ids(res.json()['results']),
+        [transaction.id for transaction in self.transactions],
+    )
+
+  def test_list_follows_cursor(self):
+    url = transaction_query_url({'item': self.item1.id, 'page_size': 2})
+    pages = []
+
+    while url:
+      res = self.client.get(url)
+      self.assertEqual(res.status_code, status.HTTP_200_OK)
+      pages.append(self.ids(res.json()['results']))
+      url = res.json()['next']
+
+    self.assertListEqual(
+        pages,
+        [
+            [self.transactions[0].id, self.transactions[1].id],
+            [self.transactions[2].id, self.transactions[3].id],
+        ],
+    )
+
+  def test_list_invalid_cursor(self):
+    res = self.client.get(
+        transaction_query_url({
+            'item': self.item1.id,
+            'cursor': 'invalid',
+        })
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+  def test_list_datetime_range(self):
+    res = self.client.get(
+        transaction_query_url({
+            'item': self.item1.id,
+            'start': self.transaction_now['date_object'].isoformat(),
+            'end': self.one_second_from_now.isoformat(),
+        })
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        self.ids(res.json()['results']),
+        [self.transactions[1].id, self.transactions[2].id],
+    )
+
+  def test_list_item_owned_by_another_user(self):
+    res = self.client.get(transaction_query_url({'item': self.item2.id}))
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(res.json()['results'], [])
+
+  @override_settings(TRANSACTION_EXPORT_CHUNK_SIZE=3)
+  def test_export_streams_all_chunks(self):
+    res = self.client.get(
+        TRANSACTION_EXPORT_URL,
+        {'item': self.item1.id},
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertTrue(res.streaming)
+    self.assertListEqual(
+        self.ids(json.loads(b"".join(res.streaming_content))),
+        [transaction.id for transaction in self.transactions],
+    )
+
+  def test_export_empty(self):
+    res = self.client.get(
+        TRANSACTION_EXPORT_URL,
+        {'item': self.item2.id},
+    )
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(json.loads(b"".join(res.streaming_content)), [])
+
+  def test_export_item_required(self):
+    res = self.client.get(TRANSACTION_EXPORT_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
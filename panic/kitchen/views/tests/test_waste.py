@@ -0,0 +1,114 @@
+"""Test the Waste report API."""
+
+from datetime import datetime
+
+import pytz
+from django.test import TestCase
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ...models.waste import Waste
+from ...tests.fixtures.fixtures_transaction import TransactionTestHarness
+
+WASTE_ITEMS_URL = reverse("v1:waste-items")
+WASTE_SHELVES_URL = reverse("v1:waste-shelves")
+WASTE_MONTHS_URL = reverse("v1:waste-months")
+
+
+class PublicWasteReportTest(TestCase):
+  """Test the public Waste report API."""
+
+  def setUp(self):
+    self.client = APIClient()
+
+  def test_login_required(self):
+    for url in (WASTE_ITEMS_URL, WASTE_SHELVES_URL, WASTE_MONTHS_URL):
+      res = self.client.get(url)
+
+      self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@freeze_time("2020-03-14 12:00:00")
+class PrivateWasteReportTest(TransactionTestHarness):
+  """Test the authorized Waste report API."""
+
+  mute_signals = False
+
+  def setUp(self):
+    super().setUp()
+    self.user1.timezone = pytz.utc
+    self.user1.save()
+    self.item1.shelf_life = 10
+    self.item1.save()
+    self.create_test_instance(
+        item=self.item1,
+        date_object=pytz.utc.localize(datetime(2020, 2, 1)),
+        quantity=3,
+    )
+    Waste.objects.record_expired(self.user1)
+    self.client = APIClient()
+    self.client.force_authenticate(self.user1)
+
+  def test_items(self):
+    res = self.client.get(WASTE_ITEMS_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        res.json(),
+        [{
+            "id": self.item1.id,
+            "name": self.item1.name,
+            "quantity": 3.0,
+            "cost": "6.00",
+        }],
+    )
+
+  def test_shelves(self):
+    res = self.client.get(WASTE_SHELVES_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        res.json(),
+        [{
+            "id": self.shelf1.id,
+            "name": self.shelf1.name,
+            "quantity": 3.0,
+            "cost": "6.00",
+        }],
+    )
+
+  def test_months(self):
+    res = self.client.get(WASTE_MONTHS_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(
+        res.json(),
+        [{
+            "month": "2020-02-01",
+            "quantity": 3.0,
+            "cost": "6.00",
+        }],
+    )
+
+  def test_other_user(self):
+    self.client.force_authenticate(self.create_another_user(2))
+
+    res = self.client.get(WASTE_ITEMS_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertListEqual(res.json(), [])
+
+  def test_does_not_record_waste(self):
+    self.create_test_instance(
+        item=self.item1,
+        date_object=pytz.utc.localize(datetime(2020, 2, 2)),
+        quantity=1,
+    )
+
+    res = self.client.get(WASTE_ITEMS_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertEqual(res.json()[0]["quantity"], 3.0)
+    self.assertEqual(Waste.objects.count(), 1)
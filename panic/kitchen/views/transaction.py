@@ -1,9 +1,17 @@
 """Views for the Transaction model."""
 
-from rest_framework import mixins, viewsets
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django_filters import rest_framework as filters
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import decorators, mixins, status, viewsets
+from rest_framework.renderers import JSONRenderer
 
+from ..filters import TransactionFilter
 from ..models.transaction import Transaction
+from ..pagination import TransactionCursorPagination
 from ..serializers.transaction import TransactionSerializer
+from ..swagger import custom_transaction_cursor_view_parm, openapi_ready
 from .bases import KitchenBaseView
 
 
@@ -19,6 +27,50 @@ class BaseTransactionView(
 class TransactionViewSet(
     BaseTransactionView,
     mixins.CreateModelMixin,
+    mixins.ListModelMixin,
     viewsets.GenericViewSet,
 ):
   """Transaction API view."""
+
+  filter_backends = (filters.DjangoFilterBackend,)
+  filterset_class = TransactionFilter
+  pagination_class = TransactionCursorPagination
+
+  @openapi_ready
+  def get_queryset(self):
+    """Retrieve the view queryset."""
+    queryset = self.queryset
+    return queryset.filter(item__user=self.request.user).\
+        order_by(*TransactionCursorPagination.ordering)
+
+  @swagger_auto_schema(manual_parameters=[custom_transaction_cursor_view_parm])
+  def list(self, request, *args, **kwargs):
+    """List an Item's Transactions in chronological order, by cursor."""
+    return super().list(request, *args, **kwargs)
+
+  @swagger_auto_schema(
+      responses={status.HTTP_200_OK: TransactionSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False, pagination_class=None)
+  # pylint: disable=unused-argument
+  def export(self, request, *args, **kwargs):
+    """Stream an Item's entire Transaction history in chronological order."""
+    queryset = self.filter_queryset(self.get_queryset())
+    return StreamingHttpResponse(
+        self.__stream(queryset),
+        content_type="application/json",
+    )
+
+  def __stream(self, queryset):
+    renderer = JSONRenderer()
+    separator = b"["
+    for chunk in TransactionCursorPagination.iterate_chunks(
+        queryset,
+        settings.TRANSACTION_EXPORT_CHUNK_SIZE,
+    ):
+      rendered = renderer.render(self.get_serializer(chunk, many=True).data)
+      yield separator + rendered[1:-1]
+      separator = b","
+    if separator == b"[":
+      yield separator
+    yield b"]"
@@ -0,0 +1,63 @@
+"""Views for the user's waste report."""
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import decorators, response, status, viewsets
+
+from ..models.waste_summary import WasteSummary
+from ..serializers.reports.waste import (
+    WasteByItemSerializer,
+    WasteByMonthSerializer,
+    WasteByShelfSerializer,
+)
+from .bases import KitchenBaseView
+
+
+class WasteReportViewSet(
+    KitchenBaseView,
+    viewsets.GenericViewSet,
+):
+  """Waste report API views.
+
+  Reports are read only.  Expired inventory is recorded as waste when an
+  item is consumed, and periodically by the `record_waste` command.
+  """
+
+  queryset = WasteSummary.objects.all()
+
+  def get_serializer_class(self):
+    """Retrieve the serializer for the requested report."""
+    return {
+        "shelves": WasteByShelfSerializer,
+        "months": WasteByMonthSerializer,
+    }.get(self.action, WasteByItemSerializer)
+
+  @swagger_auto_schema(
+      responses={status.HTTP_200_OK: WasteByItemSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False)
+  # pylint: disable=unused-argument
+  def items(self, request, *args, **kwargs):
+    """Retrieve the total cost of wasted inventory for each Item."""
+    return self.__report(WasteSummary.objects.by_item)
+
+  @swagger_auto_schema(
+      responses={status.HTTP_200_OK: WasteByShelfSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False)
+  # pylint: disable=unused-argument
+  def shelves(self, request, *args, **kwargs):
+    """Retrieve the total cost of wasted inventory for each Shelf."""
+    return self.__report(WasteSummary.objects.by_shelf)
+
+  @swagger_auto_schema(
+      responses={status.HTTP_200_OK: WasteByMonthSerializer(many=True)},
+  )
+  @decorators.action(methods=["GET"], detail=False)
+  # pylint: disable=unused-argument
+  def months(self, request, *args, **kwargs):
+    """Retrieve the total cost of wasted inventory for each month."""
+    return self.__report(WasteSummary.objects.by_month)
+
+  def __report(self, report):
+    serializer = self.get_serializer(report(self.request.user), many=True)
+    return response.Response(serializer.data)
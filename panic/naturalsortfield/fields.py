@@ -4,9 +4,22 @@ import re
 
 from django.db import models
 
+DEFAULT_BATCH_SIZE = 500
+
+PREFIX_PATTERN = re.compile(r'^the\s+')
+INTEGER_PATTERN = re.compile(r'\d+')
+
+
+def _naturalize_int_match(match):
+  return '%08d' % (int(match.group(0)),)
+
 
 class NaturalSortField(models.CharField):
-  """Django field for natural sort ordering."""
+  """Django field for natural sort ordering.
+
+  The source value each instance was last naturalized from is remembered, so
+  saves that don't change the source field skip naturalization entirely.
+  """
 
   def __init__(self, for_field, **kwargs):
     self.for_field = for_field
@@ -16,6 +29,13 @@ class NaturalSortField(models.CharField):
     super().__init__(**kwargs)
     self.max_length = kwargs['max_length']
 
+  def contribute_to_class(self, cls, name, private_only=False):
+    """Register the field, and track the source value of loaded instances."""
+
+    super().contribute_to_class(cls, name, private_only=private_only)
+    if not cls._meta.abstract:
+      models.signals.post_init.connect(self.remember_source, sender=cls)
+
   def deconstruct(self):
     """Return enough information to recreate the field as a 4-tuple."""
 
@@ -23,10 +43,50 @@ class NaturalSortField(models.CharField):
     args.append(self.for_field)
     return name, path, args, kwargs
 
+  @property
+  def source_cache_name(self):
+    """Return the instance attribute holding the last naturalized source.
+
+    :returns: The name of the instance attribute
+    :rtype: str
+    """
+    return f"_{self.attname}_source"
+
+  # pylint: disable=unused-argument
+  def remember_source(self, instance, **kwargs):
+    """Remember the source value of an instance with an existing sort value.
+
+    :param instance: A model instance that was just initialized
+    :type instance: :class:`django.db.models.Model`
+    """
+    if instance.__dict__.get(self.attname):
+      source = instance.__dict__.get(self.for_field)
+      if source is not None:
+        instance.__dict__[self.source_cache_name] = source
+
   def pre_save(self, model_instance, add):
     """Return field's value just before saving."""
 
-    return self.naturalize(getattr(model_instance, self.for_field))
+    source = getattr(model_instance, self.for_field)
+    if model_instance.__dict__.get(self.source_cache_name) == source:
+      return getattr(model_instance, self.attname)
+
+    value = self.naturalize(source)
+    self.assign(model_instance, source, value)
+    return value
+
+  def assign(self, model_instance, source, value):
+    """Assign a naturalized value, and remember the source it came from.
+
+    :param model_instance: The model instance to assign the value to
+    :type model_instance: :class:`django.db.models.Model`
+    :param source: The source value that was naturalized
+    :type source: str
+    :param value: The naturalized value
+    :type value: str
+    """
+    setattr(model_instance, self.attname, value)
+    model_instance.__dict__[self.source_cache_name] = source
 
   def naturalize(self, string):
     """Return a naturalized sortable version of the input string.
@@ -37,13 +97,77 @@ class NaturalSortField(models.CharField):
     :rtype: string
     """
 
-    def naturalize_int_match(match):
-      return '%08d' % (int(match.group(0)),)
-
     string = string.lower()
     string = string.strip()
-    string = re.sub(r'^the\s+', '', string)
-    string = re.sub(r'\d+', naturalize_int_match, string)
+    string = PREFIX_PATTERN.sub('', string)
+    string = INTEGER_PATTERN.sub(_naturalize_int_match, string)
     string = string[:self.max_length]
 
     return string
+
+  def naturalize_many(self, strings):
+    """Return naturalized sortable versions of many input strings.
+
+    Repeated strings are only naturalized once.
+
+    :param strings: The string values you wish to make naturalized sortable.
+    :type strings: List[str]
+    :returns: Naturalized sortable versions of the input strings, in order.
+    :rtype: List[str]
+    """
+    naturalized = {string: None for string in strings}
+    for string in naturalized:
+      naturalized[string] = self.naturalize(string)
+    return [naturalized[string] for string in strings]
+
+  def prepare_many(self, model_instances):
+    """Naturalize and assign the sort values of many model instances at once.
+
+    Instances prepared this way skip naturalization in `pre_save`, which makes
+    this suitable for use before `bulk_create`.
+
+    :param model_instances: The model instances to prepare
+    :type model_instances: List[:class:`django.db.models.Model`]
+    """
+    sources = [
+        getattr(model_instance, self.for_field)
+        for model_instance in model_instances
+    ]
+    for model_instance, source, value in zip(
+        model_instances,
+        sources,
+        self.naturalize_many(sources),
+    ):
+      self.assign(model_instance, source, value)
+
+  def rebuild(self, batch_size=DEFAULT_BATCH_SIZE):
+    """Recompute this field's stored values in bulk batches.
+
+    Only rows whose stored value is out of date are written.
+
+    :param batch_size: The number of rows to read and write at a time
+    :type batch_size: int
+    :returns: The number of rows that were updated
+    :rtype: int
+    """
+    manager = self.model._base_manager
+    queryset = manager.only('pk', self.for_field, self.attname).order_by('pk')
+
+    updated = 0
+    batch = []
+    for instance in queryset.iterator(chunk_size=batch_size):
+      value = self.naturalize(getattr(instance, self.for_field))
+      if value != getattr(instance, self.attname):
+        setattr(instance, self.attname, value)
+        batch.append(instance)
+      if len(batch) >= batch_size:
+        updated += self.__write_batch(manager, batch)
+        batch = []
+    updated += self.__write_batch(manager, batch)
+
+    return updated
+
+  def __write_batch(self, manager, batch):
+    if batch:
+      manager.bulk_update(batch, [self.attname], batch_size=len(batch))
+    return len(batch)
@@ -0,0 +1,47 @@
+"""A management command to recompute all natural sort values."""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from ...fields import DEFAULT_BATCH_SIZE, NaturalSortField
+
+MESSAGE_REBUILDING = "Rebuilding {model}.{field}..."
+MESSAGE_UPDATED = "Updated {count} rows."
+MESSAGE_SUCCESS = "Natural sort values have been rebuilt!"
+
+
+class Command(BaseCommand):
+  """Management command that recomputes all natural sort values."""
+
+  help = 'Recomputes the stored value of every NaturalSortField in batches.'
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help='The number of rows to read and write at a time.',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+
+    for field in self._natural_sort_fields():
+      self.stdout.write(
+          MESSAGE_REBUILDING.format(
+              model=field.model._meta.label,
+              field=field.name,
+          )
+      )
+      count = field.rebuild(batch_size=options['batch_size'])
+      self.stdout.write(MESSAGE_UPDATED.format(count=count))
+
+    self.stdout.write(self.style.SUCCESS(MESSAGE_SUCCESS))
+
+  @staticmethod
+  def _natural_sort_fields():
+    for model in apps.get_models():
+      for field in model._meta.concrete_fields:
+        if isinstance(field, NaturalSortField):
+          yield field
@@ -0,0 +1,68 @@
+"""Test rebuild_natural_sort management command."""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..rebuild_natural_sort import (
+    MESSAGE_REBUILDING,
+    MESSAGE_SUCCESS,
+    MESSAGE_UPDATED,
+)
+from kitchen.models.shelf import Shelf
+from kitchen.models.store import Store
+
+
+class TestCommand(TestCase):
+  """Test the rebuild_natural_sort command."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.user = get_user_model().objects.create_user(
+        username="created_test_user",
+        email="created_test_user@niallbyrne.ca",
+        password="test123",
+    )
+    cls.shelves = [
+        Shelf.objects.create(user=cls.user, name=f"Shelf {index}")
+        for index in range(3)
+    ]
+    Store.objects.create(user=cls.user, name="The Store")
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    Shelf.objects.filter(pk=self.shelves[0].pk).update(_index="stale")
+
+  def _call_command(self):
+    call_command(
+        'rebuild_natural_sort',
+        '--batch-size=2',
+        stdout=self.output_stdout,
+        no_color=True,
+    )
+
+  def test_rebuilds_stale_values(self):
+    self._call_command()
+
+    self.assertEqual(
+        Shelf.objects.get(pk=self.shelves[0].pk)._index,
+        "shelf 00000000",
+    )
+
+  def test_only_stale_values_are_written(self):
+    self._call_command()
+
+    stdout_capture = self.output_stdout.getvalue()
+    self.assertIn(
+        MESSAGE_REBUILDING.format(model="kitchen.Shelf", field="_index") +
+        "\n" + MESSAGE_UPDATED.format(count=1),
+        stdout_capture,
+    )
+    self.assertIn(
+        MESSAGE_REBUILDING.format(model="kitchen.Store", field="_index") +
+        "\n" + MESSAGE_UPDATED.format(count=0),
+        stdout_capture,
+    )
+    self.assertIn(MESSAGE_SUCCESS, stdout_capture)
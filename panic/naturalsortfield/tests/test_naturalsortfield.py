@@ -13,6 +13,7 @@ class TestNaturalSortFieldModelModeMethods(TestCase):
 
   def setUp(self):
     self.field = NaturalSortField(for_field="test_field")
+    self.field.set_attributes_from_name("natural")
 
   @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
   def test_presave(self, m_naturalize):
@@ -27,6 +28,93 @@ class TestNaturalSortFieldModelModeMethods(TestCase):
 
     m_naturalize.assert_called_once_with(mock_model.test_field,)
 
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_presave_assigns_value(self, m_naturalize):
+
+    mock_model = mock.Mock()
+    mock_model.test_field = "The unnaturalized string"
+    m_naturalize.return_value = "mocked naturalized string"
+
+    self.field.pre_save(mock_model, None)
+
+    self.assertEqual(mock_model.natural, m_naturalize.return_value)
+
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_presave_unchanged_source(self, m_naturalize):
+
+    mock_model = mock.Mock()
+    mock_model.test_field = "The unnaturalized string"
+    m_naturalize.return_value = "mocked naturalized string"
+
+    self.field.pre_save(mock_model, None)
+    result = self.field.pre_save(mock_model, None)
+
+    self.assertEqual(result, m_naturalize.return_value)
+    m_naturalize.assert_called_once_with(mock_model.test_field,)
+
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_presave_changed_source(self, m_naturalize):
+
+    mock_model = mock.Mock()
+    mock_model.test_field = "The unnaturalized string"
+    m_naturalize.return_value = "mocked naturalized string"
+
+    self.field.pre_save(mock_model, None)
+    mock_model.test_field = "A different string"
+    self.field.pre_save(mock_model, None)
+
+    self.assertEqual(m_naturalize.call_count, 2)
+
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_remember_source(self, m_naturalize):
+
+    mock_model = mock.Mock()
+    mock_model.test_field = "The unnaturalized string"
+    mock_model.natural = "stored naturalized string"
+
+    self.field.remember_source(mock_model)
+    result = self.field.pre_save(mock_model, None)
+
+    self.assertEqual(result, mock_model.natural)
+    m_naturalize.assert_not_called()
+
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_remember_source_without_value(self, m_naturalize):
+
+    mock_model = mock.Mock()
+    mock_model.test_field = "The unnaturalized string"
+    mock_model.natural = ""
+    m_naturalize.return_value = "mocked naturalized string"
+
+    self.field.remember_source(mock_model)
+    result = self.field.pre_save(mock_model, None)
+
+    self.assertEqual(result, m_naturalize.return_value)
+
+  def test_prepare_many(self):
+    mock_models = [mock.Mock(), mock.Mock()]
+    mock_models[0].test_field = "Item 2"
+    mock_models[1].test_field = "The Item 10"
+
+    self.field.prepare_many(mock_models)
+
+    self.assertListEqual(
+        [mock_model.natural for mock_model in mock_models],
+        ["item 00000002", "item 00000010"],
+    )
+
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_prepare_many_skips_presave(self, m_naturalize):
+
+    mock_model = mock.Mock()
+    mock_model.test_field = "The unnaturalized string"
+    m_naturalize.return_value = "mocked naturalized string"
+
+    self.field.prepare_many([mock_model])
+    self.field.pre_save(mock_model, None)
+
+    m_naturalize.assert_called_once_with(mock_model.test_field,)
+
   @mock.patch(FIELDS_MODULE + ".models.CharField.deconstruct")
   def test_deconstruct(self, m_deconstruct):
 
@@ -96,3 +184,19 @@ class TestNaturalSortFieldNaturalize(TestCase):
         result,
         '%08d-%08d' % (int(values[0]), int(values[1])),
     )
+
+  def test_naturalize_many(self):
+    test_values = ["The 4th", "UPPER", "The 4th"]
+
+    result = self.field.naturalize_many(test_values)
+    self.assertListEqual(
+        result,
+        [self.field.naturalize(test_value) for test_value in test_values],
+    )
+
+  @mock.patch(FIELDS_MODULE + ".NaturalSortField.naturalize")
+  def test_naturalize_many_repeated_values(self, m_naturalize):
+    test_values = ["The 4th", "UPPER", "The 4th"]
+
+    self.field.naturalize_many(test_values)
+    self.assertEqual(m_naturalize.call_count, 2)
@@ -3,14 +3,29 @@ ASGI config for panic project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The async API views are served by a separate handler, with only async capable
+middleware, so they aren't serialized behind the project's sync middleware.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
 """
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
+from utilities.asynchronous.handlers import (
+    AsyncMiddlewareHandler,
+    PathPrefixRouter,
+)
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+application = PathPrefixRouter(
+    settings.ASYNC_API_PREFIX,
+    prefixed=AsyncMiddlewareHandler(),
+    default=django_application,
+)
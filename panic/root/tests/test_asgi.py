@@ -0,0 +1,144 @@
+"""Test the async API views, served by the ASGI application."""
+
+import base64
+import json
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+from django.urls import reverse
+
+from ..asgi import application, django_application
+from kitchen.models.item import Item
+from kitchen.tests.fixtures.benchmark_testdata import (
+    BenchmarkDataConfiguration,
+    BenchmarkDataGenerator,
+)
+from utilities.asynchronous.executors import shutdown_executors
+from utilities.asynchronous.handlers import AsyncMiddlewareHandler
+from utilities.metrics.middleware import HEADER_QUERY_COUNT
+
+
+class TestDataConfiguration(BenchmarkDataConfiguration):
+  """Test configuration for benchmark data generation."""
+
+  number_of_items = 2
+  number_of_users = 1
+  summarize = False
+  username_prefix = "asgi_user"
+  years = 1
+
+
+class TestASGIApplication(TransactionTestCase):
+  """Test the async API views, served by the ASGI application."""
+
+  def setUp(self):
+    config = TestDataConfiguration()
+    BenchmarkDataGenerator(config=config).generate_data()
+    user = get_user_model().objects.get(username=config.username_prefix + "0")
+    self.item = Item.objects.filter(user=user).order_by('_index')[0]
+    credentials = "%s:%s" % (user.username, config.password)
+    self.authorization = "Basic " + base64.b64encode(credentials.encode()
+                                                    ).decode()
+
+  def tearDown(self):
+    shutdown_executors()
+
+  def asgi_get(self, path, authorized=True):
+    messages = []
+    headers = [(b"host", b"testserver")]
+    if authorized:
+      headers.append((b"authorization", self.authorization.encode()))
+
+    async def receive():
+      return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+      messages.append(message)
+
+    async_to_sync(application)(
+        {
+            "type": "http",
+            "asgi": {
+                "version": "3.0"
+            },
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+        },
+        receive,
+        send,
+    )
+    headers = {
+        name.decode(): value.decode() for name, value in messages[0]["headers"]
+    }
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], headers, body
+
+  def assertMatchesSync(self, async_view, sync_view, *args):
+    async_path = reverse(async_view, args=args)
+    sync_response = self.client.get(
+        reverse(sync_view, args=args),
+        HTTP_AUTHORIZATION=self.authorization,
+    )
+
+    status, headers, body = self.asgi_get(async_path)
+
+    self.assertEqual(status, 200)
+    self.assertEqual(json.loads(body), sync_response.json())
+    self.assertGreater(int(headers[HEADER_QUERY_COUNT]), 0)
+    self.assertEqual(headers["X-Frame-Options"], "DENY")
+
+  def test_routes_async_api_prefix(self):
+    self.assertIsInstance(application.prefixed, AsyncMiddlewareHandler)
+    self.assertIs(application.default, django_application)
+    self.assertTrue(
+        reverse("async_v1:timezones").startswith(settings.ASYNC_API_PREFIX)
+    )
+
+  def test_item_list(self):
+    self.assertMatchesSync("async_v1:items-list", "v1:items-supplementary-list")
+
+  def test_item_detail(self):
+    self.assertMatchesSync(
+        "async_v1:items-detail",
+        "v1:items-detail",
+        self.item.id,
+    )
+
+  def test_item_activity(self):
+    self.assertMatchesSync(
+        "async_v1:items-activity",
+        "v1:items-activity",
+        self.item.id,
+    )
+
+  def test_suggestions(self):
+    self.assertMatchesSync("async_v1:suggestions-list", "v1:suggestions-list")
+
+  def test_timezones(self):
+    sync_response = self.client.get(
+        reverse("user:timezones"),
+        HTTP_AUTHORIZATION=self.authorization,
+    )
+
+    status, _, body = self.asgi_get(reverse("async_v1:timezones"))
+
+    self.assertEqual(status, 200)
+    self.assertEqual(body, sync_response.content)
+
+  def test_login_required(self):
+    status, _, _ = self.asgi_get(
+        reverse("async_v1:items-list"),
+        authorized=False,
+    )
+
+    self.assertEqual(status, 401)
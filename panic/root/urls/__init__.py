@@ -4,10 +4,13 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
+from utilities.views.metrics import metrics
+
 urlpatterns = [
     path('', include('appengine.urls')),
     path('', include('legal.urls')),
     path('', include('root.urls.api.v1')),
+    path('watchman/metrics/', metrics, name='metrics'),
     path('watchman/', include('watchman.urls')),
 ]
 
@@ -0,0 +1,47 @@
+"""URLS for the async read only views of the Panic v1 API.
+
+These views mirror their synchronous counterparts, and are served under the
+`ASYNC_API_PREFIX` by the ASGI application's async handler.
+"""
+
+from django.urls import path
+
+from kitchen.views.item import ItemListCreateViewSet, ItemViewSet
+from kitchen.views.suggested import SuggestedItemListViewSet
+from user.views import TimeZones
+from utilities.asynchronous.views import async_view
+
+app_name = "async_v1"
+
+urlpatterns = [
+    path(
+        "items/",
+        async_view(ItemListCreateViewSet.as_view({"get": "list"})),
+        name="items-list",
+    ),
+    path(
+        "items/<int:pk>/",
+        async_view(ItemViewSet.as_view({"get": "retrieve"})),
+        name="items-detail",
+    ),
+    path(
+        "items/<int:pk>/activity/",
+        async_view(
+            ItemViewSet.as_view(
+                {"get": "activity"},
+                concurrent_activity=True,
+            )
+        ),
+        name="items-activity",
+    ),
+    path(
+        "suggestions/",
+        async_view(SuggestedItemListViewSet.as_view({"get": "list"})),
+        name="suggestions-list",
+    ),
+    path(
+        "timezones/",
+        async_view(TimeZones.as_view()),
+        name="timezones",
+    ),
+]
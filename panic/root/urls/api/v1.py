@@ -16,6 +16,10 @@ urlpatterns = [
             namespace="v1",
         ),
     ),
+    path(
+        "api/v1/async/",
+        include("root.urls.api.async_v1"),
+    ),
     path(
         "api/v1/auth/",
         include("spa_security.urls"),
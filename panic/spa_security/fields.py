@@ -1,23 +1,115 @@
 """Django model fields for the spa_security app."""
 
+import re
+from functools import lru_cache
+
+from bleach import clean
 from django.conf import settings
 from django.db import models
+from django.utils.safestring import mark_safe
 from django_bleach.models import BleachField
 
+SANITIZE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def _restore_pattern(restore_keys):
+  return re.compile(
+      "|".join(
+          re.escape(key) for key in sorted(restore_keys, key=len, reverse=True)
+      )
+  )
+
+
+def restore(data, restore_list):
+  """Restore bleached substrings in a single pass.
+
+  :param data: The bleached string
+  :type data: str
+  :param restore_list: A mapping of bleached substrings to their replacements
+  :type restore_list: dict
+
+  :returns: The restored string
+  :rtype: str
+  """
+  if not restore_list or not data:
+    return data
+  pattern = _restore_pattern(tuple(restore_list))
+  return pattern.sub(lambda match: restore_list[match.group(0)], data)
+
 
 class BlondeCharField(models.CharField, BleachField):
-  """A django_bleach derived char field, with appropriate protection."""
+  """A django_bleach derived char field, with appropriate protection.
+
+  The value each saved instance was loaded with, or last sanitized to, is
+  remembered, so saves that don't change the field skip sanitization.  Any
+  other value is sanitized, even if it has already been marked safe elsewhere.
+  """
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self.sanitize = lru_cache(maxsize=SANITIZE_CACHE_SIZE)(self._sanitize)
+
+  def _sanitize(self, data):
+    return clean(data, **self.bleach_kwargs)
+
+  def contribute_to_class(self, cls, name, private_only=False):
+    """Register the field, and track the value of initialized instances."""
+
+    super().contribute_to_class(cls, name, private_only=private_only)
+    if not cls._meta.abstract:
+      models.signals.post_init.connect(self.remember_value, sender=cls)
+
+  @property
+  def value_cache_name(self):
+    """Return the instance attribute holding the last loaded or saved value.
+
+    :returns: The name of the instance attribute
+    :rtype: str
+    """
+    return f"_{self.attname}_sanitized"
+
+  # pylint: disable=unused-argument
+  def remember_value(self, instance, **kwargs):
+    """Remember the value an instance was initialized with.
+
+    The value is only trusted once the instance is known to have been loaded
+    from the database, as unsaved instances are initialized the same way.
+
+    :param instance: A model instance that was just initialized
+    :type instance: :class:`django.db.models.Model`
+    """
+    instance.__dict__[self.value_cache_name
+                     ] = instance.__dict__.get(self.attname)
+
+  def is_unchanged(self, model_instance, data):
+    """Return whether a saved instance still holds its sanitized value.
+
+    :param model_instance: The model instance being saved
+    :type model_instance: :class:`django.db.models.Model`
+    :param data: The value about to be saved
+    :type data: str
+
+    :returns: A boolean indicating if sanitization can be skipped
+    :rtype: bool
+    """
+    if model_instance._state.adding:
+      return False
+    return model_instance.__dict__.get(self.value_cache_name) == data
 
   def pre_save(self, model_instance, add):
     """Override the :class:`django.db.models.fields.Field` `pre_save` hook.
 
     Allows for restoring some modified fields after they have been "bleached".
     """
-    restored_data = None
-    data = super().pre_save(model_instance, add)
-    for key, value in getattr(settings, "BLEACH_RESTORE_LIST", {}).items():
-      restored_data = data.replace(key, value)
-    if restored_data:
-      setattr(model_instance, self.attname, restored_data)
-      return restored_data
-    return data
+    data = getattr(model_instance, self.attname)
+    if data is None or self.is_unchanged(model_instance, data):
+      return data
+
+    sanitized = self.sanitize(data) if data else ""
+    restored_data = mark_safe(
+        restore(sanitized, getattr(settings, "BLEACH_RESTORE_LIST", {}))
+    )
+    setattr(model_instance, self.attname, restored_data)
+    model_instance.__dict__[self.value_cache_name] = restored_data
+    return restored_data
@@ -1,8 +1,15 @@
 """Test the custom model field."""
 
+from unittest.mock import patch
+
+from django.db.models.base import ModelState
 from django.test import SimpleTestCase, override_settings
+from django.utils.safestring import SafeData, mark_safe
+
+from .. import fields
+from ..fields import BlondeCharField, restore
 
-from ..fields import BlondeCharField
+FIELDS_MODULE = fields.__name__
 
 
 class BlondeCharFieldTest(SimpleTestCase):
@@ -11,7 +18,10 @@ class BlondeCharFieldTest(SimpleTestCase):
   def setUp(self):
 
     class EmptyObject:
-      field_name = "Initial&Value"
+
+      def __init__(self):
+        self.field_name = "Initial&Value"
+        self._state = ModelState()
 
     self.field = BlondeCharField()
     self.field.attname = "field_name"
@@ -26,3 +36,101 @@ class BlondeCharFieldTest(SimpleTestCase):
   def test_override_execution(self):
     self.field.pre_save(self.object, "")
     self.assertEqual(self.object.field_name, "Initial&Value")
+
+  @override_settings(BLEACH_RESTORE_LIST={"&amp;": "&", "&lt;": "<"})
+  def test_override_execution_multiple_replacements(self):
+    self.object.field_name = "Initial&Value<"
+    self.field.pre_save(self.object, "")
+    self.assertEqual(self.object.field_name, "Initial&Value<")
+
+  def test_sanitized_value_is_marked_safe(self):
+    self.field.pre_save(self.object, "")
+    self.assertIsInstance(self.object.field_name, SafeData)
+
+  def test_none(self):
+    self.object.field_name = None
+    self.assertIsNone(self.field.pre_save(self.object, ""))
+
+  @override_settings(BLEACH_RESTORE_LIST={})
+  def test_safe_value_is_sanitized(self):
+    self.object.field_name = mark_safe("Loaded<Value>")
+
+    result = self.field.pre_save(self.object, "")
+
+    self.assertEqual(result, "Loaded&lt;Value&gt;")
+
+  @patch(FIELDS_MODULE + ".clean")
+  def test_unchanged_loaded_value_is_not_sanitized(self, m_clean):
+    self.object._state.adding = False
+    self.field.remember_value(self.object)
+
+    result = self.field.pre_save(self.object, "")
+
+    self.assertEqual(result, "Initial&Value")
+    m_clean.assert_not_called()
+
+  @patch(FIELDS_MODULE + ".clean")
+  def test_unsaved_value_is_sanitized(self, m_clean):
+    m_clean.return_value = "Sanitized Value"
+    self.field.remember_value(self.object)
+
+    result = self.field.pre_save(self.object, "")
+
+    self.assertEqual(result, "Sanitized Value")
+    m_clean.assert_called_once_with(
+        "Initial&Value",
+        **self.field.bleach_kwargs,
+    )
+
+  @patch(FIELDS_MODULE + ".clean")
+  def test_changed_loaded_value_is_sanitized(self, m_clean):
+    m_clean.return_value = "Sanitized Value"
+    self.object._state.adding = False
+    self.field.remember_value(self.object)
+    self.object.field_name = "Changed Value"
+
+    result = self.field.pre_save(self.object, "")
+
+    self.assertEqual(result, "Sanitized Value")
+    m_clean.assert_called_once_with(
+        "Changed Value",
+        **self.field.bleach_kwargs,
+    )
+
+  @patch(FIELDS_MODULE + ".clean")
+  def test_repeated_values_are_cached(self, m_clean):
+    m_clean.return_value = "Sanitized Value"
+
+    for _ in range(2):
+      self.object.field_name = "Repeated Value"
+      self.field.pre_save(self.object, "")
+
+    m_clean.assert_called_once_with(
+        "Repeated Value",
+        **self.field.bleach_kwargs,
+    )
+
+
+class RestoreTest(SimpleTestCase):
+  """Test the restore function."""
+
+  def test_empty_restore_list(self):
+    self.assertEqual(restore("a&amp;b", {}), "a&amp;b")
+
+  def test_single_pass(self):
+    self.assertEqual(
+        restore("&amp;lt;", {
+            "&amp;": "&",
+            "&lt;": "<"
+        }),
+        "&lt;",
+    )
+
+  def test_longest_match_first(self):
+    self.assertEqual(
+        restore("&amp;", {
+            "&": "and",
+            "&amp;": "&"
+        }),
+        "&",
+    )
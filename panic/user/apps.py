@@ -12,4 +12,4 @@ class UserConfig(AppConfig):
   def ready(self):
     """Load Signals."""
     # pylint: disable=unused-import, import-outside-toplevel
-    from .signals import signup
+    from .signals import signup, user
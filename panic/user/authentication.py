@@ -0,0 +1,82 @@
+"""Authentication classes for the user app."""
+
+from dj_rest_auth.jwt_auth import JWTCookieAuthentication
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .utilities.user_cache import USER_CACHE
+
+
+class CachedJWTCookieAuthentication(JWTCookieAuthentication):
+  """JWT cookie authentication, serving users from an in-process cache.
+
+  The token's signed claims are verified on every request, but the user they
+  identify is only loaded from the database when it is not already cached.
+  Cached users are discarded when they are saved or deleted, and otherwise
+  expire after `USER_CACHE_TTL` seconds.
+
+  Invalidation only reaches the cache of the process that saved the user, so
+  cached users are only served to read only requests.  Any other request
+  drops the cached entry and loads the user from the database, preventing a
+  stale instance from being saved over a newer password or deactivation.
+  """
+
+  cache_request = False
+
+  def authenticate(self, request):
+    """Authenticate a request, noting whether it may use the user cache.
+
+    :param request: The incoming request
+    :type request: :class:`rest_framework.request.Request`
+
+    :returns: The authenticated user and token, or None
+    :rtype: tuple, None
+    """
+    self.cache_request = request.method in SAFE_METHODS
+    return super().authenticate(request)
+
+  def get_user(self, validated_token):
+    """Return the user identified by a validated token.
+
+    :param validated_token: A validated JWT
+    :type validated_token: :class:`rest_framework_simplejwt.tokens.Token`
+
+    :returns: The authenticated user
+    :rtype: :class:`user.models.user.User`
+
+    :raises: :class:`rest_framework_simplejwt.exceptions.AuthenticationFailed`
+    """
+    try:
+      user_id = validated_token[api_settings.USER_ID_CLAIM]
+    except KeyError as exc:
+      raise InvalidToken(
+          "Token contained no recognizable user identification"
+      ) from exc
+
+    if not self.cache_request:
+      USER_CACHE.invalidate(user_id)
+      return super().get_user(validated_token)
+
+    user = USER_CACHE.get(self.user_model, user_id)
+    if user is None:
+      user = super().get_user(validated_token)
+      USER_CACHE.set(user)
+      return user
+
+    if not user.is_active:
+      raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+    if api_settings.CHECK_REVOKE_TOKEN:
+      if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM
+                            ) != get_md5_hash_password(user.password):
+        raise AuthenticationFailed(
+            "The user's password has been changed.",
+            code="password_changed",
+        )
+
+    return user
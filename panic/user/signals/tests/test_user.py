@@ -0,0 +1,34 @@
+"""Test the User model signal receivers."""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from .. import user
+
+User = get_user_model()
+
+
+@patch(user.__name__ + ".USER_CACHE.invalidate")
+class TestUserSignalHandler(TestCase):
+  """Test the User model signal handler."""
+
+  def setUp(self):
+    self.user = User.objects.create_user(
+        username="testuser1",
+        email="test1@niallbyrne.ca",
+        password="test123",
+    )
+
+  def test_save_invalidates_cache(self, m_invalidate):
+    self.user.save()
+
+    m_invalidate.assert_called_once_with(self.user.pk)
+
+  def test_delete_invalidates_cache(self, m_invalidate):
+    user_id = self.user.pk
+
+    self.user.delete()
+
+    m_invalidate.assert_called_once_with(user_id)
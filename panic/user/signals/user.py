@@ -0,0 +1,19 @@
+"""Handles signals from the User model."""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..utilities.user_cache import USER_CACHE
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_change_handler(instance, **kwargs):
+  """Handle the User model `post_save` and `post_delete` signals.
+
+  :param instance: A django user object
+  :type instance: :class:`user.models.user.User`
+  """
+  USER_CACHE.invalidate(instance.pk)
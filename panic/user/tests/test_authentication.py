@@ -0,0 +1,131 @@
+"""Test the user app authentication classes."""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from patches.patched_access_token import PatchedAccessToken
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+
+from .. import authentication
+from ..authentication import CachedJWTCookieAuthentication
+from ..utilities.user_cache import USER_CACHE, UserCache
+
+User = get_user_model()
+
+
+class TestCachedJWTCookieAuthentication(TestCase):
+  """Test the CachedJWTCookieAuthentication class."""
+
+  def setUp(self):
+    USER_CACHE.clear()
+    self.user = User.objects.create_user(
+        username="testuser1",
+        email="test1@niallbyrne.ca",
+        password="test123",
+    )
+    self.token = PatchedAccessToken.for_user(self.user)
+    self.authentication = CachedJWTCookieAuthentication()
+    self.factory = APIRequestFactory()
+
+  def tearDown(self):
+    USER_CACHE.clear()
+
+  def authenticate(self, method="get"):
+    request = getattr(self.factory, method)(
+        "/",
+        HTTP_AUTHORIZATION="Bearer %s" % self.token,
+    )
+    return self.authentication.authenticate(request)
+
+  def authenticate_with_cache(self, cache, method="get"):
+    with mock.patch.object(authentication, "USER_CACHE", cache):
+      return self.authenticate(method)
+
+  def test_first_request_loads_user(self):
+    with self.assertNumQueries(1):
+      user, _ = self.authenticate()
+
+    self.assertEqual(user, self.user)
+
+  def test_subsequent_requests_use_cache(self):
+    self.authenticate()
+
+    with self.assertNumQueries(0):
+      user, _ = self.authenticate()
+
+    self.assertEqual(user, self.user)
+    self.assertEqual(user.timezone, self.user.timezone)
+
+  def test_save_refreshes_cached_user(self):
+    self.authenticate()
+    self.user.first_name = "Changed"
+    self.user.save()
+
+    with self.assertNumQueries(1):
+      user, _ = self.authenticate()
+
+    self.assertEqual(user.first_name, "Changed")
+
+  def test_deactivated_user_rejected(self):
+    self.authenticate()
+    self.user.is_active = False
+    self.user.save()
+
+    with self.assertRaises(AuthenticationFailed):
+      self.authenticate()
+
+  def test_cached_inactive_user_rejected(self):
+    self.user.is_active = False
+    USER_CACHE.set(self.user)
+
+    with self.assertRaises(AuthenticationFailed):
+      self.authenticate()
+
+  def test_token_without_user_claim(self):
+    del self.token['user_id']
+
+    with self.assertRaises(InvalidToken):
+      self.authenticate()
+
+  def test_unsafe_requests_load_user(self):
+    self.authenticate()
+
+    with self.assertNumQueries(1):
+      user, _ = self.authenticate("post")
+
+    self.assertEqual(user, self.user)
+
+  def test_unsafe_requests_drop_stale_user_cached_elsewhere(self):
+    process_a = UserCache(ttl=60, max_size=10)
+    process_b = UserCache(ttl=60, max_size=10)
+    self.authenticate_with_cache(process_a)
+    self.authenticate_with_cache(process_b)
+
+    self.user.set_password("changed123")
+    self.user.save()
+    process_a.invalidate(self.user.pk)
+
+    user, _ = self.authenticate_with_cache(process_b, "patch")
+
+    self.assertTrue(user.check_password("changed123"))
+    self.assertIsNone(process_b.get(User, self.user.pk))
+
+  def test_unsafe_requests_see_deactivation_cached_elsewhere(self):
+    process_a = UserCache(ttl=60, max_size=10)
+    process_b = UserCache(ttl=60, max_size=10)
+    self.authenticate_with_cache(process_a)
+    self.authenticate_with_cache(process_b)
+
+    self.user.is_active = False
+    self.user.save()
+    process_a.invalidate(self.user.pk)
+
+    with self.assertRaises(AuthenticationFailed):
+      self.authenticate_with_cache(process_b, "delete")
+
+    self.assertIsNone(process_b.get(User, self.user.pk))
@@ -1,6 +1,9 @@
 """Test the views for the user app."""
 
+import json
+
 import pytz
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
@@ -8,6 +11,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from .. import views as view_module
+from ..utilities.timezones import TIMEZONE_CATALOGUE
 
 TIMEZONE_URL = reverse("user:timezones")
 VIEW_MODULE = view_module.__name__
@@ -48,4 +52,48 @@ class PrivateTimezoneTest(TestCase):
       expected.append({"id": index, "name": timezone})
 
     self.assertEqual(resp.status_code, status.HTTP_200_OK)
-    self.assertEqual(resp.data, expected)
+    self.assertEqual(json.loads(resp.content), expected)
+
+  def test_timezone_list_cache_headers(self):
+    resp = self.client.get(TIMEZONE_URL)
+
+    self.assertEqual(resp['ETag'], TIMEZONE_CATALOGUE.etag)
+    self.assertEqual(
+        resp['Cache-Control'],
+        f"private, max-age={settings.TIMEZONE_CACHE_MAX_AGE}",
+    )
+
+  def test_timezone_list_not_modified(self):
+    resp = self.client.get(
+        TIMEZONE_URL,
+        HTTP_IF_NONE_MATCH=TIMEZONE_CATALOGUE.etag,
+    )
+
+    self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+    self.assertEqual(resp.content, b"")
+    self.assertEqual(resp['ETag'], TIMEZONE_CATALOGUE.etag)
+
+  def test_timezone_list_modified(self):
+    resp = self.client.get(TIMEZONE_URL, HTTP_IF_NONE_MATCH='"stale"')
+
+    self.assertEqual(resp.status_code, status.HTTP_200_OK)
+    self.assertEqual(resp.content, TIMEZONE_CATALOGUE.payload)
+
+  def test_timezone_search(self):
+    resp = self.client.get(TIMEZONE_URL, {"q": "america/toro"})
+
+    self.assertEqual(resp.status_code, status.HTTP_200_OK)
+    self.assertEqual(
+        json.loads(resp.content),
+        [{
+            "id": pytz.common_timezones.index("America/Toronto"),
+            "name": "America/Toronto",
+        }],
+    )
+    self.assertNotEqual(resp['ETag'], TIMEZONE_CATALOGUE.etag)
+
+  def test_timezone_search_no_results(self):
+    resp = self.client.get(TIMEZONE_URL, {"q": "Atlantis/"})
+
+    self.assertEqual(resp.status_code, status.HTTP_200_OK)
+    self.assertEqual(json.loads(resp.content), [])
@@ -0,0 +1,119 @@
+"""Request scoped resolution of the authenticated user's timezone."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pendulum
+import pytz
+
+_REQUEST_TIMEZONE: ContextVar = ContextVar("request_timezone", default=None)
+
+
+class LocalTimezone:
+  """A timezone, with local time boundaries memoized for its lifetime.
+
+  The current time is captured once on creation, so all boundaries computed
+  from the same instance agree with each other.
+
+  :param timezone: A timezone object
+  :type timezone: :class:`pytz.tzinfo.BaseTzInfo`
+  :param user_id: The pk of the user this timezone belongs to, if any
+  :type user_id: int, None
+  """
+
+  def __init__(self, timezone, user_id=None):
+    self.timezone = timezone
+    self.zone = timezone.zone
+    self.user_id = user_id
+    self.now = pendulum.now(tz=timezone)
+    self._boundaries = {}
+
+  @classmethod
+  def from_zone(cls, zone):
+    """Create a local timezone from a zone string, or pass one through as is.
+
+    :param zone: A world timezone descriptor string, or a local timezone
+    :type zone: str, :class:`LocalTimezone`
+
+    :returns: A local timezone instance
+    :rtype: :class:`LocalTimezone`
+    """
+    if isinstance(zone, cls):
+      return zone
+    return cls(pytz.timezone(zone))
+
+  def start_of(self, unit):
+    """Return the start of the current local day, week or month.
+
+    :param unit: The pendulum unit ("day", "week", "month")
+    :type unit: str
+
+    :returns: The local datetime at the start of the unit
+    :rtype: :class:`pendulum.DateTime`
+    """
+    if unit not in self._boundaries:
+      self._boundaries[unit] = self.now.start_of(unit)
+    return self._boundaries[unit]
+
+
+class RequestTimezone:
+  """Lazily resolves the authenticated user's timezone, once per request.
+
+  :param get_user: A callable returning the request user
+  :type get_user: func
+  """
+
+  def __init__(self, get_user):
+    self._get_user = get_user
+    self._local_timezone = None
+    self._resolved = False
+
+  def resolve(self):
+    """Return the request user's local timezone, if they are authenticated.
+
+    :returns: A local timezone instance, or None
+    :rtype: :class:`LocalTimezone`, None
+    """
+    if not self._resolved:
+      user = self._get_user()
+      if user is not None and user.is_authenticated:
+        self._local_timezone = LocalTimezone(user.timezone, user.pk)
+      self._resolved = True
+    return self._local_timezone
+
+
+@contextmanager
+def request_timezone(get_user):
+  """Share the request user's timezone with all code run within this context.
+
+  :param get_user: A callable returning the request user
+  :type get_user: func
+  """
+  token = _REQUEST_TIMEZONE.set(RequestTimezone(get_user))
+  try:
+    yield
+  finally:
+    _REQUEST_TIMEZONE.reset(token)
+
+
+def local_timezone(owned_instance):
+  """Return the local timezone of a model instance's owning user.
+
+  The request user's timezone is reused when they own the instance, without
+  dereferencing the instance's user.
+
+  :param owned_instance: A model instance with a `user` foreign key
+  :type owned_instance: :class:`django.db.models.Model`
+
+  :returns: A local timezone instance
+  :rtype: :class:`LocalTimezone`
+  """
+  context = _REQUEST_TIMEZONE.get()
+  if context is not None:
+    shared = context.resolve()
+    if shared is not None and shared.user_id == owned_instance.user_id:
+      return shared
+  return LocalTimezone(
+      owned_instance.user.timezone,
+      owned_instance.user_id,
+  )
@@ -0,0 +1,129 @@
+"""Test the request scoped timezone utilities."""
+
+from unittest.mock import Mock
+
+import pendulum
+import pytz
+from django.test import SimpleTestCase
+from freezegun import freeze_time
+
+from ..request_timezone import (
+    LocalTimezone,
+    RequestTimezone,
+    local_timezone,
+    request_timezone,
+)
+
+
+def mock_user(pk, zone):
+  return Mock(pk=pk, timezone=pytz.timezone(zone), is_authenticated=True)
+
+
+def mock_owned_instance(user):
+  return Mock(user_id=user.pk, user=user)
+
+
+@freeze_time("2020-01-14 03:00:00")
+class TestLocalTimezone(SimpleTestCase):
+  """Test the LocalTimezone class."""
+
+  def setUp(self):
+    self.zone = "America/Toronto"
+    self.local = LocalTimezone(pytz.timezone(self.zone), user_id=1)
+
+  def test_attributes(self):
+    self.assertEqual(self.local.zone, self.zone)
+    self.assertEqual(self.local.user_id, 1)
+    self.assertEqual(self.local.now, pendulum.now(tz=self.zone))
+
+  def test_start_of_day(self):
+    self.assertEqual(
+        self.local.start_of('day'),
+        pendulum.datetime(2020, 1, 13, tz=self.zone),
+    )
+
+  def test_start_of_month(self):
+    self.assertEqual(
+        self.local.start_of('month'),
+        pendulum.datetime(2020, 1, 1, tz=self.zone),
+    )
+
+  def test_start_of_is_memoized(self):
+    self.assertIs(self.local.start_of('week'), self.local.start_of('week'))
+
+  def test_from_zone_string(self):
+    local = LocalTimezone.from_zone(self.zone)
+
+    self.assertEqual(local.zone, self.zone)
+    self.assertIsNone(local.user_id)
+
+  def test_from_zone_local_timezone(self):
+    self.assertIs(LocalTimezone.from_zone(self.local), self.local)
+
+
+class TestRequestTimezone(SimpleTestCase):
+  """Test the RequestTimezone class."""
+
+  def test_resolves_once(self):
+    get_user = Mock(return_value=mock_user(1, "Asia/Tokyo"))
+    context = RequestTimezone(get_user)
+
+    self.assertIs(context.resolve(), context.resolve())
+    self.assertEqual(context.resolve().zone, "Asia/Tokyo")
+    get_user.assert_called_once_with()
+
+  def test_anonymous_user(self):
+    get_user = Mock(return_value=Mock(is_authenticated=False))
+    context = RequestTimezone(get_user)
+
+    self.assertIsNone(context.resolve())
+
+  def test_no_user(self):
+    context = RequestTimezone(Mock(return_value=None))
+
+    self.assertIsNone(context.resolve())
+
+
+class TestLocalTimezoneFunction(SimpleTestCase):
+  """Test the local_timezone function."""
+
+  def setUp(self):
+    self.user1 = mock_user(1, "Asia/Tokyo")
+    self.user2 = mock_user(2, "America/Toronto")
+
+  def test_without_context(self):
+    local = local_timezone(mock_owned_instance(self.user1))
+
+    self.assertEqual(local.zone, "Asia/Tokyo")
+    self.assertEqual(local.user_id, self.user1.pk)
+
+  def test_shared_within_context(self):
+    with request_timezone(lambda: self.user1):
+      local1 = local_timezone(mock_owned_instance(self.user1))
+      local2 = local_timezone(mock_owned_instance(self.user1))
+
+    self.assertIs(local1, local2)
+
+  def test_shared_without_dereferencing_user(self):
+    instance = Mock(user_id=self.user1.pk, spec=['user_id'])
+
+    with request_timezone(lambda: self.user1):
+      local = local_timezone(instance)
+
+    self.assertEqual(local.zone, "Asia/Tokyo")
+
+  def test_other_users_within_context(self):
+    with request_timezone(lambda: self.user1):
+      local = local_timezone(mock_owned_instance(self.user2))
+
+    self.assertEqual(local.zone, "America/Toronto")
+    self.assertEqual(local.user_id, self.user2.pk)
+
+  def test_context_is_reset(self):
+    with request_timezone(lambda: self.user1):
+      pass
+
+    self.assertIsNot(
+        local_timezone(mock_owned_instance(self.user1)),
+        local_timezone(mock_owned_instance(self.user1)),
+    )
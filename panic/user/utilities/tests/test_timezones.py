@@ -1,9 +1,12 @@
 """Test the timezone utilities."""
 
+import hashlib
+import json
+
 import pytz
 from django.test import TestCase
 
-from ..timezones import generate_timezones
+from ..timezones import TimezoneCatalogue, generate_timezones
 
 
 class TestGenerateTimezones(TestCase):
@@ -21,3 +24,40 @@ class TestGenerateTimezones(TestCase):
           },
           generated,
       )
+
+
+class TestTimezoneCatalogue(TestCase):
+  """Test the TimezoneCatalogue class."""
+
+  def setUp(self):
+    self.catalogue = TimezoneCatalogue()
+
+  def test_payload(self):
+    self.assertEqual(
+        json.loads(self.catalogue.payload),
+        list(generate_timezones()),
+    )
+
+  def test_etag(self):
+    self.assertEqual(
+        self.catalogue.etag,
+        '"%s"' % hashlib.sha1(self.catalogue.payload).hexdigest(),
+    )
+
+  def test_search_ignores_case(self):
+    names = [timezone["name"] for timezone in self.catalogue.search("EUROPE/")]
+
+    self.assertEqual(
+        names,
+        [name for name in pytz.common_timezones if name.startswith("Europe/")],
+    )
+
+  def test_search_keeps_ids(self):
+    for timezone in self.catalogue.search("asia/t"):
+      self.assertEqual(
+          pytz.common_timezones[timezone["id"]],
+          timezone["name"],
+      )
+
+  def test_search_no_match(self):
+    self.assertListEqual(self.catalogue.search("zzz"), [])
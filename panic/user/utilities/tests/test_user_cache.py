@@ -0,0 +1,77 @@
+"""Test the UserCache class."""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from .. import user_cache
+from ..user_cache import UserCache
+
+User = get_user_model()
+
+
+class TestUserCache(TestCase):
+  """Test the UserCache class."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.user1 = User.objects.create_user(
+        username="testuser1",
+        email="test1@niallbyrne.ca",
+        password="test123",
+        timezone="America/Toronto",
+    )
+    cls.user2 = User.objects.create_user(
+        username="testuser2",
+        email="test2@niallbyrne.ca",
+        password="test123",
+    )
+
+  def setUp(self):
+    self.cache = UserCache(ttl=60, max_size=1)
+
+  def test_get_missing(self):
+    self.assertIsNone(self.cache.get(User, self.user1.pk))
+
+  def test_get_cached(self):
+    self.cache.set(self.user1)
+
+    with self.assertNumQueries(0):
+      cached = self.cache.get(User, self.user1.pk)
+
+    self.assertEqual(cached, self.user1)
+    self.assertIsNot(cached, self.user1)
+    self.assertEqual(cached.timezone, self.user1.timezone)
+    self.assertEqual(cached.password, self.user1.password)
+    self.assertFalse(cached._state.adding)  # pylint: disable=protected-access
+
+  @patch(user_cache.__name__ + ".time.monotonic")
+  def test_get_expired(self, m_monotonic):
+    m_monotonic.return_value = 100
+    self.cache.set(self.user1)
+
+    m_monotonic.return_value = 160
+
+    self.assertIsNone(self.cache.get(User, self.user1.pk))
+
+  def test_set_evicts_least_recently_used(self):
+    self.cache.set(self.user1)
+    self.cache.set(self.user2)
+
+    self.assertIsNone(self.cache.get(User, self.user1.pk))
+    self.assertEqual(self.cache.get(User, self.user2.pk), self.user2)
+
+  def test_invalidate(self):
+    self.cache.set(self.user1)
+
+    self.cache.invalidate(self.user1.pk)
+
+    self.assertIsNone(self.cache.get(User, self.user1.pk))
+
+  def test_clear(self):
+    self.cache.set(self.user1)
+
+    self.cache.clear()
+
+    self.assertIsNone(self.cache.get(User, self.user1.pk))
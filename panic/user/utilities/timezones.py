@@ -1,5 +1,9 @@
 """Timezone utilities."""
 
+import bisect
+import hashlib
+import json
+
 import pytz
 
 
@@ -10,3 +14,63 @@ def generate_timezones():
 
   for index, timezone in enumerate(timezones):
     yield {"id": index, "name": timezone}
+
+
+class TimezoneCatalogue:
+  """A precomputed, encoded catalogue of Timezones.
+
+  The full catalogue is encoded once, and prefix searches are served from an
+  in-memory sorted index of the lower case Timezone names.
+  """
+
+  def __init__(self):
+    self.timezones = list(generate_timezones())
+    self.payload = self.encode(self.timezones)
+    self.etag = self.create_etag(self.payload)
+    self._index = sorted((timezone["name"].lower(), timezone["id"])
+                         for timezone in self.timezones)
+
+  @staticmethod
+  def encode(timezones):
+    """Encode a list of Timezones as JSON bytes.
+
+    :param timezones: The Timezones to encode
+    :type timezones: List[dict]
+
+    :returns: The encoded Timezones
+    :rtype: bytes
+    """
+    return json.dumps(timezones, separators=(",", ":")).encode("utf-8")
+
+  @staticmethod
+  def create_etag(payload):
+    """Create a strong ETag for an encoded payload.
+
+    :param payload: The encoded payload
+    :type payload: bytes
+
+    :returns: A quoted ETag value
+    :rtype: str
+    """
+    return '"%s"' % hashlib.sha1(payload).hexdigest()
+
+  def search(self, prefix):
+    """Return the Timezones whose names start with a prefix, ignoring case.
+
+    :param prefix: The prefix to search for
+    :type prefix: str
+
+    :returns: The matching Timezones, in catalogue order
+    :rtype: List[dict]
+    """
+    prefix = prefix.lower()
+    start = bisect.bisect_left(self._index, (prefix,))
+    matches = []
+    for name, timezone_id in self._index[start:]:
+      if not name.startswith(prefix):
+        break
+      matches.append(timezone_id)
+    return [self.timezones[timezone_id] for timezone_id in sorted(matches)]
+
+
+TIMEZONE_CATALOGUE = TimezoneCatalogue()
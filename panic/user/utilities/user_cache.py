@@ -0,0 +1,84 @@
+"""A small in-process cache of authenticated users."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+class UserCache:
+  """A thread safe, least recently used cache of users, with a TTL.
+
+  Only field values are cached, and each lookup builds a new model instance,
+  so requests never share a mutable user object.
+
+  :param ttl: The number of seconds a cached user remains valid
+  :type ttl: float
+  :param max_size: The maximum number of cached users
+  :type max_size: int
+  """
+
+  def __init__(self, ttl, max_size):
+    self.ttl = ttl
+    self.max_size = max_size
+    self._entries = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, model, user_id):
+    """Return a cached user, if it is present and has not expired.
+
+    :param model: The user model class
+    :type model: :class:`user.models.user.User`
+    :param user_id: The pk of the user
+    :type user_id: int
+
+    :returns: A new user instance, or None
+    :rtype: :class:`user.models.user.User`, None
+    """
+    with self._lock:
+      entry = self._entries.get(user_id)
+      if entry is None:
+        return None
+      expires, field_names, values = entry
+      if expires <= time.monotonic():
+        del self._entries[user_id]
+        return None
+      self._entries.move_to_end(user_id)
+    return model.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+  def set(self, user):
+    """Cache the field values of a user.
+
+    :param user: A django user object
+    :type user: :class:`user.models.user.User`
+    """
+    field_names = tuple(field.attname for field in user._meta.concrete_fields)
+    values = tuple(getattr(user, name) for name in field_names)
+    with self._lock:
+      self._entries[user.pk] = (
+          time.monotonic() + self.ttl,
+          field_names,
+          values,
+      )
+      self._entries.move_to_end(user.pk)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+
+  def invalidate(self, user_id):
+    """Discard a cached user.
+
+    :param user_id: The pk of the user
+    :type user_id: int
+    """
+    with self._lock:
+      self._entries.pop(user_id, None)
+
+  def clear(self):
+    """Discard all cached users."""
+    with self._lock:
+      self._entries.clear()
+
+
+USER_CACHE = UserCache(settings.USER_CACHE_TTL, settings.USER_CACHE_MAX_SIZE)
@@ -1,22 +1,53 @@
 """Views for the user app."""
 
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .serializers.timezones import TimezoneSerializer
-from .utilities.timezones import generate_timezones
+from .utilities.timezones import TIMEZONE_CATALOGUE
+
+JSON_CONTENT_TYPE = "application/json"
 
 
 class TimeZones(APIView):
   """User Timezones API view."""
 
   @swagger_auto_schema(
+      manual_parameters=[
+          openapi.Parameter(
+              'q',
+              openapi.IN_QUERY,
+              description="Filter Timezones by a name prefix (ignores case).",
+              type=openapi.TYPE_STRING,
+          ),
+      ],
       responses={status.HTTP_200_OK: TimezoneSerializer(many=True)},
   )
-  def get(self, request):  # pylint: disable=unused-argument
+  def get(self, request):
     """User Timezones API view."""
 
-    serialized = TimezoneSerializer(generate_timezones(), many=True)
-    return Response(serialized.data)
+    prefix = request.query_params.get('q')
+    if prefix:
+      payload = TIMEZONE_CATALOGUE.encode(TIMEZONE_CATALOGUE.search(prefix))
+      etag = TIMEZONE_CATALOGUE.create_etag(payload)
+    else:
+      payload = TIMEZONE_CATALOGUE.payload
+      etag = TIMEZONE_CATALOGUE.etag
+
+    if etag in request.headers.get('If-None-Match', ''):
+      response = HttpResponseNotModified()
+    else:
+      response = HttpResponse(payload, content_type=JSON_CONTENT_TYPE)
+
+    response['ETag'] = etag
+    patch_cache_control(
+        response,
+        private=True,
+        max_age=settings.TIMEZONE_CACHE_MAX_AGE,
+    )
+    return response
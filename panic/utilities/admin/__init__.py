@@ -0,0 +1,8 @@
+"""Admin models for the utilities app."""
+
+from django.contrib import admin
+
+from ..models.request_profile import RequestProfile
+from .request_profile_modeladmin import RequestProfileModelAdmin
+
+admin.site.register(RequestProfile, RequestProfileModelAdmin)
@@ -0,0 +1,151 @@
+"""ModelAdmin for the RequestProfile model."""
+
+import json
+
+from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+PROFILE_CONTENT_TYPE = "application/octet-stream"
+PROFILE_FILENAME = "request-profile-{id}.prof"
+QUERIES_CONTENT_TYPE = "application/json"
+QUERIES_FILENAME = "request-profile-{id}-queries.json"
+
+
+class RequestProfileModelAdmin(admin.ModelAdmin):
+  """ModelAdmin for the RequestProfile model."""
+
+  date_hierarchy = 'created'
+  list_display = (
+      'created',
+      'user',
+      'method',
+      'path',
+      'status_code',
+      'duration_ms',
+      'query_count',
+  )
+  list_filter = ('method', 'status_code')
+  search_fields = ('path', 'user__username', 'user__email')
+  fieldsets = (
+      (
+          'Request',
+          {
+              'fields': (
+                  'created',
+                  'user',
+                  'method',
+                  'path',
+                  'status_code',
+              )
+          },
+      ),
+      (
+          'Profile',
+          {
+              'fields': (
+                  'duration_ms',
+                  'query_count',
+                  'query_time_ms',
+                  'downloads',
+                  'formatted_summary',
+              )
+          },
+      ),
+  )
+  readonly_fields = (
+      'created',
+      'user',
+      'method',
+      'path',
+      'status_code',
+      'duration_ms',
+      'query_count',
+      'query_time_ms',
+      'downloads',
+      'formatted_summary',
+  )
+
+  def has_add_permission(self, request):
+    """Request profiles are only created by profiling requests."""
+    return False
+
+  def has_change_permission(self, request, obj=None):
+    """Request profiles are read only."""
+    return False
+
+  def get_urls(self):
+    """Add the download views to the admin's urls."""
+    info = self.model._meta.app_label, self.model._meta.model_name
+    return [
+        path(
+            '<path:object_id>/download/profile/',
+            self.admin_site.admin_view(self.download_profile),
+            name='%s_%s_download_profile' % info,
+        ),
+        path(
+            '<path:object_id>/download/queries/',
+            self.admin_site.admin_view(self.download_queries),
+            name='%s_%s_download_queries' % info,
+        ),
+    ] + super().get_urls()
+
+  def download_profile(self, request, object_id):
+    """Download a request's cProfile statistics, for use with pstats."""
+    instance = self.get_downloadable(request, object_id)
+    return self.attachment(
+        bytes(instance.profile),
+        PROFILE_CONTENT_TYPE,
+        PROFILE_FILENAME.format(id=instance.id),
+    )
+
+  def download_queries(self, request, object_id):
+    """Download a request's SQL timeline, as JSON."""
+    instance = self.get_downloadable(request, object_id)
+    return self.attachment(
+        json.dumps(instance.queries, indent=2),
+        QUERIES_CONTENT_TYPE,
+        QUERIES_FILENAME.format(id=instance.id),
+    )
+
+  def get_downloadable(self, request, object_id):
+    """Retrieve a request profile the user is allowed to download."""
+    instance = get_object_or_404(self.model, pk=object_id)
+    if not self.has_view_permission(request, instance):
+      raise PermissionDenied
+    return instance
+
+  @staticmethod
+  def attachment(content, content_type, filename):
+    """Create a response downloading content as a file."""
+    response = HttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = 'attachment; filename="%s"' % filename
+    return response
+
+  @admin.display(description='Duration (ms)', ordering='duration')
+  def duration_ms(self, instance):
+    """Retrieve the request duration in milliseconds."""
+    return round(instance.duration * 1000, 2)
+
+  @admin.display(description='Query time (ms)')
+  def query_time_ms(self, instance):
+    """Retrieve the total query time in milliseconds."""
+    return round(instance.query_time * 1000, 2)
+
+  @admin.display(description='Downloads')
+  def downloads(self, instance):
+    """Retrieve links to download the profile and SQL timeline."""
+    info = self.model._meta.app_label, self.model._meta.model_name
+    return format_html(
+        '<a href="{}">cProfile statistics</a> | <a href="{}">SQL timeline</a>',
+        reverse('admin:%s_%s_download_profile' % info, args=[instance.id]),
+        reverse('admin:%s_%s_download_queries' % info, args=[instance.id]),
+    )
+
+  @admin.display(description='Summary')
+  def formatted_summary(self, instance):
+    """Retrieve the profile summary, preformatted."""
+    return format_html('<pre>{}</pre>', instance.summary)
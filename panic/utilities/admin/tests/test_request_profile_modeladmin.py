@@ -0,0 +1,118 @@
+"""Test the ModelAdmin for the RequestProfile model."""
+
+import json
+import marshal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from ...models.request_profile import RequestProfile
+
+PROFILE_STATS = {("module.py", 1, "function"): (1, 1, 0.1, 0.1, {})}
+QUERIES = [{
+    "database": "default",
+    "start_ms": 1.0,
+    "duration_ms": 2.0,
+    "sql": "SELECT 1",
+}]
+
+
+class TestRequestProfileModelAdmin(TestCase):
+  """Test the RequestProfileModelAdmin class."""
+
+  @classmethod
+  def setUpTestData(cls):
+    cls.superuser = get_user_model().objects.create_superuser(
+        username="superuser",
+        email="superuser@niallbyrne.ca",
+        password="test123",
+    )
+    cls.staff = get_user_model().objects.create_user(
+        username="staff_user",
+        email="staff_user@niallbyrne.ca",
+        password="test123",
+        is_staff=True,
+    )
+    cls.request_profile = RequestProfile.objects.create(
+        duration=0.0125,
+        method="GET",
+        path="/api/v1/items/",
+        profile=marshal.dumps(PROFILE_STATS),
+        queries=QUERIES,
+        query_count=1,
+        query_time=0.002,
+        status_code=200,
+        summary="<summary>",
+        user=cls.superuser,
+    )
+
+  def setUp(self):
+    self.client.force_login(self.superuser)
+
+  def admin_url(self, name, *args):
+    return reverse("admin:utilities_requestprofile_" + name, args=args)
+
+  def test_changelist(self):
+    response = self.client.get(self.admin_url("changelist"))
+
+    self.assertEqual(response.status_code, 200)
+    self.assertContains(response, "/api/v1/items/")
+
+  def test_change_view_is_read_only(self):
+    response = self.client.get(
+        self.admin_url("change", self.request_profile.id)
+    )
+
+    self.assertEqual(response.status_code, 200)
+    self.assertContains(response, "12.5")
+    self.assertContains(response, "<pre>&lt;summary&gt;</pre>", html=True)
+    self.assertContains(
+        response,
+        self.admin_url("download_profile", self.request_profile.id),
+    )
+    self.assertNotContains(response, 'name="_save"')
+
+  def test_add_view_is_disabled(self):
+    response = self.client.get(self.admin_url("add"))
+
+    self.assertEqual(response.status_code, 403)
+
+  def test_download_profile(self):
+    response = self.client.get(
+        self.admin_url("download_profile", self.request_profile.id)
+    )
+
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(
+        response["Content-Disposition"],
+        'attachment; filename="request-profile-%s.prof"' %
+        self.request_profile.id,
+    )
+    self.assertEqual(marshal.loads(response.content), PROFILE_STATS)
+
+  def test_download_queries(self):
+    response = self.client.get(
+        self.admin_url("download_queries", self.request_profile.id)
+    )
+
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(
+        response["Content-Disposition"],
+        'attachment; filename="request-profile-%s-queries.json"' %
+        self.request_profile.id,
+    )
+    self.assertEqual(json.loads(response.content), QUERIES)
+
+  def test_download_not_found(self):
+    response = self.client.get(self.admin_url("download_profile", 0))
+
+    self.assertEqual(response.status_code, 404)
+
+  def test_download_without_permission(self):
+    self.client.force_login(self.staff)
+
+    for name in ("download_profile", "download_queries"):
+      response = self.client.get(self.admin_url(name, self.request_profile.id))
+
+      self.assertEqual(response.status_code, 403)
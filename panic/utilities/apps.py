@@ -1,9 +1,18 @@
 """AppConfig for the utilities app."""
 
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class UtilitiesConfig(AppConfig):
   """AppConfig for the utilities app."""
 
   name = 'utilities'
+
+  def ready(self):
+    """Validate the replica, and record the queries of every connection."""
+    # pylint: disable=import-outside-toplevel
+    from .database.routers import validate_replica_configuration
+    from .metrics.queries import install_request_recorder
+    validate_replica_configuration()
+    connection_created.connect(install_request_recorder)
@@ -0,0 +1,113 @@
+"""Thread pools for running synchronous database code from async views."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+POOL_QUERIES = "queries"
+POOL_VIEWS = "views"
+
+_EXECUTORS = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def get_executor(pool):
+  """Return the process wide thread pool with the specified name.
+
+  Each pool is sized by its entry in the `ASYNC_THREADS` setting.  Every
+  thread holds its own persistent database connection.
+
+  :param pool: The name of the thread pool
+  :type pool: str
+
+  :returns: The thread pool
+  :rtype: :class:`concurrent.futures.ThreadPoolExecutor`
+  """
+  with _EXECUTORS_LOCK:
+    if pool not in _EXECUTORS:
+      size = settings.ASYNC_THREADS[pool]
+      _EXECUTORS[pool] = (
+          ThreadPoolExecutor(
+              max_workers=size,
+              thread_name_prefix="async-%s" % pool,
+          ),
+          size,
+      )
+    return _EXECUTORS[pool][0]
+
+
+def close_connections(executor, size):
+  """Close the database connections of each of a thread pool's threads.
+
+  :param executor: The thread pool
+  :type executor: :class:`concurrent.futures.ThreadPoolExecutor`
+  :param size: The maximum number of threads in the pool
+  :type size: int
+  """
+  # Every task waits for the others, so each runs on a separate thread.
+  barrier = threading.Barrier(size)
+
+  def close():
+    barrier.wait()
+    connections.close_all()
+
+  for future in [executor.submit(close) for _ in range(size)]:
+    future.result()
+
+
+def shutdown_executors():
+  """Close the database connections of every pool's threads, and stop them.
+
+  Pools are created again when they're next used.
+  """
+  with _EXECUTORS_LOCK:
+    executors = list(_EXECUTORS.values())
+    _EXECUTORS.clear()
+
+  for executor, size in executors:
+    close_connections(executor, size)
+    executor.shutdown(wait=True)
+
+
+def database_sync_to_async(func, pool=POOL_QUERIES):
+  """Adapt a function using the ORM, to be awaited from async code.
+
+  Django 3.2 has no asynchronous ORM, so each query blocks a thread.  The
+  function runs on a thread of the named pool, instead of the single thread
+  `sync_to_async` shares with all other sync code by default, so concurrent
+  requests query in parallel.  Stale connections are closed before and after
+  the call, as the request signals would for a synchronous request.
+
+  Views and the queries they wait on use separate pools, so a pool full of
+  waiting views can't deadlock.
+
+  :param func: The synchronous function
+  :type func: func
+  :param pool: The name of the thread pool to run the function on
+  :type pool: str
+
+  :returns: An awaitable version of the function
+  :rtype: func
+  """
+
+  @wraps(func)
+  def run_with_connections(*args, **kwargs):
+    close_old_connections()
+    try:
+      return func(*args, **kwargs)
+    finally:
+      close_old_connections()
+
+  async def run_on_executor(*args, **kwargs):
+    awaitable = sync_to_async(
+        run_with_connections,
+        thread_sensitive=False,
+        executor=get_executor(pool),
+    )
+    return await awaitable(*args, **kwargs)
+
+  return run_on_executor
@@ -0,0 +1,85 @@
+"""ASGI handlers for serving async views concurrently."""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+SYNC_MIDDLEWARE_ERROR = "Middleware %s is not async capable."
+
+
+class AsyncMiddlewareHandler(ASGIHandler):
+  """An ASGI handler with its own chain of async capable middleware.
+
+  Django runs any sync only middleware on the single thread it shares with
+  all other sync code, which serializes every request passing through it.
+  This handler loads `ASYNC_MIDDLEWARE` in place of `MIDDLEWARE`, so async
+  views are served concurrently.
+  """
+
+  def load_middleware(self, is_async=False):
+    """Populate the middleware chain from the `ASYNC_MIDDLEWARE` setting.
+
+    :param is_async: Ignored, the chain is always asynchronous
+    :type is_async: bool
+    """
+    self._view_middleware = []
+    self._template_response_middleware = []
+    self._exception_middleware = []
+
+    handler = convert_exception_to_response(self._get_response_async)
+    for middleware_path in reversed(settings.ASYNC_MIDDLEWARE):
+      middleware = import_string(middleware_path)
+      if not getattr(middleware, "async_capable", False):
+        raise ImproperlyConfigured(SYNC_MIDDLEWARE_ERROR % middleware_path)
+      instance = middleware(handler)
+
+      if hasattr(instance, "process_view"):
+        self._view_middleware.insert(
+            0,
+            self.adapt_method_mode(True, instance.process_view),
+        )
+      if hasattr(instance, "process_template_response"):
+        self._template_response_middleware.append(
+            self.adapt_method_mode(True, instance.process_template_response),
+        )
+      if hasattr(instance, "process_exception"):
+        self._exception_middleware.append(
+            self.adapt_method_mode(False, instance.process_exception),
+        )
+      handler = convert_exception_to_response(instance)
+
+    self._middleware_chain = handler
+
+
+class PathPrefixRouter:
+  """Route the HTTP requests under a path prefix to a separate application.
+
+  :param prefix: The path prefix of the routed requests
+  :type prefix: str
+  :param prefixed: The ASGI application serving the routed requests
+  :type prefixed: func
+  :param default: The ASGI application serving all other connections
+  :type default: func
+  """
+
+  def __init__(self, prefix, prefixed, default):
+    self.prefix = prefix
+    self.prefixed = prefixed
+    self.default = default
+
+  async def __call__(self, scope, receive, send):
+    """Pass an ASGI connection to the application serving its path.
+
+    :param scope: The ASGI connection scope
+    :type scope: dict
+    :param receive: The ASGI receive channel
+    :type receive: func
+    :param send: The ASGI send channel
+    :type send: func
+    """
+    application = self.default
+    if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+      application = self.prefixed
+    return await application(scope, receive, send)
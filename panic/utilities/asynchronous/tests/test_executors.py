@@ -0,0 +1,83 @@
+"""Test the thread pools for synchronous database code."""
+
+import threading
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+
+from .. import executors
+from ..executors import (
+    POOL_QUERIES,
+    POOL_VIEWS,
+    database_sync_to_async,
+    get_executor,
+    shutdown_executors,
+)
+
+
+def current_thread_name():
+  return threading.current_thread().name
+
+
+class TestGetExecutor(SimpleTestCase):
+  """Test the get_executor function."""
+
+  def test_same_pool_is_reused(self):
+    self.assertIs(get_executor(POOL_QUERIES), get_executor(POOL_QUERIES))
+
+  def test_pools_are_separate(self):
+    self.assertIsNot(get_executor(POOL_QUERIES), get_executor(POOL_VIEWS))
+
+
+class TestShutdownExecutors(SimpleTestCase):
+  """Test the shutdown_executors function."""
+
+  @override_settings(ASYNC_THREADS={POOL_QUERIES: 2, POOL_VIEWS: 1})
+  @patch(executors.__name__ + ".connections")
+  def test_closes_connections_of_each_thread(self, m_connections):
+    shutdown_executors()
+    m_connections.reset_mock()
+    executor = get_executor(POOL_QUERIES)
+    get_executor(POOL_VIEWS)
+
+    shutdown_executors()
+
+    self.assertEqual(m_connections.close_all.call_count, 3)
+    self.assertIsNot(get_executor(POOL_QUERIES), executor)
+    shutdown_executors()
+
+
+@patch(executors.__name__ + ".close_old_connections")
+class TestDatabaseSyncToAsync(SimpleTestCase):
+  """Test the database_sync_to_async function."""
+
+  def test_runs_on_queries_pool(self, _):
+    run = database_sync_to_async(current_thread_name)
+
+    self.assertRegex(async_to_sync(run)(), r"^async-queries")
+
+  def test_runs_on_named_pool(self, _):
+    run = database_sync_to_async(current_thread_name, pool=POOL_VIEWS)
+
+    self.assertRegex(async_to_sync(run)(), r"^async-views")
+
+  def test_passes_arguments(self, _):
+    run = database_sync_to_async(lambda *args, **kwargs: (args, kwargs))
+
+    self.assertEqual(async_to_sync(run)(1, key=2), ((1,), {"key": 2}))
+
+  def test_closes_old_connections(self, m_close):
+    async_to_sync(database_sync_to_async(current_thread_name))()
+
+    self.assertEqual(m_close.call_count, 2)
+
+  def test_closes_old_connections_on_exception(self, m_close):
+
+    def fail():
+      raise ValueError
+
+    with self.assertRaises(ValueError):
+      async_to_sync(database_sync_to_async(fail))()
+
+    self.assertEqual(m_close.call_count, 2)
@@ -0,0 +1,76 @@
+"""Test the ASGI handlers for async views."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from ..handlers import (
+    SYNC_MIDDLEWARE_ERROR,
+    AsyncMiddlewareHandler,
+    PathPrefixRouter,
+)
+
+ASYNC_MIDDLEWARE = [
+    'utilities.metrics.middleware.QueryMetricsMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+]
+SYNC_MIDDLEWARE = 'allauth.account.middleware.AccountMiddleware'
+
+
+class TestAsyncMiddlewareHandler(SimpleTestCase):
+  """Test the AsyncMiddlewareHandler class."""
+
+  @override_settings(ASYNC_MIDDLEWARE=ASYNC_MIDDLEWARE)
+  def test_loads_async_middleware(self):
+    handler = AsyncMiddlewareHandler()
+
+    # pylint: disable=protected-access
+    self.assertTrue(asyncio.iscoroutinefunction(handler._middleware_chain))
+    self.assertEqual(len(handler._view_middleware), 1)
+
+  @override_settings(ASYNC_MIDDLEWARE=ASYNC_MIDDLEWARE + [SYNC_MIDDLEWARE])
+  def test_rejects_sync_middleware(self):
+    with self.assertRaisesMessage(
+        ImproperlyConfigured,
+        SYNC_MIDDLEWARE_ERROR % SYNC_MIDDLEWARE,
+    ):
+      AsyncMiddlewareHandler()
+
+
+class TestPathPrefixRouter(SimpleTestCase):
+  """Test the PathPrefixRouter class."""
+
+  def setUp(self):
+    self.prefixed = AsyncMock()
+    self.default = AsyncMock()
+    self.router = PathPrefixRouter("/async/", self.prefixed, self.default)
+
+  def route(self, scope):
+    async_to_sync(self.router)(scope, "receive", "send")
+
+  def test_prefixed_http(self):
+    scope = {"type": "http", "path": "/async/items/"}
+
+    self.route(scope)
+
+    self.prefixed.assert_awaited_once_with(scope, "receive", "send")
+    self.default.assert_not_called()
+
+  def test_other_http(self):
+    scope = {"type": "http", "path": "/items/"}
+
+    self.route(scope)
+
+    self.default.assert_awaited_once_with(scope, "receive", "send")
+    self.prefixed.assert_not_called()
+
+  def test_other_scope(self):
+    scope = {"type": "lifespan"}
+
+    self.route(scope)
+
+    self.default.assert_awaited_once_with(scope, "receive", "send")
+    self.prefixed.assert_not_called()
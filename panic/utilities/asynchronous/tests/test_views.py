@@ -0,0 +1,53 @@
+"""Test the async view adapter."""
+
+import threading
+from unittest.mock import Mock
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from ..views import async_view
+
+
+class TestAsyncView(SimpleTestCase):
+  """Test the async_view function."""
+
+  def setUp(self):
+    self.request = RequestFactory().get("/")
+
+  def test_runs_view_on_views_pool(self):
+
+    def view(request):  # pylint: disable=unused-argument
+      return HttpResponse(threading.current_thread().name)
+
+    response = async_to_sync(async_view(view))(self.request)
+
+    self.assertRegex(response.content.decode(), r"^async-views")
+
+  def test_passes_arguments(self):
+    response = HttpResponse()
+    view = Mock(return_value=response)
+
+    result = async_to_sync(async_view(view))(self.request, pk=1)
+
+    self.assertIs(result, response)
+    view.assert_called_once_with(self.request, pk=1)
+
+  def test_renders_response(self):
+    response = Mock()
+    view = Mock(return_value=response)
+
+    async_to_sync(async_view(view))(self.request)
+
+    response.render.assert_called_once_with()
+
+  def test_csrf_exempt(self):
+    view = Mock(csrf_exempt=True)
+
+    self.assertTrue(async_view(view).csrf_exempt)
+
+  def test_not_csrf_exempt(self):
+    view = Mock(spec=[])
+
+    self.assertFalse(async_view(view).csrf_exempt)
@@ -0,0 +1,32 @@
+"""Adapt synchronous views to be served asynchronously."""
+
+from .executors import POOL_VIEWS, database_sync_to_async
+
+
+def async_view(view):
+  """Adapt a synchronous view, such as a DRF view, into an async view.
+
+  The view runs on the views thread pool, and its response is rendered there
+  too.  The adapted view keeps the `csrf_exempt` marking of DRF views, but not
+  their `cls` attribute, so it's left out of the OpenAPI schema.
+
+  :param view: The synchronous view function, ie. from `as_view`
+  :type view: func
+
+  :returns: The asynchronous view function
+  :rtype: func
+  """
+
+  def render_view(request, *args, **kwargs):
+    response = view(request, *args, **kwargs)
+    if callable(getattr(response, "render", None)):
+      response.render()
+    return response
+
+  run = database_sync_to_async(render_view, pool=POOL_VIEWS)
+
+  async def view_async(request, *args, **kwargs):
+    return await run(request, *args, **kwargs)
+
+  view_async.csrf_exempt = getattr(view, "csrf_exempt", False)
+  return view_async
@@ -0,0 +1 @@
+"""PostgreSQL backend with connection health checks and optional pooling."""
@@ -0,0 +1,134 @@
+"""PostgreSQL database backend with health checks and optional pooling.
+
+Configure it with these additional keys in the database settings::
+
+    'CONN_HEALTH_CHECKS': True,
+    'POOL': {'MAX_SIZE': 10, 'TIMEOUT': 10},
+
+Health checks test a persistent connection before its first use in each
+request, and reconnect if it has failed.  A positive `POOL['MAX_SIZE']`
+enables a process wide connection pool: closed connections are returned to
+the pool instead of being disconnected, so `CONN_MAX_AGE` should be 0.
+"""
+
+from django.db.backends.postgresql import base, creation
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE as IDLE
+
+from ...pool import PoolTimeout, get_pool, remove_pools
+
+Database = base.Database
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+  """Closes pooled connections before dropping a test database."""
+
+  def _destroy_test_db(self, test_database_name, verbosity):
+    remove_pools(self.connection.alias)
+    super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+  """PostgreSQL database wrapper with health checks and optional pooling."""
+
+  creation_class = DatabaseCreation
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self.health_check_done = False
+    self.pool = None
+
+  @property
+  def health_check_enabled(self):
+    """Return True if persistent connections are checked before reuse.
+
+    :returns: A boolean indicating if health checks are enabled
+    :rtype: bool
+    """
+    return self.settings_dict.get('CONN_HEALTH_CHECKS', False)
+
+  def get_new_connection(self, conn_params):
+    """Open a new connection, or check one out from the pool.
+
+    :param conn_params: The connection parameters
+    :type conn_params: dict
+
+    :returns: A psycopg2 connection
+    :rtype: :class:`psycopg2.extensions.connection`
+    """
+    pool_settings = self.settings_dict.get('POOL') or {}
+    if pool_settings.get('MAX_SIZE', 0) <= 0:
+      return super().get_new_connection(conn_params)
+
+    self.pool = get_pool(
+        (self.alias,) + tuple(sorted(conn_params.items())),
+        pool_settings['MAX_SIZE'],
+        pool_settings.get('TIMEOUT', 10),
+    )
+    while True:
+      try:
+        connection = self.pool.checkout(
+            lambda: super(DatabaseWrapper, self).
+            get_new_connection(conn_params)
+        )
+      except PoolTimeout as exc:
+        raise Database.OperationalError(str(exc)) from exc
+      if not self.health_check_enabled or self.__is_healthy(connection):
+        break
+      self.pool.discard(connection)
+
+    self.isolation_level = self.settings_dict['OPTIONS'].get(
+        'isolation_level',
+        connection.isolation_level,
+    )
+    return connection
+
+  def connect(self):
+    """Connect to the database, marking the new connection as healthy."""
+    self.health_check_done = True
+    super().connect()
+
+  def ensure_connection(self):
+    """Check a persistent connection once per request, before it's reused."""
+    if (
+        self.connection is not None and self.health_check_enabled and
+        not self.health_check_done and not self.in_atomic_block
+    ):
+      self.health_check_done = True
+      if not self.is_usable():
+        self.close()
+    super().ensure_connection()
+
+  def close_if_unusable_or_obsolete(self):
+    """Close an unusable or expired connection, at a request boundary."""
+    super().close_if_unusable_or_obsolete()
+    self.health_check_done = False
+
+  def _close(self):
+    if self.pool is None or self.connection is None:
+      return super()._close()
+
+    if self.errors_occurred or not self.__reset(self.connection):
+      self.pool.discard(self.connection)
+    else:
+      self.pool.checkin(self.connection)
+    return None
+
+  @staticmethod
+  def __reset(connection):
+    if connection.closed:
+      return False
+    try:
+      if connection.info.transaction_status != IDLE:
+        connection.rollback()
+    except Database.Error:
+      return False
+    return connection.info.transaction_status == IDLE
+
+  @classmethod
+  def __is_healthy(cls, connection):
+    try:
+      with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    except Database.Error:
+      return False
+    return cls.__reset(connection)
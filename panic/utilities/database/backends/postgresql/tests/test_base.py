@@ -0,0 +1,143 @@
+"""Test the PostgreSQL database backend."""
+
+from django.db import connection
+from django.db.utils import InterfaceError, OperationalError
+from django.test import TestCase
+
+from .....database.pool import pool_stats, remove_pools
+from ..base import DatabaseWrapper
+
+TEST_ALIAS = "backend_test"
+
+
+class DatabaseWrapperTestHarness(TestCase):
+  """Test harness for the DatabaseWrapper class."""
+
+  health_checks = True
+  pool = None
+
+  def setUp(self):
+    self.wrappers = []
+
+  def tearDown(self):
+    for wrapper in self.wrappers:
+      wrapper.close()
+    remove_pools(TEST_ALIAS)
+
+  def create_wrapper(self):
+    settings_dict = dict(connection.settings_dict)
+    settings_dict['CONN_MAX_AGE'] = None
+    settings_dict['CONN_HEALTH_CHECKS'] = self.health_checks
+    settings_dict['POOL'] = self.pool
+    wrapper = DatabaseWrapper(settings_dict, TEST_ALIAS)
+    self.wrappers.append(wrapper)
+    return wrapper
+
+  @staticmethod
+  def query(wrapper):
+    with wrapper.cursor() as cursor:
+      cursor.execute("SELECT 1")
+      return cursor.fetchone()
+
+
+class TestHealthChecks(DatabaseWrapperTestHarness):
+  """Test the DatabaseWrapper class with health checks enabled."""
+
+  def test_reconnects_after_failure(self):
+    wrapper = self.create_wrapper()
+    self.query(wrapper)
+    failed = wrapper.connection
+    failed.close()
+
+    wrapper.close_if_unusable_or_obsolete()
+
+    self.assertEqual(self.query(wrapper), (1,))
+    self.assertIsNot(wrapper.connection, failed)
+
+  def test_reuses_healthy_connection(self):
+    wrapper = self.create_wrapper()
+    self.query(wrapper)
+    healthy = wrapper.connection
+
+    wrapper.close_if_unusable_or_obsolete()
+
+    self.assertEqual(self.query(wrapper), (1,))
+    self.assertIs(wrapper.connection, healthy)
+
+
+class TestWithoutHealthChecks(DatabaseWrapperTestHarness):
+  """Test the DatabaseWrapper class with health checks disabled."""
+
+  health_checks = False
+
+  def test_failure_is_raised(self):
+    wrapper = self.create_wrapper()
+    self.query(wrapper)
+    wrapper.connection.close()
+
+    wrapper.close_if_unusable_or_obsolete()
+
+    with self.assertRaises(InterfaceError):
+      self.query(wrapper)
+
+
+class TestPooled(DatabaseWrapperTestHarness):
+  """Test the DatabaseWrapper class with a connection pool."""
+
+  pool = {'MAX_SIZE': 1, 'TIMEOUT': 0.05}
+
+  def test_close_returns_connection_to_pool(self):
+    first = self.create_wrapper()
+    self.query(first)
+    pooled = first.connection
+    first.close()
+
+    second = self.create_wrapper()
+    self.query(second)
+
+    self.assertIs(second.connection, pooled)
+    self.assertEqual(pool_stats()[TEST_ALIAS]['checkouts'], 2)
+
+  def test_close_rolls_back_open_transaction(self):
+    first = self.create_wrapper()
+    first.set_autocommit(False)
+    self.query(first)
+    pooled = first.connection
+    first.close()
+
+    second = self.create_wrapper()
+    self.query(second)
+
+    self.assertIs(second.connection, pooled)
+
+  def test_close_discards_failed_connection(self):
+    first = self.create_wrapper()
+    self.query(first)
+    failed = first.connection
+    failed.close()
+    first.close()
+
+    second = self.create_wrapper()
+    self.query(second)
+
+    self.assertIsNot(second.connection, failed)
+    self.assertEqual(pool_stats()[TEST_ALIAS]['size'], 1)
+
+  def test_checkout_discards_unhealthy_connection(self):
+    first = self.create_wrapper()
+    self.query(first)
+    unhealthy = first.connection
+    first.pool.checkin(unhealthy)
+    first.connection = None
+    unhealthy.close()
+
+    second = self.create_wrapper()
+    self.query(second)
+
+    self.assertIsNot(second.connection, unhealthy)
+
+  def test_checkout_timeout(self):
+    self.query(self.create_wrapper())
+
+    with self.assertRaises(OperationalError):
+      self.query(self.create_wrapper())
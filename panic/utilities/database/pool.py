@@ -0,0 +1,182 @@
+"""An in-process database connection pool."""
+
+import threading
+from time import perf_counter
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class PoolTimeout(Exception):
+  """Raised when no pooled connection becomes available in time."""
+
+
+class ConnectionPool:
+  """A bounded, last in first out pool of open database connections.
+
+  Waiting for a connection blocks on a :class:`threading.Condition`, which
+  cooperatively yields to other greenlets when gevent has patched threading.
+
+  :param max_size: The maximum number of open connections
+  :type max_size: int
+  :param timeout: The number of seconds to wait for a connection
+  :type timeout: float
+  """
+
+  def __init__(self, max_size, timeout):
+    self.max_size = max_size
+    self.timeout = timeout
+    self._condition = threading.Condition()
+    self._idle = []
+    self._size = 0
+    self._checkouts = 0
+    self._waits = 0
+    self._wait_time_total = 0.0
+    self._wait_time_max = 0.0
+    self._timeouts = 0
+
+  def checkout(self, factory):
+    """Check out an idle connection, or open a new one if there is room.
+
+    :param factory: A callable that opens a new connection
+    :type factory: func
+
+    :returns: An open connection
+    :rtype: object
+
+    :raises: :class:`PoolTimeout`
+    """
+    start = perf_counter()
+    waited = 0.0
+    with self._condition:
+      while not self._idle and self._size >= self.max_size:
+        remaining = start + self.timeout - perf_counter()
+        if remaining <= 0:
+          self._timeouts += 1
+          raise PoolTimeout(
+              "No connection became available within %ss." % self.timeout
+          )
+        self._condition.wait(remaining)
+        waited = perf_counter() - start
+      self.__record_checkout(waited)
+      if self._idle:
+        return self._idle.pop()
+      self._size += 1
+
+    try:
+      return factory()
+    except BaseException:
+      self.__release()
+      raise
+
+  def checkin(self, connection):
+    """Return a healthy connection to the pool, for reuse.
+
+    :param connection: A connection checked out from this pool
+    :type connection: object
+    """
+    with self._condition:
+      self._idle.append(connection)
+      self._condition.notify()
+
+  def discard(self, connection):
+    """Close a connection checked out from this pool, freeing its place.
+
+    :param connection: A connection checked out from this pool
+    :type connection: object
+    """
+    try:
+      connection.close()
+    except Exception:  # pylint: disable=broad-except
+      pass
+    self.__release()
+
+  def close_all(self):
+    """Close all idle connections."""
+    with self._condition:
+      idle, self._idle = self._idle, []
+    for connection in idle:
+      self.discard(connection)
+
+  def stats(self):
+    """Return the pool's size and checkout wait metrics.
+
+    :returns: A dictionary of metrics
+    :rtype: dict
+    """
+    with self._condition:
+      return {
+          "max_size": self.max_size,
+          "size": self._size,
+          "idle": len(self._idle),
+          "in_use": self._size - len(self._idle),
+          "checkouts": self._checkouts,
+          "waits": self._waits,
+          "wait_time_total": self._wait_time_total,
+          "wait_time_max": self._wait_time_max,
+          "timeouts": self._timeouts,
+      }
+
+  def __record_checkout(self, waited):
+    self._checkouts += 1
+    if waited:
+      self._waits += 1
+      self._wait_time_total += waited
+      self._wait_time_max = max(self._wait_time_max, waited)
+
+  def __release(self):
+    with self._condition:
+      self._size -= 1
+      self._condition.notify()
+
+
+def get_pool(key, max_size, timeout):
+  """Return the process wide connection pool for a database.
+
+  :param key: A key identifying the database, starting with its alias
+  :type key: tuple
+  :param max_size: The maximum number of open connections
+  :type max_size: int
+  :param timeout: The number of seconds to wait for a connection
+  :type timeout: float
+
+  :returns: The connection pool
+  :rtype: :class:`ConnectionPool`
+  """
+  with _POOLS_LOCK:
+    if key not in _POOLS:
+      _POOLS[key] = ConnectionPool(max_size, timeout)
+    return _POOLS[key]
+
+
+def remove_pools(alias):
+  """Close and forget all connection pools for a database alias.
+
+  :param alias: The database alias
+  :type alias: str
+  """
+  with _POOLS_LOCK:
+    keys = [key for key in _POOLS if key[0] == alias]
+    pools = [_POOLS.pop(key) for key in keys]
+  for pool in pools:
+    pool.close_all()
+
+
+def pool_stats():
+  """Return the combined metrics of the connection pools, by database alias.
+
+  :returns: A dictionary of metrics, for each alias
+  :rtype: dict
+  """
+  with _POOLS_LOCK:
+    pools = list(_POOLS.items())
+  stats = {}
+  for key, pool in pools:
+    metrics = pool.stats()
+    combined = stats.setdefault(key[0], dict.fromkeys(metrics, 0))
+    for name, value in metrics.items():
+      if name == "wait_time_max":
+        combined[name] = max(combined[name], value)
+      else:
+        combined[name] += value
+  return stats
@@ -0,0 +1,171 @@
+"""Database routers."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_CACHE_KEY = "utilities:replica_pin:{user_id}"
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+)
+PROCESS_LOCAL_CACHE_ERROR = (
+    "The read replica needs a cache shared between processes to pin users "
+    "to the primary after writing.  Configure a shared backend for the "
+    "'{alias}' cache, or set DATABASE_REPLICA_PIN_CACHE to one."
+)
+
+_REPLICA_READS: ContextVar = ContextVar("replica_reads", default=None)
+
+
+def replica_alias():
+  """Return the alias of the read replica, if one is configured.
+
+  :returns: The database alias, or None
+  :rtype: str, None
+  """
+  alias = settings.DATABASE_REPLICA_ALIAS
+  if alias in settings.DATABASES:
+    return alias
+  return None
+
+
+def validate_replica_configuration():
+  """Refuse to read from a replica, unless the user pins are shared.
+
+  Pins stored in a process local cache would only apply to the process that
+  served the write, so other processes could serve stale reads.
+
+  :raises: :class:`django.core.exceptions.ImproperlyConfigured`
+  """
+  if replica_alias() is None:
+    return
+  alias = settings.DATABASE_REPLICA_PIN_CACHE
+  if settings.CACHES[alias]["BACKEND"] in PROCESS_LOCAL_CACHE_BACKENDS:
+    raise ImproperlyConfigured(PROCESS_LOCAL_CACHE_ERROR.format(alias=alias))
+
+
+def pin_to_primary(user_id):
+  """Send a user's reads to the primary database for a short while.
+
+  This gives the replica time to catch up with the user's own writes.
+
+  :param user_id: The pk of the user who has written
+  :type user_id: int
+  """
+  caches[settings.DATABASE_REPLICA_PIN_CACHE].set(
+      PIN_CACHE_KEY.format(user_id=user_id),
+      True,
+      settings.DATABASE_REPLICA_PIN_SECONDS,
+  )
+
+
+def is_pinned_to_primary(user_id):
+  """Return True if a user has recently written to the primary database.
+
+  :param user_id: The pk of the user
+  :type user_id: int
+
+  :returns: A boolean indicating if the user is pinned to the primary
+  :rtype: bool
+  """
+  return caches[settings.DATABASE_REPLICA_PIN_CACHE].get(
+      PIN_CACHE_KEY.format(user_id=user_id),
+      False,
+  )
+
+
+class ReplicaReads:
+  """Request scoped routing of reads to the read replica.
+
+  Reads are only routed to the replica once activated for a read-only
+  request, and only until the first write within it.
+  """
+
+  def __init__(self):
+    self.active = False
+    self.user_id = None
+    self._written = False
+
+  def activate(self, user_id, read_only):
+    """Identify the request user, and read from the replica if allowed.
+
+    :param user_id: The pk of the request user, if they are authenticated
+    :type user_id: int, None
+    :param read_only: A boolean indicating if the request is read-only
+    :type read_only: bool
+    """
+    self.user_id = user_id
+    if self._written:
+      self.__pin()
+    self.active = (
+        read_only and not self._written and replica_alias() is not None and
+        (user_id is None or not is_pinned_to_primary(user_id))
+    )
+
+  def written(self):
+    """Return to the primary, and pin the request user to it."""
+    self.active = False
+    if not self._written:
+      self._written = True
+      self.__pin()
+
+  def __pin(self):
+    if self.user_id is not None:
+      pin_to_primary(self.user_id)
+
+
+@contextmanager
+def replica_reads():
+  """Allow reads within this context to be routed to the read replica.
+
+  :returns: The context's routing state, which must be activated
+  :rtype: :class:`ReplicaReads`
+  """
+  context = ReplicaReads()
+  token = _REPLICA_READS.set(context)
+  try:
+    yield context
+  finally:
+    _REPLICA_READS.reset(token)
+
+
+class ReplicaRouter:
+  """Routes reads in activated read-only contexts to the read replica."""
+
+  def db_for_read(self, model, **hints):  # pylint: disable=unused-argument
+    """Return the read replica alias, when reading from it is allowed."""
+    context = _REPLICA_READS.get()
+    if context is None or not context.active:
+      return None
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+      return None
+    return replica_alias()
+
+  def db_for_write(self, model, **hints):  # pylint: disable=unused-argument
+    """Write to the primary, and pin the request user to it.
+
+    The primary is always returned, as Django would otherwise save instances
+    back to the database they were read from.
+    """
+    context = _REPLICA_READS.get()
+    if context is not None:
+      context.written()
+    return DEFAULT_DB_ALIAS
+
+  def allow_relation(self, obj1, obj2, **hints):  # pylint: disable=W0613
+    """Allow relations between the primary and its replica."""
+    databases = {DEFAULT_DB_ALIAS, replica_alias()}
+    if obj1._state.db in databases and obj2._state.db in databases:
+      return True
+    return None
+
+  def allow_migrate(self, db, app_label, **hints):  # pylint: disable=W0613
+    """Only migrate the primary, the replica mirrors it."""
+    if db == replica_alias():
+      return False
+    return None
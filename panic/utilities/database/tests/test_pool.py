@@ -0,0 +1,146 @@
+"""Test the database connection pool."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from ..pool import (
+    ConnectionPool,
+    PoolTimeout,
+    get_pool,
+    pool_stats,
+    remove_pools,
+)
+
+
+class TestConnectionPool(SimpleTestCase):
+  """Test the ConnectionPool class."""
+
+  def setUp(self):
+    self.pool = ConnectionPool(max_size=2, timeout=0.05)
+    self.factory = Mock(side_effect=lambda: Mock())
+
+  def test_checkout_opens_connections(self):
+    first = self.pool.checkout(self.factory)
+    second = self.pool.checkout(self.factory)
+
+    self.assertIsNot(first, second)
+    self.assertEqual(self.factory.call_count, 2)
+
+  def test_checkin_reuses_connections(self):
+    connection = self.pool.checkout(self.factory)
+    self.pool.checkin(connection)
+
+    self.assertIs(self.pool.checkout(self.factory), connection)
+    self.assertEqual(self.factory.call_count, 1)
+
+  def test_checkout_timeout(self):
+    self.pool.checkout(self.factory)
+    self.pool.checkout(self.factory)
+
+    with self.assertRaises(PoolTimeout):
+      self.pool.checkout(self.factory)
+
+    self.assertEqual(self.pool.stats()['timeouts'], 1)
+
+  def test_checkout_waits_for_checkin(self):
+    self.pool.timeout = 5
+    connection = self.pool.checkout(self.factory)
+    self.pool.checkout(self.factory)
+
+    def return_connection():
+      time.sleep(0.01)
+      self.pool.checkin(connection)
+
+    thread = threading.Thread(target=return_connection)
+    thread.start()
+    checked_out = self.pool.checkout(self.factory)
+    thread.join()
+
+    stats = self.pool.stats()
+    self.assertIs(checked_out, connection)
+    self.assertEqual(stats['waits'], 1)
+    self.assertGreater(stats['wait_time_total'], 0)
+    self.assertEqual(stats['wait_time_max'], stats['wait_time_total'])
+
+  def test_discard_frees_place(self):
+    connection = self.pool.checkout(self.factory)
+    self.pool.checkout(self.factory)
+
+    self.pool.discard(connection)
+
+    connection.close.assert_called_once_with()
+    self.pool.checkout(self.factory)
+    self.assertEqual(self.factory.call_count, 3)
+
+  def test_factory_error_frees_place(self):
+    self.factory.side_effect = OSError
+
+    with self.assertRaises(OSError):
+      self.pool.checkout(self.factory)
+
+    self.assertEqual(self.pool.stats()['size'], 0)
+
+  def test_close_all(self):
+    connection = self.pool.checkout(self.factory)
+    self.pool.checkin(connection)
+
+    self.pool.close_all()
+
+    connection.close.assert_called_once_with()
+    self.assertEqual(self.pool.stats()['size'], 0)
+
+  def test_stats(self):
+    connection = self.pool.checkout(self.factory)
+    self.pool.checkout(self.factory)
+    self.pool.checkin(connection)
+
+    self.assertDictEqual(
+        self.pool.stats(),
+        {
+            "max_size": 2,
+            "size": 2,
+            "idle": 1,
+            "in_use": 1,
+            "checkouts": 2,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "timeouts": 0,
+        },
+    )
+
+
+class TestPoolRegistry(SimpleTestCase):
+  """Test the process wide connection pool registry."""
+
+  def tearDown(self):
+    remove_pools("registry")
+
+  def test_get_pool_same_key(self):
+    self.assertIs(
+        get_pool(("registry", "a"), 1, 1),
+        get_pool(("registry", "a"), 1, 1),
+    )
+
+  def test_remove_pools(self):
+    pool = get_pool(("registry", "a"), 1, 1)
+    connection = pool.checkout(Mock)
+    pool.checkin(connection)
+
+    remove_pools("registry")
+
+    connection.close.assert_called_once_with()
+    self.assertIsNot(get_pool(("registry", "a"), 1, 1), pool)
+
+  def test_pool_stats_combined_by_alias(self):
+    get_pool(("registry", "a"), 1, 1).checkout(Mock)
+    get_pool(("registry", "b"), 2, 1).checkout(Mock)
+
+    stats = pool_stats()["registry"]
+
+    self.assertEqual(stats['max_size'], 3)
+    self.assertEqual(stats['in_use'], 2)
+    self.assertEqual(stats['checkouts'], 2)
@@ -0,0 +1,211 @@
+"""Test the database routers."""
+
+from unittest.mock import Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from .. import routers
+from ..routers import (
+    ReplicaRouter,
+    is_pinned_to_primary,
+    pin_to_primary,
+    replica_alias,
+    replica_reads,
+    validate_replica_configuration,
+)
+
+LOCAL_CACHE = "django.core.cache.backends.locmem.LocMemCache"
+REPLICA_ALIAS = "replica"
+SHARED_CACHE = "django.core.cache.backends.memcached.PyMemcacheCache"
+
+
+class TestReplicaAlias(SimpleTestCase):
+  """Test the replica_alias function."""
+
+  def test_not_configured(self):
+    self.assertIsNone(replica_alias())
+
+  def test_configured(self):
+    with override_settings(
+        DATABASES={
+            "default": {},
+            REPLICA_ALIAS: {}
+        },
+        DATABASE_REPLICA_ALIAS=REPLICA_ALIAS,
+    ):
+      self.assertEqual(replica_alias(), REPLICA_ALIAS)
+
+
+class TestValidateReplicaConfiguration(SimpleTestCase):
+  """Test the validate_replica_configuration function."""
+
+  def test_not_configured(self):
+    validate_replica_configuration()
+
+  @patch(routers.__name__ + ".replica_alias", Mock(return_value=REPLICA_ALIAS))
+  def test_shared_cache(self):
+    with override_settings(
+        CACHES={"pins": {
+            "BACKEND": SHARED_CACHE
+        }},
+        DATABASE_REPLICA_PIN_CACHE="pins",
+    ):
+      validate_replica_configuration()
+
+  @patch(routers.__name__ + ".replica_alias", Mock(return_value=REPLICA_ALIAS))
+  def test_process_local_cache(self):
+    with override_settings(
+        CACHES={"pins": {
+            "BACKEND": LOCAL_CACHE
+        }},
+        DATABASE_REPLICA_PIN_CACHE="pins",
+    ):
+      with self.assertRaises(ImproperlyConfigured):
+        validate_replica_configuration()
+
+
+class TestPinToPrimary(SimpleTestCase):
+  """Test the pin_to_primary and is_pinned_to_primary functions."""
+
+  def setUp(self):
+    cache.clear()
+
+  def tearDown(self):
+    cache.clear()
+
+  def test_not_pinned(self):
+    self.assertFalse(is_pinned_to_primary(1))
+
+  def test_pinned(self):
+    pin_to_primary(1)
+
+    self.assertTrue(is_pinned_to_primary(1))
+    self.assertFalse(is_pinned_to_primary(2))
+
+
+@patch(routers.__name__ + ".replica_alias", Mock(return_value=REPLICA_ALIAS))
+class TestReplicaRouter(SimpleTestCase):
+  """Test the ReplicaRouter class."""
+
+  def setUp(self):
+    cache.clear()
+    self.router = ReplicaRouter()
+    self.model = Mock()
+
+  def tearDown(self):
+    cache.clear()
+
+  def test_read_outside_context(self):
+    self.assertIsNone(self.router.db_for_read(self.model))
+
+  def test_read_inactive(self):
+    with replica_reads():
+      self.assertIsNone(self.router.db_for_read(self.model))
+
+  def test_read_active(self):
+    with replica_reads() as context:
+      context.activate(1, True)
+
+      self.assertEqual(self.router.db_for_read(self.model), REPLICA_ALIAS)
+
+  def test_read_active_anonymous(self):
+    with replica_reads() as context:
+      context.activate(None, True)
+
+      self.assertEqual(self.router.db_for_read(self.model), REPLICA_ALIAS)
+
+  def test_read_not_read_only(self):
+    with replica_reads() as context:
+      context.activate(1, False)
+
+      self.assertIsNone(self.router.db_for_read(self.model))
+
+  def test_read_pinned(self):
+    pin_to_primary(1)
+
+    with replica_reads() as context:
+      context.activate(1, True)
+
+      self.assertIsNone(self.router.db_for_read(self.model))
+
+  @patch(routers.__name__ + ".connections")
+  def test_read_atomic(self, m_connections):
+    m_connections.__getitem__.return_value.in_atomic_block = True
+
+    with replica_reads() as context:
+      context.activate(1, True)
+
+      self.assertIsNone(self.router.db_for_read(self.model))
+
+  def test_write(self):
+    with replica_reads() as context:
+      context.activate(1, True)
+
+      self.assertEqual(self.router.db_for_write(self.model), DEFAULT_DB_ALIAS)
+      self.assertIsNone(self.router.db_for_read(self.model))
+
+    self.assertTrue(is_pinned_to_primary(1))
+
+  def test_write_before_activation(self):
+    with replica_reads() as context:
+      self.router.db_for_write(self.model)
+      context.activate(1, True)
+
+      self.assertIsNone(self.router.db_for_read(self.model))
+
+    self.assertTrue(is_pinned_to_primary(1))
+
+  def test_allow_relation(self):
+    obj1 = Mock()
+    obj2 = Mock()
+    obj1._state.db = "default"
+    obj2._state.db = REPLICA_ALIAS
+
+    self.assertTrue(self.router.allow_relation(obj1, obj2))
+
+  def test_allow_relation_unknown(self):
+    obj1 = Mock()
+    obj2 = Mock()
+    obj1._state.db = "default"
+    obj2._state.db = "other"
+
+    self.assertIsNone(self.router.allow_relation(obj1, obj2))
+
+  def test_allow_migrate(self):
+    self.assertIsNone(self.router.allow_migrate("default", "kitchen"))
+    self.assertFalse(self.router.allow_migrate(REPLICA_ALIAS, "kitchen"))
+
+
+@patch(routers.__name__ + ".replica_alias", Mock(return_value=REPLICA_ALIAS))
+class TestReplicaRouterSave(TestCase):
+  """Test saving instances read from the read replica."""
+
+  def setUp(self):
+    cache.clear()
+
+  def tearDown(self):
+    cache.clear()
+
+  def test_save_replica_instance(self):
+    user = get_user_model().objects.create_user(
+        username="replica_user",
+        email="replica_user@niallbyrne.ca",
+        password="test123",
+    )
+    user._state.db = REPLICA_ALIAS  # pylint: disable=protected-access
+
+    with replica_reads() as context:
+      context.activate(user.id, True)
+      user.first_name = "changed"
+      user.save()
+
+    self.assertEqual(user._state.db, DEFAULT_DB_ALIAS)  # pylint: disable=W0212
+    self.assertEqual(
+        get_user_model().objects.get(pk=user.pk).first_name,
+        "changed",
+    )
+    self.assertTrue(is_pinned_to_primary(user.id))
@@ -0,0 +1,123 @@
+"""A management command to benchmark pooled database connections."""
+
+import threading
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from ...database.backends.postgresql.base import DatabaseWrapper
+from ...database.pool import pool_stats, remove_pools
+
+BENCHMARK_ALIAS = "benchmark"
+BENCHMARK_QUERY = "SELECT 1"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_REQUESTS = 200
+ERROR_MESSAGE = "The default database must use the PostgreSQL backend."
+RESULT_MESSAGE = (
+    "{mode}: {requests} requests in {total:.2f} ms, "
+    "{throughput:.1f} requests per second"
+)
+WAIT_MESSAGE = (
+    "Pool checkout waits: {waits} of {checkouts}, "
+    "{mean:.3f} ms mean wait, {max:.3f} ms max wait"
+)
+SPEEDUP_MESSAGE = "Pooled connections are {speedup:.2f}x faster."
+
+
+class Command(BaseCommand):
+  """Compare connect-per-request throughput to pooled connections."""
+
+  help = (
+      'Compares the throughput of simulated requests that open a new '
+      'connection each time, to requests using a connection pool.'
+  )
+
+  def add_arguments(self, parser):
+    """Entry point for subclassed commands to add custom arguments."""
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help='The number of simulated requests in each mode.',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help='The number of concurrent workers.',
+    )
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=None,
+        help='The maximum pool size (defaults to the concurrency).',
+    )
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    if not isinstance(connections[DEFAULT_DB_ALIAS], DatabaseWrapper):
+      self.stderr.write(self.style.ERROR(ERROR_MESSAGE))
+      return
+
+    requests = max(options['requests'], 1)
+    concurrency = max(options['concurrency'], 1)
+    pool_size = max(options['pool_size'] or concurrency, 1)
+
+    unpooled = self._time_requests(0, requests, concurrency)
+    try:
+      pooled = self._time_requests(pool_size, requests, concurrency)
+      stats = pool_stats()[BENCHMARK_ALIAS]
+    finally:
+      remove_pools(BENCHMARK_ALIAS)
+
+    self._report("connect-per-request", unpooled, requests)
+    self._report("pooled", pooled, requests)
+    self.stdout.write(
+        WAIT_MESSAGE.format(
+            waits=stats['waits'],
+            checkouts=stats['checkouts'],
+            mean=1000 * stats['wait_time_total'] / max(stats['waits'], 1),
+            max=1000 * stats['wait_time_max'],
+        )
+    )
+    self.stdout.write(
+        self.style.SUCCESS(SPEEDUP_MESSAGE.format(speedup=unpooled / pooled))
+    )
+
+  @staticmethod
+  def _time_requests(pool_size, requests, concurrency):
+    settings_dict = dict(connections[DEFAULT_DB_ALIAS].settings_dict)
+    settings_dict['CONN_MAX_AGE'] = 0
+    settings_dict['POOL'] = {'MAX_SIZE': pool_size}
+    shares = [
+        requests // concurrency + (index < requests % concurrency)
+        for index in range(concurrency)
+    ]
+
+    def simulate(count):
+      wrapper = DatabaseWrapper(settings_dict, BENCHMARK_ALIAS)
+      for _ in range(count):
+        with wrapper.cursor() as cursor:
+          cursor.execute(BENCHMARK_QUERY)
+        wrapper.close()
+
+    workers = [
+        threading.Thread(target=simulate, args=(share,)) for share in shares
+    ]
+    start = perf_counter()
+    for worker in workers:
+      worker.start()
+    for worker in workers:
+      worker.join()
+    return (perf_counter() - start) * 1000
+
+  def _report(self, mode, total, requests):
+    self.stdout.write(
+        RESULT_MESSAGE.format(
+            mode=mode,
+            requests=requests,
+            total=total,
+            throughput=1000 * requests / total,
+        )
+    )
@@ -0,0 +1,18 @@
+"""A django admin command to delete expired throttle buckets."""
+
+from django.core.management.base import BaseCommand
+
+from ...throttling.stores import DatabaseThrottleStore
+
+SUCCESS_MESSAGE = "Deleted {count} expired throttle bucket(s)."
+
+
+class Command(BaseCommand):
+  """Django command that deletes expired throttle buckets."""
+
+  help = 'Deletes expired throttle buckets from the database.'
+
+  def handle(self, *args, **options):
+    """Command implementation."""
+    count = DatabaseThrottleStore().prune()
+    self.stdout.write(self.style.SUCCESS(SUCCESS_MESSAGE.format(count=count)))
@@ -0,0 +1,55 @@
+"""Test benchmark_connections management command."""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from .. import benchmark_connections as command_module
+from ..benchmark_connections import ERROR_MESSAGE
+
+COMMAND_MODULE = command_module.__name__
+
+
+class CommandTests(TestCase):
+  """Test the benchmark_connections management command."""
+
+  def setUp(self):
+    self.output_stdout = StringIO()
+    self.output_stderr = StringIO()
+
+  def _call_command(self):
+    call_command(
+        'benchmark_connections',
+        requests=5,
+        concurrency=2,
+        stdout=self.output_stdout,
+        stderr=self.output_stderr,
+        no_color=True,
+    )
+
+  def test_benchmark_output(self):
+    self._call_command()
+    stdout = self.output_stdout.getvalue()
+
+    self.assertIn("connect-per-request: 5 requests", stdout)
+    self.assertIn("pooled: 5 requests", stdout)
+    self.assertIn("Pool checkout waits:", stdout)
+    self.assertIn("Pooled connections are", stdout)
+    self.assertEqual(self.output_stderr.getvalue(), "")
+
+  def test_benchmark_removes_pool(self):
+    self._call_command()
+
+    self.assertNotIn(
+        command_module.BENCHMARK_ALIAS,
+        command_module.pool_stats(),
+    )
+
+  @patch(COMMAND_MODULE + ".DatabaseWrapper", type("Unsupported", (), {}))
+  def test_unsupported_backend(self):
+    self._call_command()
+
+    self.assertIn(ERROR_MESSAGE, self.output_stderr.getvalue())
+    self.assertEqual(self.output_stdout.getvalue(), "")
@@ -0,0 +1,40 @@
+"""Test prune_throttles management command."""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ....models.throttle_bucket import ThrottleBucket
+from ..prune_throttles import SUCCESS_MESSAGE
+
+
+class CommandTests(TestCase):
+  """Test the prune_throttles management command."""
+
+  def setUp(self):
+    now = timezone.now()
+    ThrottleBucket.objects.create(
+        key="expired",
+        tokens=0,
+        updated=now - timedelta(minutes=2),
+        expires=now - timedelta(minutes=1),
+    )
+    ThrottleBucket.objects.create(
+        key="current",
+        tokens=0,
+        updated=now,
+        expires=now + timedelta(minutes=1),
+    )
+
+  def test_prune_throttles(self):
+    capture = StringIO()
+    call_command("prune_throttles", stdout=capture)
+
+    self.assertIn(SUCCESS_MESSAGE.format(count=1), capture.getvalue())
+    self.assertListEqual(
+        list(ThrottleBucket.objects.values_list("key", flat=True)),
+        ["current"],
+    )
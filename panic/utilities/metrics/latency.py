@@ -0,0 +1,45 @@
+"""Latency percentiles and throughput for benchmarked requests."""
+
+
+def percentile(samples, rank):
+  """Return a percentile of a sorted list of samples, by interpolation.
+
+  :param samples: The samples, sorted in ascending order
+  :type samples: List[float]
+  :param rank: The percentile to return, from 0 to 100
+  :type rank: float
+
+  :returns: The interpolated percentile, or None if there are no samples
+  :rtype: float, None
+  """
+  if not samples:
+    return None
+  position = (len(samples) - 1) * rank / 100
+  lower = int(position)
+  upper = min(lower + 1, len(samples) - 1)
+  return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+def summarize(latencies, elapsed):
+  """Summarize the latencies of a series of requests.
+
+  :param latencies: The latency of each request, in seconds
+  :type latencies: List[float]
+  :param elapsed: The wall clock duration of the whole series, in seconds
+  :type elapsed: float
+
+  :returns: The latency percentiles in milliseconds, and requests per second
+  :rtype: dict
+  """
+  ordered = sorted(latencies)
+  summary = {"requests": len(ordered)}
+  for rank in (50, 95, 99):
+    value = percentile(ordered, rank)
+    summary["p%s_ms" % rank] = None if value is None else round(value * 1000, 3)
+  summary["mean_ms"] = round(
+      sum(ordered) * 1000 / len(ordered), 3
+  ) if ordered else None
+  summary["throughput_rps"] = round(
+      len(ordered) / elapsed, 2
+  ) if elapsed > 0 else None
+  return summary
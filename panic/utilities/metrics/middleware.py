@@ -0,0 +1,182 @@
+"""Middleware recording the database queries of each request."""
+
+import asyncio
+import json
+import logging
+import re
+from time import perf_counter
+
+from django.conf import settings
+
+from .queries import ENDPOINT_METRICS, REQUEST_METRICS, QueryMetrics
+
+HEADER_QUERY_COUNT = "X-Query-Count"
+HEADER_QUERY_TIME = "X-Query-Time"
+HEADER_QUERY_SLOWEST = "X-Query-Slowest"
+HEADER_SQL_LENGTH = 200
+UNRESOLVED_ENDPOINT = "unresolved"
+
+logger = logging.getLogger(__name__)
+
+
+def endpoint_name(request):
+  """Return a low cardinality name for the endpoint serving a request.
+
+  :param request: The request
+  :type request: :class:`django.http.HttpRequest`
+
+  :returns: The view name of the resolved URL pattern
+  :rtype: str
+  """
+  match = getattr(request, "resolver_match", None)
+  if match is None:
+    return UNRESOLVED_ENDPOINT
+  return match.view_name or match.route or UNRESOLVED_ENDPOINT
+
+
+def header_safe(sql):
+  """Shorten a SQL statement to a single ASCII line, safe for a header.
+
+  :param sql: The SQL statement
+  :type sql: str
+
+  :returns: The shortened statement
+  :rtype: str
+  """
+  line = re.sub(r"\s+", " ", sql).strip()[:HEADER_SQL_LENGTH]
+  return line.encode("ascii", "replace").decode("ascii")
+
+
+class QueryMetricsMiddleware:
+  """Records the number, total time and slowest of each request's queries.
+
+  Queries on all database connections are recorded while the view runs,
+  including those made from other threads on behalf of an async view.
+  Queries made while a streaming response is consumed are not.
+
+  The metrics are added to each response as headers when
+  `QUERY_METRICS_HEADERS` is enabled, and logged as JSON when
+  `QUERY_METRICS_LOG` is enabled.  Totals for each endpoint are always kept
+  for the Prometheus metrics view.
+
+  :param get_response: The next handler in the middleware chain
+  :type get_response: func
+  """
+
+  sync_capable = True
+  async_capable = True
+
+  def __init__(self, get_response):
+    self.get_response = get_response
+    if asyncio.iscoroutinefunction(get_response):
+      # pylint: disable=protected-access
+      self._is_coroutine = asyncio.coroutines._is_coroutine
+
+  def __call__(self, request):
+    if asyncio.iscoroutinefunction(self.get_response):
+      return self.__acall__(request)
+
+    metrics = QueryMetrics(settings.QUERY_METRICS_SLOWEST)
+    start = perf_counter()
+    token = REQUEST_METRICS.set(metrics)
+    try:
+      response = self.get_response(request)
+    finally:
+      REQUEST_METRICS.reset(token)
+    return self.finish(request, response, perf_counter() - start, metrics)
+
+  async def __acall__(self, request):
+    """Record the queries of an asynchronous request.
+
+    :param request: The request
+    :type request: :class:`django.http.HttpRequest`
+
+    :returns: The response
+    :rtype: :class:`django.http.HttpResponse`
+    """
+    metrics = QueryMetrics(settings.QUERY_METRICS_SLOWEST)
+    start = perf_counter()
+    token = REQUEST_METRICS.set(metrics)
+    try:
+      response = await self.get_response(request)
+    finally:
+      REQUEST_METRICS.reset(token)
+    return self.finish(request, response, perf_counter() - start, metrics)
+
+  def finish(self, request, response, duration, metrics):
+    """Record, and report the query metrics of a finished request.
+
+    :param request: The request
+    :type request: :class:`django.http.HttpRequest`
+    :param response: The response
+    :type response: :class:`django.http.HttpResponse`
+    :param duration: The duration of the request in seconds
+    :type duration: float
+    :param metrics: The query metrics of the request
+    :type metrics: :class:`utilities.metrics.queries.QueryMetrics`
+
+    :returns: The response
+    :rtype: :class:`django.http.HttpResponse`
+    """
+    endpoint = endpoint_name(request)
+    ENDPOINT_METRICS.record(endpoint, duration, metrics)
+
+    if settings.QUERY_METRICS_HEADERS:
+      self.add_headers(response, metrics)
+    if settings.QUERY_METRICS_LOG:
+      self.log(request, response, endpoint, duration, metrics)
+
+    return response
+
+  @staticmethod
+  def add_headers(response, metrics):
+    """Add a request's query metrics to its response headers.
+
+    :param response: The response
+    :type response: :class:`django.http.HttpResponse`
+    :param metrics: The query metrics of the request
+    :type metrics: :class:`utilities.metrics.queries.QueryMetrics`
+    """
+    response[HEADER_QUERY_COUNT] = str(metrics.count)
+    response[HEADER_QUERY_TIME] = "%.2f" % (metrics.duration * 1000)
+    if metrics.slowest:
+      response[HEADER_QUERY_SLOWEST] = " | ".join(
+          "%.2fms %s" % (duration * 1000, header_safe(sql))
+          for duration, sql in metrics.slowest
+      )
+
+  @staticmethod
+  def log(request, response, endpoint, duration, metrics):
+    """Log a request's query metrics as a JSON document.
+
+    :param request: The request
+    :type request: :class:`django.http.HttpRequest`
+    :param response: The response
+    :type response: :class:`django.http.HttpResponse`
+    :param endpoint: The name of the endpoint
+    :type endpoint: str
+    :param duration: The duration of the request in seconds
+    :type duration: float
+    :param metrics: The query metrics of the request
+    :type metrics: :class:`utilities.metrics.queries.QueryMetrics`
+    """
+    logger.info(
+        json.dumps({
+            "endpoint":
+                endpoint,
+            "method":
+                request.method,
+            "status":
+                response.status_code,
+            "duration_ms":
+                round(duration * 1000, 2),
+            "query_count":
+                metrics.count,
+            "query_time_ms":
+                round(metrics.duration * 1000, 2),
+            "slowest": [{
+                "duration_ms": round(query_duration * 1000, 2),
+                "sql": sql,
+            } for query_duration, sql in metrics.slowest],
+        })
+    )
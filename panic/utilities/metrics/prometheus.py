@@ -0,0 +1,114 @@
+"""Render metrics in the Prometheus text exposition format."""
+
+from ..database.pool import pool_stats
+from .queries import ENDPOINT_METRICS
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+ENDPOINT_SERIES = (
+    (
+        "panic_http_requests_total",
+        "requests",
+        "counter",
+        "Total requests served.",
+    ),
+    (
+        "panic_http_request_seconds_total",
+        "request_seconds",
+        "counter",
+        "Total time spent serving requests.",
+    ),
+    (
+        "panic_db_queries_total",
+        "queries",
+        "counter",
+        "Total database queries executed by requests.",
+    ),
+    (
+        "panic_db_query_seconds_total",
+        "query_seconds",
+        "counter",
+        "Total time spent executing database queries in requests.",
+    ),
+)
+
+POOL_SERIES = (
+    ("panic_db_pool_size", "size", "gauge", "Open pooled connections."),
+    ("panic_db_pool_idle", "idle", "gauge", "Idle pooled connections."),
+    (
+        "panic_db_pool_checkouts_total",
+        "checkouts",
+        "counter",
+        "Total pooled connection checkouts.",
+    ),
+    (
+        "panic_db_pool_waits_total",
+        "waits",
+        "counter",
+        "Total checkouts that waited for a connection.",
+    ),
+    (
+        "panic_db_pool_wait_seconds_total",
+        "wait_time_total",
+        "counter",
+        "Total time spent waiting for pooled connections.",
+    ),
+    (
+        "panic_db_pool_timeouts_total",
+        "timeouts",
+        "counter",
+        "Total checkouts that timed out.",
+    ),
+)
+
+
+def escape_label(value):
+  """Escape a Prometheus label value.
+
+  :param value: The label value
+  :type value: str
+
+  :returns: The escaped label value
+  :rtype: str
+  """
+  return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_series(series, label, samples):
+  """Render a group of metric families, each with one sample per label value.
+
+  :param series: Tuples of (metric name, sample key, type, help text)
+  :type series: Tuple[Tuple[str, str, str, str]]
+  :param label: The name of the label
+  :type label: str
+  :param samples: A dictionary of samples, for each label value
+  :type samples: dict
+
+  :returns: The rendered lines
+  :rtype: List[str]
+  """
+  lines = []
+  for name, key, metric_type, description in series:
+    lines.append("# HELP %s %s" % (name, description))
+    lines.append("# TYPE %s %s" % (name, metric_type))
+    for value in sorted(samples):
+      lines.append(
+          '%s{%s="%s"} %s' % (
+              name,
+              label,
+              escape_label(value),
+              repr(float(samples[value][key])),
+          )
+      )
+  return lines
+
+
+def render_metrics():
+  """Render this process' endpoint and connection pool metrics.
+
+  :returns: The metrics, in the Prometheus text exposition format
+  :rtype: str
+  """
+  lines = render_series(ENDPOINT_SERIES, "endpoint", ENDPOINT_METRICS.totals())
+  lines += render_series(POOL_SERIES, "database", pool_stats())
+  return "\n".join(lines) + "\n"
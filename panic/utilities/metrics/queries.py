@@ -0,0 +1,160 @@
+"""Per request database query metrics."""
+
+import heapq
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+
+REQUEST_METRICS = ContextVar("request_query_metrics", default=None)
+
+
+class QueryMetrics:
+  """Records the queries executed through a database execute wrapper.
+
+  Install an instance with :meth:`django.db.backends.base.base.
+  BaseDatabaseWrapper.execute_wrapper`, or set it as the
+  `REQUEST_METRICS` of the current context.  Queries may be recorded from
+  several threads at once.
+
+  :param slowest: The number of slowest statements to keep
+  :type slowest: int
+  """
+
+  def __init__(self, slowest):
+    self.count = 0
+    self.duration = 0.0
+    self.slowest_size = slowest
+    self._slowest = []
+    self._lock = threading.Lock()
+
+  def __call__(self, execute, sql, params, many, context):
+    """Execute and time a query.
+
+    :param execute: The next callable in the execute wrapper chain
+    :type execute: func
+    :param sql: The SQL statement
+    :type sql: str
+    :param params: The statement parameters
+    :type params: list, tuple, dict
+    :param many: A boolean indicating if this is an executemany call
+    :type many: bool
+    :param context: The connection and cursor in use
+    :type context: dict
+    """
+    start = perf_counter()
+    try:
+      return execute(sql, params, many, context)
+    finally:
+      self.record(sql, perf_counter() - start)
+
+  def record(self, sql, duration):
+    """Record an executed query.
+
+    :param sql: The SQL statement
+    :type sql: str
+    :param duration: The duration of the query in seconds
+    :type duration: float
+    """
+    with self._lock:
+      self.count += 1
+      self.duration += duration
+      entry = (duration, self.count, sql)
+      if len(self._slowest) < self.slowest_size:
+        heapq.heappush(self._slowest, entry)
+      elif self._slowest and entry > self._slowest[0]:
+        heapq.heapreplace(self._slowest, entry)
+
+  @property
+  def slowest(self):
+    """Return the slowest statements, slowest first.
+
+    :returns: Pairs of (duration in seconds, SQL statement)
+    :rtype: List[Tuple[float, str]]
+    """
+    return [(duration, sql) for duration, _, sql in sorted(self._slowest)[::-1]]
+
+
+def record_request_queries(execute, sql, params, many, context):
+  """Record a query to the `REQUEST_METRICS` of the current context.
+
+  Async views query from pool threads, so a request's queries can't be found
+  by wrapping the connections of the thread serving it.  This execute wrapper
+  is installed on every connection instead, and records to the request found
+  in the context, which is copied to the pool threads.
+
+  :param execute: The next callable in the execute wrapper chain
+  :type execute: func
+  :param sql: The SQL statement
+  :type sql: str
+  :param params: The statement parameters
+  :type params: list, tuple, dict
+  :param many: A boolean indicating if this is an executemany call
+  :type many: bool
+  :param context: The connection and cursor in use
+  :type context: dict
+  """
+  metrics = REQUEST_METRICS.get()
+  if metrics is None:
+    return execute(sql, params, many, context)
+  return metrics(execute, sql, params, many, context)
+
+
+def install_request_recorder(sender, connection, **kwargs):  # pylint: disable=unused-argument
+  """Install :func:`record_request_queries` on a new database connection.
+
+  The wrapper is placed first, as temporary execute wrappers are removed from
+  the end of the list.
+
+  :param sender: The database wrapper class
+  :type sender: type
+  :param connection: The newly connected database wrapper
+  :type connection: :class:`django.db.backends.base.base.BaseDatabaseWrapper`
+  """
+  if record_request_queries not in connection.execute_wrappers:
+    connection.execute_wrappers.insert(0, record_request_queries)
+
+
+class EndpointMetrics:
+  """Thread safe, process wide totals of the requests to each endpoint."""
+
+  fields = ("requests", "request_seconds", "queries", "query_seconds")
+
+  def __init__(self):
+    self._totals = {}
+    self._lock = threading.Lock()
+
+  def record(self, endpoint, duration, metrics):
+    """Add a request to an endpoint's totals.
+
+    :param endpoint: The name of the endpoint
+    :type endpoint: str
+    :param duration: The duration of the request in seconds
+    :type duration: float
+    :param metrics: The query metrics of the request
+    :type metrics: :class:`QueryMetrics`
+    """
+    with self._lock:
+      totals = self._totals.setdefault(endpoint, dict.fromkeys(self.fields, 0))
+      totals["requests"] += 1
+      totals["request_seconds"] += duration
+      totals["queries"] += metrics.count
+      totals["query_seconds"] += metrics.duration
+
+  def totals(self):
+    """Return a copy of the totals of each endpoint.
+
+    :returns: A dictionary of totals, for each endpoint
+    :rtype: dict
+    """
+    with self._lock:
+      return {
+          endpoint: dict(totals) for endpoint, totals in self._totals.items()
+      }
+
+  def clear(self):
+    """Discard all totals."""
+    with self._lock:
+      self._totals.clear()
+
+
+ENDPOINT_METRICS = EndpointMetrics()
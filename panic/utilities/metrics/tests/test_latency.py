@@ -0,0 +1,57 @@
+"""Test the benchmarked request latency summaries."""
+
+from django.test import SimpleTestCase
+
+from ..latency import percentile, summarize
+
+
+class TestPercentile(SimpleTestCase):
+  """Test the percentile function."""
+
+  def test_no_samples(self):
+    self.assertIsNone(percentile([], 50))
+
+  def test_single_sample(self):
+    self.assertEqual(percentile([2.0], 99), 2.0)
+
+  def test_interpolates(self):
+    samples = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    self.assertEqual(percentile(samples, 0), 1.0)
+    self.assertEqual(percentile(samples, 50), 3.0)
+    self.assertEqual(percentile(samples, 90), 4.6)
+    self.assertEqual(percentile(samples, 100), 5.0)
+
+
+class TestSummarize(SimpleTestCase):
+  """Test the summarize function."""
+
+  def test_summarize(self):
+    summary = summarize([0.003, 0.001, 0.002, 0.004], 0.02)
+
+    self.assertEqual(
+        summary,
+        {
+            "requests": 4,
+            "p50_ms": 2.5,
+            "p95_ms": 3.85,
+            "p99_ms": 3.97,
+            "mean_ms": 2.5,
+            "throughput_rps": 200.0,
+        },
+    )
+
+  def test_summarize_no_requests(self):
+    summary = summarize([], 0)
+
+    self.assertEqual(
+        summary,
+        {
+            "requests": 0,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+            "mean_ms": None,
+            "throughput_rps": None,
+        },
+    )
@@ -0,0 +1,118 @@
+"""Test the QueryMetricsMiddleware class."""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+
+from .. import middleware
+from ..middleware import (
+    HEADER_QUERY_COUNT,
+    HEADER_QUERY_SLOWEST,
+    HEADER_QUERY_TIME,
+    UNRESOLVED_ENDPOINT,
+    QueryMetricsMiddleware,
+    endpoint_name,
+    header_safe,
+)
+from ..queries import ENDPOINT_METRICS
+
+
+def view(request):
+  request.resolver_match = Mock(view_name="v1:test", route="test/")
+  get_user_model().objects.count()
+  get_user_model().objects.exists()
+  return HttpResponse()
+
+
+async def async_view(request):
+  return await sync_to_async(view)(request)
+
+
+class TestHelpers(SimpleTestCase):
+  """Test the endpoint_name and header_safe functions."""
+
+  def test_endpoint_name_unresolved(self):
+    self.assertEqual(endpoint_name(Mock(resolver_match=None)), "unresolved")
+
+  def test_endpoint_name(self):
+    request = Mock()
+    request.resolver_match.view_name = "v1:items-list"
+
+    self.assertEqual(endpoint_name(request), "v1:items-list")
+
+  def test_header_safe(self):
+    self.assertEqual(
+        header_safe("SELECT\n  \"name\"\tFROM é"),
+        'SELECT "name" FROM ?',
+    )
+
+
+@override_settings(QUERY_METRICS_SLOWEST=1)
+class TestQueryMetricsMiddleware(TestCase):
+  """Test the QueryMetricsMiddleware class."""
+
+  def setUp(self):
+    ENDPOINT_METRICS.clear()
+    self.request = RequestFactory().get("/")
+    self.middleware = QueryMetricsMiddleware(view)
+
+  def tearDown(self):
+    ENDPOINT_METRICS.clear()
+
+  @override_settings(QUERY_METRICS_HEADERS=True, QUERY_METRICS_LOG=False)
+  def test_headers(self):
+    response = self.middleware(self.request)
+
+    self.assertEqual(response[HEADER_QUERY_COUNT], "2")
+    self.assertGreater(float(response[HEADER_QUERY_TIME]), 0)
+    self.assertRegex(response[HEADER_QUERY_SLOWEST], r"^[\d.]+ms SELECT")
+    self.assertNotIn(" | ", response[HEADER_QUERY_SLOWEST])
+
+  @override_settings(QUERY_METRICS_HEADERS=False, QUERY_METRICS_LOG=True)
+  def test_log(self):
+    with self.assertLogs(middleware.__name__, "INFO") as logs:
+      response = self.middleware(self.request)
+
+    self.assertFalse(response.has_header(HEADER_QUERY_COUNT))
+    record = json.loads(logs.records[0].getMessage())
+    self.assertEqual(record["endpoint"], "v1:test")
+    self.assertEqual(record["method"], "GET")
+    self.assertEqual(record["status"], 200)
+    self.assertEqual(record["query_count"], 2)
+    self.assertEqual(len(record["slowest"]), 1)
+
+  def test_endpoint_totals(self):
+    self.middleware(self.request)
+    self.middleware(self.request)
+
+    totals = ENDPOINT_METRICS.totals()["v1:test"]
+    self.assertEqual(totals["requests"], 2)
+    self.assertEqual(totals["queries"], 4)
+
+  def test_unresolved_no_queries(self):
+    response = QueryMetricsMiddleware(lambda request: HttpResponse())(
+        self.request
+    )
+
+    self.assertEqual(response[HEADER_QUERY_COUNT], "0")
+    self.assertFalse(response.has_header(HEADER_QUERY_SLOWEST))
+    self.assertIn(UNRESOLVED_ENDPOINT, ENDPOINT_METRICS.totals())
+
+  def test_async(self):
+    middleware = QueryMetricsMiddleware(async_view)
+    self.assertTrue(asyncio.iscoroutinefunction(middleware))
+
+    response = async_to_sync(middleware)(self.request)
+
+    self.assertEqual(response[HEADER_QUERY_COUNT], "2")
+    self.assertEqual(ENDPOINT_METRICS.totals()["v1:test"]["queries"], 2)
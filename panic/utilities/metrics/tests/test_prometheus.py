@@ -0,0 +1,56 @@
+"""Test the Prometheus text rendering."""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from .. import prometheus
+from ..prometheus import escape_label, render_metrics
+from ..queries import ENDPOINT_METRICS, QueryMetrics
+
+
+class TestPrometheus(SimpleTestCase):
+  """Test the Prometheus rendering functions."""
+
+  def setUp(self):
+    ENDPOINT_METRICS.clear()
+
+  def tearDown(self):
+    ENDPOINT_METRICS.clear()
+
+  def test_escape_label(self):
+    self.assertEqual(escape_label('a"b\\c\nd'), 'a\\"b\\\\c\\nd')
+
+  @patch(prometheus.__name__ + ".pool_stats")
+  def test_render_metrics(self, m_pool_stats):
+    m_pool_stats.return_value = {
+        "default": {
+            "size": 2,
+            "idle": 1,
+            "checkouts": 10,
+            "waits": 1,
+            "wait_time_total": 0.5,
+            "timeouts": 0,
+        }
+    }
+    metrics = QueryMetrics(1)
+    metrics.record("SELECT 1", 0.25)
+    ENDPOINT_METRICS.record("v1:items-list", 0.5, metrics)
+
+    rendered = render_metrics()
+
+    self.assertIn(
+        "# TYPE panic_http_requests_total counter\n"
+        'panic_http_requests_total{endpoint="v1:items-list"} 1.0\n',
+        rendered,
+    )
+    self.assertIn(
+        'panic_db_query_seconds_total{endpoint="v1:items-list"} 0.25\n',
+        rendered,
+    )
+    self.assertIn(
+        "# TYPE panic_db_pool_size gauge\n"
+        'panic_db_pool_size{database="default"} 2.0\n',
+        rendered,
+    )
+    self.assertTrue(rendered.endswith("\n"))
@@ -0,0 +1,132 @@
+"""Test the per request database query metrics."""
+
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from ..queries import (
+    REQUEST_METRICS,
+    EndpointMetrics,
+    QueryMetrics,
+    install_request_recorder,
+    record_request_queries,
+)
+
+
+class TestQueryMetrics(SimpleTestCase):
+  """Test the QueryMetrics class."""
+
+  def setUp(self):
+    self.metrics = QueryMetrics(2)
+
+  def test_call(self):
+    execute = Mock(return_value="result")
+    context = {"connection": Mock(), "cursor": Mock()}
+
+    result = self.metrics(execute, "SELECT 1", (), False, context)
+
+    self.assertEqual(result, "result")
+    execute.assert_called_once_with("SELECT 1", (), False, context)
+    self.assertEqual(self.metrics.count, 1)
+    self.assertEqual(self.metrics.slowest[0][1], "SELECT 1")
+
+  def test_call_exception(self):
+    execute = Mock(side_effect=ValueError)
+
+    with self.assertRaises(ValueError):
+      self.metrics(execute, "SELECT 1", (), False, {})
+
+    self.assertEqual(self.metrics.count, 1)
+
+  def test_record(self):
+    self.metrics.record("SELECT 1", 0.1)
+    self.metrics.record("SELECT 2", 0.3)
+    self.metrics.record("SELECT 3", 0.2)
+
+    self.assertEqual(self.metrics.count, 3)
+    self.assertAlmostEqual(self.metrics.duration, 0.6)
+    self.assertListEqual(
+        self.metrics.slowest,
+        [(0.3, "SELECT 2"), (0.2, "SELECT 3")],
+    )
+
+  def test_record_no_slowest(self):
+    metrics = QueryMetrics(0)
+    metrics.record("SELECT 1", 0.1)
+
+    self.assertListEqual(metrics.slowest, [])
+
+
+class TestRequestRecorder(SimpleTestCase):
+  """Test the record_request_queries and install_request_recorder functions."""
+
+  def setUp(self):
+    self.execute = Mock(return_value="result")
+
+  def test_record_without_request(self):
+    result = record_request_queries(self.execute, "SELECT 1", (), False, {})
+
+    self.assertEqual(result, "result")
+    self.execute.assert_called_once_with("SELECT 1", (), False, {})
+
+  def test_record_with_request(self):
+    metrics = QueryMetrics(1)
+    token = REQUEST_METRICS.set(metrics)
+    try:
+      result = record_request_queries(self.execute, "SELECT 1", (), False, {})
+    finally:
+      REQUEST_METRICS.reset(token)
+
+    self.assertEqual(result, "result")
+    self.assertEqual(metrics.count, 1)
+    self.assertEqual(metrics.slowest[0][1], "SELECT 1")
+
+  def test_install_first(self):
+    wrapper = Mock()
+    connection = Mock(execute_wrappers=[wrapper])
+
+    install_request_recorder(None, connection)
+
+    self.assertEqual(
+        connection.execute_wrappers,
+        [record_request_queries, wrapper],
+    )
+
+  def test_install_once(self):
+    connection = Mock(execute_wrappers=[])
+
+    install_request_recorder(None, connection)
+    install_request_recorder(None, connection)
+
+    self.assertEqual(connection.execute_wrappers, [record_request_queries])
+
+
+class TestEndpointMetrics(SimpleTestCase):
+  """Test the EndpointMetrics class."""
+
+  def setUp(self):
+    self.endpoints = EndpointMetrics()
+    self.metrics = QueryMetrics(1)
+    self.metrics.record("SELECT 1", 0.25)
+
+  def test_record(self):
+    self.endpoints.record("v1:items-list", 0.5, self.metrics)
+    self.endpoints.record("v1:items-list", 0.5, self.metrics)
+
+    self.assertDictEqual(
+        self.endpoints.totals(),
+        {
+            "v1:items-list": {
+                "requests": 2,
+                "request_seconds": 1.0,
+                "queries": 2,
+                "query_seconds": 0.5,
+            }
+        },
+    )
+
+  def test_clear(self):
+    self.endpoints.record("v1:items-list", 0.5, self.metrics)
+    self.endpoints.clear()
+
+    self.assertDictEqual(self.endpoints.totals(), {})
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-19 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+  initial = True
+
+  dependencies = []
+
+  operations = [
+      migrations.CreateModel(
+          name='ThrottleBucket',
+          fields=[
+              (
+                  'key',
+                  models.CharField(
+                      max_length=255, primary_key=True, serialize=False
+                  )
+              ),
+              ('tokens', models.FloatField()),
+              ('updated', models.DateTimeField()),
+              ('expires', models.DateTimeField(db_index=True)),
+          ],
+      ),
+  ]
@@ -0,0 +1,58 @@
+# Generated by Django 3.2.25 on 2026-10-19 19:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+  dependencies = [
+      migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+      ('utilities', '0001_throttle_20261019_1800'),
+  ]
+
+  operations = [
+      migrations.CreateModel(
+          name='RequestProfile',
+          fields=[
+              (
+                  'id',
+                  models.AutoField(
+                      auto_created=True,
+                      primary_key=True,
+                      serialize=False,
+                      verbose_name='ID'
+                  )
+              ),
+              (
+                  'created',
+                  models.DateTimeField(auto_now_add=True, db_index=True)
+              ),
+              ('duration', models.FloatField()),
+              ('method', models.CharField(max_length=10)),
+              ('path', models.CharField(max_length=2048)),
+              ('profile', models.BinaryField()),
+              ('queries', models.JSONField(default=list)),
+              ('query_count', models.PositiveIntegerField()),
+              ('query_time', models.FloatField()),
+              ('status_code', models.PositiveSmallIntegerField()),
+              ('summary', models.TextField()),
+              (
+                  'user',
+                  models.ForeignKey(
+                      blank=True,
+                      null=True,
+                      on_delete=django.db.models.deletion.SET_NULL,
+                      to=settings.AUTH_USER_MODEL
+                  )
+              ),
+          ],
+          options={
+              'ordering': ['-created'],
+              'permissions': [
+                  ('profile_request', 'Can profile individual requests')
+              ],
+          },
+      ),
+  ]
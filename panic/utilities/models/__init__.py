@@ -0,0 +1,3 @@
+"""Aggregated Models"""
+
+from . import request_profile, throttle_bucket
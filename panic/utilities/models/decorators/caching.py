@@ -2,6 +2,8 @@
 
 from django.utils.timezone import now
 
+from ..validators.trusted import trusted_write
+
 SETTER_ERROR = "This attribute can not be assigned directly."
 
 
@@ -15,6 +17,12 @@ class PersistentCachedProperty:
   Call `del` on the property to delete the cached value and replace it with
   up to date data.
 
+  Call `prefetch` to supply a value calculated in bulk for many instances,
+  which is then used in place of the decorated function.
+
+  Refreshed values of saved instances are written with `update_fields`, so
+  only the internal field is saved.
+
   :param ttl_field: Model field containing a datetime to control TTL
   :type ttl_field: str
   :param cached_field: Model field to store the value (default: _ + field name)
@@ -44,6 +52,11 @@ class PersistentCachedProperty:
       self.cached_field = "_" + self.func.__name__
 
   def __get__(self, instance, cls=None):
+    if instance is None:
+      return self
+    if self.func.__name__ in instance.__dict__:
+      return instance.__dict__[self.func.__name__]
+
     cache_value = getattr(instance, self.cached_field)
     ttl_value = getattr(instance, self.ttl_field)
 
@@ -56,8 +69,32 @@ class PersistentCachedProperty:
     return calculated_value
 
   def __delete__(self, instance):
+    instance.__dict__.pop(self.func.__name__, None)
     self._write_cache(instance)
 
+  def prefetch(self, instance, calculated_value):
+    """Supply a calculated value for an instance, without calling the function.
+
+    The persisted value is still used while it is valid, and otherwise is
+    replaced by the calculated value.
+
+    :param instance: The instance to supply the value to
+    :type instance: :class:`django.db.models.Model`
+    :param calculated_value: The value the decorated function would return
+    :type calculated_value: object
+    """
+    cache_value = getattr(instance, self.cached_field)
+    ttl_value = getattr(instance, self.ttl_field)
+
+    if not self._cache_is_valid(cache_value, ttl_value):
+      setattr(instance, self.cached_field, calculated_value)
+      self._save(instance, cache_value, calculated_value)
+
+    instance.__dict__[self.func.__name__] = getattr(
+        instance,
+        self.cached_field,
+    )
+
   def __set__(self, _instance, _value):
     raise AttributeError(SETTER_ERROR)
 
@@ -78,7 +115,10 @@ class PersistentCachedProperty:
     setattr(instance, self.cached_field, computed_value)
     return computed_value
 
-  @staticmethod
-  def _save(instance, cache_value, calculated_value):
+  def _save(self, instance, cache_value, calculated_value):
     if cache_value != calculated_value:
-      instance.save()
+      with trusted_write():
+        if instance.pk is None:
+          instance.save()
+        else:
+          instance.save(update_fields=[self.cached_field])
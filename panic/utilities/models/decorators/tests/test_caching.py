@@ -7,6 +7,7 @@ from django.test import SimpleTestCase
 from django.utils.timezone import now
 from freezegun import freeze_time
 
+from ...validators.trusted import is_trusted_write
 from ..caching import SETTER_ERROR, PersistentCachedProperty
 
 
@@ -121,6 +122,27 @@ class TestCachingDecoratorTTLTestHarness(SimpleTestCase):
         expected_count,
     )
 
+  def test_model_save_is_a_trusted_write(self):
+    _ = self.instance1.cached_calculated
+
+    self.assertListEqual(self.instance1._save_trusted, [True])
+    self.assertFalse(is_trusted_write())
+
+  def test_model_save_only_updates_cached_field(self):
+    _ = self.instance1.cached_calculated
+
+    self.assertListEqual(
+        self.instance1._save_update_fields,
+        [["_cached_calculated"]],
+    )
+
+  def test_unsaved_model_save_is_a_full_save(self):
+    self.instance1.pk = None
+
+    _ = self.instance1.cached_calculated
+
+    self.assertListEqual(self.instance1._save_update_fields, [None])
+
   def test_alias_calculation_caching_is_dependent_on_ttl(self):
     result1 = self.instance1.alias_calculation
 
@@ -175,6 +197,33 @@ class TestCachingDecoratorTTLTestHarness(SimpleTestCase):
         self.ttl_valid,
     )
 
+  def test_prefetch(self):
+    self.instance1._cached_calculated = self.initial_value
+    Model.cached_calculated.prefetch(self.instance1, self.initial_value + 5)
+
+    expected = self.initial_value if self.ttl_valid else self.initial_value + 5
+    self.assertEqual(self.instance1.cached_calculated, expected)
+    self.assertEqual(self.instance1._cached_calculated, expected)
+    self.assertEqual(self.instance1._save_calls, 0 if self.ttl_valid else 1)
+
+  def test_prefetch_is_not_recalculated(self):
+    Model.cached_calculated.prefetch(self.instance1, self.initial_value + 5)
+    self.instance1.increment_cached_value()
+
+    self.assertEqual(
+        self.instance1.cached_calculated,
+        self.initial_value + 5,
+    )
+
+  def test_prefetch_invalidation(self):
+    Model.cached_calculated.prefetch(self.instance1, self.initial_value + 5)
+    del self.instance1.cached_calculated
+
+    self.assertEqual(
+        self.instance1.cached_calculated,
+        self.initial_value + 1,
+    )
+
 
 class TestCachingDecoratorTTLValid(TestCachingDecoratorTTLTestHarness):
   """Test the PersistentCachedProperty class while TTL is valid."""
@@ -195,13 +244,18 @@ class Model:
 
   def __init__(self, instance_id, initial, expiry):
     self.id = instance_id
+    self.pk = instance_id
     self.initial = initial
     self.expiry_date = expiry
     self._cached_calculated = None
     self._save_calls = 0
+    self._save_trusted = []
+    self._save_update_fields = []
 
-  def save(self):
+  def save(self, update_fields=None):
     self._save_calls += 1
+    self._save_trusted.append(is_trusted_write())
+    self._save_update_fields.append(update_fields)
 
   def increment_cached_value(self):
     self.initial += 1
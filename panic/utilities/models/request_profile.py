@@ -0,0 +1,41 @@
+"""RequestProfile model."""
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+User = get_user_model()
+
+
+class RequestProfile(models.Model):
+  """RequestProfile model.
+
+  The cProfile statistics and SQL timeline of a single request, captured on
+  demand for a staff user.  The statistics are stored in the marshalled
+  format read by :class:`pstats.Stats`.
+  """
+
+  created = models.DateTimeField(auto_now_add=True, db_index=True)
+  duration = models.FloatField()
+  method = models.CharField(max_length=10)
+  path = models.CharField(max_length=2048)
+  profile = models.BinaryField()
+  queries = models.JSONField(default=list)
+  query_count = models.PositiveIntegerField()
+  query_time = models.FloatField()
+  status_code = models.PositiveSmallIntegerField()
+  summary = models.TextField()
+  user = models.ForeignKey(
+      User,
+      on_delete=models.SET_NULL,
+      blank=True,
+      null=True,
+  )
+
+  class Meta:
+    ordering = ['-created']
+    permissions = [
+        ("profile_request", "Can profile individual requests"),
+    ]
+
+  def __str__(self):
+    return "%s %s (%.2f ms)" % (self.method, self.path, self.duration * 1000)
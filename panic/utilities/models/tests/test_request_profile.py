@@ -0,0 +1,23 @@
+"""Test the RequestProfile model."""
+
+from django.test import TestCase
+
+from ..request_profile import RequestProfile
+
+
+class TestRequestProfile(TestCase):
+  """Test the RequestProfile model."""
+
+  def test_str(self):
+    request_profile = RequestProfile.objects.create(
+        duration=0.0125,
+        method="GET",
+        path="/api/v1/items/",
+        profile=b"",
+        query_count=3,
+        query_time=0.002,
+        status_code=200,
+        summary="",
+    )
+
+    self.assertEqual(str(request_profile), "GET /api/v1/items/ (12.50 ms)")
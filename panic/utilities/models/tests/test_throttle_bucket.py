@@ -0,0 +1,20 @@
+"""Test the ThrottleBucket model."""
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..throttle_bucket import ThrottleBucket
+
+
+class TestThrottleBucket(TestCase):
+  """Test the ThrottleBucket model."""
+
+  def test_str(self):
+    bucket = ThrottleBucket.objects.create(
+        key="throttle_user_1",
+        tokens=2.5,
+        updated=timezone.now(),
+        expires=timezone.now(),
+    )
+
+    self.assertEqual(str(bucket), "throttle_user_1: 2.5 tokens")
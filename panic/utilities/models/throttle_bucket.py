@@ -0,0 +1,19 @@
+"""ThrottleBucket model."""
+
+from django.db import models
+
+
+class ThrottleBucket(models.Model):
+  """ThrottleBucket model.
+
+  The token bucket of a single throttle key, shared by all worker processes.
+  Buckets are full again once they expire, and can then be deleted.
+  """
+
+  key = models.CharField(max_length=255, primary_key=True)
+  tokens = models.FloatField()
+  updated = models.DateTimeField()
+  expires = models.DateTimeField(db_index=True)
+
+  def __str__(self):
+    return "%s: %s tokens" % (self.key, self.tokens)
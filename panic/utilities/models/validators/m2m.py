@@ -1,7 +1,15 @@
 """Validators for Django models with M2M fields."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.core.exceptions import ValidationError
 
+_VALIDATED_INSTANCES: ContextVar = ContextVar(
+    "m2m_validated_instances",
+    default=frozenset(),
+)
+
 
 class ManyToManyRelatedValidator:
   """Validator for Many to Many fields, ensures a related field matches.
@@ -19,6 +27,26 @@ class ManyToManyRelatedValidator:
     self.related_field = related_field
     self.match_field = match_field
 
+  @staticmethod
+  @contextmanager
+  def validated(related_instances):
+    """Mark related instances as already validated within this context.
+
+    Instances resolved and validated by a caller (such as a serializer field
+    scoped to the request user) are not queried for again during validation.
+
+    :param related_instances: The related model instances already validated
+    :type related_instances: List[:class:`django.db.models.Model`]
+    """
+    token = _VALIDATED_INSTANCES.set(
+        _VALIDATED_INSTANCES.get() |
+        {(instance.__class__, instance.pk) for instance in related_instances}
+    )
+    try:
+      yield
+    finally:
+      _VALIDATED_INSTANCES.reset(token)
+
   def validate(self, instance, pk_set):
     """Perform validation on a many to many field.
 
@@ -31,12 +59,20 @@ class ManyToManyRelatedValidator:
     """
 
     model = self._get_related_model(instance)
+    pk_set = self._exclude_validated(model, pk_set)
+    if not pk_set:
+      return
+
     related_instances = model.objects.filter(pk__in=pk_set)
     errors = self._collect_errors(instance, related_instances)
 
     if errors[self.match_field]:
       raise ValidationError(errors)
 
+  def _exclude_validated(self, model, pk_set):
+    validated = _VALIDATED_INSTANCES.get()
+    return {pk for pk in pk_set if (model, pk) not in validated}
+
   def _get_related_model(self, instance):
     field = getattr(instance.__class__, self.related_field).field
     return field.related_model
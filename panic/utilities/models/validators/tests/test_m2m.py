@@ -84,3 +84,45 @@ class TestValidatePreferredStores(SimpleTestCase):
         value,
         self.mock_model1.user,
     )
+
+  def test_validated_skips_query(self):
+
+    class RelatedModel:
+      objects = Mock()
+
+    MockModelWithM2M.related.field.related_model = RelatedModel
+    validated = Mock(spec=RelatedModel, pk=2)
+
+    with ManyToManyRelatedValidator.validated([validated]):
+      self.m2m_validator.validate(self.mock_model4, {2})
+
+    RelatedModel.objects.filter.assert_not_called()
+
+  def test_validated_partial_query(self):
+
+    class RelatedModel:
+      objects = Mock()
+
+    RelatedModel.objects.filter.return_value = []
+    MockModelWithM2M.related.field.related_model = RelatedModel
+    validated = Mock(spec=RelatedModel, pk=2)
+
+    with ManyToManyRelatedValidator.validated([validated]):
+      self.m2m_validator.validate(self.mock_model4, {1, 2})
+
+    RelatedModel.objects.filter.assert_called_once_with(pk__in={1})
+
+  def test_validated_is_scoped(self):
+
+    class RelatedModel:
+      objects = Mock()
+
+    RelatedModel.objects.filter.return_value = []
+    MockModelWithM2M.related.field.related_model = RelatedModel
+    validated = Mock(spec=RelatedModel, pk=2)
+
+    with ManyToManyRelatedValidator.validated([validated]):
+      pass
+    self.m2m_validator.validate(self.mock_model4, {2})
+
+    RelatedModel.objects.filter.assert_called_once_with(pk__in={2})
@@ -0,0 +1,30 @@
+"""Test the trusted write context."""
+
+from django.test import SimpleTestCase
+
+from ..trusted import is_trusted_write, trusted_write
+
+
+class TestTrustedWrite(SimpleTestCase):
+  """Test the trusted write context."""
+
+  def test_default(self):
+    self.assertFalse(is_trusted_write())
+
+  def test_within_context(self):
+    with trusted_write():
+      self.assertTrue(is_trusted_write())
+
+  def test_nested_context(self):
+    with trusted_write():
+      with trusted_write():
+        self.assertTrue(is_trusted_write())
+      self.assertTrue(is_trusted_write())
+    self.assertFalse(is_trusted_write())
+
+  def test_reset_on_exception(self):
+    with self.assertRaises(ValueError):
+      with trusted_write():
+        raise ValueError()
+
+    self.assertFalse(is_trusted_write())
@@ -0,0 +1,30 @@
+"""Trusted write context for internal model saves."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_TRUSTED_WRITE: ContextVar = ContextVar("trusted_write", default=False)
+
+
+@contextmanager
+def trusted_write():
+  """Mark model saves made within this context as trusted system updates.
+
+  Models that clean themselves on save may skip user input validation for
+  trusted writes, such as internal bookkeeping that only changes values the
+  system has already validated.
+  """
+  token = _TRUSTED_WRITE.set(True)
+  try:
+    yield
+  finally:
+    _TRUSTED_WRITE.reset(token)
+
+
+def is_trusted_write():
+  """Determine if the current save is a trusted system update.
+
+  :returns: A boolean indicating if validation may be skipped
+  :rtype: bool
+  """
+  return _TRUSTED_WRITE.get()
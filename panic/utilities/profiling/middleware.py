@@ -0,0 +1,176 @@
+"""Middleware profiling individual requests on demand."""
+
+import cProfile
+import io
+import marshal
+import pstats
+from contextlib import ExitStack
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from ..models.request_profile import RequestProfile
+from .timeline import QueryTimeline
+
+HEADER_REQUEST_PROFILE = "X-Request-Profile"
+PROFILE_PERMISSION = "utilities.profile_request"
+
+
+def profiling_user(request):
+  """Return the request user, if they may profile requests.
+
+  Users authenticated by the API's authentication classes (ie. with a JWT
+  cookie) are also considered, as they are not yet known to Django.
+
+  :param request: The request
+  :type request: :class:`django.http.HttpRequest`
+
+  :returns: A staff user with the profiling permission, or None
+  :rtype: :class:`user.models.user.User`, None
+  """
+  user = getattr(request, "user", None)
+  if user is None or not user.is_authenticated:
+    user = api_user(request)
+  if user is not None and user.is_staff and user.has_perm(PROFILE_PERMISSION):
+    return user
+  return None
+
+
+def api_user(request):
+  """Authenticate a request with the API's authentication classes.
+
+  :param request: The request
+  :type request: :class:`django.http.HttpRequest`
+
+  :returns: The authenticated user, or None
+  :rtype: :class:`user.models.user.User`, None
+  """
+  original = request.__dict__.get("user")
+  api_request = Request(
+      request,
+      authenticators=[
+          authenticator()
+          for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+      ],
+  )
+  try:
+    user = api_request.user
+  except APIException:
+    user = None
+  finally:
+    if original is None:
+      request.__dict__.pop("user", None)
+    else:
+      request.user = original
+  if user is None or not user.is_authenticated:
+    return None
+  return user
+
+
+class RequestProfilingMiddleware:
+  """Profiles individual requests on demand, for staff users.
+
+  A request is profiled when it has a `REQUEST_PROFILING_HEADER` header or a
+  `REQUEST_PROFILING_PARAM` query parameter, and it is made by a staff user
+  with the `utilities.profile_request` permission.  The cProfile statistics
+  and SQL timeline are saved as a
+  :class:`utilities.models.request_profile.RequestProfile`, and its id is
+  returned in the `X-Request-Profile` response header.
+
+  All other requests are passed straight through.
+
+  :param get_response: The next handler in the middleware chain
+  :type get_response: func
+  """
+
+  def __init__(self, get_response):
+    self.get_response = get_response
+    self.header = "HTTP_" + settings.REQUEST_PROFILING_HEADER.upper(
+    ).replace("-", "_")
+    self.param = settings.REQUEST_PROFILING_PARAM
+    self.path_length = RequestProfile._meta.get_field("path").max_length
+
+  def __call__(self, request):
+    if not self.is_requested(request):
+      return self.get_response(request)
+
+    user = profiling_user(request)
+    if user is None:
+      return self.get_response(request)
+
+    return self.profile(request, user)
+
+  def is_requested(self, request):
+    """Return a boolean indicating if a request asks to be profiled.
+
+    :param request: The request
+    :type request: :class:`django.http.HttpRequest`
+
+    :rtype: bool
+    """
+    if self.header in request.META:
+      return True
+    return (
+        self.param in request.META.get("QUERY_STRING", "") and
+        self.param in request.GET
+    )
+
+  def profile(self, request, user):
+    """Profile a request, and save the results.
+
+    :param request: The request
+    :type request: :class:`django.http.HttpRequest`
+    :param user: The user profiling the request
+    :type user: :class:`user.models.user.User`
+
+    :returns: The response
+    :rtype: :class:`django.http.HttpResponse`
+    """
+    timeline = QueryTimeline(settings.REQUEST_PROFILING_MAX_QUERIES)
+    profiler = cProfile.Profile()
+    start = perf_counter()
+    with ExitStack() as stack:
+      for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(timeline))
+      profiler.enable()
+      try:
+        response = self.get_response(request)
+      finally:
+        profiler.disable()
+    duration = perf_counter() - start
+
+    profiler.create_stats()
+    request_profile = RequestProfile.objects.create(
+        duration=duration,
+        method=request.method,
+        path=request.get_full_path()[:self.path_length],
+        profile=marshal.dumps(profiler.stats),
+        queries=timeline.queries,
+        query_count=timeline.count,
+        query_time=timeline.duration,
+        status_code=response.status_code,
+        summary=self.summarize(profiler),
+        user=user,
+    )
+    response[HEADER_REQUEST_PROFILE] = str(request_profile.id)
+    return response
+
+  @staticmethod
+  def summarize(profiler):
+    """Summarize a profile's most expensive calls, by cumulative time.
+
+    :param profiler: A completed profiler
+    :type profiler: :class:`cProfile.Profile`
+
+    :returns: The printed statistics
+    :rtype: str
+    """
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(settings.REQUEST_PROFILING_SUMMARY_LINES)
+    return stream.getvalue()
@@ -0,0 +1,216 @@
+"""Test the request profiling middleware."""
+
+import base64
+import marshal
+from unittest.mock import Mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from ...models.request_profile import RequestProfile
+from ..middleware import (
+    HEADER_REQUEST_PROFILE,
+    RequestProfilingMiddleware,
+    api_user,
+    profiling_user,
+)
+
+PASSWORD = "test123"
+SHELF_URL = reverse("v1:shelves-supplementary-list")
+
+
+def basic_auth(user):
+  credentials = "%s:%s" % (user.username, PASSWORD)
+  return "Basic " + base64.b64encode(credentials.encode()).decode()
+
+
+class ProfilingTestHarness(TestCase):
+  """Create users with and without the profiling permission."""
+
+  @classmethod
+  def setUpTestData(cls):
+    permission = Permission.objects.get(
+        codename="profile_request",
+        content_type__app_label="utilities",
+    )
+    cls.staff = get_user_model().objects.create_user(
+        username="staff_user",
+        email="staff_user@niallbyrne.ca",
+        password=PASSWORD,
+        is_staff=True,
+    )
+    cls.staff.user_permissions.add(permission)
+    cls.staff_without_permission = get_user_model().objects.create_user(
+        username="staff_user_without_permission",
+        email="staff_user_without_permission@niallbyrne.ca",
+        password=PASSWORD,
+        is_staff=True,
+    )
+    cls.user = get_user_model().objects.create_user(
+        username="user",
+        email="user@niallbyrne.ca",
+        password=PASSWORD,
+    )
+    cls.user.user_permissions.add(permission)
+
+  def get_user(self, user):
+    return get_user_model().objects.get(pk=user.pk)
+
+
+class TestProfilingUser(ProfilingTestHarness):
+  """Test the profiling_user and api_user functions."""
+
+  def setUp(self):
+    self.factory = RequestFactory()
+
+  def test_session_staff_user(self):
+    request = self.factory.get(SHELF_URL)
+    request.user = self.get_user(self.staff)
+
+    self.assertEqual(profiling_user(request), self.staff)
+
+  def test_session_staff_user_without_permission(self):
+    request = self.factory.get(SHELF_URL)
+    request.user = self.get_user(self.staff_without_permission)
+
+    self.assertIsNone(profiling_user(request))
+
+  def test_session_user(self):
+    request = self.factory.get(SHELF_URL)
+    request.user = self.get_user(self.user)
+
+    self.assertIsNone(profiling_user(request))
+
+  def test_api_staff_user(self):
+    request = self.factory.get(
+        SHELF_URL, HTTP_AUTHORIZATION=basic_auth(self.staff)
+    )
+    request.user = AnonymousUser()
+
+    self.assertEqual(profiling_user(request), self.staff)
+
+  def test_api_user_restores_request_user(self):
+    request = self.factory.get(
+        SHELF_URL, HTTP_AUTHORIZATION=basic_auth(self.staff)
+    )
+    anonymous = AnonymousUser()
+    request.user = anonymous
+
+    self.assertEqual(api_user(request), self.staff)
+    self.assertIs(request.user, anonymous)
+
+  def test_api_user_without_request_user(self):
+    request = self.factory.get(
+        SHELF_URL, HTTP_AUTHORIZATION=basic_auth(self.staff)
+    )
+
+    self.assertEqual(api_user(request), self.staff)
+    self.assertNotIn("user", request.__dict__)
+
+  def test_api_user_invalid_credentials(self):
+    request = self.factory.get(SHELF_URL, HTTP_AUTHORIZATION="Basic invalid")
+
+    self.assertIsNone(api_user(request))
+
+  def test_api_user_anonymous(self):
+    request = self.factory.get(SHELF_URL)
+
+    self.assertIsNone(api_user(request))
+
+
+class TestRequestProfilingMiddleware(ProfilingTestHarness):
+  """Test the RequestProfilingMiddleware class."""
+
+  def test_not_requested(self):
+    response = self.client.get(
+        SHELF_URL, HTTP_AUTHORIZATION=basic_auth(self.staff)
+    )
+
+    self.assertNotIn(HEADER_REQUEST_PROFILE, response)
+    self.assertFalse(RequestProfile.objects.exists())
+
+  def test_requested_by_header(self):
+    response = self.client.get(
+        SHELF_URL,
+        HTTP_AUTHORIZATION=basic_auth(self.staff),
+        HTTP_X_PROFILE="1",
+    )
+
+    request_profile = RequestProfile.objects.get()
+    self.assertEqual(response[HEADER_REQUEST_PROFILE], str(request_profile.id))
+    self.assertEqual(request_profile.user, self.staff)
+    self.assertEqual(request_profile.method, "GET")
+    self.assertEqual(request_profile.path, SHELF_URL)
+    self.assertEqual(request_profile.status_code, 200)
+    self.assertGreater(request_profile.duration, 0)
+    self.assertGreater(request_profile.query_count, 0)
+    self.assertEqual(
+        len(request_profile.queries),
+        request_profile.query_count,
+    )
+    self.assertIn("cumulative", request_profile.summary)
+    self.assertIsInstance(marshal.loads(request_profile.profile), dict)
+
+  def test_requested_by_query_param(self):
+    response = self.client.get(
+        SHELF_URL + "?profile=1",
+        HTTP_AUTHORIZATION=basic_auth(self.staff),
+    )
+
+    request_profile = RequestProfile.objects.get()
+    self.assertEqual(response[HEADER_REQUEST_PROFILE], str(request_profile.id))
+    self.assertEqual(request_profile.path, SHELF_URL + "?profile=1")
+
+  def test_requested_by_session_user(self):
+    self.client.force_login(self.staff)
+
+    response = self.client.get(SHELF_URL, HTTP_X_PROFILE="1")
+
+    request_profile = RequestProfile.objects.get()
+    self.assertEqual(response[HEADER_REQUEST_PROFILE], str(request_profile.id))
+    self.assertEqual(request_profile.user, self.staff)
+
+  def test_requested_without_permission(self):
+    for user in (self.staff_without_permission, self.user):
+      response = self.client.get(
+          SHELF_URL,
+          HTTP_AUTHORIZATION=basic_auth(user),
+          HTTP_X_PROFILE="1",
+      )
+
+      self.assertEqual(response.status_code, 200)
+      self.assertNotIn(HEADER_REQUEST_PROFILE, response)
+    self.assertFalse(RequestProfile.objects.exists())
+
+  def test_requested_anonymously(self):
+    response = self.client.get(SHELF_URL, HTTP_X_PROFILE="1")
+
+    self.assertNotIn(HEADER_REQUEST_PROFILE, response)
+    self.assertFalse(RequestProfile.objects.exists())
+
+  @override_settings(REQUEST_PROFILING_SUMMARY_LINES=5)
+  def test_summarize(self):
+    get_response = Mock(return_value=HttpResponse())
+    middleware = RequestProfilingMiddleware(get_response)
+    request = RequestFactory().get("/", HTTP_X_PROFILE="1")
+    request.user = self.get_user(self.staff)
+
+    response = middleware(request)
+
+    request_profile = RequestProfile.objects.get(
+        id=response[HEADER_REQUEST_PROFILE]
+    )
+    self.assertIn("due to restriction <5>", request_profile.summary)
+    self.assertEqual(request_profile.query_count, 0)
+
+  def test_not_requested_is_passed_through(self):
+    response = HttpResponse()
+    get_response = Mock(return_value=response)
+    middleware = RequestProfilingMiddleware(get_response)
+    request = Mock(META={"QUERY_STRING": ""})
+
+    self.assertIs(middleware(request), response)
+    get_response.assert_called_once_with(request)
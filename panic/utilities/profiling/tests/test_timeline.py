@@ -0,0 +1,69 @@
+"""Test the profiled request query timeline."""
+
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from ..timeline import QueryTimeline
+
+
+class TestQueryTimeline(SimpleTestCase):
+  """Test the QueryTimeline class."""
+
+  def setUp(self):
+    self.timeline = QueryTimeline(2)
+    self.context = {"connection": Mock(alias="default"), "cursor": Mock()}
+
+  def test_call(self):
+    execute = Mock(return_value="result")
+
+    result = self.timeline(execute, "SELECT 1", (1,), False, self.context)
+
+    self.assertEqual(result, "result")
+    execute.assert_called_once_with("SELECT 1", (1,), False, self.context)
+    self.assertEqual(self.timeline.count, 1)
+    self.assertEqual(self.timeline.queries[0]["database"], "default")
+    self.assertEqual(self.timeline.queries[0]["sql"], "SELECT 1")
+    self.assertNotIn("params", self.timeline.queries[0])
+
+  def test_call_exception(self):
+    execute = Mock(side_effect=ValueError)
+
+    with self.assertRaises(ValueError):
+      self.timeline(execute, "SELECT 1", (), False, self.context)
+
+    self.assertEqual(self.timeline.count, 1)
+
+  def test_record(self):
+    start = self.timeline.start
+    self.timeline.record("default", "SELECT 1", start + 0.001, start + 0.003)
+    self.timeline.record("replica", "SELECT 2", start + 0.004, start + 0.005)
+
+    self.assertEqual(self.timeline.count, 2)
+    self.assertAlmostEqual(self.timeline.duration, 0.003)
+    self.assertEqual(
+        self.timeline.queries,
+        [
+            {
+                "database": "default",
+                "start_ms": 1.0,
+                "duration_ms": 2.0,
+                "sql": "SELECT 1",
+            },
+            {
+                "database": "replica",
+                "start_ms": 4.0,
+                "duration_ms": 1.0,
+                "sql": "SELECT 2",
+            },
+        ],
+    )
+
+  def test_record_max_queries(self):
+    start = self.timeline.start
+    for index in range(3):
+      self.timeline.record("default", "SELECT %s" % index, start, start + 0.1)
+
+    self.assertEqual(self.timeline.count, 3)
+    self.assertAlmostEqual(self.timeline.duration, 0.3)
+    self.assertEqual(len(self.timeline.queries), 2)
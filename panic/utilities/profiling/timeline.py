@@ -0,0 +1,63 @@
+"""A timeline of the database queries made by a profiled request."""
+
+from time import perf_counter
+
+
+class QueryTimeline:
+  """Records when each query started, and how long it took.
+
+  Install an instance with :meth:`django.db.backends.base.base.
+  BaseDatabaseWrapper.execute_wrapper`.  Query parameters are not recorded.
+
+  :param max_queries: The number of queries to keep in the timeline
+  :type max_queries: int
+  """
+
+  def __init__(self, max_queries):
+    self.count = 0
+    self.duration = 0.0
+    self.max_queries = max_queries
+    self.queries = []
+    self.start = perf_counter()
+
+  def __call__(self, execute, sql, params, many, context):
+    """Execute and record a query.
+
+    :param execute: The next callable in the execute wrapper chain
+    :type execute: func
+    :param sql: The SQL statement
+    :type sql: str
+    :param params: The statement parameters
+    :type params: list, tuple, dict
+    :param many: A boolean indicating if this is an executemany call
+    :type many: bool
+    :param context: The connection and cursor in use
+    :type context: dict
+    """
+    start = perf_counter()
+    try:
+      return execute(sql, params, many, context)
+    finally:
+      self.record(context["connection"].alias, sql, start, perf_counter())
+
+  def record(self, alias, sql, start, end):
+    """Record a completed query.
+
+    :param alias: The alias of the database connection
+    :type alias: str
+    :param sql: The SQL statement
+    :type sql: str
+    :param start: The performance counter value when the query started
+    :type start: float
+    :param end: The performance counter value when the query completed
+    :type end: float
+    """
+    self.count += 1
+    self.duration += end - start
+    if len(self.queries) < self.max_queries:
+      self.queries.append({
+          "database": alias,
+          "start_ms": round((start - self.start) * 1000, 3),
+          "duration_ms": round((end - start) * 1000, 3),
+          "sql": sql,
+      })
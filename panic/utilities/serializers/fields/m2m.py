@@ -1,6 +1,28 @@
 """Serializer fields for M2M models."""
 
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+
+class M2MThroughManyRelatedField(serializers.ManyRelatedField):
+  """Many related field that resolves all incoming `pk`'s with one query.
+
+  Model instances are passed through as is, while all `pk`'s are looked up
+  together with a single `pk__in` query against the child's queryset.
+  """
+
+  def to_internal_value(self, data):
+    """Transform the *incoming* primitive data into a list of native values."""
+    if isinstance(data, str) or not hasattr(data, '__iter__'):
+      self.fail('not_a_list', input_type=type(data).__name__)
+    if not self.allow_empty and len(data) == 0:
+      self.fail('empty')
+
+    resolved = self.child_relation.resolve_many(data)
+    return [
+        resolved[str(item)] if self.child_relation.is_pk(item) else item
+        for item in data
+    ]
 
 
 class M2MThroughSerializerField(serializers.RelatedField):
@@ -10,13 +32,69 @@ class M2MThroughSerializerField(serializers.RelatedField):
   format as well.
   """
 
-  def to_internal_value(self, data):
-    """Transform the *incoming* primitive data into a native value."""
-    if isinstance(data, (
+  default_error_messages = {
+      'does_not_exist': 'Invalid pk "{pk_value}" - object does not exist.',
+  }
+
+  @classmethod
+  def many_init(cls, *args, **kwargs):
+    """Create a parent :class:`M2MThroughManyRelatedField` for `many=True`."""
+    list_kwargs = {'child_relation': cls(*args, **kwargs)}
+    for key in kwargs:
+      if key in MANY_RELATION_KWARGS:
+        list_kwargs[key] = kwargs[key]
+    return M2MThroughManyRelatedField(**list_kwargs)
+
+  def is_pk(self, data):
+    """Determine if the incoming data is a `pk` rather than an instance.
+
+    :param data: The incoming primitive data, or a model instance
+    :type data: int, str, :class:`django.db.models.Model`
+
+    :returns: A boolean indicating if the data is a `pk`
+    :rtype: bool
+    """
+    return isinstance(data, (
         int,
         str,
-    )):
-      return self.queryset.get(pk=data)
+    ))
+
+  def resolve_many(self, data):
+    """Resolve all `pk`'s in the incoming data with a single query.
+
+    :param data: The incoming primitive data, and/or model instances
+    :type data: List[int, str, :class:`django.db.models.Model`]
+
+    :returns: A dictionary of model instances, keyed by their string `pk`
+    :rtype: dict
+    """
+    pks = {str(item) for item in data if self.is_pk(item)}
+    if not pks:
+      return {}
+
+    resolved = {
+        str(instance.pk): instance
+        for instance in self.get_queryset().filter(pk__in=pks)
+    }
+    missing = sorted(pks - set(resolved))
+    if missing:
+      self.fail_missing(missing)
+    return resolved
+
+  def fail_missing(self, missing):
+    """Raise a validation error for `pk`'s that could not be resolved.
+
+    :param missing: The `pk`'s that were not found in the queryset
+    :type missing: List[str]
+
+    :raises: :class:`rest_framework.exceptions.ValidationError`
+    """
+    self.fail('does_not_exist', pk_value=missing[0])
+
+  def to_internal_value(self, data):
+    """Transform the *incoming* primitive data into a native value."""
+    if self.is_pk(data):
+      return self.get_queryset().get(pk=data)
     return data
 
   def to_representation(self, value):
@@ -3,8 +3,9 @@
 from unittest.mock import Mock
 
 from django.test import SimpleTestCase
+from rest_framework.serializers import ValidationError
 
-from ..m2m import M2MThroughSerializerField
+from ..m2m import M2MThroughManyRelatedField, M2MThroughSerializerField
 
 
 class TestM2MThroughSerializerField(SimpleTestCase):
@@ -53,3 +54,55 @@ class TestM2MThroughSerializerField(SimpleTestCase):
         result,
         self.model.id,
     )
+
+
+class TestM2MThroughManyRelatedField(SimpleTestCase):
+  """Test the M2MThroughManyRelatedField class."""
+
+  def setUp(self):
+    super().setUp()
+    self.model1 = Mock(pk=1, id=1)
+    self.model2 = Mock(pk=2, id=2)
+    self.instance = Mock(pk=3, id=3)
+    self.queryset = Mock()
+    self.queryset.filter.return_value = [self.model1, self.model2]
+
+    self.field = M2MThroughSerializerField(queryset=self.queryset, many=True)
+
+  def test_many_init(self):
+    self.assertIsInstance(self.field, M2MThroughManyRelatedField)
+    self.assertIsInstance(
+        self.field.child_relation,
+        M2MThroughSerializerField,
+    )
+
+  def test_to_internal_single_query(self):
+    result = self.field.to_internal_value([1, "2", self.instance])
+
+    self.queryset.filter.assert_called_once_with(pk__in={"1", "2"})
+    self.queryset.get.assert_not_called()
+    self.assertListEqual(
+        result,
+        [self.model1, self.model2, self.instance],
+    )
+
+  def test_to_internal_instances_only(self):
+    result = self.field.to_internal_value([self.instance])
+
+    self.queryset.filter.assert_not_called()
+    self.assertListEqual(result, [self.instance])
+
+  def test_to_internal_missing(self):
+    self.queryset.filter.return_value = [self.model1]
+
+    with self.assertRaises(ValidationError) as raised:
+      self.field.to_internal_value([1, 2])
+
+    self.assertEqual(
+        str(raised.exception.detail[0]),
+        'Invalid pk "2" - object does not exist.',
+    )
+
+  def test_to_internal_not_a_list(self):
+    with self.assertRaises(ValidationError):
+      self.field.to_internal_value("1")
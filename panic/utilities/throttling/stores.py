@@ -0,0 +1,184 @@
+"""Shared stores for throttling state."""
+
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.module_loading import import_string
+
+from ..models.throttle_bucket import ThrottleBucket
+
+THROTTLE_CACHE_KEY = "utilities:throttle:{key}:{window}"
+
+# A single statement refills and consumes from the bucket, so concurrent
+# requests are serialized by the row lock.  Denied requests leave the bucket
+# unchanged, and return no row.
+CONSUME_SQL = """
+INSERT INTO {table} AS bucket (key, tokens, updated, expires)
+VALUES (
+    %(key)s,
+    %(limit)s - 1,
+    statement_timestamp(),
+    statement_timestamp() + make_interval(secs => 1 / %(rate)s)
+)
+ON CONFLICT (key) DO UPDATE SET
+    tokens = {refilled} - 1,
+    updated = statement_timestamp(),
+    expires = statement_timestamp() + make_interval(
+        secs => (%(limit)s - {refilled} + 1) / %(rate)s
+    )
+WHERE {refilled} >= 1
+RETURNING bucket.tokens
+"""
+
+REFILLED_SQL = """
+LEAST(
+    %(limit)s::double precision,
+    bucket.tokens + %(rate)s * GREATEST(
+        0, EXTRACT(EPOCH FROM statement_timestamp() - bucket.updated)
+    )
+)
+"""
+
+PRUNE_SQL = "DELETE FROM {table} WHERE expires <= statement_timestamp()"
+
+
+class DatabaseThrottleStore:
+  """Token bucket throttling, stored in a database table.
+
+  Needs no external service, and costs a single statement per request.
+  Buckets are refilled at the throttle's rate, up to its limit, so bursts of
+  the full limit are allowed.
+  """
+
+  def __init__(self):
+    self.table = connections[DEFAULT_DB_ALIAS].ops.quote_name(
+        ThrottleBucket._meta.db_table
+    )
+
+  def consume(self, key, limit, duration):
+    """Consume a single request from a throttle key's allowance.
+
+    :param key: The throttle key
+    :type key: str
+    :param limit: The number of requests allowed per duration
+    :type limit: int
+    :param duration: The duration in seconds
+    :type duration: int
+
+    :returns: A boolean indicating if the request is allowed, and the seconds
+        to wait before retrying if it is not
+    :rtype: Tuple[bool, float, None]
+    """
+    rate = limit / duration
+    sql = CONSUME_SQL.format(table=self.table, refilled=REFILLED_SQL)
+    # The router is bypassed, so throttling never counts as a request's write.
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+      cursor.execute(sql, {"key": key, "limit": limit, "rate": rate})
+      row = cursor.fetchone()
+    if row is None:
+      return False, 1 / rate
+    return True, None
+
+  def prune(self):
+    """Delete all expired buckets, which are full and equivalent to no bucket.
+
+    :returns: The number of deleted buckets
+    :rtype: int
+    """
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+      cursor.execute(PRUNE_SQL.format(table=self.table))
+      return cursor.rowcount
+
+
+class CacheThrottleStore:
+  """Sliding window throttling, stored in a shared Django cache.
+
+  Requests are counted in fixed windows with atomic increments, and the count
+  of the previous window is weighted by its overlap with the sliding window.
+  Closed windows no longer change, so their counts are kept in process, and
+  most requests cost a single increment.
+
+  The cache must be shared by all worker processes (ie. memcached or redis).
+
+  :param alias: The alias of the Django cache to use
+  :type alias: str
+  :param max_size: The maximum number of closed window counts kept in process
+  :type max_size: int
+  """
+
+  def __init__(self, alias, max_size):
+    self.cache = caches[alias]
+    self.max_size = max_size
+    self._closed = {}
+    self._lock = threading.Lock()
+
+  def consume(self, key, limit, duration):
+    """Consume a single request from a throttle key's allowance.
+
+    :param key: The throttle key
+    :type key: str
+    :param limit: The number of requests allowed per duration
+    :type limit: int
+    :param duration: The duration in seconds
+    :type duration: int
+
+    :returns: A boolean indicating if the request is allowed, and the seconds
+        to wait before retrying if it is not
+    :rtype: Tuple[bool, float, None]
+    """
+    now = time.time()
+    window, elapsed = divmod(now, duration)
+    window = int(window)
+    current_key = THROTTLE_CACHE_KEY.format(key=key, window=window)
+
+    try:
+      current = self.cache.incr(current_key)
+    except ValueError:
+      if self.cache.add(current_key, 1, duration * 2):
+        current = 1
+      else:
+        current = self.cache.incr(current_key)
+
+    weight = 1 - elapsed / duration
+    previous = self.__closed_count(key, window - 1)
+    if previous * weight + current <= limit:
+      return True, None
+
+    self.cache.decr(current_key)
+    return False, duration - elapsed
+
+  def __closed_count(self, key, window):
+    with self._lock:
+      closed = self._closed.get(key)
+    if closed is not None and closed[0] == window:
+      return closed[1]
+
+    count = self.cache.get(
+        THROTTLE_CACHE_KEY.format(key=key, window=window),
+        0,
+    )
+    with self._lock:
+      if len(self._closed) >= self.max_size:
+        self._closed.clear()
+      self._closed[key] = (window, count)
+    return count
+
+
+@lru_cache(maxsize=None)
+def get_throttle_store():
+  """Return the configured throttle store, shared by all throttles.
+
+  :returns: A throttle store instance
+  :rtype: :class:`DatabaseThrottleStore`, :class:`CacheThrottleStore`
+  """
+  store_class = import_string(settings.THROTTLE_STORE)
+  if store_class is CacheThrottleStore:
+    return store_class(
+        settings.THROTTLE_CACHE_ALIAS,
+        settings.THROTTLE_CACHE_MAX_SIZE,
+    )
+  return store_class()
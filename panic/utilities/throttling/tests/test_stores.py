@@ -0,0 +1,169 @@
+"""Test the shared throttle stores."""
+
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ...models.throttle_bucket import ThrottleBucket
+from .. import stores
+from ..stores import (
+    CacheThrottleStore,
+    DatabaseThrottleStore,
+    get_throttle_store,
+)
+
+THROTTLE_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "throttle": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "throttle",
+    },
+}
+
+
+class TestDatabaseThrottleStore(TestCase):
+  """Test the DatabaseThrottleStore class."""
+
+  def setUp(self):
+    self.store = DatabaseThrottleStore()
+
+  def test_consume_within_limit(self):
+    for _ in range(3):
+      self.assertEqual(self.store.consume("key", 3, 60), (True, None))
+
+    bucket = ThrottleBucket.objects.get(key="key")
+    self.assertAlmostEqual(bucket.tokens, 0, places=2)
+    self.assertGreater(bucket.expires, bucket.updated)
+
+  def test_consume_over_limit(self):
+    for _ in range(3):
+      self.store.consume("key", 3, 60)
+
+    self.assertEqual(self.store.consume("key", 3, 60), (False, 20))
+
+  def test_consume_keys_are_independent(self):
+    self.store.consume("key1", 1, 60)
+
+    self.assertEqual(self.store.consume("key2", 1, 60), (True, None))
+
+  def test_consume_refills(self):
+    self.store.consume("key", 1, 60)
+    ThrottleBucket.objects.filter(key="key").update(
+        updated=ThrottleBucket.objects.get(key="key"
+                                          ).updated.replace(year=2020)
+    )
+
+    self.assertEqual(self.store.consume("key", 1, 60), (True, None))
+    self.assertAlmostEqual(
+        ThrottleBucket.objects.get(key="key").tokens,
+        0,
+        places=2,
+    )
+
+  def test_consume_single_query(self):
+    with self.assertNumQueries(1):
+      self.store.consume("key", 1, 60)
+    with self.assertNumQueries(1):
+      self.store.consume("key", 1, 60)
+
+  def test_prune(self):
+    self.store.consume("expired", 1, 60)
+    self.store.consume("current", 1, 60)
+    ThrottleBucket.objects.filter(key="expired").update(
+        expires=ThrottleBucket.objects.get(key="expired").updated
+    )
+
+    self.assertEqual(self.store.prune(), 1)
+    self.assertListEqual(
+        list(ThrottleBucket.objects.values_list("key", flat=True)),
+        ["current"],
+    )
+
+
+@override_settings(CACHES=THROTTLE_CACHES)
+class TestCacheThrottleStore(SimpleTestCase):
+  """Test the CacheThrottleStore class."""
+
+  def setUp(self):
+    caches["throttle"].clear()
+    self.store = CacheThrottleStore("throttle", 2)
+
+  def tearDown(self):
+    caches["throttle"].clear()
+
+  @patch(stores.__name__ + ".time.time", return_value=600)
+  def test_consume_within_limit(self, _):
+    for _ in range(3):
+      self.assertEqual(self.store.consume("key", 3, 60), (True, None))
+
+  @patch(stores.__name__ + ".time.time", return_value=600)
+  def test_consume_over_limit(self, _):
+    for _ in range(3):
+      self.store.consume("key", 3, 60)
+
+    self.assertEqual(self.store.consume("key", 3, 60), (False, 60))
+    self.assertEqual(caches["throttle"].get("utilities:throttle:key:10"), 3)
+
+  @patch(stores.__name__ + ".time.time")
+  def test_consume_weights_previous_window(self, m_time):
+    m_time.return_value = 600
+    for _ in range(4):
+      self.store.consume("key", 4, 60)
+
+    m_time.return_value = 690
+    self.assertEqual(self.store.consume("key", 4, 60), (True, None))
+    self.assertEqual(self.store.consume("key", 4, 60), (True, None))
+    self.assertEqual(self.store.consume("key", 4, 60), (False, 30))
+
+  @patch(stores.__name__ + ".time.time")
+  def test_consume_caches_closed_windows(self, m_time):
+    m_time.return_value = 600
+    self.store.consume("key", 4, 60)
+    m_time.return_value = 660
+
+    with patch.object(
+        self.store.cache,
+        "get",
+        wraps=self.store.cache.get,
+    ) as m_get:
+      self.store.consume("key", 4, 60)
+      self.store.consume("key", 4, 60)
+
+    m_get.assert_called_once()
+
+  @patch(stores.__name__ + ".time.time", return_value=600)
+  def test_consume_bounds_closed_windows(self, _):
+    for key in ("key1", "key2", "key3"):
+      self.store.consume(key, 4, 60)
+
+    self.assertLessEqual(len(self.store._closed), 2)
+
+
+class TestGetThrottleStore(SimpleTestCase):
+  """Test the get_throttle_store function."""
+
+  def setUp(self):
+    get_throttle_store.cache_clear()
+
+  def tearDown(self):
+    get_throttle_store.cache_clear()
+
+  def test_database(self):
+    store = get_throttle_store()
+
+    self.assertIsInstance(store, DatabaseThrottleStore)
+    self.assertIs(get_throttle_store(), store)
+
+  @override_settings(
+      CACHES=THROTTLE_CACHES,
+      THROTTLE_CACHE_ALIAS="throttle",
+      THROTTLE_STORE="utilities.throttling.stores.CacheThrottleStore",
+  )
+  def test_cache(self):
+    store = get_throttle_store()
+
+    self.assertIsInstance(store, CacheThrottleStore)
+    self.assertIs(store.cache, caches["throttle"])
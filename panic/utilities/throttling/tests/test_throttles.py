@@ -0,0 +1,91 @@
+"""Test the shared DRF throttles."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from ..throttles import SharedAnonRateThrottle, SharedUserRateThrottle
+
+
+class AnonThrottle(SharedAnonRateThrottle):
+  rate = "2/minute"
+
+
+class UserThrottle(SharedUserRateThrottle):
+  rate = "2/minute"
+
+
+class UnlimitedThrottle(SharedUserRateThrottle):
+  rate = None
+
+
+class ThrottledView(APIView):
+  permission_classes = []
+  throttle_classes = [AnonThrottle, UserThrottle]
+
+  def get(self, request):
+    return Response()
+
+
+class UnlimitedView(ThrottledView):
+  throttle_classes = [UnlimitedThrottle]
+
+
+class TestSharedThrottles(TestCase):
+  """Test the SharedAnonRateThrottle and SharedUserRateThrottle classes."""
+
+  def setUp(self):
+    self.factory = APIRequestFactory()
+    self.user1 = get_user_model().objects.create_user(
+        username="testuser1",
+        email="test1@niallbyrne.ca",
+        password="test123",
+    )
+    self.user2 = get_user_model().objects.create_user(
+        username="testuser2",
+        email="test2@niallbyrne.ca",
+        password="test123",
+    )
+
+  def request(self, view=ThrottledView, user=None):
+    request = self.factory.get("/")
+    if user is not None:
+      force_authenticate(request, user)
+    return view.as_view()(request)
+
+  def test_anonymous(self):
+    for _ in range(2):
+      self.assertEqual(self.request().status_code, status.HTTP_200_OK)
+
+    res = self.request()
+
+    self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+    self.assertEqual(res["Retry-After"], "30")
+
+  def test_user(self):
+    for _ in range(2):
+      self.assertEqual(
+          self.request(user=self.user1).status_code,
+          status.HTTP_200_OK,
+      )
+
+    self.assertEqual(
+        self.request(user=self.user1).status_code,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    )
+    self.assertEqual(
+        self.request(user=self.user2).status_code,
+        status.HTTP_200_OK,
+    )
+    self.assertEqual(self.request().status_code, status.HTTP_200_OK)
+
+  def test_unlimited(self):
+    with self.assertNumQueries(0):
+      for _ in range(3):
+        self.assertEqual(
+            self.request(view=UnlimitedView, user=self.user1).status_code,
+            status.HTTP_200_OK,
+        )
@@ -0,0 +1,42 @@
+"""DRF throttles with state shared between worker processes."""
+
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+from .stores import get_throttle_store
+
+
+class SharedRateThrottleMixin:
+  """Replaces the per process request history of a DRF rate throttle.
+
+  Requests are counted in the configured throttle store instead.
+  """
+
+  wait_time = None
+
+  def allow_request(self, request, view):
+    """Implement the check to see if the request should be throttled."""
+    if self.rate is None:
+      return True
+
+    self.key = self.get_cache_key(request, view)
+    if self.key is None:
+      return True
+
+    allowed, self.wait_time = get_throttle_store().consume(
+        self.key,
+        self.num_requests,
+        self.duration,
+    )
+    return allowed
+
+  def wait(self):
+    """Return the recommended number of seconds to wait before retrying."""
+    return self.wait_time
+
+
+class SharedAnonRateThrottle(SharedRateThrottleMixin, AnonRateThrottle):
+  """Limits the rate of API calls that may be made by anonymous users."""
+
+
+class SharedUserRateThrottle(SharedRateThrottleMixin, UserRateThrottle):
+  """Limits the rate of API calls that may be made by a given user."""
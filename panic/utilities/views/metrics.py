@@ -0,0 +1,21 @@
+"""A Prometheus metrics view, protected like the watchman views."""
+
+from django.http import HttpResponse
+from django.views.decorators.cache import never_cache
+from watchman.decorators import auth
+
+from ..metrics.prometheus import CONTENT_TYPE, render_metrics
+
+
+@never_cache
+@auth
+def metrics(request):  # pylint: disable=unused-argument
+  """Return this process' metrics, in the Prometheus text format.
+
+  :param request: The request
+  :type request: :class:`django.http.HttpRequest`
+
+  :returns: The metrics response
+  :rtype: :class:`django.http.HttpResponse`
+  """
+  return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
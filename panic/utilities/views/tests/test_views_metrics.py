@@ -0,0 +1,44 @@
+"""Test the Prometheus metrics view."""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import urlencode
+from rest_framework import status
+
+from ...metrics.prometheus import CONTENT_TYPE
+from ...metrics.queries import ENDPOINT_METRICS
+
+METRICS_URL = reverse("metrics")
+METRICS_TOKEN = "token"
+
+
+@patch("watchman.settings.WATCHMAN_TOKENS", METRICS_TOKEN)
+class TestMetricsView(TestCase):
+  """Test the metrics view."""
+
+  def setUp(self):
+    ENDPOINT_METRICS.clear()
+
+  def tearDown(self):
+    ENDPOINT_METRICS.clear()
+
+  def test_token_required(self):
+    res = self.client.get(METRICS_URL)
+
+    self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+  def test_metrics(self):
+    url = "{}?{}".format(
+        METRICS_URL, urlencode({"watchman-token": METRICS_TOKEN})
+    )
+    self.client.get(url)
+    res = self.client.get(url)
+
+    self.assertEqual(res.status_code, status.HTTP_200_OK)
+    self.assertEqual(res["Content-Type"], CONTENT_TYPE)
+    self.assertIn(
+        'panic_http_requests_total{endpoint="metrics"} 1.0',
+        res.content.decode("utf-8"),
+    )